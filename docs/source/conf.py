@@ -233,6 +233,7 @@ rst_prolog = """
 .. |Bipartition| replace:: :class:`~dendropy.datamodel.treemodel.Bipartition`
 .. |TreeList| replace:: :class:`~dendropy.datamodel.treecollectionmodel.TreeList`
 .. |TreeArray| replace:: :class:`~dendropy.datamodel.treecollectionmodel.TreeArray`
+.. |TreeStreamWriter| replace:: :class:`~dendropy.dataio.ioservice.TreeStreamWriter`
 .. |SplitDistribution| replace:: :class:`~dendropy.datamodel.treecollectionmodel.SplitDistribution`
 .. |SplitDistributionSummarizer| replace:: :class:`~dendropy.datamodel.treecollectionmodel.SplitDistributionSummarizer`
 .. |DataSet| replace:: :class:`~dendropy.datamodel.datasetmodel.DataSet`
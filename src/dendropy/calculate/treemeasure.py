@@ -21,7 +21,11 @@
 Statistics, metrics, measurements, and values calculated on (single) trees.
 """
 
+import array
+import collections
 import math
+import multiprocessing
+import dendropy
 from dendropy.calculate import phylogeneticdistance
 
 EULERS_CONSTANT = 0.5772156649015328606065120900824024310421
@@ -110,6 +114,9 @@ def colless_tree_imbalance(tree, normalize="max"):
             right = subtree_leaves[nd._child_nodes[1]]
             colless += abs(right-left)
             subtree_leaves[nd] = right + left
+    return _normalize_colless_tree_imbalance(colless, num_leaves, normalize)
+
+def _normalize_colless_tree_imbalance(colless, num_leaves, normalize):
     if normalize == "yule":
         colless = float(colless - (num_leaves * math.log(num_leaves)) - (num_leaves * (EULERS_CONSTANT - 1.0 - math.log(2))))/num_leaves
     elif normalize == "pda":
@@ -159,6 +166,11 @@ def pybus_harvey_gamma(tree, prec=0.00001):
             n += 1
     if node is None:
         raise ValueError("Empty tree encountered")
+    return _pybus_harvey_gamma(speciation_ages, n)
+
+def _pybus_harvey_gamma(speciation_ages, n):
+    # Calculates the gamma statistic given the ages of the bifurcating nodes
+    # and the number of other nodes (leaves) of a tree.
     speciation_ages.sort(reverse=True)
     g = []
     older = speciation_ages[0]
@@ -219,6 +231,9 @@ def sackin_index(tree, normalize=True):
         leaf_count += 1
         for parent in leaf_node.ancestor_iter(inclusive=False):
             num_anc += 1
+    return _normalize_sackin_index(num_anc, leaf_count, normalize)
+
+def _normalize_sackin_index(num_anc, leaf_count, normalize):
     if normalize == "yule":
         x = sum(1.0/j for j in range(2, leaf_count+1))
         s = float(num_anc - (2 * leaf_count * x))/leaf_count
@@ -248,3 +263,299 @@ def treeness(tree):
             internal += nd.edge.length
     return internal/(external + internal)
 
+
+###########################################################################
+### Tree Shape Summaries
+
+TREE_SHAPE_STATISTICS = (
+        "B1",
+        "colless_tree_imbalance",
+        "N_bar",
+        "sackin_index",
+        "treeness",
+        "pybus_harvey_gamma",
+        )
+
+def tree_shape_statistics(
+        tree,
+        statistics=None,
+        colless_normalize="max",
+        sackin_normalize=True,
+        ultrametricity_precision=0.00001):
+    """
+    Calculates any number of tree shape statistics in a single postorder
+    traversal of a tree.
+
+    The value of each statistic is that returned by the function of the same
+    name in this module (e.g., :func:`colless_tree_imbalance()`), but the
+    intermediate values shared by the statistics (e.g., the number of leaves
+    subtended by each node) are only calculated once, on the fly, rather
+    than being stored for each node by each statistic.
+
+    Parameters
+    ----------
+    tree : |Tree|
+        The tree to summarize.
+    statistics : iterable[str]
+        Names of the statistics to calculate, from
+        :data:`TREE_SHAPE_STATISTICS`. If |None|, then all of them are
+        calculated.
+    colless_normalize : str or bool or None
+        The ``normalize`` argument of :func:`colless_tree_imbalance()`.
+    sackin_normalize : str or bool or None
+        The ``normalize`` argument of :func:`sackin_index()`.
+    ultrametricity_precision : float
+        The ``prec`` argument of :func:`pybus_harvey_gamma()`. As by
+        :func:`pybus_harvey_gamma()`, the ages stored on the nodes of the tree
+        are used if the root has one; unlike :func:`pybus_harvey_gamma()`,
+        node ages are otherwise calculated without being stored on the nodes.
+
+    Returns
+    -------
+    s : dict
+        A dictionary with the names of the statistics as keys and their
+        values as values.
+    """
+    if statistics is None:
+        statistics = TREE_SHAPE_STATISTICS
+    else:
+        statistics = list(statistics)
+        for stat in statistics:
+            if stat not in TREE_SHAPE_STATISTICS:
+                raise ValueError("Unrecognized tree shape statistic: '{}'".format(stat))
+    is_colless = "colless_tree_imbalance" in statistics
+    is_b1 = "B1" in statistics
+    is_treeness = "treeness" in statistics
+    is_gamma = "pybus_harvey_gamma" in statistics
+    is_use_node_ages = is_gamma and tree.seed_node.age is not None
+    colless = 0.0
+    b1 = 0.0
+    num_leaves = 0
+    num_ancestors = 0
+    internal_length = 0.0
+    external_length = 0.0
+    speciation_ages = []
+    num_non_bifurcating_nodes = 0
+    # the values for the child nodes of each node are on the top of the
+    # stack when the node is visited: (number of leaves, maximum number of
+    # nodes to a leaf, age)
+    stack = []
+    for nd in tree.postorder_node_iter():
+        child_nodes = nd._child_nodes
+        num_children = len(child_nodes)
+        if num_children == 0:
+            num_leaves += 1
+            nd_leaves = 1
+            nd_mi = 0
+            nd_age = 0.0
+        else:
+            children = stack[-num_children:]
+            del stack[-num_children:]
+            nd_leaves = 0
+            nd_mi = 0
+            for ch_leaves, ch_mi, ch_age in children:
+                nd_leaves += ch_leaves
+                if ch_mi > nd_mi:
+                    nd_mi = ch_mi
+            nd_mi += 1
+            num_ancestors += nd_leaves
+            if is_colless:
+                if num_children != 2:
+                    raise TypeError("Colless' tree imbalance statistic requires strictly bifurcating trees")
+                colless += abs(children[1][0] - children[0][0])
+            if is_b1 and nd._parent_node is not None:
+                b1 += 1.0/nd_mi
+            if is_gamma and not is_use_node_ages:
+                nd_age = _calc_node_age(nd, children, ultrametricity_precision)
+        if is_gamma:
+            if is_use_node_ages:
+                nd_age = nd.age
+            if num_children == 2:
+                speciation_ages.append(nd_age)
+            else:
+                num_non_bifurcating_nodes += 1
+        else:
+            nd_age = None
+        if is_treeness and nd._parent_node is not None:
+            if num_children == 0:
+                external_length += nd.edge.length
+            else:
+                internal_length += nd.edge.length
+        stack.append((nd_leaves, nd_mi, nd_age))
+    results = {}
+    for stat in statistics:
+        if stat == "B1":
+            results[stat] = b1
+        elif stat == "colless_tree_imbalance":
+            results[stat] = _normalize_colless_tree_imbalance(colless, num_leaves, colless_normalize)
+        elif stat == "N_bar":
+            results[stat] = float(num_ancestors) / num_leaves
+        elif stat == "sackin_index":
+            results[stat] = _normalize_sackin_index(num_ancestors, num_leaves, sackin_normalize)
+        elif stat == "treeness":
+            results[stat] = internal_length/(external_length + internal_length)
+        elif stat == "pybus_harvey_gamma":
+            if not stack:
+                raise ValueError("Empty tree encountered")
+            results[stat] = _pybus_harvey_gamma(speciation_ages, num_non_bifurcating_nodes)
+    return results
+
+def tree_shape_statistics_table(
+        trees,
+        statistics=None,
+        colless_normalize="max",
+        sackin_normalize=True,
+        ultrametricity_precision=0.00001):
+    """
+    Calculates tree shape statistics (see :func:`tree_shape_statistics()`)
+    for each of a collection or stream of trees.
+
+    Parameters
+    ----------
+    trees : iterable[|Tree|]
+        The trees to summarize: e.g., a |TreeList|, or an iterator over trees
+        read one-by-one from files (see :meth:`Tree.yield_from_files()`).
+    statistics : iterable[str]
+        Names of the statistics to calculate, from
+        :data:`TREE_SHAPE_STATISTICS`. If |None|, then all of them are
+        calculated.
+    colless_normalize : str or bool or None
+        The ``normalize`` argument of :func:`colless_tree_imbalance()`.
+    sackin_normalize : str or bool or None
+        The ``normalize`` argument of :func:`sackin_index()`.
+    ultrametricity_precision : float
+        The ``prec`` argument of :func:`pybus_harvey_gamma()`.
+
+    Returns
+    -------
+    s : dict
+        A dictionary with the names of the statistics as keys and, as
+        values, arrays (``array.array("d")``, which support the buffer
+        protocol, and so can be wrapped by, e.g., ``numpy.frombuffer()``
+        without copying) of their values for each tree, in order.
+    """
+    if statistics is None:
+        statistics = TREE_SHAPE_STATISTICS
+    else:
+        statistics = list(statistics)
+    table = collections.OrderedDict((stat, array.array("d")) for stat in statistics)
+    for tree in trees:
+        results = tree_shape_statistics(
+                tree,
+                statistics=statistics,
+                colless_normalize=colless_normalize,
+                sackin_normalize=sackin_normalize,
+                ultrametricity_precision=ultrametricity_precision)
+        for stat in statistics:
+            table[stat].append(results[stat])
+    return table
+
+def tree_shape_statistics_from_files(
+        files,
+        schema,
+        statistics=None,
+        colless_normalize="max",
+        sackin_normalize=True,
+        ultrametricity_precision=0.00001,
+        num_processes=None,
+        **kwargs):
+    """
+    Calculates tree shape statistics (see :func:`tree_shape_statistics()`)
+    for each of the trees in a set of files, reading the trees one-by-one.
+
+    Parameters
+    ----------
+    files : iterable[str]
+        Paths of the files to read.
+    schema : str
+        The name of the data format (e.g., "newick" or "nexus").
+    statistics : iterable[str]
+        Names of the statistics to calculate, from
+        :data:`TREE_SHAPE_STATISTICS`. If |None|, then all of them are
+        calculated.
+    colless_normalize : str or bool or None
+        The ``normalize`` argument of :func:`colless_tree_imbalance()`.
+    sackin_normalize : str or bool or None
+        The ``normalize`` argument of :func:`sackin_index()`.
+    ultrametricity_precision : float
+        The ``prec`` argument of :func:`pybus_harvey_gamma()`.
+    num_processes : int
+        If greater than 1, then the files are distributed over this many
+        worker processes, each of which reads and summarizes the trees of a
+        file at a time. Otherwise, all files are processed in this process.
+    \*\*kwargs : keyword arguments
+        Passed to :meth:`Tree.yield_from_files()` (e.g., ``tree_offset`` to
+        skip burn-in).
+
+    Returns
+    -------
+    s : dict
+        As returned by :func:`tree_shape_statistics_table()`, with the values
+        for the trees of each file following those of the previous file.
+    """
+    if statistics is None:
+        statistics = TREE_SHAPE_STATISTICS
+    else:
+        statistics = list(statistics)
+    files = list(files)
+    tasks = [(
+        [f],
+        schema,
+        statistics,
+        colless_normalize,
+        sackin_normalize,
+        ultrametricity_precision,
+        kwargs) for f in files]
+    if num_processes is None or num_processes <= 1 or len(files) < 2:
+        file_tables = [_tree_shape_statistics_table_from_files(task) for task in tasks]
+    else:
+        pool = multiprocessing.Pool(processes=num_processes)
+        try:
+            file_tables = pool.map(_tree_shape_statistics_table_from_files, tasks, 1)
+        finally:
+            pool.close()
+            pool.join()
+    table = collections.OrderedDict((stat, array.array("d")) for stat in statistics)
+    for file_table in file_tables:
+        for stat in statistics:
+            table[stat].extend(file_table[stat])
+    return table
+
+def _tree_shape_statistics_table_from_files(task):
+    # (module-level, so that it can be run by worker processes)
+    files, schema, statistics, colless_normalize, sackin_normalize, ultrametricity_precision, kwargs = task
+    return tree_shape_statistics_table(
+            dendropy.Tree.yield_from_files(files, schema, **kwargs),
+            statistics=statistics,
+            colless_normalize=colless_normalize,
+            sackin_normalize=sackin_normalize,
+            ultrametricity_precision=ultrametricity_precision)
+
+def _calc_node_age(nd, child_values, ultrametricity_precision):
+    # Age of a node given the (number of leaves, maximum number of nodes to a
+    # leaf, age) values of its child nodes, calculated as by
+    # `Tree.calc_node_ages()`, but without storing it on the node.
+    child_nodes = nd._child_nodes
+    first_child_length = child_nodes[0].edge.length
+    age = child_values[0][2]
+    if first_child_length is not None:
+        age += first_child_length
+    for ch, ch_values in zip(child_nodes[1:], child_values[1:]):
+        ch_length = ch.edge.length
+        if ch_length is None:
+            ch_length = 0.0
+        deviance = abs(age - (ch_values[2] + ch_length))
+        if deviance > ultrametricity_precision:
+            raise dendropy.UltrametricityError(
+                    ("Tree is not ultrametric within threshold of {threshold}: {deviance}.\n"
+                     "Encountered in subtree of node {node}: child node {child} has age of {child_age} and edge length of {length}, "
+                     "resulting in parent node age of {age} instead of {expected_age}").format(
+                threshold=ultrametricity_precision,
+                deviance=deviance,
+                node=nd,
+                child=ch,
+                child_age=ch_values[2],
+                length=ch.edge.length,
+                age=ch_values[2] + ch_length,
+                expected_age=age))
+    return age
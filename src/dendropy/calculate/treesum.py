@@ -384,9 +384,10 @@ class TopologyCounter(object):
 
     def hash_topology(tree):
         """
-        Set of all splits on tree: default topology hash.
+        Sorted tuple of the bitmasks of all splits on tree: default topology
+        hash (see :meth:`Tree.topology_fingerprint()`).
         """
-        return frozenset(tree.bipartition_encoding)
+        return tree.topology_fingerprint(is_bipartitions_updated=True)
     hash_topology = staticmethod(hash_topology)
 
     def __init__(self):
@@ -444,8 +445,8 @@ class TopologyCounter(object):
         hash_freqs = self.calc_hash_freqs()
         tree_freqs = collections.OrderedDict()
         for topology_hash, (count, freq) in hash_freqs.items():
-            tree = dendropy.Tree.from_bipartition_encoding(
-                bipartition_encoding=topology_hash,
+            tree = dendropy.Tree.from_split_bitmasks(
+                split_bitmasks=topology_hash,
                 taxon_namespace=taxon_namespace,
                 is_rooted=is_rooted)
             tree_freqs[tree] = (count, freq)
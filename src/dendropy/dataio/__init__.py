@@ -17,7 +17,9 @@
 ##
 ##############################################################################
 
+import os
 import collections
+from dendropy.dataio import ioservice
 from dendropy.dataio import newickreader
 from dendropy.dataio import newickwriter
 from dendropy.dataio import newickyielder
@@ -31,7 +33,12 @@ from dendropy.dataio import nexmlwriter
 from dendropy.dataio import nexmlyielder
 from dendropy.dataio import phylipreader
 from dendropy.dataio import phylipwriter
+from dendropy.dataio import binaryalignmentreader
+from dendropy.dataio import binaryalignmentwriter
+from dendropy.datamodel import taxonmodel
 from dendropy.utility import container
+from dendropy.utility import textprocessing
+from dendropy.utility import filesys
 
 _IOServices = collections.namedtuple(
         "_IOServices",
@@ -48,6 +55,7 @@ _IO_SERVICE_REGISTRY["dnafasta"] = _IOServices(fastareader.DnaFastaReader, fasta
 _IO_SERVICE_REGISTRY["rnafasta"] = _IOServices(fastareader.RnaFastaReader, fastawriter.FastaWriter, None)
 _IO_SERVICE_REGISTRY["proteinfasta"] = _IOServices(fastareader.ProteinFastaReader, fastawriter.FastaWriter, None)
 _IO_SERVICE_REGISTRY["phylip"] = _IOServices(phylipreader.PhylipReader, phylipwriter.PhylipWriter, None)
+_IO_SERVICE_REGISTRY["dendropy-binary"] = _IOServices(binaryalignmentreader.BinaryAlignmentReader, binaryalignmentwriter.BinaryAlignmentWriter, None)
 
 def get_reader(schema, **kwargs):
     try:
@@ -90,6 +98,79 @@ def get_tree_yielder(
     except KeyError:
         raise NotImplementedError("'{}' is not a supported data yielding schema".format(schema))
 
+def open_tree_writer(
+        dest,
+        schema,
+        taxon_namespace=None,
+        label=None,
+        **kwargs):
+    """
+    Opens a |TreeStreamWriter| that writes trees to ``dest`` one at a time.
+
+    Any content that precedes the trees (e.g., for the NEXUS format, the
+    "TAXA" block and the "TRANSLATE" statement) is written immediately, and
+    the trees block is completed when the writer is closed. The writer is a
+    context manager, closing itself at exit.
+
+    Parameters
+    ----------
+    dest : str or file or file-like object
+        Path to the file, or stream opened for writing, to which trees will be
+        written. If a path is given, the file is created (or overwritten)
+        and closed when the writer is closed.
+    schema : str
+        Format of the output: "newick" or "nexus".
+    taxon_namespace : |TaxonNamespace|
+        The taxon namespace referenced by all the trees to be written. Required
+        for the NEXUS format, as the "TAXA" block and "TRANSLATE" statement
+        are written before any trees: the namespace must then already have
+        all the taxa of the trees, and must not change while they are
+        written. If not specified (Newick format only), a new namespace is
+        created.
+    label : str
+        Label for the block of trees (used for the "TITLE" of the NEXUS trees
+        block, if written).
+    \*\*kwargs : keyword arguments, optional
+        Keyword arguments passed to the schema writer (see
+        |TreeList.write|).
+
+    Returns
+    -------
+    w : |TreeStreamWriter|
+        The writer object.
+    """
+    try:
+        writer_type =_IO_SERVICE_REGISTRY[schema].writer
+        if writer_type is None:
+            raise KeyError
+    except KeyError:
+        raise NotImplementedError("'{}' is not a supported data writing schema".format(schema))
+    if writer_type._write_tree_stream_start is ioservice.DataWriter._write_tree_stream_start:
+        raise NotImplementedError("'{}' does not support incremental writing of trees".format(schema))
+    if taxon_namespace is None:
+        if writer_type is nexuswriter.NexusWriter:
+            raise TypeError("'taxon_namespace' must be specified when writing trees incrementally in '{}' format".format(schema))
+        taxon_namespace = taxonmodel.TaxonNamespace()
+    from dendropy.datamodel import treecollectionmodel
+    writer = writer_type(**kwargs)
+    tree_list = treecollectionmodel.TreeList(taxon_namespace=taxon_namespace, label=label)
+    if textprocessing.is_str_type(dest):
+        stream = filesys.open_text_file(os.path.expandvars(os.path.expanduser(dest)), "w")
+        close_stream = True
+    else:
+        stream = dest
+        close_stream = False
+    try:
+        return ioservice.TreeStreamWriter(
+                writer=writer,
+                stream=stream,
+                tree_list=tree_list,
+                close_stream=close_stream)
+    except:
+        if close_stream:
+            stream.close()
+        raise
+
 def register_service(schema, reader=None, writer=None, tree_yielder=None):
     global _IO_SERVICE_REGISTRY
     _IO_SERVICE_REGISTRY[schema] = _IOServices(reader, writer, tree_yielder)
@@ -0,0 +1,239 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Implementation of reader for binary alignment cache ("dendropy-binary") files.
+
+The file consists of:
+
+    - An 8-byte "magic number" identifying the format and version
+      (``BINARY_ALIGNMENT_MAGIC``).
+    - The size of the header in bytes, as an 8-byte unsigned little-endian
+      integer.
+    - The header: a UTF-8 encoded JSON object, with a list of matrix
+      descriptions under the key "matrices". Each of these gives the label
+      and data type of the matrix, the label of its taxon namespace, a table
+      of the states of the state alphabet (``[symbol, state denomination,
+      fundamental symbols]``), indexed by (file) state code, the character
+      subsets, and a list of ``[taxon label, offset, length]`` entries
+      locating each row of the matrix in the data section.
+    - The data section: the rows of each matrix, one byte per character,
+      with each byte being the state code of the character.
+
+Files are memory-mapped when possible while being read, and the data section
+is copied into memory in a single block before the map is closed, so that
+the file can be safely overwritten (e.g., by writing the matrix back to the
+same path) once reading is done. Sequences are decoded lazily: the codes of
+a row are only copied out of this block when first accessed.
+"""
+
+import json
+import mmap
+import struct
+from dendropy.dataio import ioservice
+from dendropy.utility.error import DataParseError
+
+BINARY_ALIGNMENT_MAGIC = b"DPYBIN\x00\x01"
+BINARY_ALIGNMENT_HEADER_SIZE_FORMAT = "<Q"
+
+class BinaryAlignmentRowSource(object):
+    """
+    Source of the character codes of a single row of a binary alignment
+    file, bound to a (lazily-loaded) character sequence. ``buffer`` is an
+    in-memory copy of (a section of) the file, and ``offset`` the position
+    of the row in it.
+    """
+
+    def __init__(self, buffer, offset, length, translation_table=None):
+        self.buffer = buffer
+        self.offset = offset
+        self.length = length
+        self.translation_table = translation_table
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo=None):
+        return self
+
+    def load(self, indices=None):
+        """
+        Returns a ``bytearray`` of the codes of the characters of this row,
+        or only those at the (0-based) indexes given by the set ``indices``.
+        Runs of consecutive indexes are copied in single slices.
+        """
+        buffer = self.buffer
+        start = self.offset
+        if indices is None:
+            codes = bytearray(buffer[start:start + self.length])
+        else:
+            codes = bytearray()
+            run_start = None
+            run_end = None
+            for idx in sorted(indices):
+                if idx < 0 or idx >= self.length:
+                    continue
+                if idx == run_end:
+                    run_end += 1
+                    continue
+                if run_start is not None:
+                    codes += buffer[start + run_start:start + run_end]
+                run_start = idx
+                run_end = idx + 1
+            if run_start is not None:
+                codes += buffer[start + run_start:start + run_end]
+        if self.translation_table is not None:
+            codes = codes.translate(self.translation_table)
+        return codes
+
+class BinaryAlignmentReader(ioservice.DataReader):
+    "Encapsulates loading of a binary alignment cache ('dendropy-binary') file."
+
+    def __init__(self, **kwargs):
+        """
+        Keyword Arguments
+        -----------------
+        data_type: str
+            Ignored: the type of data is given by the file.
+        """
+        ioservice.DataReader.__init__(self)
+        kwargs.pop("data_type", None)
+        self.check_for_unused_keyword_arguments(kwargs)
+
+    def _map_stream(self, stream):
+        """
+        Returns a read-only memory map of the file underlying ``stream`` or,
+        if ``stream`` is not backed by a file, its (binary) contents.
+        """
+        try:
+            fileno = stream.fileno()
+        except (AttributeError, ValueError, EnvironmentError):
+            fileno = None
+        if fileno is not None:
+            try:
+                return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+            except (ValueError, EnvironmentError):
+                pass
+        data = getattr(stream, "buffer", stream).read()
+        if not isinstance(data, bytes):
+            raise DataParseError(message="'dendropy-binary' data must be read from a file or binary stream", stream=stream)
+        return data
+
+    def _get_translation_table(self, state_specs, state_alphabet, stream):
+        """
+        Returns table for translating the state codes of the file to the
+        storage codes of ``state_alphabet``, or |None| if these are the same.
+        """
+        table = bytearray(range(256))
+        is_identity = True
+        for file_code, (symbol, state_denomination, fundamental_symbols) in enumerate(state_specs):
+            try:
+                if symbol is not None:
+                    state = state_alphabet[symbol]
+                else:
+                    try:
+                        state = state_alphabet.match_state(fundamental_symbols,
+                                state_denomination=state_denomination)
+                    except KeyError:
+                        if state_denomination == state_alphabet.AMBIGUOUS_STATE:
+                            state = state_alphabet.new_ambiguous_state(
+                                    symbol=None,
+                                    member_state_symbols=fundamental_symbols)
+                        else:
+                            state = state_alphabet.new_polymorphic_state(
+                                    symbol=None,
+                                    member_state_symbols=fundamental_symbols)
+            except KeyError:
+                raise DataParseError(message="State '{}' is not defined in the state alphabet".format(symbol or fundamental_symbols), stream=stream)
+            code = state_alphabet._get_state_storage_code(state)
+            if code is None:
+                raise DataParseError(message="Too many states in state alphabet", stream=stream)
+            table[file_code] = code
+            if code != file_code:
+                is_identity = False
+        if is_identity:
+            return None
+        return bytes(table)
+
+    def _read(self,
+            stream,
+            taxon_namespace_factory=None,
+            tree_list_factory=None,
+            char_matrix_factory=None,
+            state_alphabet_factory=None,
+            global_annotations_target=None):
+        buffer = self._map_stream(stream)
+        try:
+            return self._read_buffer(buffer,
+                    stream=stream,
+                    taxon_namespace_factory=taxon_namespace_factory,
+                    char_matrix_factory=char_matrix_factory)
+        finally:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+
+    def _read_buffer(self,
+            buffer,
+            stream,
+            taxon_namespace_factory,
+            char_matrix_factory):
+        header_size_size = struct.calcsize(BINARY_ALIGNMENT_HEADER_SIZE_FORMAT)
+        data_start = len(BINARY_ALIGNMENT_MAGIC) + header_size_size
+        if len(buffer) < data_start or buffer[:len(BINARY_ALIGNMENT_MAGIC)] != BINARY_ALIGNMENT_MAGIC:
+            raise DataParseError(message="Not a 'dendropy-binary' file (or unsupported version)", stream=stream)
+        header_size = struct.unpack(BINARY_ALIGNMENT_HEADER_SIZE_FORMAT,
+                buffer[len(BINARY_ALIGNMENT_MAGIC):data_start])[0]
+        try:
+            header = json.loads(buffer[data_start:data_start + header_size].decode("utf-8"))
+        except ValueError as e:
+            raise DataParseError(message="Invalid 'dendropy-binary' header: {}".format(e), stream=stream)
+        data_start += header_size
+        # the rows are copied out of the (memory-mapped) file in one block,
+        # as the map is closed once reading is done
+        data = buffer[data_start:]
+        char_matrices = []
+        for matrix_spec in header["matrices"]:
+            taxon_namespace = taxon_namespace_factory(label=matrix_spec["taxon_namespace_label"])
+            char_matrix = char_matrix_factory(
+                    matrix_spec["data_type"],
+                    label=matrix_spec["label"],
+                    taxon_namespace=taxon_namespace)
+            translation_table = self._get_translation_table(
+                    matrix_spec["states"],
+                    char_matrix.default_state_alphabet,
+                    stream)
+            for taxon_label, offset, length in matrix_spec["rows"]:
+                if offset + length > len(data):
+                    raise DataParseError(message="Truncated 'dendropy-binary' file: data for taxon '{}' is incomplete".format(taxon_label), stream=stream)
+                taxon = taxon_namespace.require_taxon(label=taxon_label)
+                seq = char_matrix.new_sequence(taxon)
+                seq._bind_character_codes_source(BinaryAlignmentRowSource(
+                    buffer=data,
+                    offset=offset,
+                    length=length,
+                    translation_table=translation_table))
+            for label, character_indices in matrix_spec["character_subsets"]:
+                char_matrix.new_character_subset(label=label,
+                        character_indices=character_indices)
+            char_matrices.append(char_matrix)
+        product = self.Product(
+                taxon_namespaces=None,
+                tree_lists=None,
+                char_matrices=char_matrices)
+        return product
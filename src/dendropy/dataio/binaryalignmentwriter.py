@@ -0,0 +1,111 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Implementation of writer for binary alignment cache ("dendropy-binary")
+files. See :mod:`dendropy.dataio.binaryalignmentreader` for a description
+of the format.
+"""
+
+import json
+import struct
+from dendropy.dataio import ioservice
+from dendropy.dataio.binaryalignmentreader import BINARY_ALIGNMENT_MAGIC
+from dendropy.dataio.binaryalignmentreader import BINARY_ALIGNMENT_HEADER_SIZE_FORMAT
+
+class BinaryAlignmentWriter(ioservice.DataWriter):
+    """
+    Formatter for binary alignment cache ('dendropy-binary') files.
+
+    Only matrices of characters with a fixed state alphabet (DNA, RNA,
+    nucleotide, protein, restriction sites, and infinite sites data) are
+    supported. Sequences, taxon labels, and character subsets are written,
+    but not character types or metadata annotations.
+    """
+
+    def __init__(self, **kwargs):
+        ioservice.DataWriter.__init__(self)
+        self.check_for_unused_keyword_arguments(kwargs)
+
+    def _compose_matrix_rows(self, char_matrix, offset, rows):
+        state_alphabet = getattr(char_matrix.character_sequence_type, "datatype_alphabet", None)
+        if state_alphabet is None:
+            raise TypeError("Only character matrices with fixed state alphabets (e.g., DNA or protein) can be written in the 'dendropy-binary' format")
+        row_index = []
+        for taxon in char_matrix:
+            seq = char_matrix[taxon]
+            codes = None
+            if getattr(seq, "datatype_alphabet", None) is state_alphabet:
+                codes = seq._character_codes
+            if codes is None:
+                codes = state_alphabet._get_storage_codes_for_states(list(seq))
+                if codes is None:
+                    raise ValueError("Sequence for taxon '{}' has values that are not states of the state alphabet".format(taxon.label))
+            row_index.append([taxon.label, offset, len(codes)])
+            rows.append(codes)
+            offset += len(codes)
+        # storage codes are assigned to states on demand, so the table of
+        # states is composed after all the sequences have been coded
+        state_specs = []
+        for state in state_alphabet._storage_code_states:
+            if state.symbol:
+                state_specs.append([state.symbol, state.state_denomination, None])
+            else:
+                state_specs.append([None, state.state_denomination, "".join(state.fundamental_symbols)])
+        matrix_spec = {
+            "label": char_matrix.label,
+            "data_type": char_matrix.data_type,
+            "taxon_namespace_label": char_matrix.taxon_namespace.label,
+            "states": state_specs,
+            "rows": row_index,
+            "character_subsets": [[label, sorted(character_subset.character_indices)]
+                for label, character_subset in char_matrix.character_subsets.items()],
+        }
+        return matrix_spec, offset
+
+    def _write(self,
+            stream,
+            taxon_namespaces=None,
+            tree_lists=None,
+            char_matrices=None,
+            global_annotations_target=None):
+        matrix_specs = []
+        rows = []
+        offset = 0
+        for char_matrix in char_matrices:
+            if (self.attached_taxon_namespace is not None
+                    and char_matrix.taxon_namespace is not self.attached_taxon_namespace):
+                continue
+            matrix_spec, offset = self._compose_matrix_rows(char_matrix, offset, rows)
+            matrix_specs.append(matrix_spec)
+        header = json.dumps({"matrices": matrix_specs}).encode("utf-8")
+        # text streams (e.g., opened by ``write(path=...)``) are written to
+        # through their underlying binary buffer
+        if hasattr(stream, "buffer"):
+            stream.flush()
+            stream = stream.buffer
+        try:
+            stream.write(BINARY_ALIGNMENT_MAGIC)
+        except TypeError:
+            raise TypeError("'dendropy-binary' data can only be written to a file or binary stream")
+        stream.write(struct.pack(BINARY_ALIGNMENT_HEADER_SIZE_FORMAT, len(header)))
+        stream.write(header)
+        for codes in rows:
+            stream.write(codes)
+        stream.flush()
@@ -28,6 +28,8 @@ from dendropy.utility import deprecate
 class FastaReader(ioservice.DataReader):
     "Encapsulates loading and parsing of a FASTA format file."
 
+    _WHITESPACE_BYTES = b" \t\r\n\x0b\x0c"
+
     def __init__(self, **kwargs):
         """
         Keyword Arguments
@@ -72,7 +74,8 @@ class FastaReader(ioservice.DataReader):
                     self.data_type,
                     label=None,
                     taxon_namespace=taxon_namespace)
-        symbol_state_map = char_matrix.default_state_alphabet.full_symbol_state_map
+        state_alphabet = char_matrix.default_state_alphabet
+        symbol_state_map = state_alphabet.full_symbol_state_map
         curr_vec = None
         curr_taxon = None
         for line_index, line in enumerate(stream):
@@ -90,6 +93,10 @@ class FastaReader(ioservice.DataReader):
             elif curr_vec is None:
                 raise DataParseError(message="FASTA error: Expecting a lines starting with > before sequences", line_num=line_index + 1, stream=stream)
             else:
+                if curr_vec._extend_from_symbol_string(state_alphabet, s,
+                        ignore_bytes=FastaReader._WHITESPACE_BYTES):
+                    continue
+                # slow path (e.g., to locate an unrecognized symbol)
                 states = []
                 for col_ind, c in enumerate(s):
                     c = c.strip()
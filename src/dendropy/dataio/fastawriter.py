@@ -58,15 +58,20 @@ class FastaWriter(ioservice.DataWriter):
             stream.write(">{}\n".format(taxon.label))
             seq = char_matrix[taxon]
             if self.wrap:
-                col_count = 0
-                for c in seq:
-                    if col_count == self.wrap_width:
-                        stream.write("\n")
-                        col_count = 0
-                    stream.write(str(c))
-                    col_count += 1
+                s = seq.symbols_as_string(sep="")
+                if len(s) == len(seq):
+                    # single-character symbols: wrap by slicing
+                    stream.write("\n".join(s[idx:idx+self.wrap_width] for idx in range(0, len(s), self.wrap_width)))
+                else:
+                    col_count = 0
+                    for c in seq.symbols_as_list():
+                        if col_count == self.wrap_width:
+                            stream.write("\n")
+                            col_count = 0
+                        stream.write(c)
+                        col_count += 1
             else:
-                s = "".join("{}".format(c) for c in seq)
+                s = seq.symbols_as_string(sep="")
                 stream.write("{}\n".format(s))
             stream.write("\n\n")
 
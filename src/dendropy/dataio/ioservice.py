@@ -23,6 +23,7 @@ import warnings
 from dendropy.datamodel import taxonmodel
 from dendropy.utility import deprecate
 from dendropy.utility import textprocessing
+from dendropy.utility import filesys
 if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
     from dendropy.utility.filesys import pre_py34_open as open
 
@@ -495,6 +496,171 @@ class DataWriter(IOService):
                 char_matrices=[char_matrix],
                 global_annotations_target=None)
 
+    def _write_tree_stream_start(self, stream, tree_list):
+        """
+        Deriving classes that support incremental writing of trees (see
+        |TreeStreamWriter|) should implement this method to write everything
+        that precedes the first tree statement to ``stream``.
+
+        Parameters
+        ----------
+
+        stream : file or file-like object
+            Destination for data.
+        tree_list : |TreeList| object
+            An (empty) |TreeList| that provides the taxon namespace, label,
+            annotations and comments of the block of trees that will be
+            written.
+
+        Returns
+        -------
+        t : set[|Taxon|] or |None|
+            The taxa declared by what was written (e.g., in the "TAXA" block
+            or "TRANSLATE" statement of the NEXUS format), to which the taxa of
+            the trees written are then restricted, or |None| if nothing
+            written depends on the taxa.
+
+        """
+        raise NotImplementedError
+
+    def _write_tree_stream_tree(self, stream, tree, tree_idx):
+        """
+        Deriving classes that support incremental writing of trees should
+        implement this method to write ``tree``, the ``tree_idx``-th tree
+        (0-based) of the block, to ``stream``.
+        """
+        raise NotImplementedError
+
+    def _write_tree_stream_end(self, stream, tree_list):
+        """
+        Deriving classes that support incremental writing of trees should
+        implement this method to write everything that follows the last tree
+        statement to ``stream``.
+        """
+        raise NotImplementedError
+
+###############################################################################
+## TreeStreamWriter
+
+class TreeStreamWriter(object):
+    """
+    Writes trees to a destination one at a time, so that arbitrarily large
+    collections of trees can be written without holding them in memory.
+
+    Anything that precedes the trees (e.g., the "TAXA" block and the
+    "TRANSLATE" statement in NEXUS format) is written when the writer is
+    opened, and anything that follows them (e.g., closing the "TREES" block)
+    when it is closed. As the taxa are then already written out, the taxon
+    namespace must have all the taxa of the trees to be written when the
+    writer is opened, and must not change while trees are being written.
+    Instances are usually obtained through
+    :func:`dendropy.dataio.open_tree_writer`, and used as context managers::
+
+        # Read the taxa (here, from the "TAXA" block preceding the first
+        # tree of the first file) before opening the writer
+        tns = dendropy.TaxonNamespace()
+        dendropy.Tree.get(path="run1.nex", schema="nexus", taxon_namespace=tns)
+        with dendropy.dataio.open_tree_writer(
+                "filtered.nex",
+                schema="nexus",
+                taxon_namespace=tns) as writer:
+            for tree in dendropy.Tree.yield_from_files(
+                    files=["run1.nex", "run2.nex"],
+                    schema="nexus",
+                    taxon_namespace=tns):
+                if tree.label.startswith("keep"):
+                    writer.write_tree(tree)
+
+    """
+
+    def __init__(self,
+            writer,
+            stream,
+            tree_list,
+            close_stream=False):
+        """
+        Parameters
+        ----------
+        writer : ``DataWriter`` object
+            A writer that implements the incremental tree writing protocol.
+        stream : file or file-like object
+            Destination for data.
+        tree_list : |TreeList| object
+            An (empty) |TreeList| that provides the taxon namespace, label,
+            annotations and comments of the block of trees to be written. Trees
+            written must reference the same taxon namespace as this.
+        close_stream : bool
+            If |True|, then ``stream`` will be closed when this writer is
+            closed.
+        """
+        self.writer = writer
+        self.stream = stream
+        self.tree_list = tree_list
+        self.close_stream = close_stream
+        self.num_trees_written = 0
+        self.is_closed = False
+        self._header_taxa = self.writer._write_tree_stream_start(self.stream, self.tree_list)
+        self._header_taxon_namespace_size = len(self.tree_list.taxon_namespace)
+
+    def _get_taxon_namespace(self):
+        return self.tree_list.taxon_namespace
+    taxon_namespace = property(_get_taxon_namespace)
+
+    def write_tree(self, tree):
+        """
+        Writes ``tree`` to the destination.
+
+        Raises ``ValueError`` if the taxa already written out (e.g., in the
+        "TAXA" block of the NEXUS format) are inconsistent with ``tree``: i.e.,
+        if the taxon namespace has changed since the writer was opened, or if
+        ``tree`` has a taxon that was not written out.
+        """
+        if self.is_closed:
+            raise ValueError("Writing tree to closed writer")
+        if tree.taxon_namespace is not self.tree_list.taxon_namespace:
+            raise ValueError("Tree does not reference the same taxon namespace as the writer")
+        if self._header_taxa is not None:
+            if len(self.tree_list.taxon_namespace) != self._header_taxon_namespace_size:
+                raise ValueError("Taxon namespace has changed since the writer was opened: expecting {} taxa but found {}".format(
+                    self._header_taxon_namespace_size,
+                    len(self.tree_list.taxon_namespace)))
+            for nd in tree:
+                if nd.taxon is not None and nd.taxon not in self._header_taxa:
+                    raise ValueError("Tree has taxon not written out when the writer was opened: {}".format(nd.taxon))
+        self.writer._write_tree_stream_tree(self.stream, tree, self.num_trees_written)
+        self.num_trees_written += 1
+
+    def write_trees(self, trees):
+        """
+        Writes each tree in the iterable ``trees`` to the destination. Trees
+        are consumed one at a time, so ``trees`` may be a generator.
+        """
+        for tree in trees:
+            self.write_tree(tree)
+
+    def close(self):
+        """
+        Completes the output and, if ``close_stream`` was specified, closes the
+        underlying stream. Calling this more than once has no effect.
+        """
+        if self.is_closed:
+            return
+        self.is_closed = True
+        try:
+            self.writer._write_tree_stream_end(self.stream, self.tree_list)
+            if hasattr(self.stream, "flush"):
+                self.stream.flush()
+        finally:
+            if self.close_stream:
+                self.stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
 ###############################################################################
 ## DataYielder
 
@@ -532,7 +698,7 @@ class DataYielder(IOService):
 
     def iterate_over_file(self, current_file):
         if textprocessing.is_str_type(current_file):
-            self._current_file = open(current_file, "r")
+            self._current_file = filesys.open_text_file(current_file)
             self._current_file_name = current_file
         else:
             self._current_file = current_file
@@ -555,6 +721,15 @@ class DataYielder(IOService):
 
 class TreeDataYielder(DataYielder):
 
+    # Schema under which files are indexed for random access to trees (see
+    # ``dendropy.dataio.treeindex``); |None| if not supported.
+    tree_index_schema = None
+
+    # Whether the implementation consults ``_select_next_tree()`` before
+    # building each tree, so that trees that are not selected can be skipped
+    # without being built.
+    is_tree_skipping_supported = False
+
     def __init__(self,
             files=None,
             taxon_namespace=None,
@@ -564,8 +739,136 @@ class TreeDataYielder(DataYielder):
         assert self.taxon_namespace is not None
         self.attached_taxon_namespace = self.taxon_namespace
         self.tree_type = tree_type
+        self.tree_offset = 0
+        self.tree_stride = 1
+        self.tree_index = None
+        self.collection_offset = None
+        self._reset_tree_selection()
 
     def tree_factory(self):
         return self.tree_type(taxon_namespace=self.taxon_namespace)
 
+    def select_trees(self,
+            tree_offset=None,
+            tree_stride=None,
+            tree_index=None,
+            collection_offset=None):
+        """
+        Restricts the trees yielded from each file to every ``tree_stride``-th
+        tree, starting with the tree at 0-based index ``tree_offset`` (e.g.,
+        to skip a burn-in and thin the sample). If ``collection_offset`` is
+        not |None|, then only trees from the collection (e.g., NEXUS "TREES"
+        block) with this 0-based index are yielded, and ``tree_offset`` is
+        the index of the tree within this collection.
+
+        For files given by path that have been indexed (see
+        ``dendropy.dataio.treeindex``), only the selected trees are read. If
+        ``tree_index`` is |True|, then files are indexed if they have not
+        already been, while if it is |False|, indexes are not used. Otherwise,
+        the trees that are not selected are skipped over without being built
+        (or, for schemas that do not support this, are built and discarded).
+        """
+        if tree_offset is None:
+            tree_offset = 0
+        if tree_stride is None:
+            tree_stride = 1
+        if tree_offset < 0:
+            raise ValueError("Tree offset must be non-negative: {}".format(tree_offset))
+        if tree_stride < 1:
+            raise ValueError("Tree stride must be positive: {}".format(tree_stride))
+        if collection_offset is not None and collection_offset < 0:
+            raise ValueError("Collection offset must be non-negative: {}".format(collection_offset))
+        self.tree_offset = tree_offset
+        self.tree_stride = tree_stride
+        self.tree_index = tree_index
+        self.collection_offset = collection_offset
+
+    def _is_tree_selection_active(self):
+        return (self.tree_offset != 0
+                or self.tree_stride != 1
+                or self.collection_offset is not None)
+
+    def _reset_tree_selection(self):
+        self._num_candidate_trees = 0
+        self._num_tree_collections = 0
+
+    def _get_num_tree_collections(self):
+        """
+        Number of tree collections with at least one tree encountered so far
+        in the current file.
+        """
+        return self._num_tree_collections
+    num_tree_collections = property(_get_num_tree_collections)
 
+    def _select_next_tree(self, collection_index=0):
+        """
+        Called by implementations (that support skipping trees) for each tree
+        statement encountered, before building the tree; returns |True| if
+        the tree is to be built and yielded, or |False| if it is to be
+        skipped.
+        """
+        if collection_index >= self._num_tree_collections:
+            self._num_tree_collections = collection_index + 1
+        if self.collection_offset is not None and collection_index != self.collection_offset:
+            return False
+        tree_idx = self._num_candidate_trees
+        self._num_candidate_trees += 1
+        return tree_idx >= self.tree_offset and (tree_idx - self.tree_offset) % self.tree_stride == 0
+
+    def iterate_over_stream(self, stream):
+        """
+        Iterates over the (selected) trees in ``stream``, which, unlike the
+        sources given by ``files``, is left open.
+        """
+        self._reset_tree_selection()
+        trees = self._yield_items_from_stream(stream=stream)
+        if self.is_tree_skipping_supported or not self._is_tree_selection_active():
+            return trees
+        return (tree for tree in trees if self._select_next_tree())
+
+    def iterate_over_file(self, current_file):
+        self._reset_tree_selection()
+        if not self._is_tree_selection_active() and not self.tree_index:
+            for item in DataYielder.iterate_over_file(self, current_file):
+                yield item
+            return
+        index = None
+        if (self.tree_index is not False
+                and self.tree_index_schema is not None
+                and textprocessing.is_str_type(current_file)):
+            from dendropy.dataio import treeindex
+            index = treeindex.get_tree_file_index(current_file,
+                    self.tree_index_schema,
+                    build=bool(self.tree_index))
+        if index is not None:
+            if self.collection_offset is None:
+                tree_indexes = range(len(index))
+            elif self.collection_offset < index.num_collections:
+                tree_indexes = index.collection_tree_indexes(self.collection_offset)
+            else:
+                tree_indexes = range(0)
+            tree_indexes = tree_indexes[self.tree_offset::self.tree_stride]
+            self._current_file = index.compose_source(tree_indexes)
+            self._current_file_name = current_file
+            # the composed source only has the selected trees
+            collection_offset = self.collection_offset
+            self.collection_offset = None
+            tree_offset, tree_stride = self.tree_offset, self.tree_stride
+            self.tree_offset, self.tree_stride = 0, 1
+            try:
+                with self._current_file:
+                    for item in self._yield_items_from_stream(stream=self._current_file):
+                        yield item
+            finally:
+                self.collection_offset = collection_offset
+                self.tree_offset, self.tree_stride = tree_offset, tree_stride
+            self._num_tree_collections = index.num_collections
+            self._current_file = None
+            return
+        if self.is_tree_skipping_supported:
+            for item in DataYielder.iterate_over_file(self, current_file):
+                yield item
+            return
+        for item in DataYielder.iterate_over_file(self, current_file):
+            if self._select_next_tree():
+                yield item
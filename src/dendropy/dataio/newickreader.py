@@ -399,6 +399,31 @@ class NewickReader(ioservice.DataReader):
             current_token = nexus_tokenizer.next_token()
         return tree
 
+    def _skip_tree_statement(self, nexus_tokenizer):
+        """
+        Moves past a single tree statement without parsing it into a tree,
+        under the same expectations as ``_parse_tree_statement()``, and
+        leaving the tokenizer in the same state that it would. Returns |False|
+        if there is no tree statement to skip, |True| otherwise.
+        """
+        current_token = nexus_tokenizer.current_token
+        while (current_token == ";" or current_token is None) and not nexus_tokenizer.is_eof():
+            current_token = nexus_tokenizer.require_next_token()
+        nexus_tokenizer.clear_captured_comments()
+        if nexus_tokenizer.is_eof():
+            return False
+        if not nexus_tokenizer.skip_to_terminator(";"):
+            raise NewickReader.NewickReaderIncompleteTreeStatementError(
+                    message="Incomplete or improperly-terminated tree statement (end of stream reached instead of a semi-colon ';')",
+                    line_num=nexus_tokenizer.current_line_num,
+                    col_num=nexus_tokenizer.current_column_num,
+                    stream=nexus_tokenizer.src)
+        current_token = nexus_tokenizer.current_token
+        while current_token == ";" and not nexus_tokenizer.is_eof():
+            nexus_tokenizer.clear_captured_comments()
+            current_token = nexus_tokenizer.next_token()
+        return True
+
     def _process_tree_comments(self, tree, tree_comments, nexus_tokenizer):
         # NOTE: this also unconditionally sets the tree rootedness and
         # weighting if no comment indicating these are found; for this to work
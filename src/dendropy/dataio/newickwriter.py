@@ -119,6 +119,10 @@ class NewickWriter(ioservice.DataWriter):
             annotations. The format specifier should be given in Python's
             string format specification mini-language. E.g. ".8f", ".4E",
             "8.4f".
+        tree_write_batch_size : integer, default: 1000
+            Number of trees composed in memory before being written out to the
+            stream when writing a tree collection. Larger values result in
+            fewer (but larger) writes.
         ignore_unrecognized_keyword_arguments : boolean, default: |False|
             If |True|, then unsupported or unrecognized keyword arguments will
             not result in an error. Default is |False|: unsupported keyword
@@ -195,6 +199,8 @@ class NewickWriter(ioservice.DataWriter):
         self.real_value_format_specifier = kwargs.pop("real_value_format_specifier", self._real_value_format_specifier)
         if self.edge_label_compose_fn is None:
             self.edge_label_compose_fn = self._format_edge_length
+        self.tree_write_batch_size = kwargs.pop("tree_write_batch_size", 1000)
+        self._escaped_taxon_token_cache = {}
         self.check_for_unused_keyword_arguments(kwargs)
 
     def _get_taxon_tree_token(self, taxon):
@@ -239,9 +245,28 @@ class NewickWriter(ioservice.DataWriter):
         """
         Writes a |TreeList| in Newick schema to ``stream``.
         """
+        # Trees are composed as strings and written out in batches: a few
+        # large writes are much cheaper than many small ones when the
+        # collection is large.
+        batch = []
         for tree in tree_list:
-            self._write_tree(stream, tree)
-            stream.write("\n")
+            batch.append(self._compose_tree(tree))
+            if len(batch) >= self.tree_write_batch_size:
+                batch.append("")
+                stream.write("\n".join(batch))
+                batch = []
+        if batch:
+            batch.append("")
+            stream.write("\n".join(batch))
+        self._write_tree_stream_end(stream, tree_list)
+
+    def _write_tree_stream_start(self, stream, tree_list):
+        pass
+
+    def _write_tree_stream_tree(self, stream, tree, tree_idx):
+        stream.write(self._compose_tree(tree) + "\n")
+
+    def _write_tree_stream_end(self, stream, tree_list):
         # In Newick format, no clear way to distinguish between
         # annotations/comments associated with tree collection and
         # annotations/comments associated with first tree. So we place them at
@@ -262,6 +287,15 @@ class NewickWriter(ioservice.DataWriter):
         """
         Composes and writes ``tree`` to ``stream``.
         """
+        stream.write(self._compose_tree(tree))
+
+    def _compose_tree(self, tree):
+        """
+        Returns the Newick representation of ``tree`` as a string.
+
+        The tree statement is accumulated as a list of fragments in a single
+        (non-recursive) pass over the nodes, and joined once at the end.
+        """
         if tree.rooting_state_is_undefined or self.suppress_rooting:
             rooting = ""
         elif tree.is_rooted:
@@ -282,49 +316,60 @@ class NewickWriter(ioservice.DataWriter):
         else:
             annotation_comments = ""
         tree_comments = self._compose_comment_string(tree)
-        stream.write("{}{}{}{}".format(
-                rooting,
-                weight,
-                annotation_comments,
-                tree_comments,
-                ))
-        tree.apply(
-                before_fn=lambda x: self._write_node_open(x, stream),
-                after_fn=lambda x: self._write_node_close(x, stream),
-                leaf_fn=lambda x: self._write_leaf(x, stream),
-                )
-        stream.write(";")
-
-    def _write_node_open(self, node, out):
-        if node._parent_node is None or node._parent_node._child_nodes[0] is node:
-            out.write("(")
+        parts = [rooting, weight, annotation_comments, tree_comments]
+        compose_node_body = self._compose_node_body
+        seed_node = tree.seed_node
+        if not seed_node._child_nodes:
+            parts.append(compose_node_body(seed_node, True))
         else:
-            out.write(",(")
-
-    def _write_leaf(self, node, out):
-        if not (node._parent_node is None or node._parent_node._child_nodes[0] is node):
-            out.write(",")
-        self._write_node_body(node, out)
-
-    def _write_node_close(self, node, out):
-        out.write(")")
-        self._write_node_body(node, out)
+            parts.append("(")
+            # each stack entry is [node, index of next child to visit]
+            stack = [[seed_node, 0]]
+            while stack:
+                frame = stack[-1]
+                node = frame[0]
+                child_idx = frame[1]
+                child_nodes = node._child_nodes
+                if child_idx == len(child_nodes):
+                    stack.pop()
+                    parts.append(")")
+                    parts.append(compose_node_body(node, False))
+                    continue
+                frame[1] = child_idx + 1
+                if child_idx:
+                    parts.append(",")
+                child = child_nodes[child_idx]
+                if child._child_nodes:
+                    parts.append("(")
+                    stack.append([child, 0])
+                else:
+                    parts.append(compose_node_body(child, True))
+        parts.append(";")
+        return "".join(parts)
 
-    def _write_node_body(self, node, out):
-        out.write(self._render_node_tag(node))
-        if node.edge and node.edge.length != None and not self.suppress_edge_lengths:
-            out.write(":{}".format(self.edge_label_compose_fn(node.edge)))
+    def _compose_node_body(self, node, is_leaf):
+        """
+        Returns the label, edge length, annotations and comments of ``node``
+        as a string.
+        """
+        edge = node.edge
+        body = self._render_node_tag(node, is_leaf)
+        if edge and edge.length != None and not self.suppress_edge_lengths:
+            body = "{}:{}".format(body, self.edge_label_compose_fn(edge))
         if not self.suppress_annotations:
-            node_annotation_comments = nexusprocessing.format_item_annotations_as_comments(node,
-                    nhx=self.annotations_as_nhx,
-                    real_value_format_specifier=self.real_value_format_specifier)
-            out.write(node_annotation_comments)
-            edge_annotation_comments = nexusprocessing.format_item_annotations_as_comments(node.edge,
-                    nhx=self.annotations_as_nhx,
-                    real_value_format_specifier=self.real_value_format_specifier)
-            out.write(edge_annotation_comments)
-        out.write(self._compose_comment_string(node))
-        out.write(self._compose_comment_string(node.edge))
+            # skip formatting altogether for the (usual) case of no annotations
+            if getattr(node, "_annotations", None):
+                body += nexusprocessing.format_item_annotations_as_comments(node,
+                        nhx=self.annotations_as_nhx,
+                        real_value_format_specifier=self.real_value_format_specifier)
+            if getattr(edge, "_annotations", None):
+                body += nexusprocessing.format_item_annotations_as_comments(edge,
+                        nhx=self.annotations_as_nhx,
+                        real_value_format_specifier=self.real_value_format_specifier)
+        if not self.suppress_item_comments:
+            body += self._compose_comment_string(node)
+            body += self._compose_comment_string(edge)
+        return body
 
     def _compose_comment_string(self, item):
         if not self.suppress_item_comments and item.comments:
@@ -338,54 +383,53 @@ class NewickWriter(ioservice.DataWriter):
             item_comment_str = ""
         return item_comment_str
 
-    def _render_node_tag(self, node):
+    def _render_node_tag(self, node, is_leaf=None):
         """
         Based on current settings, the attributes of a node, and
         whether or not the node is a leaf, returns an appropriate tag.
         """
-        tag = None
         if self.node_label_compose_fn:
             tag = self.node_label_compose_fn(node)
+            if tag:
+                return self._escape_tag(tag)
+            return ""
+        if is_leaf is None:
+            is_leaf = len(node._child_nodes) == 0
+        if is_leaf:
+            suppress_taxon_label = self.suppress_leaf_taxon_labels
+            suppress_node_label = self.suppress_leaf_node_labels
         else:
-            tag_parts = []
-            is_leaf = len(node.child_nodes()) == 0
-            if is_leaf:
-                if hasattr(node, 'taxon') \
-                        and node.taxon \
-                        and node.taxon.label is not None \
-                        and not self.suppress_leaf_taxon_labels:
-                    tag_parts.append(self._get_taxon_tree_token(node.taxon))
-                if hasattr(node, 'label') \
-                        and node.label \
-                        and node.label is not None \
-                        and not self.suppress_leaf_node_labels:
-                    tag_parts.append(str(node.label))
-                if len(tag_parts) > 0:
-                    tag = self.node_label_element_separator.join(tag_parts)
-                else:
-                    return "" # anonymous leaf
-            else:
-                if hasattr(node, 'taxon') \
-                        and node.taxon \
-                        and node.taxon.label is not None \
-                        and not self.suppress_internal_taxon_labels:
-                    tag_parts.append(self._get_taxon_tree_token(node.taxon))
-                if hasattr(node, 'label') \
-                        and node.label \
-                        and node.label is not None \
-                        and not self.suppress_internal_node_labels:
-                    tag_parts.append(str(node.label))
-                if len(tag_parts) > 0:
-                    tag = self.node_label_element_separator.join(tag_parts)
-                else:
-                    return ""
-        if tag:
-            tag = nexusprocessing.escape_nexus_token(tag,
-                    preserve_spaces=self.preserve_spaces,
-                    quote_underscores=not self.unquoted_underscores)
-            return tag
+            suppress_taxon_label = self.suppress_internal_taxon_labels
+            suppress_node_label = self.suppress_internal_node_labels
+        taxon = node.taxon
+        if taxon is not None and taxon.label is not None and not suppress_taxon_label:
+            taxon_token = self._get_taxon_tree_token(taxon)
         else:
+            taxon_token = None
+        if node.label and not suppress_node_label:
+            if taxon_token is not None:
+                tag = self.node_label_element_separator.join([taxon_token, str(node.label)])
+            else:
+                tag = str(node.label)
+            if tag:
+                return self._escape_tag(tag)
+            return ""
+        if not taxon_token:
             return ""
+        # Taxon tokens recur in every tree written, so their escaped forms
+        # are cached.
+        key = (taxon_token, self.preserve_spaces, self.unquoted_underscores)
+        try:
+            return self._escaped_taxon_token_cache[key]
+        except KeyError:
+            tag = self._escape_tag(taxon_token)
+            self._escaped_taxon_token_cache[key] = tag
+            return tag
+
+    def _escape_tag(self, tag):
+        return nexusprocessing.escape_nexus_token(tag,
+                preserve_spaces=self.preserve_spaces,
+                quote_underscores=not self.unquoted_underscores)
 
     # def _compose_node(self, node):
     #     """
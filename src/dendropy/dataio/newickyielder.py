@@ -28,6 +28,9 @@ from dendropy.dataio import nexusprocessing
 
 class NewickTreeDataYielder(ioservice.TreeDataYielder):
 
+    tree_index_schema = "newick"
+    is_tree_skipping_supported = True
+
     def __init__(self,
             files=None,
             taxon_namespace=None,
@@ -66,6 +69,10 @@ class NewickTreeDataYielder(ioservice.TreeDataYielder):
                 enable_lookup_by_taxon_number=False,
                 case_sensitive=self.newick_reader.case_sensitive_taxon_labels)
         while True:
+            if not self._select_next_tree():
+                if not self.newick_reader._skip_tree_statement(nexus_tokenizer):
+                    break
+                continue
             tree = self.newick_reader._parse_tree_statement(
                     nexus_tokenizer=nexus_tokenizer,
                     tree_factory=self.tree_factory,
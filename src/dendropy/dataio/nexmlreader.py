@@ -130,6 +130,8 @@ class _AnnotationParser(object):
 
 class NexmlElement(xmlprocessing.XmlElement):
 
+    type_parse_pattern = re.compile(r"([A-Za-z0-9]+?):(.+)")
+
     def __init__(self, element, default_namespace=None):
         # if default_namespace is None:
         #     default_namespace = NexmlReader.DEFAULT_NEXML_NAMESPACE
@@ -138,7 +140,6 @@ class NexmlElement(xmlprocessing.XmlElement):
         xmlprocessing.XmlElement.__init__(self,
                 element=element,
                 default_namespace=default_namespace)
-        self.type_parse_pattern = re.compile(r"([A-Za-z0-9]+?):(.+)")
 
     ## Annotations ##
 
@@ -349,38 +350,41 @@ class NexmlReader(ioservice.DataReader, _AnnotationParser):
 
     def _parse_taxon_namespaces(self, xml_root):
         for nxtaxa in xml_root.iter_otus():
-            taxon_namespace_label = nxtaxa.get('label', None)
-            taxon_namespace = self._new_taxon_namespace(label=taxon_namespace_label)
-            taxon_namespace_id = nxtaxa.get('id', id(taxon_namespace))
-            self._id_taxon_namespace_map[taxon_namespace_id] = taxon_namespace
-            annotations = [i for i in nxtaxa.findall_annotations()]
+            self._parse_taxon_namespace(nxtaxa)
+
+    def _parse_taxon_namespace(self, nxtaxa):
+        taxon_namespace_label = nxtaxa.get('label', None)
+        taxon_namespace = self._new_taxon_namespace(label=taxon_namespace_label)
+        taxon_namespace_id = nxtaxa.get('id', id(taxon_namespace))
+        self._id_taxon_namespace_map[taxon_namespace_id] = taxon_namespace
+        annotations = [i for i in nxtaxa.findall_annotations()]
+        for annotation in annotations:
+            self._parse_annotations(taxon_namespace, annotation)
+        if self.case_sensitive_taxon_labels:
+            label_taxon_map = {}
+        else:
+            label_taxon_map = container.OrderedCaselessDict()
+        if self.attached_taxon_namespace is not None:
+            for t in taxon_namespace:
+                label_taxon_map[t.label] = t
+        for idx, nxtaxon in enumerate(nxtaxa.findall_otu()):
+            taxon = None
+            taxon_label = nxtaxon.get('label', None)
+            taxon_oid = nxtaxon.get('id', id(nxtaxon))
+            if taxon_label is not None and self.attached_taxon_namespace is not None:
+                # taxon = label_taxon_map.get_taxon(
+                #         label=taxon_label,
+                #         case_sensitive=self.case_sensitive_taxon_labels)
+                try:
+                    taxon = label_taxon_map[taxon_label]
+                except KeyError:
+                    taxon = None
+            if taxon is None:
+                taxon = taxon_namespace.new_taxon(label=taxon_label)
+            annotations = [i for i in nxtaxon.findall_annotations()]
             for annotation in annotations:
-                self._parse_annotations(taxon_namespace, annotation)
-            if self.case_sensitive_taxon_labels:
-                label_taxon_map = {}
-            else:
-                label_taxon_map = container.OrderedCaselessDict()
-            if self.attached_taxon_namespace is not None:
-                for t in taxon_namespace:
-                    label_taxon_map[t.label] = t
-            for idx, nxtaxon in enumerate(nxtaxa.findall_otu()):
-                taxon = None
-                taxon_label = nxtaxon.get('label', None)
-                taxon_oid = nxtaxon.get('id', id(nxtaxon))
-                if taxon_label is not None and self.attached_taxon_namespace is not None:
-                    # taxon = label_taxon_map.get_taxon(
-                    #         label=taxon_label,
-                    #         case_sensitive=self.case_sensitive_taxon_labels)
-                    try:
-                        taxon = label_taxon_map[taxon_label]
-                    except KeyError:
-                        taxon = None
-                if taxon is None:
-                    taxon = taxon_namespace.new_taxon(label=taxon_label)
-                annotations = [i for i in nxtaxon.findall_annotations()]
-                for annotation in annotations:
-                    self._parse_annotations(taxon, annotation)
-                self._id_taxon_map[(taxon_namespace_id, taxon_oid)] = taxon
+                self._parse_annotations(taxon, annotation)
+            self._id_taxon_map[(taxon_namespace_id, taxon_oid)] = taxon
 
     def _parse_char_matrices(self, xml_root):
         nxc = _NexmlCharBlockParser(self._namespace_registry,
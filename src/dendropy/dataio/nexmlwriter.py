@@ -124,6 +124,7 @@ class NexmlWriter(ioservice.DataWriter):
         self._taxon_namespaces_to_write = []
         self._taxon_namespace_id_map = {}
         self._object_xml_id = {}
+        self._nexml_id_count = 0
         self._taxon_id_map = {}
         self._node_id_map = {}
         self._state_alphabet_id_map = {}
@@ -316,40 +317,43 @@ class NexmlWriter(ioservice.DataWriter):
                 else:
                     # standard or continuous
                     separator = ' '
-                print_count = 1
+                # sequence is written in lines of 58 symbols, with each line
+                # composed in a single slice or join
+                symbols = None
+                if not separator:
+                    symbols = char_vector.symbols_as_string()
+                    if len(symbols) != len(char_vector):
+                        # some symbols are not single characters
+                        symbols = None
+                if symbols is None:
+                    symbols = char_vector.symbols_as_list()
+                    for cidx, symbol in enumerate(symbols):
+                        if not symbol:
+                            raise TypeError("Character %d in char_vector '%s' does not have a symbol defined for its character state:" % (cidx, char_vector.default_oid) \
+                                        + " this matrix cannot be written in sequence format (set 'markup_as_sequences' to False)'")
+                line_start = "\n{}".format(self.indent * (indent_level+4))
                 dest.write("{}<seq>".format(self.indent * (indent_level+3)))
-                for cidx, c in enumerate(char_vector):
-                    s = str(c)
-                    if not s:
-                        raise TypeError("Character %d in char_vector '%s' does not have a symbol defined for its character state:" % (cidx, char_vector.default_oid) \
-                                    + " this matrix cannot be written in sequence format (set 'markup_as_sequences' to False)'")
-                    if print_count == 1:
-                        dest.write("\n{}".format(self.indent * (indent_level+4)))
-                    else:
-                        dest.write(separator)
-                    dest.write(s)
-                    if print_count == 58:
-                        print_count = 1
-                    else:
-                        print_count += 1
+                dest.write("".join([line_start + separator.join(symbols[idx:idx+58]) for idx in range(0, len(symbols), 58)]))
                 dest.write("\n{}</seq>\n".format(self.indent * (indent_level+3)))
             else:
-                for col_idx, (char_value, cell_char_type, cell_annotations) in enumerate(char_vector.cell_iter()):
-                    parts = []
-                    parts.append('%s<cell' % (self.indent*(indent_level+3)))
-                    parts.append('char="%s"' % cell_char_type_id_map[ (taxon, col_idx) ])
-                    if char_matrix.data_type == "continuous":
+                cell_indent = self.indent*(indent_level+3)
+                is_continuous = char_matrix.data_type == "continuous"
+                state_id_map = self._state_id_map
+                cells = []
+                for char_type_id, (char_value, cell_char_type, cell_annotations) in zip(cell_char_type_id_map[taxon], char_vector.cell_iter()):
+                    if is_continuous:
                         v = str(char_value)
                     else:
-                        v = self._state_id_map[char_value]
-                    parts.append('state="%s"' % v)
-                    dest.write(' '.join(parts))
+                        v = state_id_map[char_value]
                     if cell_annotations is not None:
-                        dest.write('>\n')
+                        dest.write("".join(cells))
+                        cells = []
+                        dest.write('%s<cell char="%s" state="%s">\n' % (cell_indent, char_type_id, v))
                         self._write_annotation_set(cell_annotations, dest, indent_level=indent_level+4)
                         dest.write('%s</cell>' % (self.indent*(indent_level+3)))
                     else:
-                        dest.write('/>\n')
+                        cells.append('%s<cell char="%s" state="%s"/>\n' % (cell_indent, char_type_id, v))
+                dest.write("".join(cells))
             dest.write(self.indent * (indent_level+2))
             dest.write('</row>\n')
         dest.write("%s</matrix>\n" % (self.indent * (indent_level+1)))
@@ -376,18 +380,64 @@ class NexmlWriter(ioservice.DataWriter):
         if tree.has_annotations or (hasattr(tree, "comments") and tree.comments):
             self._write_annotations_and_comments(tree, dest,
                     indent_level=indent_level+1)
-        for node in tree.preorder_node_iter():
-            self._write_node(
-                    node=node,
-                    dest=dest,
-                    is_root=tree.is_rooted and node is tree.seed_node,
-                    indent_level=indent_level+1)
-        for edge in tree.preorder_edge_iter():
-            self._write_edge(
-                    edge=edge,
-                    dest=dest,
-                    is_root=tree.is_rooted and node is tree.seed_node,
-                    indent_level=indent_level+1)
+        # Node and edge elements of the tree are composed into a single string
+        # that is written in one go; elements with annotations or comments are
+        # written out individually. Node and edge ids are only referenced
+        # within the tree, and so are not retained once it has been written.
+        nodes = list(tree.preorder_node_iter())
+        root_node = tree.seed_node if tree.is_rooted else None
+        element_indent = self.indent * (indent_level+1)
+        new_nexml_id = self._new_nexml_id
+        node_id_map = {}
+        self._node_id_map = node_id_map
+        taxon_id_map = self._taxon_id_map
+        lines = []
+        for node in nodes:
+            if node.has_annotations or node.comments:
+                dest.write("".join(lines))
+                lines = []
+                self._write_node(
+                        node=node,
+                        dest=dest,
+                        is_root=node is root_node,
+                        indent_level=indent_level+1)
+                continue
+            node_id = new_nexml_id()
+            node_id_map[node] = node_id
+            parts = [element_indent, '<node id="', node_id, '"']
+            if node.label:
+                parts.append(' label=%s' % _protect_attr(node.label))
+            if node.taxon:
+                parts.append(' otu="%s"' % taxon_id_map[node.taxon])
+            if node is root_node:
+                parts.append(' root="true"')
+            parts.append(' />\n')
+            lines.append("".join(parts))
+        for node in nodes:
+            edge = node.edge
+            if edge.has_annotations or edge.comments:
+                dest.write("".join(lines))
+                lines = []
+                self._write_edge(
+                        edge=edge,
+                        dest=dest,
+                        is_root=node is root_node,
+                        indent_level=indent_level+1)
+                continue
+            if edge.tail_node is not None:
+                parts = [element_indent, '<edge id="', new_nexml_id(),
+                        '" source="', node_id_map[edge.tail_node],
+                        '" target="', node_id_map[node], '"']
+            else:
+                parts = [element_indent, '<rootedge id="', new_nexml_id(),
+                        '" target="', node_id_map[node], '"']
+            if edge.length is not None:
+                parts.append(' length="%s"' % edge.length)
+            if edge.label:
+                parts.append(' label=%s' % _protect_attr(edge.label))
+            parts.append(' />\n')
+            lines.append("".join(parts))
+        dest.write("".join(lines))
         dest.write('%s</tree>\n' % (self.indent * indent_level))
 
     def _write_to_nexml_open(self, dest, indent_level=0):
@@ -445,7 +495,7 @@ class NexmlWriter(ioservice.DataWriter):
         "Writes out a NEXML node element."
         parts = []
         parts.append('<node')
-        self._node_id_map[node] = self._get_nexml_id(node)
+        self._node_id_map[node] = self._new_nexml_id()
         parts.append('id="%s"' % self._node_id_map[node])
         if hasattr(node, 'label') and node.label:
             parts.append('label=%s' % _protect_attr(node.label))
@@ -473,7 +523,7 @@ class NexmlWriter(ioservice.DataWriter):
                 # EDGE-ON-ROOT:
                 tag = "rootedge"
                 parts.append('<%s' % tag)
-            parts.append('id="%s"' % self._get_nexml_id(edge))
+            parts.append('id="%s"' % self._new_nexml_id())
             # programmatically more efficent to do this in above
             # block, but want to maintain this tag order ...
             if edge.tail_node is not None:
@@ -529,7 +579,7 @@ class NexmlWriter(ioservice.DataWriter):
 
     def _compose_char_type_xml_for_continuous_type(self, indent_level, char_type_id=None):
         if char_type_id is None:
-            char_type_id = self._get_nexml_id(object())
+            char_type_id = self._new_nexml_id()
         s = ('%s<char id="%s" />'
             % ((self.indent*(indent_level)), char_type_id))
         return char_type_id, s
@@ -540,7 +590,7 @@ class NexmlWriter(ioservice.DataWriter):
         else:
             char_type_state = ' '
         if char_type_id is None:
-            char_type_id = self._get_nexml_id(object())
+            char_type_id = self._new_nexml_id()
         s = ('%s<char id="%s"%s/>'
             % ((self.indent*(indent_level)), char_type_id, char_type_state))
         return char_type_id, s
@@ -587,22 +637,29 @@ class NexmlWriter(ioservice.DataWriter):
                 format_section_parts.append('%s</states>' % (self.indent * (indent_level+1)))
         cell_char_type_id_map = {}
         char_type_ids_written = set()
+        is_continuous = char_matrix.data_type == "continuous"
+        sa = None
         for taxon in char_matrix:
             char_vector = char_matrix[taxon]
-            for col_idx, (char_value, cell_char_type, cell_annotations) in enumerate(char_vector.cell_iter()):
+            char_type_ids = []
+            for char_value, cell_char_type, cell_annotations in char_vector.cell_iter():
                 if cell_char_type is None:
-                    if char_matrix.data_type == "continuous":
+                    # each untyped cell gets its own (new) character definition
+                    if is_continuous:
                         char_type_id, char_type_xml = self._compose_char_type_xml_for_continuous_type(indent_level=indent_level+1)
                     else:
-                        sa = self._get_state_alphabet_for_char_matrix(char_matrix)
-                        assert sa is not None
+                        if sa is None:
+                            sa = self._get_state_alphabet_for_char_matrix(char_matrix)
+                            assert sa is not None
                         char_type_id, char_type_xml = self._compose_char_type_xml_for_state_alphabet(sa, indent_level=indent_level+1)
+                    format_section_parts.append(char_type_xml)
                 else:
                     char_type_id, char_type_xml = self._compose_char_type_xml_for_character_type(cell_char_type, indent_level=indent_level+1)
-                if char_type_id not in char_type_ids_written:
-                    format_section_parts.append(char_type_xml)
-                    char_type_ids_written.add(char_type_id)
-                cell_char_type_id_map[ (taxon, col_idx) ] = char_type_id
+                    if char_type_id not in char_type_ids_written:
+                        format_section_parts.append(char_type_xml)
+                        char_type_ids_written.add(char_type_id)
+                char_type_ids.append(char_type_id)
+            cell_char_type_id_map[taxon] = char_type_ids
         if format_section_parts:
             dest.write("%s<format>\n" % (self.indent*(indent_level)))
             dest.write(('\n'.join(format_section_parts)) + '\n')
@@ -613,10 +670,16 @@ class NexmlWriter(ioservice.DataWriter):
         try:
             return self._object_xml_id[o]
         except KeyError:
-            oid = "d{}".format(len(self._object_xml_id))
+            oid = self._new_nexml_id()
             self._object_xml_id[o] = oid
             return oid
 
+    def _new_nexml_id(self):
+        "Returns a new id that is not associated with any object."
+        oid = "d{}".format(self._nexml_id_count)
+        self._nexml_id_count += 1
+        return oid
+
     def _compose_annotation_xml(self,
             annote,
             indent="",
@@ -65,25 +65,54 @@ class NexmlTreeDataYielder(
     ## Implementation of DataYielder interface
 
     def _yield_items_from_stream(self, stream):
-        xml_doc = xmlprocessing.XmlDocument(file_obj=stream,
-                subelement_factory=self._subelement_factory)
-        self._namespace_registry = xml_doc.namespace_registry
-        xml_root = xml_doc.root
-        self._parse_taxon_namespaces(xml_root)
+        """
+        Trees are built and yielded as soon as the corresponding elements have
+        been parsed, after which the elements are discarded, so that at most
+        one tree of the document is held in memory at any time. Taxon
+        namespaces are parsed as their ("otus") elements are completed, which,
+        as required by the NeXML schema, precede any trees that reference
+        them.
+        """
+        self._namespace_registry = xmlprocessing.XmlNamespaces()
+        otus_tag = self._compose_nexml_tag("otus")
+        trees_tag = self._compose_nexml_tag("trees")
+        tree_tag = self._compose_nexml_tag("tree")
+        characters_tag = self._compose_nexml_tag("characters")
         tree_parser = nexmlreader._NexmlTreeParser(
                 id_taxon_map=self._id_taxon_map,
                 annotations_processor_fn=self._parse_annotations,
                 )
-        for trees_idx, trees_element in enumerate(xml_root.iter_trees()):
-            trees_id = trees_element.get('id', "Trees" + str(trees_idx))
-            trees_label = trees_element.get('label', None)
-            otus_id = trees_element.get('otus', None)
-            if otus_id is None:
-                raise Exception("Taxa block not specified for trees block '{}'".format(otus_id))
-            taxon_namespace = self._id_taxon_namespace_map.get(otus_id, None)
-            if not taxon_namespace:
-                raise Exception("Tree block '{}': Taxa block '{}' not found".format(trees_id, otus_id))
-            for tree_element in trees_element.findall_tree():
+        trees_idx = 0
+        trees_element = None
+        otus_id = None
+        for event, element in xmlprocessing.iterparse_elements(stream, self._namespace_registry):
+            if event == "start":
+                if element.tag == trees_tag:
+                    trees_element = element
+                    trees_id = trees_element.get('id', "Trees" + str(trees_idx))
+                    trees_idx += 1
+                    otus_id = trees_element.get('otus', None)
+                    if otus_id is None:
+                        raise Exception("Taxa block not specified for trees block '{}'".format(otus_id))
+                    taxon_namespace = self._id_taxon_namespace_map.get(otus_id, None)
+                    if not taxon_namespace:
+                        raise Exception("Tree block '{}': Taxa block '{}' not found".format(trees_id, otus_id))
+            elif element.tag == tree_tag and trees_element is not None:
                 tree_obj = self.tree_factory()
-                tree_parser.build_tree(tree_obj, tree_element, otus_id)
+                tree_parser.build_tree(tree_obj, self._subelement_factory(element), otus_id)
+                element.clear()
+                trees_element.remove(element)
                 yield tree_obj
+            elif element.tag == trees_tag:
+                trees_element = None
+                element.clear()
+            elif element.tag == otus_tag:
+                self._parse_taxon_namespace(self._subelement_factory(element))
+                element.clear()
+            elif element.tag == characters_tag:
+                element.clear()
+
+    def _compose_nexml_tag(self, tag):
+        if self.default_namespace:
+            return "{%s}%s" % (self.default_namespace, tag)
+        return tag
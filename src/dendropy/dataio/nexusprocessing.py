@@ -85,6 +85,7 @@ class NexusTokenizer(Tokenizer):
                 self.uncaptured_delimiters.append("\n")
             if "\r" not in self.uncaptured_delimiters:
                 self.uncaptured_delimiters.append("\r")
+        self._unquoted_token_special_chars = None
 
     def set_hyphens_as_captured_delimiters(self, hyphens_as_captured_delimiters):
         if hyphens_as_captured_delimiters:
@@ -95,6 +96,7 @@ class NexusTokenizer(Tokenizer):
                 self.captured_delimiters.remove("-")
             except ValueError:
                 pass
+        self._unquoted_token_special_chars = None
 
     def require_next_token_ucase(self):
         t = self.require_next_token()
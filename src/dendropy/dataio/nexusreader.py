@@ -1292,6 +1292,15 @@ class NexusReader(ioservice.DataReader):
             elif token == ";":
                 raise NexusReader.BlockTerminatedException
             else:
+                # Fast path: translate entire token in one pass if it consists
+                # solely of valid (non-MATCHCHAR) symbols and does not
+                # overflow the sequence
+                if self._match_char.isdisjoint(token):
+                    states = state_alphabet._get_states_for_symbol_string(token)
+                    if (states is not None
+                            and len(character_data_vector) + len(states_to_add) + len(states) <= self._file_specified_nchar):
+                        states_to_add.extend(states)
+                        continue
                 for c in token:
                     if c in self._match_char:
                         try:
@@ -230,22 +230,8 @@ class NexusWriter(ioservice.DataWriter):
             char_matrices=None,
             global_annotations_target=None):
 
-        # Header
-        stream.write('#NEXUS\n\n')
-
-        # File/Document-level annotations and comments
-        if self.file_comments:
-            self._write_comments(stream, self.file_comments)
-        if global_annotations_target is not None:
-            self._write_item_annotations(stream, global_annotations_target)
-            self._write_item_comments(stream, global_annotations_target)
-
-        # Other blocks
-        if self.preamble_blocks:
-            for block in self.preamble_blocks:
-                stream.write(block)
-                stream.write("\n")
-            stream.write("\n")
+        # Header, file-level annotations and comments, and preamble
+        self._write_preamble(stream, global_annotations_target)
 
         # Taxon namespace discovery
         candidate_taxon_namespaces = collections.OrderedDict()
@@ -290,11 +276,50 @@ class NexusWriter(ioservice.DataWriter):
                             tree_list=tree_list)
 
         # Write out remaining
+        self._write_supplemental_blocks(stream)
+
+    def _write_preamble(self, stream, global_annotations_target=None):
+        # Header
+        stream.write('#NEXUS\n\n')
+
+        # File/Document-level annotations and comments
+        if self.file_comments:
+            self._write_comments(stream, self.file_comments)
+        if global_annotations_target is not None:
+            self._write_item_annotations(stream, global_annotations_target)
+            self._write_item_comments(stream, global_annotations_target)
+
+        # Other blocks
+        if self.preamble_blocks:
+            for block in self.preamble_blocks:
+                stream.write(block)
+                stream.write("\n")
+            stream.write("\n")
+
+    def _write_supplemental_blocks(self, stream):
         if self.supplemental_blocks:
             for block in self.supplemental_blocks:
                 stream.write(block)
                 stream.write("\n")
 
+    def _write_tree_stream_start(self, stream, tree_list):
+        self._write_preamble(stream)
+        self.taxon_namespaces_to_write = [tree_list.taxon_namespace]
+        is_taxa_block_written = not self.simple and not self.suppress_taxa_blocks
+        if is_taxa_block_written:
+            self._write_taxa_block(stream, tree_list.taxon_namespace)
+        self._write_trees_block_start(stream, tree_list)
+        if is_taxa_block_written or self._newick_writer.taxon_token_map is not None:
+            return set(tree_list.taxon_namespace)
+        return None
+
+    def _write_tree_stream_tree(self, stream, tree, tree_idx):
+        self._write_tree_statement(stream, tree, tree_idx)
+
+    def _write_tree_stream_end(self, stream, tree_list):
+        self._write_trees_block_end(stream)
+        self._write_supplemental_blocks(stream)
+
     def _get_taxa_to_include(self, taxon_namespace):
         if not self.exclude_from_taxa_blocks:
             return list(taxon_namespace)
@@ -341,24 +366,33 @@ class NexusWriter(ioservice.DataWriter):
         stream.write("{}\n             ;\n".format(statement))
 
     def _write_trees_block(self, stream, tree_list):
+        self._write_trees_block_start(stream, tree_list)
+        for tree_idx, tree in enumerate(tree_list):
+            self._write_tree_statement(stream, tree, tree_idx)
+        self._write_trees_block_end(stream)
+
+    def _write_trees_block_start(self, stream, tree_list):
         stream.write("BEGIN TREES;\n")
         self._write_block_title(stream, tree_list)
         self._write_item_annotations(stream, tree_list)
         self._write_item_comments(stream, tree_list)
         self._write_link_to_taxa_block(stream, tree_list.taxon_namespace)
         self._set_and_write_translate_block(stream, tree_list.taxon_namespace)
-        for tree_idx, tree in enumerate(tree_list):
-            if tree.label:
-                tree_name = tree.label
-            else:
-                tree_name = str(tree_idx+1)
-            tree_name = nexusprocessing.escape_nexus_token(
-                    tree_name,
-                    preserve_spaces=self.preserve_spaces,
-                    quote_underscores=not self.unquoted_underscores)
-            stream.write("    TREE {} = ".format(tree_name))
-            self._newick_writer._write_tree(stream, tree)
-            stream.write("\n")
+
+    def _write_tree_statement(self, stream, tree, tree_idx):
+        if tree.label:
+            tree_name = tree.label
+        else:
+            tree_name = str(tree_idx+1)
+        tree_name = nexusprocessing.escape_nexus_token(
+                tree_name,
+                preserve_spaces=self.preserve_spaces,
+                quote_underscores=not self.unquoted_underscores)
+        stream.write("    TREE {} = {}\n".format(
+            tree_name,
+            self._newick_writer._compose_tree(tree)))
+
+    def _write_trees_block_end(self, stream):
         stream.write("END;\n\n")
 
     def _write_char_block(self, stream, char_matrix):
@@ -381,16 +415,23 @@ class NexusWriter(ioservice.DataWriter):
         stream.write("    DIMENSIONS{} NCHAR={};\n".format(ntaxstr, nchar))
         stream.write("    FORMAT {};\n".format(self._compose_format_terms(char_matrix)))
         stream.write("    MATRIX\n")
+        is_write_symbols = False
         if char_matrix.data_type == "continuous":
             state_value_writer = lambda x : stream.write("{} ".format(self.continuous_character_state_value_format_fn(x)))
         else:
             state_value_writer = lambda x : stream.write("{}".format(self.discrete_character_state_value_format_fn(x)))
+            # default formatting of discrete states is just their string
+            # representation, so the sequence can compose the entire row
+            is_write_symbols = self.discrete_character_state_value_format_fn == self._format_discrete_character_value
         max_label_len = max(len(v) for v in taxon_label_map.values())
         for taxon in char_matrix:
             stream.write("        {taxon_label:{field_len}}    ".format(taxon_label=taxon_label_map[taxon],
                 field_len=max_label_len))
-            for state in char_matrix[taxon]:
-                state_value_writer(state)
+            if is_write_symbols:
+                stream.write(char_matrix[taxon].symbols_as_string(sep=""))
+            else:
+                for state in char_matrix[taxon]:
+                    state_value_writer(state)
             stream.write("\n")
         stream.write("    ;\n")
         stream.write("END;\n\n\n")
@@ -33,6 +33,9 @@ class NexusTreeDataYielder(
         ioservice.TreeDataYielder,
         nexusreader.NexusReader):
 
+    tree_index_schema = "nexus"
+    is_tree_skipping_supported = True
+
     def __init__(self,
             files=None,
             taxon_namespace=None,
@@ -65,6 +68,18 @@ class NexusTreeDataYielder(
         self.exclude_chars = True
         self.exclude_trees = False
 
+    def _use_taxon_namespace_factory(self, taxon_namespace_factory):
+        """
+        Has "TAXA" blocks, and the taxa of trees, managed as by the full
+        `nexusreader.NexusReader` with ``taxon_namespace_factory`` (e.g., with
+        an error being raised for a "TAXA" block with taxa beyond the number
+        declared, or for a "TREES" block that is not linked to one of multiple
+        "TAXA" blocks), instead of all being merged into the attached taxon
+        namespace.
+        """
+        self.attached_taxon_namespace = None
+        self._taxon_namespace_factory = taxon_namespace_factory
+
     ###########################################################################
     ## Implementation of DataYielder interface
 
@@ -78,10 +93,14 @@ class NexusTreeDataYielder(
         if token.upper() != "#NEXUS":
             if self.assume_newick_if_not_nexus:
                 taxon_symbol_mapper = self._get_taxon_symbol_mapper(
-                        taxon_namespace=self.attached_taxon_namespace,
+                        taxon_namespace=self._get_taxon_namespace(),
                         enable_lookup_by_taxon_number=False,
                         )
                 while True:
+                    if not self._select_next_tree():
+                        if not self.newick_reader._skip_tree_statement(self._nexus_tokenizer):
+                            break
+                        continue
                     tree = self._build_tree_from_newick_tree_string(
                             tree_factory=self.tree_factory,
                             taxon_symbol_mapper=taxon_symbol_mapper)
@@ -129,8 +148,8 @@ class NexusTreeDataYielder(
         link_title = None
         taxon_namespace = None
         taxon_symbol_mapper = None
-        trees_block = None
         block_title = None
+        collection_index = None
         while ((not self._nexus_tokenizer.is_eof())
                 and token is not None
                 and token != 'END'
@@ -151,6 +170,8 @@ class NexusTreeDataYielder(
                     taxon_namespace = self._get_taxon_namespace(link_title)
                 if taxon_symbol_mapper is None:
                     taxon_symbol_mapper = self._get_taxon_symbol_mapper(taxon_namespace=taxon_namespace)
+                if collection_index is None:
+                    collection_index = self.num_tree_collections
                 pre_tree_comments = self._nexus_tokenizer.pull_captured_comments()
                 tree_factory = self.tree_factory
                 while True:
@@ -160,10 +181,17 @@ class NexusTreeDataYielder(
                     ## statement. Typically, this will be
                     ## 'TREE' if there is another tree, or
                     ## 'END'/'ENDBLOCK'.
-                    tree = self._parse_tree_statement(
-                            tree_factory=tree_factory,
-                            taxon_symbol_mapper=taxon_symbol_mapper)
-                    yield tree
+                    if self._select_next_tree(collection_index):
+                        tree = self._parse_tree_statement(
+                                tree_factory=tree_factory,
+                                taxon_symbol_mapper=taxon_symbol_mapper)
+                        yield tree
+                    else:
+                        self._nexus_tokenizer.skip_to_terminator(";")
+                        while (self._nexus_tokenizer.current_token == ";"
+                                and not self._nexus_tokenizer.is_eof()):
+                            self._nexus_tokenizer.clear_captured_comments()
+                            self._nexus_tokenizer.next_token()
                     if self._nexus_tokenizer.is_eof() or not self._nexus_tokenizer.current_token:
                         break
                     if self._nexus_tokenizer.cast_current_token_to_ucase() != "TREE":
@@ -177,6 +205,8 @@ class NexusTreeDataYielder(
 
 class NexusNewickTreeDataYielder(NexusTreeDataYielder):
 
+    tree_index_schema = "nexus/newick"
+
     def __init__(self,
             files=None,
             taxon_namespace=None,
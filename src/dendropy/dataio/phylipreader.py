@@ -227,7 +227,7 @@ class PhylipReader(ioservice.DataReader):
                         % (current_taxon.label, self.char_matrix[current_taxon]), line_index=line_index)
         return current_taxon, line
 
-    def _parse_sequence_from_line(self, current_taxon, line, line_index):
+    def _parse_sequence_from_line(self, current_taxon, line, line_index, line_offset=0):
         if self.data_type == "continuous":
             for c in line.split():
                 if not c:
@@ -241,15 +241,21 @@ class PhylipReader(ioservice.DataReader):
                 else:
                     self.char_matrix[current_taxon].append(state)
         else:
-            for c in line:
+            state_alphabet = self.char_matrix.default_state_alphabet
+            if self.char_matrix[current_taxon]._extend_from_symbol_string(state_alphabet, line,
+                    ignore_bytes=b" \t"):
+                return
+            # slow path (e.g., to locate invalid symbols)
+            for col_index, c in enumerate(line):
                 if c in [' ', '\t']:
                     continue
                 try:
-                    state = self.char_matrix.default_state_alphabet[c]
+                    state = state_alphabet[c]
                 except KeyError:
                     if not self.ignore_invalid_chars:
                         raise self._data_parse_error("Invalid state symbol for taxon '%s': '%s'" % (current_taxon.label, c),
-                                line_index=line_index)
+                                line_index=line_index,
+                                col_index=col_index + line_offset)
                 else:
                     self.char_matrix[current_taxon].append(state)
 
@@ -260,13 +266,14 @@ class PhylipReader(ioservice.DataReader):
             line = line.rstrip()
             if line == '':
                 continue
+            line_length = len(line)
             if current_taxon is None:
                 seq_label = None
                 current_taxon, line = self._parse_taxon_from_line(line, line_index)
                 # if current_taxon not in self.char_matrix and len(self.char_matrix.taxon_namespace) >= self.ntax:
                 #     raise self._data_parse_error("Cannot add new sequence %s: declared number of sequences (%d) already defined" \
                 #                 % (current_taxon, len(self.char_matrix.taxon_namespace)), line_index=line_index)
-            self._parse_sequence_from_line(current_taxon, line, line_index)
+            self._parse_sequence_from_line(current_taxon, line, line_index, line_length - len(line))
             if len(self.char_matrix[current_taxon]) >= self.nchar:
                 current_taxon = None
 
@@ -283,6 +290,7 @@ class PhylipReader(ioservice.DataReader):
             paged_row += 1
             if paged_row >= self.ntax:
                 paged_row = 0
+            line_length = len(line)
             if paged:
                 current_taxon = self.char_matrix.taxon_namespace[paged_row]
             else:
@@ -290,13 +298,17 @@ class PhylipReader(ioservice.DataReader):
                 if len(self.char_matrix.taxon_namespace) == self.ntax:
                     paged = True
                     paged_row = -1
-            self._parse_sequence_from_line(current_taxon, line, line_index)
+            self._parse_sequence_from_line(current_taxon, line, line_index, line_length - len(line))
 
-    def _data_parse_error(self, message, line_index=None):
+    def _data_parse_error(self, message, line_index=None, col_index=None):
         if line_index is None:
             row = None
         else:
             row = line_index + 2
+        if col_index is None:
+            col = None
+        else:
+            col = col_index + 1
         if self.strict and self.interleaved:
             error_type = PhylipReader.PhylipStrictInterleavedError
         elif self.strict:
@@ -305,5 +317,5 @@ class PhylipReader(ioservice.DataReader):
             error_type = PhylipReader.PhylipRelaxedInterleavedError
         else:
             error_type = PhylipReader.PhylipStrictSequentialError
-        return error_type(message, line_num=row, stream=self.stream)
+        return error_type(message, line_num=row, col_num=col, stream=self.stream)
 
@@ -17,12 +17,74 @@
 ##
 ##############################################################################
 
+import re
 import sys
 from dendropy.utility import error
 
+##############################################################################
+## ScanningStreamBuffer
+
+class ScanningStreamBuffer(object):
+    """
+    Wraps a stream, reading it in chunks, so that the chunks can be scanned
+    in bulk (e.g., using ``str.find()``) while still supporting reading
+    character-by-character from the current position.
+    """
+
+    def __init__(self, src, chunk_size=65536):
+        self.src = src
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+
+    def __getattr__(self, name):
+        return getattr(self.src, name)
+
+    def read(self, size=-1):
+        if size == 1 and self.pos < len(self.buffer):
+            c = self.buffer[self.pos]
+            self.pos += 1
+            return c
+        if size is None or size < 0:
+            s = self.buffer[self.pos:] + self.src.read()
+            self.buffer = ""
+            self.pos = 0
+            return s
+        while len(self.buffer) - self.pos < size and self.fill():
+            pass
+        s = self.buffer[self.pos:self.pos+size]
+        self.pos += len(s)
+        return s
+
+    def unread(self, s):
+        """
+        Pushes ``s``, the string most recently read, back onto the buffer.
+        """
+        if self.pos >= len(s) and self.buffer[self.pos-len(s):self.pos] == s:
+            self.pos -= len(s)
+        else:
+            self.buffer = s + self.buffer[self.pos:]
+            self.pos = 0
+
+    def fill(self):
+        """
+        Appends the next chunk of the stream to the unread part of the buffer,
+        returning |False| if the stream is exhausted.
+        """
+        chunk = self.src.read(self.chunk_size)
+        if not chunk:
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
 ##############################################################################
 ## Tokenizer
 
+# compiled patterns matching the characters of interest when skipping to a
+# terminator, keyed by these characters
+_SKIP_PATTERNS = {}
+
 class Tokenizer(object):
     """
     Stream tokenizer.
@@ -90,6 +152,11 @@ class Tokenizer(object):
         self.capture_comments = capture_comments
         self.preserve_unquoted_underscores = preserve_unquoted_underscores
 
+        # Characters that end (or need special handling within) an unquoted
+        # token; derived from the above on demand, and must be reset if the
+        # delimiters are modified
+        self._unquoted_token_special_chars = None
+
         # State (internals)
         self.src = src
         self._cur_char = None
@@ -224,8 +291,11 @@ class Tokenizer(object):
             self.token_column_num = self.current_column_num
             dest = []
             self.is_token_quoted = False
+            special_chars = self._get_unquoted_token_special_chars()
             while self._cur_char != "":
-                if self._cur_char in self.uncaptured_delimiters:
+                if self._cur_char not in special_chars:
+                    self._read_plain_chars(dest, special_chars)
+                elif self._cur_char in self.uncaptured_delimiters:
                     self._get_next_char()
                     break
                 elif self._cur_char in self.captured_delimiters:
@@ -249,6 +319,93 @@ class Tokenizer(object):
             return self.current_token
     next = __next__ # Python 2 legacy support
 
+    def skip_to_terminator(self, terminator=";"):
+        """
+        Moves past the next ``terminator`` character that is not part of a
+        quoted token or a comment, without tokenizing (or capturing comments
+        from) the characters in between. This is much faster than repeatedly
+        calling ``next_token()``, e.g. to skip over statements that are not
+        needed. Returns |False| if the end of the stream was reached without
+        finding ``terminator``, |True| otherwise.
+
+        After this, the current token is ``terminator``, and the next token
+        to be read is the one immediately following it.
+        """
+        if self._cur_char == "":
+            return False
+        if not isinstance(self.src, ScanningStreamBuffer):
+            self.src = ScanningStreamBuffer(self.src)
+        src = self.src
+        num_lines = 0
+        if self._cur_char is not None:
+            src.unread(self._cur_char)
+            if self._cur_char == "\n":
+                # already counted
+                num_lines = -1
+        special_chars = terminator + self.quote_chars + self.comment_begin + self.comment_end
+        try:
+            pattern = _SKIP_PATTERNS[special_chars]
+        except KeyError:
+            pattern = re.compile("[{}]".format(re.escape(special_chars)))
+            _SKIP_PATTERNS[special_chars] = pattern
+        nesting = 0
+        quote_char = None
+        is_terminated = False
+        while True:
+            buf = src.buffer
+            start = src.pos
+            if quote_char is not None:
+                end = buf.find(quote_char, start)
+            else:
+                m = pattern.search(buf, start)
+                end = m.start() if m is not None else -1
+            if end < 0:
+                num_lines += buf.count("\n", start)
+                src.pos = len(buf)
+                if not src.fill():
+                    break
+                continue
+            num_lines += buf.count("\n", start, end)
+            src.pos = end + 1
+            c = buf[end]
+            if quote_char is not None:
+                if self.escape_quote_by_doubling:
+                    if src.pos == len(buf):
+                        src.fill()
+                    if src.buffer[src.pos:src.pos+1] == quote_char:
+                        src.pos += 1
+                        continue
+                quote_char = None
+            elif c in self.comment_begin:
+                nesting += 1
+            elif c in self.comment_end:
+                if nesting > 0:
+                    nesting -= 1
+            elif nesting > 0:
+                pass
+            elif c in self.quote_chars:
+                quote_char = c
+            else:
+                is_terminated = True
+                break
+        if quote_char is not None:
+            raise Tokenizer.UnterminatedQuoteError(
+                    quote_char=quote_char,
+                    line_num=self.current_line_num + num_lines,
+                    col_num=None,
+                    stream=src)
+        if num_lines > 0:
+            self.current_line_num += num_lines
+            self.current_column_num = 0
+        self.is_token_quoted = False
+        if is_terminated:
+            self.current_token = terminator
+            self._get_next_char()
+        else:
+            self.current_token = None
+            self._cur_char = ""
+        return is_terminated
+
     def _skip_to_significant_char(self):
         if self._cur_char == "":
             return
@@ -260,6 +417,41 @@ class Tokenizer(object):
             self._get_next_char()
         return
 
+    def _get_unquoted_token_special_chars(self):
+        if self._unquoted_token_special_chars is None:
+            special_chars = set(self.uncaptured_delimiters)
+            special_chars.update(self.captured_delimiters)
+            special_chars.update(self.comment_begin)
+            special_chars.add("_")
+            self._unquoted_token_special_chars = frozenset(special_chars)
+        return self._unquoted_token_special_chars
+
+    def _read_plain_chars(self, dest, special_chars):
+        """
+        Appends the current character and all immediately following characters
+        that are not in ``special_chars`` to ``dest``, leaving the tokenizer
+        positioned at the first character (if any) that is. Equivalent to (but
+        much faster than) calling ``_get_next_char()`` for each character,
+        which matters for long unquoted tokens such as sequence data.
+        """
+        read = self.src.read
+        c = self._cur_char
+        num_chars = 0
+        while c != "" and c not in special_chars:
+            dest.append(c)
+            num_chars += 1
+            c = read(1)
+        # the first character was already accounted for when it was read
+        self.current_column_num += num_chars - 1
+        self._cur_char = c
+        if c != "":
+            if c == "\n":
+                self.current_line_num += 1
+                self.current_column_num = 1
+            else:
+                self.current_column_num += 1
+        return c
+
     def _get_next_char(self):
         self._cur_char = self.src.read(1)
         if self._cur_char != "":
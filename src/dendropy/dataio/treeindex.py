@@ -0,0 +1,442 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Indexing of NEWICK and NEXUS tree files for random access to trees.
+
+A |TreeFileIndex| records the byte span of each tree statement in a file,
+along with the index of the tree collection (e.g., NEXUS "TREES" block) to
+which it belongs. Everything in the file that is *not* a tree statement
+(the "#NEXUS" header, "TAXA" blocks, "TRANSLATE" statements, etc.) is left in
+place, so a subset of the trees can be read by composing a reduced document
+consisting of this context together with just the selected tree statements:
+the trees that are skipped are neither tokenized nor built.
+
+The index is stored in a "sidecar" file alongside the tree file (the path of
+the tree file with ``TREE_FILE_INDEX_EXTENSION`` appended), as a JSON object,
+and is only considered to be valid as long as the size and modification time
+of the tree file match those recorded in the index.
+
+Compressed files cannot be seeked into efficiently, and are never indexed.
+"""
+
+import io
+import os
+import re
+import json
+import mmap
+from dendropy.utility import filesys
+from dendropy.utility import error
+
+TREE_FILE_INDEX_FORMAT = "dendropy-tree-index"
+TREE_FILE_INDEX_VERSION = 1
+TREE_FILE_INDEX_EXTENSION = ".dpidx"
+
+# Schemas of tree files that can be indexed, mapped to the kinds of files
+# ("newick" or "nexus") that they will be read as.
+TREE_FILE_INDEX_SCHEMA_KINDS = {
+    "newick": ("newick",),
+    "nexus": ("nexus",),
+    "nexus/newick": ("nexus", "newick"),
+}
+
+_STATEMENT_SPECIAL_CHARS_PATTERN = re.compile(br"[;'\[\]]")
+_COMMENT_CHARS_PATTERN = re.compile(br"[\[\]]")
+_WHITESPACE_PATTERN = re.compile(br"\s*")
+_WORD_PATTERN = re.compile(br"[A-Za-z#]+")
+
+class TreeFileIndexError(error.DataParseError):
+    pass
+
+###############################################################################
+## Scanning
+
+def _skip_quoted(data, pos):
+    # ``pos`` is the index of the opening quote; returns index past closing
+    # quote, treating doubled quotes as escaped literals
+    while True:
+        end = data.find(b"'", pos + 1)
+        if end < 0:
+            raise TreeFileIndexError(message="Unterminated quote")
+        if data[end+1:end+2] == b"'":
+            pos = end + 1
+        else:
+            return end + 1
+
+def _skip_comment(data, pos):
+    # ``pos`` is the index of the opening bracket; returns index past the
+    # matching closing bracket, allowing for nested comments
+    nesting = 0
+    while True:
+        m = _COMMENT_CHARS_PATTERN.search(data, pos)
+        if m is None:
+            raise TreeFileIndexError(message="Unterminated comment")
+        pos = m.end()
+        if data[m.start():pos] == b"[":
+            nesting += 1
+        else:
+            nesting -= 1
+            if nesting == 0:
+                return pos
+
+def _skip_whitespace_and_comments(data, pos, end):
+    while pos < end:
+        pos = _WHITESPACE_PATTERN.match(data, pos, end).end()
+        if data[pos:pos+1] == b"[":
+            pos = _skip_comment(data, pos)
+        else:
+            break
+    return pos
+
+def _first_words(data, start, end, num_words):
+    words = []
+    pos = start
+    while len(words) < num_words:
+        pos = _skip_whitespace_and_comments(data, pos, end)
+        m = _WORD_PATTERN.match(data, pos, end)
+        if m is None:
+            break
+        words.append(m.group(0).upper())
+        pos = m.end()
+    return words
+
+def find_statement_end(data, pos, end=None):
+    """
+    Returns the index of the next semi-colon in ``data`` (a bytes-like
+    object) at or after ``pos`` that is not part of a quoted token or a
+    (possibly nested) comment, or -1 if there is no such semi-colon before
+    ``end``.
+    """
+    if end is None:
+        end = len(data)
+    while True:
+        m = _STATEMENT_SPECIAL_CHARS_PATTERN.search(data, pos, end)
+        if m is None:
+            return -1
+        pos = m.start()
+        c = data[pos:pos+1]
+        if c == b";":
+            return pos
+        elif c == b"'":
+            pos = _skip_quoted(data, pos)
+        elif c == b"[":
+            pos = _skip_comment(data, pos)
+        else:
+            pos += 1
+
+def scan_tree_statements(data):
+    """
+    Scans ``data``, the (binary) contents of a NEWICK or NEXUS file, for tree
+    statements.
+
+    Returns
+    -------
+    k : string
+        The kind of file: "nexus" or "newick".
+    spans : list of tuples
+        The tree statements in the file, each given as a tuple of the start
+        offset, end offset, and 0-based collection index of the statement. A
+        statement span extends from the end of the preceding statement
+        (so it includes any leading comments) up to and including its
+        terminating semi-colon.
+    """
+    size = len(data)
+    pos = _skip_whitespace_and_comments(data, 0, size)
+    is_nexus = data[pos:pos+6].upper() == b"#NEXUS"
+    spans = []
+    collection_index = -1
+    in_trees_block = False
+    has_trees_in_block = False
+    stmt_start = 0
+    while stmt_start < size:
+        stmt_end = find_statement_end(data, stmt_start, size)
+        if stmt_end < 0:
+            break
+        stmt_end += 1
+        if not is_nexus:
+            if _skip_whitespace_and_comments(data, stmt_start, stmt_end) < stmt_end - 1:
+                spans.append((stmt_start, stmt_end, 0))
+        else:
+            words = _first_words(data, stmt_start, stmt_end, 3)
+            if words and words[0] == b"#NEXUS":
+                words = words[1:]
+            if words:
+                if words[0] == b"BEGIN":
+                    in_trees_block = len(words) > 1 and words[1] == b"TREES"
+                    has_trees_in_block = False
+                elif words[0] in (b"END", b"ENDBLOCK"):
+                    in_trees_block = False
+                elif words[0] == b"TREE" and in_trees_block:
+                    if not has_trees_in_block:
+                        collection_index += 1
+                        has_trees_in_block = True
+                    spans.append((stmt_start, stmt_end, collection_index))
+        stmt_start = stmt_end
+    return ("nexus" if is_nexus else "newick"), spans
+
+###############################################################################
+## TreeFileIndex
+
+class TreeFileIndex(object):
+    """
+    Byte offsets of the tree statements in a NEWICK or NEXUS file, supporting
+    reading arbitrary subsets of trees without parsing the rest of the file.
+    """
+
+    def index_path_for(filepath):
+        """
+        Returns the path of the sidecar index file of ``filepath``.
+        """
+        return filepath + TREE_FILE_INDEX_EXTENSION
+    index_path_for = staticmethod(index_path_for)
+
+    def build(cls, filepath):
+        """
+        Scans ``filepath`` and returns a new |TreeFileIndex| for it.
+        """
+        stat = os.stat(filepath)
+        if stat.st_size == 0:
+            kind, spans = "newick", []
+        else:
+            with open(filepath, "rb") as src:
+                data = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    kind, spans = scan_tree_statements(data)
+                finally:
+                    data.close()
+        return cls(filepath=filepath,
+                kind=kind,
+                tree_spans=spans,
+                source_size=stat.st_size,
+                source_mtime=stat.st_mtime)
+    build = classmethod(build)
+
+    def load(cls, filepath):
+        """
+        Returns the |TreeFileIndex| stored in the sidecar index file of
+        ``filepath``, or |None| if there is no such file, or if it is out of
+        date with respect to ``filepath``.
+        """
+        index_path = cls.index_path_for(filepath)
+        try:
+            with open(index_path, "r") as src:
+                d = json.load(src)
+            stat = os.stat(filepath)
+        except (IOError, OSError, ValueError):
+            return None
+        if (d.get("format") != TREE_FILE_INDEX_FORMAT
+                or d.get("version") != TREE_FILE_INDEX_VERSION
+                or d.get("source_size") != stat.st_size
+                or d.get("source_mtime") != stat.st_mtime):
+            return None
+        collection_starts = d["collection_starts"]
+        tree_starts = d["tree_starts"]
+        tree_ends = d["tree_ends"]
+        spans = []
+        for collection_index, first_tree_index in enumerate(collection_starts):
+            if collection_index + 1 < len(collection_starts):
+                last_tree_index = collection_starts[collection_index+1]
+            else:
+                last_tree_index = len(tree_starts)
+            for tree_index in range(first_tree_index, last_tree_index):
+                spans.append((tree_starts[tree_index], tree_ends[tree_index], collection_index))
+        return cls(filepath=filepath,
+                kind=d["kind"],
+                tree_spans=spans,
+                source_size=d["source_size"],
+                source_mtime=d["source_mtime"])
+    load = classmethod(load)
+
+    def __init__(self,
+            filepath,
+            kind,
+            tree_spans,
+            source_size,
+            source_mtime):
+        self.filepath = filepath
+        self.kind = kind
+        self.tree_spans = tree_spans
+        self.source_size = source_size
+        self.source_mtime = source_mtime
+        self.collection_starts = []
+        for tree_index, span in enumerate(tree_spans):
+            if span[2] == len(self.collection_starts):
+                self.collection_starts.append(tree_index)
+        # regions of the file outside of tree statements; typically very few,
+        # as consecutive tree statements abut each other
+        self.context_spans = []
+        prev_end = 0
+        for start, end, collection_index in tree_spans:
+            if start > prev_end:
+                self.context_spans.append((prev_end, start))
+            prev_end = end
+        if source_size > prev_end:
+            self.context_spans.append((prev_end, source_size))
+
+    def __len__(self):
+        return len(self.tree_spans)
+
+    def _get_num_collections(self):
+        return len(self.collection_starts)
+    num_collections = property(_get_num_collections)
+
+    def collection_tree_indexes(self, collection_offset):
+        """
+        Returns the range of (file-wide) indexes of the trees in the
+        collection given by ``collection_offset``. Negative offsets work like
+        negative list indexes.
+        """
+        num_collections = len(self.collection_starts)
+        if collection_offset < 0:
+            collection_offset += num_collections
+        if collection_offset < 0 or collection_offset >= num_collections:
+            raise IndexError("Collection offset out of range: {} (number of collections = {}, maximum valid collection offset = {})".format(collection_offset, num_collections, num_collections-1))
+        first_tree_index = self.collection_starts[collection_offset]
+        if collection_offset + 1 < num_collections:
+            return range(first_tree_index, self.collection_starts[collection_offset+1])
+        return range(first_tree_index, len(self.tree_spans))
+
+    def save(self):
+        """
+        Writes this index to the sidecar index file of the indexed file.
+        """
+        d = {
+            "format": TREE_FILE_INDEX_FORMAT,
+            "version": TREE_FILE_INDEX_VERSION,
+            "kind": self.kind,
+            "source_size": self.source_size,
+            "source_mtime": self.source_mtime,
+            "collection_starts": self.collection_starts,
+            "tree_starts": [span[0] for span in self.tree_spans],
+            "tree_ends": [span[1] for span in self.tree_spans],
+        }
+        with open(self.index_path_for(self.filepath), "w") as dest:
+            json.dump(d, dest, separators=(",", ":"))
+
+    def is_current(self):
+        """
+        Returns |True| if the indexed file has not changed since it was indexed.
+        """
+        try:
+            stat = os.stat(self.filepath)
+        except OSError:
+            return False
+        return stat.st_size == self.source_size and stat.st_mtime == self.source_mtime
+
+    def compose_source(self, tree_indexes):
+        """
+        Returns a text stream of a document that consists of the context (all
+        content that is not a tree statement) of the indexed file up to the
+        last of the trees given by ``tree_indexes`` (file-wide 0-based
+        indexes), and the statements of those trees.
+
+        Reading the resulting document yields the requested trees (in file
+        order), and only the requested trees. Only the parts of the indexed
+        file that make up the document are read.
+        """
+        selected = sorted(set(tree_indexes))
+        for tree_index in (selected[:1] + selected[-1:]):
+            if tree_index < 0 or tree_index >= len(self.tree_spans):
+                raise IndexError("Tree index out of range: {} (number of trees = {})".format(tree_index, len(self.tree_spans)))
+        segments = []
+        if selected:
+            last_end = self.tree_spans[selected[-1]][1]
+            segments.extend(span for span in self.context_spans if span[0] < last_end)
+            segments.extend(self.tree_spans[tree_index][:2] for tree_index in selected)
+            segments.sort()
+        else:
+            segments.extend(self.context_spans)
+        parts = []
+        with open(self.filepath, "rb") as src:
+            for start, end in segments:
+                src.seek(start)
+                parts.append(src.read(end - start))
+        if selected and self.kind == "nexus":
+            parts.append(b"\nEND;\n")
+        return io.TextIOWrapper(io.BytesIO(b"".join(parts)), newline=None)
+
+###############################################################################
+## Support for readers
+
+def get_tree_file_index(filepath, schema, build=False):
+    """
+    Returns the |TreeFileIndex| of ``filepath`` if it can be used to read
+    data of schema ``schema``, or |None| otherwise.
+
+    If there is a current sidecar index file for ``filepath``, it is used. If
+    not, and ``build`` is |True|, then ``filepath`` is scanned and the
+    sidecar index file is written, if possible. Files that are compressed,
+    and schemas other than "newick", "nexus" and "nexus/newick", are not
+    supported.
+    """
+    if schema not in TREE_FILE_INDEX_SCHEMA_KINDS:
+        return None
+    try:
+        if filesys.get_compression_format(filepath) is not None:
+            return None
+    except (IOError, OSError):
+        return None
+    index = TreeFileIndex.load(filepath)
+    if index is None and build:
+        index = TreeFileIndex.build(filepath)
+        try:
+            index.save()
+        except (IOError, OSError):
+            pass
+    if index is not None and index.kind not in TREE_FILE_INDEX_SCHEMA_KINDS[schema]:
+        return None
+    return index
+
+def open_indexed_tree_collection(filepath,
+        schema,
+        collection_offset=None,
+        tree_offset=None,
+        num_trees=None,
+        tree_index=None):
+    """
+    Returns a text stream of a document that includes only the trees
+    selected from ``filepath`` by ``collection_offset`` and ``tree_offset``
+    (with the semantics of the keyword arguments of these names to
+    ``TreeList.get()``), or |None| if the file is not indexed (or ``tree_index``
+    is |False|), in which case the file needs to be parsed as normal. If
+    ``num_trees`` is not |None|, then at most this number of trees are
+    selected.
+
+    If ``tree_index`` is |True|, then the file is indexed if it has not
+    already been. The trees selected from the collection are the only trees
+    in the resulting document, which therefore has just the one collection.
+    """
+    if tree_index is False:
+        return None
+    index = get_tree_file_index(filepath, schema, build=bool(tree_index))
+    if index is None:
+        return None
+    if index.num_collections == 0:
+        # let the reader report the absence of trees
+        return index.compose_source([])
+    if collection_offset is None:
+        collection_offset = 0
+    tree_indexes = index.collection_tree_indexes(collection_offset)
+    if tree_offset is not None:
+        if tree_offset >= len(tree_indexes):
+            raise IndexError("Tree offset out of range: {} (number of trees in source = {}, maximum valid tree offset = {})".format(tree_offset, len(tree_indexes), len(tree_indexes)-1))
+        tree_indexes = tree_indexes[tree_offset:]
+    if num_trees is not None:
+        tree_indexes = tree_indexes[:num_trees]
+    return index.compose_source(tree_indexes)
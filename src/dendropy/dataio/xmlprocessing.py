@@ -173,3 +173,24 @@ class XmlDocument(XmlObject):
         for prefix, namespace in ns_map:
             self.namespace_registry.add_namespace(prefix=prefix, namespace=namespace)
 
+def iterparse_elements(source, namespace_registry=None):
+    """
+    Iterates over the elements of the XML document given by ``source`` (a
+    filepath string or a file object) as it is parsed, yielding
+    ``("start", element)`` as the start tag of each element is read and
+    ``("end", element)`` once the element is complete. Namespace declarations
+    are added to ``namespace_registry`` (if given) as they are encountered.
+
+    The (raw ``ElementTree``) elements are not recast, and the document tree
+    is built up as parsing proceeds: to keep memory use bounded when
+    processing large documents, callers should ``clear()`` completed elements
+    once done with them (and remove them from their parent elements).
+    """
+    events = "start", "end", "start-ns"
+    for event, elem in ElementTree.iterparse(source, events):
+        if event == "start-ns":
+            if namespace_registry is not None:
+                prefix, namespace = elem
+                namespace_registry.add_namespace(prefix=prefix, namespace=namespace)
+        else:
+            yield event, elem
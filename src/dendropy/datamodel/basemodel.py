@@ -34,6 +34,7 @@ from dendropy.utility import textprocessing
 from dendropy.utility import urlio
 from dendropy.utility import error
 from dendropy.utility import deprecate
+from dendropy.utility import filesys
 
 ##############################################################################
 ## Keyword Processor
@@ -213,7 +214,7 @@ class Deserializable(object):
             New instance of object, constructed and populated from data given
             in source.
         """
-        with open(src, "r", newline=None) as fsrc:
+        with filesys.open_text_file(src) as fsrc:
             return cls._parse_and_create_from_stream(stream=fsrc,
                     schema=schema,
                     **kwargs)
@@ -410,7 +411,7 @@ class MultiReadable(object):
                 - |CharacterMatrix|: number of sequences
                 - |DataSet|: ``tuple`` (number of taxon namespaces, number of tree lists, number of matrices)
         """
-        with open(src, "r", newline=None) as fsrc:
+        with filesys.open_text_file(src) as fsrc:
             return self._parse_and_add_from_stream(stream=fsrc, schema=schema, **kwargs)
 
     def read_from_string(self, src, schema, **kwargs):
@@ -599,7 +600,7 @@ class Serializable(object):
         """
         Writes to file specified by ``dest``.
         """
-        with open(os.path.expandvars(os.path.expanduser(dest)), "w") as f:
+        with filesys.open_text_file(os.path.expandvars(os.path.expanduser(dest)), "w") as f:
             return self._format_and_write_to_stream(stream=f, schema=schema, **kwargs)
 
     def as_string(self, schema, **kwargs):
@@ -30,6 +30,7 @@ from dendropy.utility import textprocessing
 from dendropy.utility import error
 from dendropy.utility import deprecate
 from dendropy.utility import container
+from dendropy.utility import filesys
 from dendropy.datamodel import charstatemodel
 from dendropy.datamodel.charstatemodel import DNA_STATE_ALPHABET
 from dendropy.datamodel.charstatemodel import RNA_STATE_ALPHABET
@@ -171,6 +172,19 @@ class CharacterDataSequence(
         """
         return self._character_values
 
+    def values_view(self):
+        """
+        Returns read-only view of the values of this vector. Unlike
+        ``values()``, this never requires the values to be stored as a list
+        (see `FixedAlphabetCharacterDataSequence`).
+
+        Returns
+        -------
+        v : `CharacterDataSequenceValuesView`
+            Sequence of values making up this vector.
+        """
+        return CharacterDataSequenceValuesView(self)
+
     def symbols_as_list(self):
         """
         Returns list of string representation of values of this vector.
@@ -403,6 +417,80 @@ class CharacterDataSequence(
         """
         self._character_annotations[idx] = annotations
 
+    def _extend_from_symbol_string(self, state_alphabet, symbols, ignore_bytes=b""):
+        """
+        Extends ``self`` with the states of ``state_alphabet`` corresponding to
+        each of the single-character symbols in ``symbols`` (skipping any
+        characters in ``ignore_bytes``), translating the entire string in a
+        single pass. Returns |False|, without modifying ``self``, if this is
+        not possible (see ``StateAlphabet._get_states_for_symbol_string()``),
+        in which case the symbols need to be processed one at a time.
+        """
+        states = state_alphabet._get_states_for_symbol_string(symbols,
+                ignore_bytes=ignore_bytes)
+        if states is None:
+            return False
+        self.extend(states)
+        return True
+
+    def _retain_indices(self, indices):
+        """
+        Removes all elements (and associated character types and metadata
+        annotations) except for those at the (0-based) indexes given in the
+        set ``indices``.
+        """
+        retained = [idx for idx in range(len(self._character_values)) if idx in indices]
+        self._character_values = [self._character_values[idx] for idx in retained]
+        self._character_types = [self._character_types[idx] for idx in retained]
+        self._character_annotations = [self._character_annotations[idx] for idx in retained]
+
+class CharacterDataSequenceValuesView(object):
+    """
+    A read-only view of the values of a `CharacterDataSequence` (see
+    ``CharacterDataSequence.values_view()``), which, unlike the list returned
+    by ``CharacterDataSequence.values()``, does not require sequences to store
+    their values as a list of references (see, e.g.,
+    `FixedAlphabetCharacterDataSequence`). Values are looked up in the
+    underlying sequence as they are accessed.
+    """
+
+    def __init__(self, sequence):
+        self._sequence = sequence
+
+    def __len__(self):
+        return len(self._sequence)
+
+    def __getitem__(self, idx):
+        return self._sequence[idx]
+
+    def __iter__(self):
+        return iter(self._sequence)
+
+    def __contains__(self, value):
+        for v in self._sequence:
+            if v is value or v == value:
+                return True
+        return False
+
+    def __eq__(self, other):
+        try:
+            if len(other) != len(self):
+                return False
+        except TypeError:
+            return False
+        for v1, v2 in zip(self, other):
+            if v1 != v2:
+                return False
+        return True
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self))
+
 ###############################################################################
 ## Subset of Character (Columns)
 
@@ -674,7 +762,7 @@ class CharacterMatrix(
         character matrix. Component parts will be recorded as character
         subsets.
         """
-        streams = [open(path, "rU") for path in paths]
+        streams = [filesys.open_text_file(path) for path in paths]
         return cls.concatenate_from_streams(streams, schema, **kwargs)
     concatenate_from_paths = classmethod(concatenate_from_paths)
 
@@ -1614,9 +1702,7 @@ class CharacterMatrix(
         clone.character_subsets = container.OrderedCaselessDict()
         indices = set(indices)
         for vec in clone.values():
-            for cell_idx in range(len(vec)-1, -1, -1):
-                if cell_idx not in indices:
-                    del(vec[cell_idx])
+            vec._retain_indices(indices)
         return clone
 
     ###########################################################################
@@ -1845,8 +1931,31 @@ class DiscreteCharacterMatrix(CharacterMatrix):
 
         """
         taxon_to_state_indices = {}
+        # index sets are computed once per distinct state (or, for sequences
+        # stored as codes, per code) and copied for each character
+        state_index_sets = {}
+        code_index_sets = {}
         for t in self:
             cdv = self[t]
+            codes = None
+            if getattr(cdv, "is_compact", False):
+                codes = cdv._character_codes
+            if codes is not None:
+                state_alphabet = cdv.datatype_alphabet
+                if char_indices is not None:
+                    codes = [codes[char_index] for char_index in char_indices]
+                v = []
+                for code in codes:
+                    try:
+                        index_set = code_index_sets[code]
+                    except KeyError:
+                        index_set = state_alphabet._get_fundamental_index_set(
+                                state_alphabet._storage_code_states[code],
+                                gaps_as_missing=gaps_as_missing)
+                        code_index_sets[code] = index_set
+                    v.append(set(index_set))
+                taxon_to_state_indices[t] = v
+                continue
             if char_indices is None:
                 ci = range(len(cdv))
             else:
@@ -1854,10 +1963,15 @@ class DiscreteCharacterMatrix(CharacterMatrix):
             v = []
             for char_index in ci:
                 state = cdv[char_index]
-                if gaps_as_missing:
-                    v.append(set(state.fundamental_indexes_with_gaps_as_missing))
-                else:
-                    v.append(set(state.fundamental_indexes))
+                try:
+                    index_set = state_index_sets[state]
+                except KeyError:
+                    if gaps_as_missing:
+                        index_set = frozenset(state.fundamental_indexes_with_gaps_as_missing)
+                    else:
+                        index_set = frozenset(state.fundamental_indexes)
+                    state_index_sets[state] = index_set
+                v.append(set(index_set))
             taxon_to_state_indices[t] = v
         return taxon_to_state_indices
 
@@ -1909,7 +2023,349 @@ class DiscreteCharacterMatrix(CharacterMatrix):
 ### Fixed Alphabet Characters ##################################################
 
 class FixedAlphabetCharacterDataSequence(CharacterDataSequence):
-    pass
+    """
+    A sequence of states of a fixed state alphabet (e.g., DNA or protein) for
+    a particular taxon or entry in a data matrix.
+
+    Specializes `CharacterDataSequence` by storing the values compactly: as a
+    ``bytearray`` of single-byte storage codes of the states in the state
+    alphabet given by the class attribute ``datatype_alphabet``, with
+    character types and metadata annotations (which are typically absent)
+    stored sparsely. |StateIdentity| references are only looked up when
+    values are accessed. Sequences of the same type can thus be copied,
+    concatenated, subsetted and written out without dereferencing any values.
+
+    If a value that cannot be coded is stored (e.g., |None|, or a state of a
+    different state alphabet), the sequence transparently switches to the
+    general list-based storage of `CharacterDataSequence`.
+
+    The codes may also be loaded lazily, from a source bound to an empty
+    sequence using ``_bind_character_codes_source()`` (e.g., a row of a
+    memory-mapped alignment file). Nothing is loaded until the values are
+    accessed, and if the sequence is subsetted before then, only the retained
+    characters are loaded.
+    """
+
+    datatype_alphabet = None
+
+    def __init__(self,
+            character_values=None,
+            character_types=None,
+            character_annotations=None):
+        if self.datatype_alphabet is None:
+            self._character_codes = None
+            self._character_values = []
+            self._character_types = []
+            self._character_annotations = []
+        else:
+            self._character_codes = bytearray()
+            self._character_values = None
+            self._character_types = {}
+            self._character_annotations = {}
+        if character_values:
+            self.extend(
+                    character_values=character_values,
+                    character_types=character_types,
+                    character_annotations=character_annotations)
+
+    def __getattr__(self, name):
+        # only called if attribute is not found in the usual way, i.e., for
+        # character codes that have not been loaded yet
+        if name == "_character_codes":
+            source = self.__dict__.get("_character_codes_source", None)
+            if source is not None:
+                self._character_codes = source.load()
+                del self._character_codes_source
+                return self._character_codes
+        raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, name))
+
+    def _bind_character_codes_source(self, source):
+        """
+        Binds this (empty) sequence to ``source``, from which the character
+        codes will be loaded when first needed. ``source`` should have an
+        attribute, ``length``, giving the number of characters, and a method,
+        ``load(indices=None)``, which returns a ``bytearray`` of storage codes
+        of (``datatype_alphabet``) states for all characters, or only those
+        at the (0-based) indexes given in the set ``indices``.
+        """
+        if self.datatype_alphabet is None or len(self) > 0:
+            raise TypeError("Character codes source can only be bound to an empty compact sequence")
+        del self._character_codes
+        self._character_codes_source = source
+
+    def _expand_storage(self):
+        """
+        Switches from compact storage to list-based storage.
+        """
+        if self._character_codes is None:
+            return
+        states = self.datatype_alphabet._storage_code_states
+        nchar = len(self._character_codes)
+        character_types = [None] * nchar
+        for idx, character_type in self._character_types.items():
+            character_types[idx] = character_type
+        character_annotations = [None] * nchar
+        for idx, annotations in self._character_annotations.items():
+            character_annotations[idx] = annotations
+        self._character_values = [states[code] for code in self._character_codes]
+        self._character_types = character_types
+        self._character_annotations = character_annotations
+        self._character_codes = None
+
+    def _get_is_compact(self):
+        """
+        |True| if values are stored as storage codes, |False| otherwise.
+        """
+        return self._character_codes is not None
+    is_compact = property(_get_is_compact)
+
+    def _normalize_index(self, idx):
+        nchar = len(self._character_codes)
+        if idx < 0:
+            idx += nchar
+        if idx < 0 or idx >= nchar:
+            raise IndexError("sequence index out of range")
+        return idx
+
+    def _shift_sparse_indices(self, start_idx, offset):
+        for d in (self._character_types, self._character_annotations):
+            if d:
+                shifted = [(idx + offset if idx >= start_idx else idx, v) for idx, v in d.items()]
+                d.clear()
+                d.update(shifted)
+
+    def _set_sparse_at(self, idx, character_type, character_annotations):
+        if character_type is None:
+            self._character_types.pop(idx, None)
+        else:
+            self._character_types[idx] = character_type
+        if character_annotations is None:
+            self._character_annotations.pop(idx, None)
+        else:
+            self._character_annotations[idx] = character_annotations
+
+    def values(self):
+        """
+        Returns list of values of this vector. As changes to the list are
+        changes to this vector, this switches the sequence to list-based
+        storage: use ``values_view()`` to access the values without doing so.
+
+        Returns
+        -------
+        v : list
+            List of values making up this vector.
+        """
+        self._expand_storage()
+        return CharacterDataSequence.values(self)
+
+    def symbols_as_list(self):
+        if self._character_codes is None:
+            return CharacterDataSequence.symbols_as_list(self)
+        symbols = self.datatype_alphabet._get_storage_code_symbols()
+        return [symbols[code] for code in self._character_codes]
+
+    def symbols_as_string(self, sep=""):
+        if self._character_codes is None:
+            return CharacterDataSequence.symbols_as_string(self, sep=sep)
+        return self.datatype_alphabet._get_symbol_string_for_storage_codes(
+                self._character_codes,
+                sep=sep)
+
+    def append(self, character_value, character_type=None, character_annotations=None):
+        if self._character_codes is not None:
+            code = self.datatype_alphabet._get_state_storage_code(character_value)
+            if code is not None:
+                self._character_codes.append(code)
+                if character_type is not None or character_annotations is not None:
+                    self._set_sparse_at(len(self._character_codes) - 1, character_type, character_annotations)
+                return
+            self._expand_storage()
+        CharacterDataSequence.append(self, character_value, character_type, character_annotations)
+
+    def extend(self, character_values, character_types=None, character_annotations=None):
+        if self._character_codes is not None:
+            if (isinstance(character_values, FixedAlphabetCharacterDataSequence)
+                    and character_values._character_codes is not None
+                    and character_values.datatype_alphabet is self.datatype_alphabet):
+                codes = character_values._character_codes
+            else:
+                codes = self.datatype_alphabet._get_storage_codes_for_states(character_values)
+            if codes is not None:
+                start_idx = len(self._character_codes)
+                self._character_codes.extend(codes)
+                if character_types is not None:
+                    assert len(character_types) == len(codes)
+                    for idx, character_type in enumerate(character_types):
+                        if character_type is not None:
+                            self._character_types[start_idx + idx] = character_type
+                if character_annotations is not None:
+                    assert len(character_annotations) == len(codes)
+                    for idx, annotations in enumerate(character_annotations):
+                        if annotations is not None:
+                            self._character_annotations[start_idx + idx] = annotations
+                return
+            self._expand_storage()
+        CharacterDataSequence.extend(self, character_values, character_types, character_annotations)
+
+    def __len__(self):
+        try:
+            codes = self.__dict__["_character_codes"]
+        except KeyError:
+            return self._character_codes_source.length
+        if codes is None:
+            return len(self._character_values)
+        return len(codes)
+
+    def __getitem__(self, idx):
+        if self._character_codes is None:
+            return self._character_values[idx]
+        states = self.datatype_alphabet._storage_code_states
+        if isinstance(idx, slice):
+            return [states[code] for code in self._character_codes[idx]]
+        return states[self._character_codes[idx]]
+
+    def __setitem__(self, idx, value):
+        if self._character_codes is not None:
+            if not isinstance(idx, slice):
+                code = self.datatype_alphabet._get_state_storage_code(value)
+                if code is not None:
+                    self._character_codes[idx] = code
+                    return
+            self._expand_storage()
+        self._character_values[idx] = value
+
+    def __iter__(self):
+        if self._character_codes is None:
+            return CharacterDataSequence.__iter__(self)
+        states = self.datatype_alphabet._storage_code_states
+        return (states[code] for code in self._character_codes)
+
+    def cell_iter(self):
+        if self._character_codes is None:
+            for v, t, a in CharacterDataSequence.cell_iter(self):
+                yield v, t, a
+            return
+        states = self.datatype_alphabet._storage_code_states
+        character_types = self._character_types
+        character_annotations = self._character_annotations
+        for idx, code in enumerate(self._character_codes):
+            yield states[code], character_types.get(idx, None), character_annotations.get(idx, None)
+
+    def __delitem__(self, idx):
+        if self._character_codes is None:
+            CharacterDataSequence.__delitem__(self, idx)
+            return
+        if isinstance(idx, slice):
+            for cell_idx in sorted(range(*idx.indices(len(self._character_codes))), reverse=True):
+                del self[cell_idx]
+            return
+        idx = self._normalize_index(idx)
+        del self._character_codes[idx]
+        self._character_types.pop(idx, None)
+        self._character_annotations.pop(idx, None)
+        self._shift_sparse_indices(idx + 1, -1)
+
+    def set_at(self, idx, character_value, character_type=None, character_annotations=None):
+        if self._character_codes is not None and idx <= len(self._character_codes):
+            code = self.datatype_alphabet._get_state_storage_code(character_value)
+            if code is not None:
+                if idx == len(self._character_codes):
+                    self._character_codes.append(code)
+                else:
+                    idx = self._normalize_index(idx)
+                    self._character_codes[idx] = code
+                self._set_sparse_at(idx, character_type, character_annotations)
+                return
+        self._expand_storage()
+        CharacterDataSequence.set_at(self, idx, character_value, character_type, character_annotations)
+
+    def insert(self, idx, character_value, character_type=None, character_annotations=None):
+        if self._character_codes is not None:
+            code = self.datatype_alphabet._get_state_storage_code(character_value)
+            if code is not None:
+                nchar = len(self._character_codes)
+                if idx < 0:
+                    idx = max(0, idx + nchar)
+                elif idx > nchar:
+                    idx = nchar
+                self._character_codes.insert(idx, code)
+                self._shift_sparse_indices(idx, 1)
+                self._set_sparse_at(idx, character_type, character_annotations)
+                return
+            self._expand_storage()
+        CharacterDataSequence.insert(self, idx, character_value, character_type, character_annotations)
+
+    def value_at(self, idx):
+        return self[idx]
+
+    def character_type_at(self, idx):
+        if self._character_codes is None:
+            return CharacterDataSequence.character_type_at(self, idx)
+        return self._character_types.get(self._normalize_index(idx), None)
+
+    def annotations_at(self, idx):
+        if self._character_codes is None:
+            return CharacterDataSequence.annotations_at(self, idx)
+        idx = self._normalize_index(idx)
+        if self._character_annotations.get(idx, None) is None:
+            self._character_annotations[idx] = basemodel.AnnotationSet(self._character_types.get(idx, None))
+        return self._character_annotations[idx]
+
+    def has_annotations_at(self, idx):
+        if self._character_codes is None:
+            return CharacterDataSequence.has_annotations_at(self, idx)
+        return self._character_annotations.get(self._normalize_index(idx), None) is not None
+
+    def set_character_type_at(self, idx, character_type):
+        if self._character_codes is None:
+            CharacterDataSequence.set_character_type_at(self, idx, character_type)
+            return
+        idx = self._normalize_index(idx)
+        if character_type is None:
+            self._character_types.pop(idx, None)
+        else:
+            self._character_types[idx] = character_type
+
+    def set_annotations_at(self, idx, annotations):
+        if self._character_codes is None:
+            CharacterDataSequence.set_annotations_at(self, idx, annotations)
+            return
+        idx = self._normalize_index(idx)
+        if annotations is None:
+            self._character_annotations.pop(idx, None)
+        else:
+            self._character_annotations[idx] = annotations
+
+    def _extend_from_symbol_string(self, state_alphabet, symbols, ignore_bytes=b""):
+        if self._character_codes is not None and state_alphabet is self.datatype_alphabet:
+            codes = state_alphabet._get_storage_codes_for_symbol_string(symbols,
+                    ignore_bytes=ignore_bytes)
+            if codes is None:
+                return False
+            self._character_codes.extend(codes)
+            return True
+        return CharacterDataSequence._extend_from_symbol_string(self,
+                state_alphabet,
+                symbols,
+                ignore_bytes=ignore_bytes)
+
+    def _retain_indices(self, indices):
+        if "_character_codes" not in self.__dict__:
+            self._character_codes = self._character_codes_source.load(indices)
+            del self._character_codes_source
+            return
+        if self._character_codes is None:
+            CharacterDataSequence._retain_indices(self, indices)
+            return
+        retained = [idx for idx in range(len(self._character_codes)) if idx in indices]
+        codes = self._character_codes
+        self._character_codes = bytearray([codes[idx] for idx in retained])
+        for d in (self._character_types, self._character_annotations):
+            if d:
+                new_indexes = dict((idx, new_idx) for new_idx, idx in enumerate(retained))
+                retained_items = [(new_indexes[idx], v) for idx, v in d.items() if idx in new_indexes]
+                d.clear()
+                d.update(retained_items)
 
 class FixedAlphabetCharacterMatrix(DiscreteCharacterMatrix):
 
@@ -1932,7 +2388,7 @@ class FixedAlphabetCharacterMatrix(DiscreteCharacterMatrix):
 ### DNA Characters ##################################################
 
 class DnaCharacterDataSequence(FixedAlphabetCharacterDataSequence):
-    pass
+    datatype_alphabet = DNA_STATE_ALPHABET
 
 class DnaCharacterMatrix(FixedAlphabetCharacterMatrix):
     """
@@ -1945,7 +2401,7 @@ class DnaCharacterMatrix(FixedAlphabetCharacterMatrix):
 ### RNA Characters ##################################################
 
 class RnaCharacterDataSequence(FixedAlphabetCharacterDataSequence):
-    pass
+    datatype_alphabet = RNA_STATE_ALPHABET
 
 class RnaCharacterMatrix(FixedAlphabetCharacterMatrix):
     """
@@ -1958,7 +2414,7 @@ class RnaCharacterMatrix(FixedAlphabetCharacterMatrix):
 ### Nucleotide Characters ##################################################
 
 class NucleotideCharacterDataSequence(FixedAlphabetCharacterDataSequence):
-    pass
+    datatype_alphabet = NUCLEOTIDE_STATE_ALPHABET
 
 class NucleotideCharacterMatrix(FixedAlphabetCharacterMatrix):
     """
@@ -1971,7 +2427,7 @@ class NucleotideCharacterMatrix(FixedAlphabetCharacterMatrix):
 ### Protein Characters ##################################################
 
 class ProteinCharacterDataSequence(FixedAlphabetCharacterDataSequence):
-    pass
+    datatype_alphabet = PROTEIN_STATE_ALPHABET
 
 class ProteinCharacterMatrix(FixedAlphabetCharacterMatrix):
     """
@@ -1984,7 +2440,7 @@ class ProteinCharacterMatrix(FixedAlphabetCharacterMatrix):
 ### Restricted Site Characters ##################################################
 
 class RestrictionSitesCharacterDataSequence(FixedAlphabetCharacterDataSequence):
-    pass
+    datatype_alphabet = RESTRICTION_SITES_STATE_ALPHABET
 
 class RestrictionSitesCharacterMatrix(FixedAlphabetCharacterMatrix):
     """
@@ -1997,7 +2453,7 @@ class RestrictionSitesCharacterMatrix(FixedAlphabetCharacterMatrix):
 ### Infinite Sites Characters ##################################################
 
 class InfiniteSitesCharacterDataSequence(FixedAlphabetCharacterDataSequence):
-    pass
+    datatype_alphabet = INFINITE_SITES_STATE_ALPHABET
 
 class InfiniteSitesCharacterMatrix(FixedAlphabetCharacterMatrix):
     """
@@ -144,6 +144,10 @@ class StateAlphabet(
     AMBIGUOUS_STATE = 1
     POLYMORPHIC_STATE = 2
 
+    # Code used in the symbol byte code table for bytes that do not
+    # correspond to any state symbol.
+    INVALID_SYMBOL_CODE = 255
+
     ###########################################################################
     ### Life-Cycle and Identity
 
@@ -171,8 +175,25 @@ class StateAlphabet(
         self._canonical_symbol_state_map = None
         self._full_symbol_state_map = None
         self._index_state_map = None
+        self._symbol_byte_code_table = None
+        self._is_symbol_byte_code_table_compiled = False
         self._fundamental_states_to_ambiguous_state_map = None
         self._fundamental_states_to_polymorphic_state_map = None
+        self._fundamental_index_bitmasks = None
+        self._fundamental_index_bitmasks_with_gaps_as_missing = None
+        self._fundamental_index_bitmask_state_maps = None
+        self._matched_multistate_cache = {}
+
+        # Append-only registry of single-byte storage codes for states (used
+        # for compact storage of sequences), assigned in the order in which
+        # states are added; unlike state indexes, these remain stable when new
+        # states are added to the alphabet
+        self._storage_code_states = []
+        self._state_storage_code_map = {}
+        self._storage_code_symbols = None
+        self._storage_code_symbol_byte_table = None
+        self._symbol_storage_code_table = None
+        self._is_symbol_storage_code_table_compiled = False
 
         # Suppress for initialization
         self.autocompile_lookup_tables = False
@@ -293,6 +314,7 @@ class StateAlphabet(
                 state_denomination=StateAlphabet.FUNDAMENTAL_STATE,
                 member_states=None)
         self._fundamental_states.append(new_state)
+        self._assign_state_storage_code(new_state)
         if not self._is_case_sensitive:
             for s in (symbol.upper(), symbol.lower()):
                 if s != symbol:
@@ -430,6 +452,7 @@ class StateAlphabet(
             self._ambiguous_states.append(new_state)
         else:
             raise ValueError(state_denomination)
+        self._assign_state_storage_code(new_state)
         if symbol and not self._is_case_sensitive:
             for s in (symbol.upper(), symbol.lower()):
                 if s != symbol:
@@ -512,6 +535,7 @@ class StateAlphabet(
                     temp_fundamental_states_to_polymorphic_state_map[member_states] = state
         self._fundamental_states_to_ambiguous_state_map = container.FrozenOrderedDict(temp_fundamental_states_to_ambiguous_state_map)
         self._fundamental_states_to_polymorphic_state_map = container.FrozenOrderedDict(temp_fundamental_states_to_polymorphic_state_map)
+        self._reset_fundamental_index_bitmask_tables()
 
     def _set_symbol_mapping(self, d, symbol, state):
         if symbol is None or symbol == "":
@@ -566,6 +590,275 @@ class StateAlphabet(
         self._canonical_symbol_state_map = container.FrozenOrderedDict(temp_canonical_symbol_state_map)
         self._full_symbol_state_map = container.FrozenOrderedDict(temp_full_symbol_state_map)
         self._index_state_map = container.FrozenOrderedDict(temp_index_state_map)
+        self._symbol_byte_code_table = None
+        self._is_symbol_byte_code_table_compiled = False
+        self._symbol_storage_code_table = None
+        self._is_symbol_storage_code_table_compiled = False
+        self._reset_fundamental_index_bitmask_tables()
+
+    def _compile_symbol_byte_code_table(self):
+        if len(self._state_identities) >= StateAlphabet.INVALID_SYMBOL_CODE:
+            return None
+        table = bytearray([StateAlphabet.INVALID_SYMBOL_CODE] * 256)
+        for symbol, state in self._full_symbol_state_map.items():
+            if symbol is None:
+                continue
+            if len(symbol) != 1 or ord(symbol) > 127:
+                return None
+            table[ord(symbol)] = state._index
+        return bytes(table)
+
+    def _get_symbol_byte_code_table(self):
+        """
+        A 256-byte translation table (suitable for ``bytes.translate()``)
+        mapping the (ASCII) byte of each state symbol, including synonyms, to
+        the index of the corresponding state, and every other byte to
+        ``StateAlphabet.INVALID_SYMBOL_CODE``. This is |None| if the states of
+        this alphabet cannot be represented in this way, i.e., if there are
+        multi-character or non-ASCII symbols, or too many states.
+        """
+        if not self._is_symbol_byte_code_table_compiled:
+            self._symbol_byte_code_table = self._compile_symbol_byte_code_table()
+            self._is_symbol_byte_code_table_compiled = True
+        return self._symbol_byte_code_table
+    symbol_byte_code_table = property(_get_symbol_byte_code_table)
+
+    def _get_states_for_symbol_string(self, symbols, ignore_bytes=b""):
+        """
+        Returns list of states corresponding to each of the single-character
+        symbols in the string ``symbols``, skipping any characters in
+        ``ignore_bytes``. The entire string is translated in a single pass
+        through ``symbol_byte_code_table``.
+
+        Returns |None| if this alphabet does not have a symbol byte code table
+        or if ``symbols`` includes characters that are not recognized symbols
+        of this alphabet: callers should then fall back to processing the
+        symbols one at a time (e.g., to report errors).
+        """
+        table = self._get_symbol_byte_code_table()
+        if table is None:
+            return None
+        try:
+            codes = bytearray(symbols.encode("ascii").translate(table, ignore_bytes))
+        except UnicodeError:
+            return None
+        if StateAlphabet.INVALID_SYMBOL_CODE in codes:
+            return None
+        states = self._state_identities
+        return [states[code] for code in codes]
+
+    def _reset_fundamental_index_bitmask_tables(self):
+        self._fundamental_index_bitmasks = None
+        self._fundamental_index_bitmasks_with_gaps_as_missing = None
+        self._fundamental_index_bitmask_state_maps = None
+        self._matched_multistate_cache = {}
+
+    def _compile_fundamental_index_bitmask_tables(self):
+        """
+        Builds tables, indexed by state index, of the bitmasks of the indexes
+        of the fundamental states to which each state maps (bit ``i`` being
+        set if the fundamental state with index ``i`` is a member), with and
+        without gaps treated as missing data. Also builds maps of these
+        bitmasks to the ambiguous and polymorphic states with the
+        corresponding member states.
+        """
+        bitmasks = []
+        bitmasks_with_gaps_as_missing = []
+        for state in self._state_identities:
+            mask = 0
+            for fundamental_state in state.fundamental_states:
+                mask |= 1 << fundamental_state._index
+            bitmasks.append(mask)
+            try:
+                indexes = state.fundamental_indexes_with_gaps_as_missing
+            except ValueError:
+                # gap state without a no-data state: only an error if used
+                bitmasks_with_gaps_as_missing.append(None)
+                continue
+            mask = 0
+            for idx in indexes:
+                mask |= 1 << idx
+            bitmasks_with_gaps_as_missing.append(mask)
+        state_maps = {}
+        for state_denomination, states in (
+                (StateAlphabet.AMBIGUOUS_STATE, self._ambiguous_states),
+                (StateAlphabet.POLYMORPHIC_STATE, self._polymorphic_states)):
+            state_map = {}
+            for state in states:
+                # As with ``_fundamental_states_to_ambiguous_state_map``, the
+                # first definition of a set of member states wins; states with
+                # non-fundamental members can never be matched.
+                mask = 0
+                for member_state in state.member_states:
+                    if member_state.state_denomination != StateAlphabet.FUNDAMENTAL_STATE:
+                        mask = None
+                        break
+                    mask |= 1 << member_state._index
+                if mask is not None and mask not in state_map:
+                    state_map[mask] = state
+            state_maps[state_denomination] = state_map
+        self._fundamental_index_bitmasks = tuple(bitmasks)
+        self._fundamental_index_bitmasks_with_gaps_as_missing = tuple(bitmasks_with_gaps_as_missing)
+        self._fundamental_index_bitmask_state_maps = state_maps
+
+    def _get_fundamental_index_bitmask(self, state, gaps_as_missing=False):
+        """
+        Returns the bitmask of the indexes of the fundamental states to which
+        ``state`` maps, looked up by the index of ``state``.
+        """
+        if self._fundamental_index_bitmasks is None:
+            self._compile_fundamental_index_bitmask_tables()
+        idx = state._index
+        if idx is not None and idx < len(self._state_identities) and self._state_identities[idx] is state:
+            if not gaps_as_missing:
+                return self._fundamental_index_bitmasks[idx]
+            mask = self._fundamental_index_bitmasks_with_gaps_as_missing[idx]
+            if mask is not None:
+                return mask
+        # state not indexed (e.g., a multistate defined without a symbol)
+        mask = 0
+        if gaps_as_missing:
+            for idx in state.fundamental_indexes_with_gaps_as_missing:
+                mask |= 1 << idx
+        else:
+            for fundamental_state in state.fundamental_states:
+                mask |= 1 << fundamental_state._index
+        return mask
+
+    def _get_fundamental_index_set(self, state, gaps_as_missing=False):
+        """
+        Returns a ``frozenset`` of the indexes of the fundamental states to
+        which ``state`` maps.
+        """
+        mask = self._get_fundamental_index_bitmask(state, gaps_as_missing=gaps_as_missing)
+        return frozenset([idx for idx in range(mask.bit_length()) if (mask >> idx) & 1])
+
+    def _match_multistate(self, symbols, state_denomination):
+        """
+        Returns the ambiguous or polymorphic state (as given by
+        ``state_denomination``) that maps to the fundamental states of
+        ``symbols``. Matches are memoized by ``symbols``, so resolving
+        recurring multistate tokens (e.g., when reading a data matrix) takes a
+        single lookup. Raises ``KeyError`` if there is no match.
+        """
+        try:
+            return self._matched_multistate_cache[state_denomination, symbols]
+        except KeyError:
+            is_cacheable = True
+        except TypeError:
+            # unhashable ``symbols`` (e.g., a list)
+            is_cacheable = False
+        if self._fundamental_index_bitmask_state_maps is None:
+            self._compile_fundamental_index_bitmask_tables()
+        mask = 0
+        for symbol in symbols:
+            mask |= self._get_fundamental_index_bitmask(self.full_symbol_state_map[symbol])
+        state = self._fundamental_index_bitmask_state_maps[state_denomination][mask]
+        if is_cacheable:
+            self._matched_multistate_cache[state_denomination, symbols] = state
+        return state
+
+    def _assign_state_storage_code(self, state):
+        """
+        Assigns the next storage code to ``state``, a state newly added to
+        this alphabet, as long as codes are available.
+        """
+        if len(self._storage_code_states) >= StateAlphabet.INVALID_SYMBOL_CODE:
+            return
+        self._state_storage_code_map[state] = len(self._storage_code_states)
+        self._storage_code_states.append(state)
+
+    def _get_state_storage_code(self, state):
+        """
+        Returns the single-byte storage code of ``state``, or |None| if
+        ``state`` is not a state of this alphabet (or there are too many
+        states to code).
+
+        Storage codes are assigned to states in the order in which they are
+        added to the alphabet (so that they depend only on how the alphabet
+        was defined, and not on the order in which codes are requested), and,
+        once assigned, never change: ``self._storage_code_states[code]``
+        always returns the state with storage code ``code``.
+        """
+        try:
+            return self._state_storage_code_map.get(state, None)
+        except TypeError:
+            # unhashable value
+            return None
+
+    def _get_storage_codes_for_states(self, states):
+        """
+        Returns a ``bytearray`` of the storage codes of each of the elements
+        of the sequence ``states``, or |None| if any of the elements is not a
+        state of this alphabet.
+        """
+        code_map = self._state_storage_code_map
+        try:
+            return bytearray(map(code_map.__getitem__, states))
+        except (KeyError, TypeError):
+            return None
+
+    def _get_storage_codes_for_symbol_string(self, symbols, ignore_bytes=b""):
+        """
+        As ``_get_states_for_symbol_string()``, but returns a ``bytearray`` of
+        the storage codes of the states instead of a list of the states.
+        """
+        if not self._is_symbol_storage_code_table_compiled:
+            table = self._get_symbol_byte_code_table()
+            if table is not None:
+                index_to_storage_code = bytearray([StateAlphabet.INVALID_SYMBOL_CODE] * 256)
+                for state in self._state_identities:
+                    code = self._get_state_storage_code(state)
+                    if code is None:
+                        table = None
+                        break
+                    index_to_storage_code[state._index] = code
+                else:
+                    table = bytearray(table).translate(bytes(index_to_storage_code))
+                    table = bytes(table)
+            self._symbol_storage_code_table = table
+            self._is_symbol_storage_code_table_compiled = True
+        table = self._symbol_storage_code_table
+        if table is None:
+            return None
+        try:
+            codes = bytearray(symbols.encode("ascii").translate(table, ignore_bytes))
+        except UnicodeError:
+            return None
+        if StateAlphabet.INVALID_SYMBOL_CODE in codes:
+            return None
+        return codes
+
+    def _get_storage_code_symbols(self):
+        """
+        Returns list of string representations of states, indexed by
+        storage code.
+        """
+        symbols = self._storage_code_symbols
+        if symbols is None or len(symbols) != len(self._storage_code_states):
+            symbols = [str(state) for state in self._storage_code_states]
+            table = bytearray([StateAlphabet.INVALID_SYMBOL_CODE] * 256)
+            for code, symbol in enumerate(symbols):
+                if len(symbol) == 1 and ord(symbol) < 128:
+                    table[code] = ord(symbol)
+            self._storage_code_symbols = symbols
+            self._storage_code_symbol_byte_table = bytes(table)
+        return symbols
+
+    def _get_symbol_string_for_storage_codes(self, codes, sep=""):
+        """
+        Returns the string representations of the states with storage codes
+        given by the ``bytearray`` ``codes`` joined by ``sep``. If each of the
+        states is represented by a single ASCII character and ``sep`` is
+        empty, then the entire string is composed in a single pass through a
+        translation table.
+        """
+        symbols = self._get_storage_code_symbols()
+        if not sep:
+            s = codes.translate(self._storage_code_symbol_byte_table)
+            if StateAlphabet.INVALID_SYMBOL_CODE not in s:
+                return s.decode("ascii")
+        return sep.join([symbols[code] for code in codes])
 
     def set_state_as_attribute(self, state, attr_name=None):
         """
@@ -805,6 +1098,10 @@ class StateAlphabet(
             A list of |StateIdentity| instances corresponding to symbols
             given in ``symbols``.
         """
+        if textprocessing.is_str_type(symbols):
+            states = self._get_states_for_symbol_string(symbols)
+            if states is not None:
+                return states
         states = [self.full_symbol_state_map[s] for s in symbols]
         return states
 
@@ -859,8 +1156,7 @@ class StateAlphabet(
         -------
         s : |StateIdentity| instance
         """
-        states = frozenset(self.get_fundamental_states_for_symbols(symbols))
-        return self._fundamental_states_to_ambiguous_state_map[states]
+        return self._match_multistate(symbols, StateAlphabet.AMBIGUOUS_STATE)
 
     def match_polymorphic_state(self, symbols):
         """
@@ -875,8 +1171,7 @@ class StateAlphabet(
         -------
         s : |StateIdentity| instance
         """
-        states = frozenset(self.get_fundamental_states_for_symbols(symbols))
-        return self._fundamental_states_to_polymorphic_state_map[states]
+        return self._match_multistate(symbols, StateAlphabet.POLYMORPHIC_STATE)
 
     def match_state(self, symbols, state_denomination):
         """
@@ -1428,6 +1723,10 @@ def new_standard_state_alphabet(
 ## Convenience Functions
 
 def coerce_to_state_identities(state_alphabet, values):
+    if textprocessing.is_str_type(values):
+        coerced_values = state_alphabet._get_states_for_symbol_string(values)
+        if coerced_values is not None:
+            return coerced_values
     coerced_values = []
     for v in values:
         if isinstance(v, StateIdentity):
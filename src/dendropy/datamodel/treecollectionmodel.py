@@ -25,17 +25,20 @@ trees.
 import collections
 import math
 import copy
+import multiprocessing
 import sys
 from dendropy.utility import container
 from dendropy.utility import error
 from dendropy.utility import bitprocessing
 from dendropy.utility import deprecate
 from dendropy.utility import constants
+from dendropy.utility import textprocessing
 from dendropy.calculate import statistics
 from dendropy.datamodel import basemodel
 from dendropy.datamodel import taxonmodel
 from dendropy.datamodel import treemodel
 from dendropy import dataio
+from dendropy.dataio import treeindex
 
 ##############################################################################
 ### TreeList
@@ -208,6 +211,44 @@ class TreeList(
         # return tree_list
     _parse_and_create_from_stream = classmethod(_parse_and_create_from_stream)
 
+    def _open_indexed_tree_collection(src, schema, kwargs):
+        # Returns a stream of just the trees requested by the
+        # ``collection_offset`` and ``tree_offset`` keyword arguments if the
+        # file ``src`` is indexed, adjusting ``kwargs`` accordingly; returns
+        # |None| if the file needs to be parsed in full.
+        tree_index = kwargs.pop("tree_index", None)
+        collection_offset = kwargs.get("collection_offset", None)
+        tree_offset = kwargs.get("tree_offset", None)
+        if collection_offset is None and tree_offset is None:
+            return None
+        stream = treeindex.open_indexed_tree_collection(
+                filepath=src,
+                schema=schema,
+                collection_offset=collection_offset,
+                tree_offset=tree_offset,
+                tree_index=tree_index)
+        if stream is not None:
+            kwargs["collection_offset"] = 0
+            kwargs["tree_offset"] = None
+        return stream
+    _open_indexed_tree_collection = staticmethod(_open_indexed_tree_collection)
+
+    def get_from_path(cls, src, schema, **kwargs):
+        """
+        Factory method to return a new |TreeList| object from the file
+        specified by string ``src``. If the file has been indexed (see the
+        ``tree_index`` keyword argument of :meth:`TreeList.get()`), then only
+        the requested trees are read.
+        """
+        stream = cls._open_indexed_tree_collection(src, schema, kwargs)
+        if stream is None:
+            return super(TreeList, cls).get_from_path(src=src, schema=schema, **kwargs)
+        with stream:
+            return cls._parse_and_create_from_stream(stream=stream,
+                    schema=schema,
+                    **kwargs)
+    get_from_path = classmethod(get_from_path)
+
     @classmethod
     def get(cls, **kwargs):
         """
@@ -245,6 +286,16 @@ class TreeList(
               specified, then the first tree (offset = 0) is assumed (i.e., no
               trees within the specified collection will be skipped). Use this
               to specify, e.g. a burn-in.
+            - **tree_index** (*bool*) -- When reading from a path, if the
+              file has a current sidecar index (see
+              ``dendropy.dataio.treeindex``), then trees before
+              ``tree_offset`` (and in other collections) are skipped by
+              seeking past them, instead of being parsed and discarded. If
+              |True|, then the file is indexed if it has not already been; if
+              |False|, then the index is not used. Note that when reading
+              from an index, taxa that are not defined in a "TAXA" block or
+              "TRANSLATE" statement, and not referenced by any of the trees
+              read, are not added to the taxon namespace.
             - **ignore_unrecognized_keyword_arguments** (*bool*) -- If |True|,
               then unsupported or unrecognized keyword arguments will not
               result in an error. Default is |False|: unsupported keyword
@@ -611,6 +662,21 @@ class TreeList(
         new_size = len(self._trees)
         return new_size - cur_size
 
+    def read_from_path(self, src, schema, **kwargs):
+        """
+        Reads data from the file specified by string ``src`` into this
+        |TreeList|. If the file has been indexed (see the ``tree_index``
+        keyword argument of :meth:`TreeList.read()`), then only the requested
+        trees are read.
+        """
+        stream = self._open_indexed_tree_collection(src, schema, kwargs)
+        if stream is None:
+            return super(TreeList, self).read_from_path(src=src, schema=schema, **kwargs)
+        with stream:
+            return self._parse_and_add_from_stream(stream=stream,
+                    schema=schema,
+                    **kwargs)
+
     def read(self, **kwargs):
         """
         Add |Tree| objects to existing |TreeList| from data source providing
@@ -642,6 +708,16 @@ class TreeList(
               specified, then the first tree (offset = 0) is assumed (i.e., no
               trees within the specified collection will be skipped). Use this
               to specify, e.g. a burn-in.
+            - **tree_index** (*bool*) -- When reading from a path, if the
+              file has a current sidecar index (see
+              ``dendropy.dataio.treeindex``), then trees before
+              ``tree_offset`` (and in other collections) are skipped by
+              seeking past them, instead of being parsed and discarded. If
+              |True|, then the file is indexed if it has not already been; if
+              |False|, then the index is not used. Note that when reading
+              from an index, taxa that are not defined in a "TAXA" block or
+              "TRANSLATE" statement, and not referenced by any of the trees
+              read, are not added to the taxon namespace.
             - **ignore_unrecognized_keyword_arguments** (*bool*) -- If |True|,
               then unsupported or unrecognized keyword arguments will not
               result in an error. Default is |False|: unsupported keyword
@@ -1269,6 +1345,110 @@ class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
         # services
         self.tree_decorator = None
 
+    def from_files(cls,
+            files,
+            schema,
+            taxon_namespace=None,
+            processes=None,
+            ignore_edge_lengths=False,
+            ignore_node_ages=True,
+            use_tree_weights=True,
+            ultrametricity_precision=constants.DEFAULT_ULTRAMETRICITY_PRECISION,
+            is_force_max_age=False,
+            taxon_label_age_map=None,
+            **kwargs):
+        """
+        Creates and returns a |SplitDistribution| with the splits of the
+        trees in a set of files counted, reading the trees one-by-one.
+
+        Parameters
+        ----------
+        files : iterable of file paths or file-like objects.
+            Sources from which to read the trees. With multiple processes,
+            these must be file paths.
+        schema : str
+            The name of the data format (e.g., "newick" or "nexus").
+        taxon_namespace : |TaxonNamespace| instance
+            The operational taxonomic unit concept namespace to use to manage
+            taxon definitions. If |None|, then a new one is created.
+        processes : int
+            If greater than 1, then the trees are divided up between this many
+            worker processes, with each counting every ``processes``-th of the
+            trees selected from each file into a shard (see
+            :meth:`SplitDistribution.as_shard()`), and the shards are merged.
+            Otherwise, all trees are counted in this process. Only the order
+            of the edge lengths and node ages collected for each split
+            depends on this.
+        ignore_edge_lengths : bool
+            See the |SplitDistribution| constructor.
+        ignore_node_ages : bool
+            See the |SplitDistribution| constructor.
+        use_tree_weights : bool
+            See the |SplitDistribution| constructor.
+        ultrametricity_precision : float
+            See the |SplitDistribution| constructor.
+        is_force_max_age : bool
+            See the |SplitDistribution| constructor.
+        taxon_label_age_map : dict
+            See the |SplitDistribution| constructor.
+        \*\*kwargs : keyword arguments
+            Passed to :meth:`Tree.yield_from_files()` (e.g., ``tree_offset`` to
+            skip burn-in, or ``rooting``).
+
+        Returns
+        -------
+        s : |SplitDistribution|
+            The split distribution of the trees.
+        """
+        if taxon_namespace is None:
+            taxon_namespace = taxonmodel.TaxonNamespace()
+        split_distribution_kwargs = {
+                "ignore_edge_lengths": ignore_edge_lengths,
+                "ignore_node_ages": ignore_node_ages,
+                "use_tree_weights": use_tree_weights,
+                "ultrametricity_precision": ultrametricity_precision,
+                "is_force_max_age": is_force_max_age,
+                "taxon_label_age_map": taxon_label_age_map,
+                }
+        files = list(files)
+        if processes is None or processes <= 1:
+            split_distribution = cls(taxon_namespace=taxon_namespace, **split_distribution_kwargs)
+            for tree in treemodel.Tree.yield_from_files(files, schema, taxon_namespace=taxon_namespace, **kwargs):
+                split_distribution.count_splits_on_tree(tree)
+            return split_distribution
+        for f in files:
+            if not textprocessing.is_str_type(f):
+                raise TypeError("Trees can only be read by multiple processes from files given by path: {}".format(f))
+        if kwargs.get("tree_index", None):
+            # build indexes here instead of concurrently in the workers
+            for f in files:
+                treeindex.get_tree_file_index(f, schema, build=True)
+            kwargs["tree_index"] = None
+        # Bring in the taxa of the first tree, so that (at least) the
+        # first taxon, relative to which splits of unrooted trees are
+        # normalized, is the same in all the workers.
+        for tree in treemodel.Tree.yield_from_files(files, schema, taxon_namespace=taxon_namespace, **kwargs):
+            break
+        tree_offset = kwargs.pop("tree_offset", None) or 0
+        tree_stride = kwargs.pop("tree_stride", None) or 1
+        tasks = []
+        for worker_idx in range(processes):
+            worker_kwargs = dict(kwargs)
+            worker_kwargs["tree_offset"] = tree_offset + (worker_idx * tree_stride)
+            worker_kwargs["tree_stride"] = tree_stride * processes
+            tasks.append((files, schema, taxon_namespace, split_distribution_kwargs, worker_kwargs))
+        pool = multiprocessing.Pool(processes=processes)
+        try:
+            shards = pool.map(_split_distribution_shard_from_files, tasks, 1)
+        finally:
+            pool.close()
+            pool.join()
+        split_distribution = cls(taxon_namespace=taxon_namespace, **split_distribution_kwargs)
+        for shard in shards:
+            split_distribution.update_from_shard(shard)
+        return split_distribution
+    from_files = classmethod(from_files)
+
     ###########################################################################
     ### Utility
 
@@ -1452,16 +1632,121 @@ class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
             return float(self.sum_of_tree_weights)
 
     def update(self, split_dist):
-        self.total_trees_counted += split_dist.total_trees_counted
-        self.sum_of_tree_weights += split_dist.sum_of_tree_weights
+        """
+        Adds the counts of another split distribution, ``split_dist``, which
+        must have counted splits on trees referencing the same taxon
+        namespace, to the counts of this one. Updating is associative, so,
+        apart from the order of the edge lengths and node ages collected for
+        each split, the result does not depend on how the trees were divided
+        up between distributions.
+        """
+        self._update_counts(
+                total_trees_counted=split_dist.total_trees_counted,
+                sum_of_tree_weights=split_dist.sum_of_tree_weights,
+                tree_rooting_types_counted=split_dist.tree_rooting_types_counted,
+                split_counts=split_dist.split_counts,
+                split_edge_lengths=split_dist.split_edge_lengths,
+                split_node_ages=split_dist.split_node_ages)
+
+    def _update_counts(self,
+            total_trees_counted,
+            sum_of_tree_weights,
+            tree_rooting_types_counted,
+            split_counts,
+            split_edge_lengths,
+            split_node_ages):
+        self.total_trees_counted += total_trees_counted
+        self.sum_of_tree_weights += sum_of_tree_weights
         self._split_edge_length_summaries = None
         self._split_node_age_summaries = None
         self._trees_counted_for_summaries = 0
-        self.tree_rooting_types_counted.update(split_dist.tree_rooting_types_counted)
-        for split in split_dist.split_counts:
-            self.split_counts[split] += split_dist.split_counts[split]
-            self.split_edge_lengths[split] += split_dist.split_edge_lengths[split]
-            self.split_node_ages[split] += split_dist.split_node_ages[split]
+        self.tree_rooting_types_counted.update(tree_rooting_types_counted)
+        for split, count in split_counts.items():
+            self.split_counts[split] += count
+        for split, edge_lengths in split_edge_lengths.items():
+            if edge_lengths:
+                self.split_edge_lengths[split].extend(edge_lengths)
+        for split, node_ages in split_node_ages.items():
+            if node_ages:
+                self.split_node_ages[split].extend(node_ages)
+
+    def as_shard(self):
+        """
+        Returns the counts of this split distribution as a "shard": a compact
+        representation, made up only of plain Python containers, that can be
+        pickled (e.g., to be sent back from a worker process) and merged into
+        another split distribution with
+        :meth:`SplitDistribution.update_from_shard()`.
+
+        As split bitmasks depend on the order in which taxa were added to the
+        taxon namespace, the shard includes the label and bitmask of each
+        taxon, so that it can be merged into a split distribution with a
+        different (but compatible) taxon namespace.
+
+        Returns
+        -------
+        d : dict
+            The shard.
+        """
+        taxon_namespace = self.taxon_namespace
+        return {
+            "taxa": [(taxon.label, taxon_namespace.taxon_bitmask(taxon)) for taxon in taxon_namespace],
+            "total_trees_counted": self.total_trees_counted,
+            "sum_of_tree_weights": self.sum_of_tree_weights,
+            "tree_rooting_types_counted": list(self.tree_rooting_types_counted),
+            "split_counts": dict(self.split_counts),
+            "split_edge_lengths": dict((split, edge_lengths) for split, edge_lengths in self.split_edge_lengths.items() if edge_lengths),
+            "split_node_ages": dict((split, node_ages) for split, node_ages in self.split_node_ages.items() if node_ages),
+            }
+
+    def update_from_shard(self, shard):
+        """
+        Adds the counts of a shard (see :meth:`SplitDistribution.as_shard()`)
+        to the counts of this split distribution.
+
+        Taxa of the shard are matched to those of the taxon namespace of this
+        split distribution by label, with taxa not found being added to it,
+        and the split bitmasks of the shard are remapped as needed. For
+        splits of unrooted trees to be remapped correctly, the first taxon of
+        the taxon namespace of the shard must be the first taxon of the taxon
+        namespace of this split distribution (which will be the case if the
+        taxon namespace of this distribution was not empty when the shard was
+        split off from it, or if it is empty now).
+
+        Parameters
+        ----------
+        shard : dict
+            The shard.
+        """
+        taxon_namespace = self.taxon_namespace
+        bitmask_map = {}
+        is_remapped = False
+        for label, bitmask in shard["taxa"]:
+            target_bitmask = taxon_namespace.taxon_bitmask(taxon_namespace.require_taxon(label=label))
+            bitmask_map[bitmask] = target_bitmask
+            if target_bitmask != bitmask:
+                is_remapped = True
+        split_counts = shard["split_counts"]
+        split_edge_lengths = shard["split_edge_lengths"]
+        split_node_ages = shard["split_node_ages"]
+        if is_remapped:
+            def _remap_bitmask(bitmask):
+                target_bitmask = 0
+                while bitmask:
+                    lsb = bitmask & -bitmask
+                    target_bitmask |= bitmask_map[lsb]
+                    bitmask ^= lsb
+                return target_bitmask
+            split_counts = dict((_remap_bitmask(split), v) for split, v in split_counts.items())
+            split_edge_lengths = dict((_remap_bitmask(split), v) for split, v in split_edge_lengths.items())
+            split_node_ages = dict((_remap_bitmask(split), v) for split, v in split_node_ages.items())
+        self._update_counts(
+                total_trees_counted=shard["total_trees_counted"],
+                sum_of_tree_weights=shard["sum_of_tree_weights"],
+                tree_rooting_types_counted=shard["tree_rooting_types_counted"],
+                split_counts=split_counts,
+                split_edge_lengths=split_edge_lengths,
+                split_node_ages=split_node_ages)
 
     ###########################################################################
     ### Basic Information Access
@@ -1821,6 +2106,14 @@ class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
 ###############################################################################
 ### SplitDistributionSummarizer
 
+def _split_distribution_shard_from_files(task):
+    # (module-level, so that it can be run by worker processes)
+    files, schema, taxon_namespace, split_distribution_kwargs, kwargs = task
+    split_distribution = SplitDistribution(taxon_namespace=taxon_namespace, **split_distribution_kwargs)
+    for tree in treemodel.Tree.yield_from_files(files, schema, taxon_namespace=taxon_namespace, **kwargs):
+        split_distribution.count_splits_on_tree(tree)
+    return split_distribution.as_shard()
+
 class SplitDistributionSummarizer(object):
 
     def __init__(self, **kwargs):
@@ -2390,6 +2683,12 @@ class TreeArray(
                 raise ValueError("TaxonNamespace object passed as keyword argument is not the same as self's TaxonNamespace reference")
             kwargs.pop("taxon_namespace")
         target_tree_offset = kwargs.pop("tree_offset", 0)
+        if target_tree_offset is None:
+            target_tree_offset = 0
+        if target_tree_offset > 0:
+            # let the yielder skip the burn-in, seeking past it in indexed files
+            kwargs["tree_offset"] = target_tree_offset
+            target_tree_offset = 0
         tree_yielder = self.tree_type.yield_from_files(
                 files=files,
                 schema=schema,
@@ -2415,6 +2714,13 @@ class TreeArray(
         new_size = len(self._tree_split_bitmasks)
         return new_size - cur_size
 
+    def read_from_path(self, src, schema, **kwargs):
+        # passed on by path, so that the tree yielder can use the file index
+        cur_size = len(self._tree_split_bitmasks)
+        self.read_from_files(files=[src], schema=schema, **kwargs)
+        new_size = len(self._tree_split_bitmasks)
+        return new_size - cur_size
+
     def read(self, **kwargs):
         """
         Add |Tree| objects to existing |TreeList| from data source providing
@@ -2446,6 +2752,16 @@ class TreeArray(
               specified, then the first tree (offset = 0) is assumed (i.e., no
               trees within the specified collection will be skipped). Use this
               to specify, e.g. a burn-in.
+            - **tree_index** (*bool*) -- When reading from a path, if the
+              file has a current sidecar index (see
+              ``dendropy.dataio.treeindex``), then trees before
+              ``tree_offset`` (and in other collections) are skipped by
+              seeking past them, instead of being parsed and discarded. If
+              |True|, then the file is indexed if it has not already been; if
+              |False|, then the index is not used. Note that when reading
+              from an index, taxa that are not defined in a "TAXA" block or
+              "TRANSLATE" statement, and not referenced by any of the trees
+              read, are not added to the taxon namespace.
             - **ignore_unrecognized_keyword_arguments** (*bool*) -- If |True|,
               then unsupported or unrecognized keyword arguments will not
               result in an error. Default is |False|: unsupported keyword
@@ -2932,12 +3248,15 @@ class TreeArray(
         """
         Returns a dictionary with keys being sets of split bitmasks and values
         being the frequency of occurrence of trees represented by those split
-        bitmask sets in the collection.
+        bitmask sets in the collection. The sets of split bitmasks are given
+        as canonical topology fingerprints, i.e., sorted tuples of the split
+        bitmasks (see :meth:`Tree.topology_fingerprint()`).
         """
         split_bitmask_set_count_map = collections.Counter()
         assert len(self._tree_split_bitmasks) == len(self._tree_weights)
+        fingerprint = treemodel.Tree.split_bitmasks_topology_fingerprint
         for split_bitmask_set, weight in zip(self._tree_split_bitmasks, self._tree_weights):
-            split_bitmask_set_count_map[frozenset(split_bitmask_set)] += (1.0 * weight)
+            split_bitmask_set_count_map[fingerprint(split_bitmask_set)] += (1.0 * weight)
         split_bitmask_set_freqs = {}
         normalization_weight = self._split_distribution.calc_normalization_weight()
         # print("===> {}".format(normalization_weight))
@@ -26,6 +26,7 @@ import collections
 import math
 from dendropy.utility.textprocessing import StringIO
 import copy
+import heapq
 import sys
 from dendropy.utility import GLOBAL_RNG
 from dendropy.utility import container
@@ -38,6 +39,26 @@ from dendropy.utility import textprocessing
 from dendropy.datamodel import basemodel
 from dendropy.datamodel import taxonmodel
 from dendropy import dataio
+from dendropy.dataio import treeindex
+
+##############################################################################
+### Structure Versioning
+
+# Token identifying the current state of the structure (i.e., the parent-child
+# relationships of the nodes) of all trees. This is replaced by a new token on
+# every structural change to any tree, invalidating all cached traversal
+# orders (see :meth:`Tree._get_traversal_order()`).
+_structure_version = object()
+
+def _structure_changed():
+    global _structure_version
+    _structure_version = object()
+
+# Token identifying the current assignment of taxa to the nodes of all trees.
+# This is replaced by a new token whenever the taxon of any node is changed,
+# invalidating the incremental updating of bipartition encodings (see
+# :meth:`Tree._is_bipartition_encoding_current()`).
+_taxon_assignment_version = object()
 
 ##############################################################################
 ### Bipartition
@@ -866,6 +887,7 @@ class Edge(
         old_tail_node = self.tail_node
         new_head_node = old_tail_node
         grandparent = old_tail_node._parent_node
+        _structure_changed()
         if grandparent is not None:
             for idx, ch in enumerate(grandparent._child_nodes):
                 if ch is old_tail_node:
@@ -1019,7 +1041,7 @@ class Node(
 
         """
         basemodel.DataObject.__init__(self, label=kwargs.pop("label", None))
-        self.taxon = kwargs.pop("taxon", None)
+        self._taxon = kwargs.pop("taxon", None)
         self.age = None
         self._edge = None
         self._child_nodes = []
@@ -1638,6 +1660,7 @@ class Node(
         """
         assert node is not self, "Cannot add node as child of itself"
         assert self._parent_node is not node, "Cannot add a node's parent as its child: remove the node from its parent's child set first"
+        _structure_changed()
         node._parent_node = self
         if node not in self._child_nodes:
             self._child_nodes.append(node)
@@ -1664,6 +1687,7 @@ class Node(
         |Node|
             The node that was added.
         """
+        _structure_changed()
         node._parent_node = self
         try:
             cur_index = self._child_nodes.index(node)
@@ -1748,6 +1772,7 @@ class Node(
             raise ValueError("Tried to remove an non-existing or null node")
         children = self._child_nodes
         if node in children:
+            _structure_changed()
             node._parent_node = None
             node.edge.tail_node = None
             index = children.index(node)
@@ -1793,6 +1818,7 @@ class Node(
         """
         Removes all child nodes.
         """
+        _structure_changed()
         del self._child_nodes[:] # list.clear() is not in Python 2.7
 
     def reversible_remove_child(self, node, suppress_unifurcations=False):
@@ -1816,6 +1842,7 @@ class Node(
         except:
             raise ValueError("Tried to remove a node that is not listed as a child")
         removed = [(node, self, pos, [], None)]
+        _structure_changed()
         node._parent_node = None
         node.edge.tail_node = None
         children.remove(node)
@@ -1926,6 +1953,24 @@ class Node(
             e = nd.edge
             e.collapse()
 
+    ###########################################################################
+    ### Taxon
+
+    def _get_taxon(self):
+        """
+        Returns the |Taxon| associated with this node.
+        """
+        return self._taxon
+    def _set_taxon(self, taxon):
+        """
+        Sets the |Taxon| associated with this node.
+        """
+        global _taxon_assignment_version
+        if taxon is not self.__dict__.get("_taxon", None):
+            _taxon_assignment_version = object()
+        self._taxon = taxon
+    taxon = property(_get_taxon, _set_taxon)
+
     ###########################################################################
     ### Edge Access and Manipulation
 
@@ -1944,6 +1989,7 @@ class Node(
         if new_edge is self._edge:
             return
         if self._parent_node is not None:
+            _structure_changed()
             try:
                 self._parent_node._child_nodes.remove(self)
             except ValueError:
@@ -2013,6 +2059,7 @@ class Node(
         return self._parent_node
     def _set_parent_node(self, parent):
         """Sets the parent node of this node."""
+        _structure_changed()
         if self._parent_node is not None:
             try:
                 self._parent_node._child_nodes.remove(self)
@@ -2558,6 +2605,10 @@ class Tree(
     semantically equivalent to the root.
     """
 
+    # Schemas for which a single tree is read by skipping over the preceding
+    # trees without building them, instead of parsing the whole source.
+    _STREAMING_SCHEMAS = ("newick", "nexus")
+
     def _parse_and_create_from_stream(cls,
             stream,
             schema,
@@ -2585,10 +2636,15 @@ class Tree(
 
         Notes
         -----
-        *All* operational taxonomic unit concepts in the data source will be included
-        in the |TaxonNamespace| object associated with the new
-        |TreeList| object and its contained |Tree| objects, even those
-        not associated with tree being retrieved.
+        For NEWICK and NEXUS sources, the trees before the requested one are
+        skipped over without being built, and reading stops once the
+        requested tree has been built: the operational taxonomic unit concepts
+        included in the |TaxonNamespace| object associated with the new
+        |Tree| object are those defined in "TAXA" blocks and "TRANSLATE"
+        statements up to that point, and those referenced by the tree itself.
+        For other schemas, *all* operational taxonomic unit concepts in the
+        data source will be included, even those not associated with tree
+        being retrieved.
 
         Parameters
         ----------
@@ -2649,13 +2705,46 @@ class Tree(
 
         tree_list_factory = lambda label, taxon_namespace: TreeList(label=label, taxon_namespace=taxon_namespace, tree_type=cls)
         label = kwargs.pop("label", None)
-        reader = dataio.get_reader(schema, **kwargs)
         # if collection_offset is None and tree_offset is not None:
         #     raise TypeError("Cannot specify ``tree_offset`` without specifying ``collection_offset``")
         if collection_offset is None:
             collection_offset = 0
         if tree_offset is None:
             tree_offset = 0
+        if (schema in Tree._STREAMING_SCHEMAS
+                and collection_offset >= 0
+                and tree_offset >= 0):
+            # skip over the trees before the requested one without building
+            # them, and stop reading once it has been built
+            tree_yielder = dataio.get_tree_yielder(
+                    files=None,
+                    schema=schema,
+                    taxon_namespace=taxon_namespace,
+                    tree_type=cls,
+                    **kwargs)
+            tree_yielder.select_trees(
+                    tree_offset=tree_offset,
+                    collection_offset=collection_offset,
+                    tree_index=False)
+            if schema == "nexus":
+                # as with the full parse, so that, e.g., multiple "TAXA"
+                # blocks are not silently merged into ``taxon_namespace``
+                tree_yielder._use_taxon_namespace_factory(tns_factory)
+            trees = tree_yielder.iterate_over_stream(stream)
+            try:
+                tree = next(trees, None)
+            finally:
+                trees.close()
+            if tree is None:
+                if tree_yielder.num_tree_collections == 0:
+                    raise ValueError("No trees in data source")
+                elif collection_offset >= tree_yielder.num_tree_collections:
+                    raise IndexError("Collection offset out of range: {} (number of collections = {}, maximum valid collection offset = {})".format(collection_offset, tree_yielder.num_tree_collections, tree_yielder.num_tree_collections-1))
+                else:
+                    raise IndexError("Tree offset out of range: {}".format(tree_offset))
+            tree.label = label
+            return tree
+        reader = dataio.get_reader(schema, **kwargs)
         tree_lists = reader.read_tree_lists(
                     stream=stream,
                     taxon_namespace_factory=tns_factory,
@@ -2705,6 +2794,15 @@ class Tree(
             - **tree_offset** (*int*) -- 0-based index of tree within the
               collection specified by ``collection_offset`` to be parsed. If
               not specified, then the first tree (offset = 0) is assumed.
+            - **tree_index** (*bool*) -- When reading from a path, if the
+              file has a current sidecar index (see
+              ``dendropy.dataio.treeindex``), then only the requested tree is
+              read, by seeking directly to it. If |True|, then the file is
+              indexed if it has not already been; if |False|, then the index
+              is not used. Note that when reading from an index, taxa that
+              are not defined in a "TAXA" block or "TRANSLATE" statement,
+              and not referenced by the requested tree, are not added to the
+              taxon namespace.
             - **ignore_unrecognized_keyword_arguments** (*bool*) -- If |True|,
               then unsupported or unrecognized keyword arguments will not
               result in an error. Default is |False|: unsupported keyword
@@ -2757,6 +2855,31 @@ class Tree(
         """
         return cls._get_from(**kwargs)
 
+    @classmethod
+    def get_from_path(cls, src, schema, **kwargs):
+        """
+        Factory method to return a new |Tree| object from the file specified
+        by string ``src``. If the file has been indexed (see the
+        ``tree_index`` keyword argument of :meth:`Tree.get()`), then only the
+        requested tree is read.
+        """
+        tree_index = kwargs.pop("tree_index", None)
+        stream = treeindex.open_indexed_tree_collection(
+                filepath=src,
+                schema=schema,
+                collection_offset=kwargs.get("collection_offset", None),
+                tree_offset=kwargs.get("tree_offset", None),
+                num_trees=1,
+                tree_index=tree_index)
+        if stream is None:
+            return super(Tree, cls).get_from_path(src=src, schema=schema, **kwargs)
+        kwargs["collection_offset"] = None
+        kwargs["tree_offset"] = None
+        with stream:
+            return cls._parse_and_create_from_stream(stream=stream,
+                    schema=schema,
+                    **kwargs)
+
     def yield_from_files(cls,
             files,
             schema,
@@ -2789,7 +2912,25 @@ class Tree(
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
         \*\*kwargs : keyword arguments
-            These will be passed directly to the schema-parser implementation.
+            These will be passed directly to the schema-parser implementation,
+            except for the following, which select the trees to be yielded
+            from each file:
+
+                - **tree_offset** (*int*) -- 0-based index of the first tree
+                  to be yielded from each file (e.g., the number of trees to
+                  discard as burn-in). Default is 0.
+                - **tree_stride** (*int*) -- Yield only every
+                  ``tree_stride``-th tree from ``tree_offset`` onward (e.g.,
+                  to thin the sample). Default is 1.
+                - **tree_index** (*bool*) -- Files given by path that have a
+                  current sidecar index (see ``dendropy.dataio.treeindex``)
+                  are read by seeking directly to the selected trees, instead
+                  of parsing and discarding the others. If |True|, then
+                  files are indexed if they have not already been; if
+                  |False|, then indexes are not used. Note that when reading
+                  from an index, taxa that are not defined in a "TAXA" block
+                  or "TRANSLATE" statement, and not referenced by any of the
+                  selected trees, are not added to the taxon namespace.
 
         Yields
         ------
@@ -2830,14 +2971,19 @@ class Tree(
                 taxon_namespace = taxonmodel.TaxonNamespace()
         else:
             assert "taxon_set" not in kwargs
-        if "tree_offset" in kwargs:
-            raise TypeError("'tree_offset' is not supported: trees should be skipped/discarded on the client code side")
+        tree_offset = kwargs.pop("tree_offset", None)
+        tree_stride = kwargs.pop("tree_stride", None)
+        tree_index = kwargs.pop("tree_index", None)
         tree_yielder = dataio.get_tree_yielder(
                 files,
                 schema,
                 taxon_namespace=taxon_namespace,
                 tree_type=cls,
                 **kwargs)
+        tree_yielder.select_trees(
+                tree_offset=tree_offset,
+                tree_stride=tree_stride,
+                tree_index=tree_index)
         return tree_yielder
     yield_from_files = classmethod(yield_from_files)
 
@@ -2908,14 +3054,17 @@ class Tree(
             iterating over this. Splits that are incompatible with the
             tree will be skipped. So if not all splits are compatible
             with each other, then the sequence of splits given in
-            ``bipartition_encoding`` should be in order of their support values
-            or some other preference criteria.
+            ``split_bitmasks`` should be in order of their support values
+            or some other preference criteria. The child nodes of each node
+            are ordered with the leaves first, in the order of their taxa in
+            ``taxon_namespace``, followed by the subtrees, in the order of
+            their splits in ``split_bitmasks``.
         taxon_namespace : |TaxonNamespace| instance
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
         is_rooted : bool
             Specifies whether or not the tree is rooted.
-        edge_lengths : dict or |False| or |None|
+        split_edge_lengths : dict or |False| or |None|
             If |False| or |None|, then no edge lengths will be added.
             Otherwise, this should be a dictionary mapping splits to edge
             lengths.
@@ -2924,84 +3073,70 @@ class Tree(
         |Tree|
             The tree reconstructed from the given bipartition encoding.
         """
-        leaf_to_root_search = True
         reconstructed_tree = cls(taxon_namespace=taxon_namespace)
-        # reconstructed_tree.is_rooted = True
         reconstructed_tree.is_rooted = is_rooted
+        leaf_nodes = []
+        leafset_bitmask = 0
         for taxon in taxon_namespace:
-            reconstructed_tree.seed_node.new_child(taxon=taxon)
-        all_taxa_bitmask = taxon_namespace.all_taxa_bitmask()
-        reconstructed_tree.encode_bipartitions()
-        reconstructed_tree.bipartition_encoding = []
-        leaves = reconstructed_tree.leaf_nodes()
-        if leaf_to_root_search:
-            to_leaf_dict = {}
-            for leaf in leaves:
-                to_leaf_dict[leaf.edge.bipartition.leafset_bitmask] = leaf
-        root = reconstructed_tree.seed_node
-        root_edge = root.edge
+            leaf_bitmask = taxon_namespace.taxon_bitmask(taxon)
+            leaf_nodes.append((leaf_bitmask.bit_length() - 1, cls.node_factory(taxon=taxon)))
+            leafset_bitmask |= leaf_bitmask
 
         split_bitmasks_to_add = []
         for s in split_bitmasks:
-            m = s & all_taxa_bitmask
-            if (m != all_taxa_bitmask) and ((m-1) & m): # if not root (i.e., all "1's") and not singleton (i.e., one "1")
-                if is_rooted:
-                    split_bitmasks_to_add.append(m)
-                else:
-                    if 1 & m:
-                        split_bitmasks_to_add.append( (~m) & all_taxa_bitmask )
-                    else:
-                        # "denormalize" split_bitmasks
-                        split_bitmasks_to_add.append(m)
-
-        # Now when we add split_bitmasks in order, we will do a greedy, extended majority-rule consensus tree
-        #for freq, split_to_add, split_in_dict in to_try_to_add:
-        _get_mask = lambda x: getattr(x.bipartition, "_leafset_bitmask")
-        for split_to_add in split_bitmasks_to_add:
-            if (split_to_add & root_edge.bipartition.leafset_bitmask) != split_to_add:
-                # incompatible
-                continue
-            elif leaf_to_root_search:
-                lb = bitprocessing.least_significant_set_bit(split_to_add)
-                one_leaf = to_leaf_dict[lb]
-                parent_node = one_leaf
-                while (split_to_add & parent_node.edge.bipartition.leafset_bitmask) != split_to_add:
-                    parent_node = parent_node.parent_node
+            m = s & leafset_bitmask
+            if not is_rooted and (1 & m):
+                # "denormalize" split_bitmasks
+                m = (~m) & leafset_bitmask
+            if (m != leafset_bitmask) and ((m-1) & m): # if not root (i.e., all "1's") and not singleton (i.e., one "1")
+                split_bitmasks_to_add.append(m)
+
+        # If all the splits are compatible with each other, the order in
+        # which they are given does not matter, and the tree is built
+        # bottom-up from the splits sorted by size. Otherwise, splits are
+        # accepted in the order given (i.e., a greedy, extended
+        # majority-rule consensus tree), skipping those incompatible with
+        # the ones already accepted.
+        clades = _build_clades_from_split_bitmasks(
+                split_bitmasks_to_add,
+                leafset_bitmask)
+        if clades is None:
+            clades = _build_clades_from_split_bitmasks(
+                    _filter_compatible_split_bitmasks(split_bitmasks_to_add, leafset_bitmask),
+                    leafset_bitmask)
+        # Children are ordered as if the splits had been added one by one,
+        # in the order given, to a star tree: the leaves first, in the order
+        # of their taxa in the namespace, then the child clades, in the order
+        # of their splits.
+        split_ranks = {}
+        for split_bitmask in split_bitmasks_to_add:
+            split_ranks.setdefault(split_bitmask, len(leaf_nodes) + len(split_ranks))
+        # nodes (and their ranks) indexed as the clades (see
+        # `_build_clades_from_split_bitmasks()`)
+        clade_nodes = [None] * leafset_bitmask.bit_length()
+        clade_ranks = [None] * len(clade_nodes)
+        for leaf_rank, (leaf_index, leaf_node) in enumerate(leaf_nodes):
+            clade_nodes[leaf_index] = leaf_node
+            clade_ranks[leaf_index] = leaf_rank
+        root_index = len(clade_nodes) + len(clades) - 1
+        for clade_bitmask, child_indexes in clades:
+            if len(clade_nodes) == root_index:
+                node = reconstructed_tree.seed_node
             else:
-                parent_node = reconstructed_tree.mrca(split_bitmask=split_to_add)
-            if parent_node is None or parent_node.edge.bipartition.leafset_bitmask == split_to_add:
-                continue # split is not in tree, or already in tree.
-            new_node = cls.node_factory()
-            #self.map_split_support_to_node(node=new_node, split_support=freq)
-            new_node_children = []
-            new_edge = new_node.edge
-            new_mask = 0
-            for child in parent_node.child_nodes():
-                # might need to modify the following if rooted split_bitmasks
-                # are used
-                cecm = child.edge.bipartition.leafset_bitmask
-                if (cecm & split_to_add):
-                    assert cecm != split_to_add
-                    new_mask |= cecm
-                    new_node_children.append(child)
-                    new_edge.bipartition = Bipartition(
-                            leafset_bitmask=new_mask,
-                            tree_leafset_bitmask=all_taxa_bitmask,
-                            is_mutable=False,
-                            compile_bipartition=True)
-                    reconstructed_tree.bipartition_encoding.append(new_edge.bipartition)
-            # Check to see if we have accumulated all of the bits that we
-            #   needed, but none that we don't need.
-            if new_edge.bipartition.leafset_bitmask == split_to_add:
+                node = cls.node_factory()
                 if split_edge_lengths:
-                    new_edge.length = split_edge_lengths[split_to_add]
-                    #old_split = new_old_split_map[split_to_add]
-                    #new_edge.length = split_edge_lengths[old_split]
-                for child in new_node_children:
-                    parent_node.remove_child(child)
-                    new_node.add_child(child)
-                parent_node.add_child(new_node)
-                # reconstructed_tree.split_edge_map[split_to_add] = new_edge
+                    node.edge.length = split_edge_lengths[clade_bitmask]
+            clade_nodes.append(node)
+            clade_ranks.append(split_ranks.get(clade_bitmask))
+            child_indexes.sort(key=clade_ranks.__getitem__)
+            child_nodes = [clade_nodes[child_index] for child_index in child_indexes]
+            for child in child_nodes:
+                child._parent_node = node
+            node._child_nodes = child_nodes
+        _structure_changed()
+        reconstructed_tree.encode_bipartitions(
+                suppress_unifurcations=False,
+                collapse_unrooted_basal_bifurcation=False)
         return reconstructed_tree
     from_split_bitmasks = classmethod(from_split_bitmasks)
 
@@ -3185,6 +3320,7 @@ class Tree(
             self._seed_node = None
             self.seed_node = None
             self.bipartition_encoding = None
+            self._bipartition_encoding_stamp = None
             self._split_bitmask_edge_map = None
             self._bipartition_edge_map = None
             seed_node = kwargs.pop("seed_node", None)
@@ -3199,6 +3335,17 @@ class Tree(
     ##############################################################################
     ## Bipartitions
 
+    def _get_bipartition_encoding(self):
+        if self.__dict__.get("_is_bipartition_encoding_stale", False):
+            # bipartitions have been updated incrementally
+            self._bipartition_encoding = [edge.bipartition for edge in self.postorder_edge_iter()]
+            self._is_bipartition_encoding_stale = False
+        return self._bipartition_encoding
+    def _set_bipartition_encoding(self, bipartition_encoding):
+        self._bipartition_encoding = bipartition_encoding
+        self._is_bipartition_encoding_stale = False
+    bipartition_encoding = property(_get_bipartition_encoding, _set_bipartition_encoding)
+
     def _get_split_edges(self):
         deprecate.dendropy_deprecation_warning(
                 message="Deprecated since DendroPy 4: 'Tree.split_edges' will no longer be supported in future releases; use 'Tree.bipartition_encoding' for a list of bipartitions on the tree, or dereference the edge through the 'Tree.bipartition_edge_map' attribute.",
@@ -3263,6 +3410,22 @@ class Tree(
 
     def __deepcopy__(self, memo=None):
         # ensure clone map
+        if memo is None:
+            memo = {}
+        traversal_cache = self.__dict__.get("_traversal_cache", None)
+        if traversal_cache is not None:
+            # cached traversals are of the nodes of this tree: do not copy
+            memo[id(traversal_cache)] = None
+        move_listeners = self.__dict__.get("_move_listeners", None)
+        if move_listeners is not None:
+            # listeners are registered with this tree only
+            memo[id(move_listeners)] = None
+        seed_node = self.__dict__.get("_seed_node", None)
+        if seed_node is not None and id(seed_node) not in memo:
+            # clone the nodes and edges first, so that the generic copy of
+            # the remaining tree attributes below finds them in the memo
+            # rather than recursing into the tree structure
+            self._clone_nodes(memo)
         return basemodel.Annotable.__deepcopy__(self, memo=memo)
         # if memo is None:
         #     memo = {}
@@ -3289,6 +3452,85 @@ class Tree(
         # # return
         # return other
 
+    def _clone_nodes(self, memo):
+        """
+        Clones all nodes and edges of this tree, registering the clones in
+        ``memo`` (as used by ``copy.deepcopy()``). Equivalent to (but much
+        faster than) deep-copying each of the nodes and edges in turn, and,
+        as the tree is traversed iteratively, not limited in the depth of the
+        tree by the recursion limit.
+
+        Nodes and edges are copied in two passes: first, all the (empty)
+        clones are created and registered in ``memo``, and then their
+        attributes are populated. Attributes other than the basic ones
+        defined by |Node| and |Edge| (and those bound by client code) are
+        deep-copied, so references to nodes and edges of this tree resolve
+        to their clones. |Taxon| references are resolved through ``memo``,
+        and so remain references to the original |Taxon| objects for
+        taxon-namespace scoped copies; annotations are only copied if
+        there are any.
+        """
+        if id(self.taxon_namespace) not in memo:
+            # exhaustive deep-copy: taxa need to be cloned before nodes
+            copy.deepcopy(self.taxon_namespace, memo)
+        nodes = self._get_traversal_order("preorder")[0]
+        new_nodes = []
+        for nd in nodes:
+            new_nd = nd.__class__.__new__(nd.__class__)
+            memo[id(nd)] = new_nd
+            new_nodes.append(new_nd)
+            memo[id(nd._child_nodes)] = []
+            edge = nd._edge
+            if edge is not None:
+                memo[id(edge)] = edge.__class__.__new__(edge.__class__)
+        for nd, new_nd in zip(nodes, new_nodes):
+            self._clone_element_attributes(nd, new_nd, Tree._CLONE_NODE_REFERENCE_ATTRS, memo)
+            child_nodes = memo[id(nd._child_nodes)]
+            child_nodes.extend([memo[id(ch)] for ch in nd._child_nodes])
+            new_nd._child_nodes = child_nodes
+            edge = nd._edge
+            if edge is not None:
+                new_edge = memo[id(edge)]
+                self._clone_element_attributes(edge, new_edge, Tree._CLONE_EDGE_REFERENCE_ATTRS, memo)
+                bipartition = edge.__dict__.get("_bipartition", None)
+                if bipartition is not None:
+                    try:
+                        new_edge._bipartition = memo[id(bipartition)]
+                    except KeyError:
+                        # all member attributes are immutable values
+                        new_edge._bipartition = copy.copy(bipartition)
+                        memo[id(bipartition)] = new_edge._bipartition
+
+    def _clone_element_attributes(self, element, other, reference_attrs, memo):
+        other.__dict__.update(element.__dict__)
+        for k, v in element.__dict__.items():
+            if k in reference_attrs:
+                if v is not None:
+                    try:
+                        other.__dict__[k] = memo[id(v)]
+                    except KeyError:
+                        other.__dict__[k] = copy.deepcopy(v, memo)
+            elif k == "comments":
+                other.comments = list(v)
+                memo[id(v)] = other.comments
+            elif k == "_annotations":
+                del other.__dict__[k]
+                if v:
+                    other.deep_copy_annotations_from(element, memo)
+            elif k not in Tree._CLONE_SHARED_ATTRS and v.__class__ not in Tree._CLONE_ATOMIC_TYPES:
+                other.__dict__[k] = copy.deepcopy(v, memo)
+
+    # Node and edge attributes referencing other objects of the tree (or
+    # taxa) when cloning; these are resolved through the memo.
+    _CLONE_NODE_REFERENCE_ATTRS = frozenset(["_parent_node", "_edge", "_taxon"])
+    _CLONE_EDGE_REFERENCE_ATTRS = frozenset(["_head_node"])
+    # Attributes that are handled separately when cloning.
+    _CLONE_SHARED_ATTRS = frozenset(["_child_nodes", "_bipartition"])
+    # Types of (immutable) attribute values that can be shared by the clone;
+    # values of any other type (e.g., of the edge length or node age) are
+    # deep-copied.
+    _CLONE_ATOMIC_TYPES = frozenset([type(None), bool, int, float, str])
+
     ###########################################################################
     ### Extracting Trees and Subtrees
 
@@ -4053,6 +4295,135 @@ class Tree(
             #   leaves that have not been encoded with leafset_bitmasks.
             return last_match
 
+    ###########################################################################
+    ### Traversal Orders
+
+    def _get_traversal_order(self, order):
+        """
+        Returns the nodes of the tree in traversal order ``order`` ("preorder",
+        "postorder", or "levelorder").
+
+        The traversal is cached, and served from the cache until the structure
+        of this tree (or of any other tree) changes.
+
+        Returns
+        -------
+        nodes : tuple [|Node|]
+            The nodes of the tree in the traversal order.
+        parent_indexes : tuple [int]
+            The index (in ``nodes``) of the parent of each of the nodes in
+            ``nodes``, or -1 for the seed node.
+        """
+        cache = self.__dict__.get("_traversal_cache", None)
+        if (cache is None
+                or cache[0] is not _structure_version
+                or cache[1] is not self._seed_node):
+            cache = (_structure_version, self._seed_node, {})
+            self._traversal_cache = cache
+        try:
+            return cache[2][order]
+        except KeyError:
+            pass
+        nodes = []
+        parent_indexes = []
+        if order == "levelorder":
+            nodes.append(self._seed_node)
+            parent_indexes.append(-1)
+            index = 0
+            while index < len(nodes):
+                for ch in nodes[index]._child_nodes:
+                    nodes.append(ch)
+                    parent_indexes.append(index)
+                index += 1
+        elif order == "preorder" or order == "postorder":
+            # post-order is the reverse of pre-order with children visited
+            # last to first
+            is_postorder = order == "postorder"
+            stack = [(self._seed_node, -1)]
+            while stack:
+                node, parent_index = stack.pop()
+                index = len(nodes)
+                nodes.append(node)
+                parent_indexes.append(parent_index)
+                if is_postorder:
+                    stack.extend([(ch, index) for ch in node._child_nodes])
+                else:
+                    stack.extend([(ch, index) for ch in reversed(node._child_nodes)])
+            if is_postorder:
+                nodes.reverse()
+                last_index = len(nodes) - 1
+                parent_indexes = [(last_index - p if p >= 0 else -1) for p in reversed(parent_indexes)]
+        else:
+            raise ValueError("Unrecognized traversal order: '{}'".format(order))
+        traversal = (tuple(nodes), tuple(parent_indexes))
+        cache[2][order] = traversal
+        return traversal
+
+    def _traversal_iter(self, order, filter_fn=None):
+        """
+        Iterates over nodes of the tree in traversal order ``order`` (see
+        :meth:`Tree._get_traversal_order()`), serving the nodes from the
+        cached traversal.
+
+        If the structure of the tree changes during the iteration, the
+        iteration continues by traversing the current structure (exactly as
+        :meth:`Node.preorder_iter()` etc. would).
+        """
+        nodes, parent_indexes = self._get_traversal_order(order)
+        version = _structure_version
+        for index, node in enumerate(nodes):
+            if filter_fn is None or filter_fn(node):
+                yield node
+            if _structure_version is not version:
+                for node in self._resume_traversal(order, nodes, parent_indexes, index, filter_fn):
+                    yield node
+                return
+
+    def _resume_traversal(self, order, nodes, parent_indexes, index, filter_fn):
+        # Reconstruct the state of the node iterator of the given order just
+        # after visiting the node at ``index``, based on the structure given by
+        # ``nodes`` and ``parent_indexes``, and continue from there.
+        ancestors = set()
+        parent_index = parent_indexes[index]
+        while parent_index >= 0:
+            ancestors.add(parent_index)
+            parent_index = parent_indexes[parent_index]
+        num_nodes = len(nodes)
+        node = nodes[index]
+        if order == "preorder":
+            stack = [nodes[j] for j in range(num_nodes-1, index, -1) if parent_indexes[j] in ancestors]
+            stack.extend(reversed(node._child_nodes))
+            while stack:
+                node = stack.pop()
+                if filter_fn is None or filter_fn(node):
+                    yield node
+                stack.extend(reversed(node._child_nodes))
+        elif order == "postorder":
+            later_child_indexes = {}
+            for j in range(index+1, num_nodes):
+                if parent_indexes[j] in ancestors and j not in ancestors:
+                    later_child_indexes.setdefault(parent_indexes[j], []).append(j)
+            stack = []
+            for ancestor_index in sorted(ancestors, reverse=True):
+                stack.append((nodes[ancestor_index], True))
+                stack.extend([(nodes[j], False) for j in reversed(later_child_indexes.get(ancestor_index, []))])
+            while stack:
+                node, state = stack.pop()
+                if state:
+                    if filter_fn is None or filter_fn(node):
+                        yield node
+                else:
+                    stack.append((node, True))
+                    stack.extend([(n, False) for n in reversed(node._child_nodes)])
+        else:
+            remaining = [nodes[j] for j in range(index+1, num_nodes) if parent_indexes[j] < index]
+            remaining.extend(node.child_nodes())
+            while len(remaining) > 0:
+                node = remaining.pop(0)
+                if filter_fn is None or filter_fn(node):
+                    yield node
+                remaining.extend(node.child_nodes())
+
     ###########################################################################
     ### Node iterators
 
@@ -4097,7 +4468,7 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding nodes in ``self`` in pre-order sequence.
         """
-        return self.seed_node.preorder_iter(filter_fn=filter_fn)
+        return self._traversal_iter("preorder", filter_fn=filter_fn)
 
     def preorder_internal_node_iter(self, filter_fn=None, exclude_seed_node=False):
         """
@@ -4126,8 +4497,15 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding the internal nodes of ``self``.
         """
-        return self.seed_node.preorder_internal_node_iter(filter_fn=filter_fn,
-                exclude_seed_node=exclude_seed_node)
+        if exclude_seed_node:
+            froot = lambda x: x._parent_node is not None
+        else:
+            froot = lambda x: True
+        if filter_fn:
+            f = lambda x: (froot(x) and x._child_nodes and filter_fn(x)) or None
+        else:
+            f = lambda x: (x and froot(x) and x._child_nodes) or None
+        return self._traversal_iter("preorder", filter_fn=f)
 
     def postorder_node_iter(self, filter_fn=None):
         """
@@ -4151,7 +4529,7 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding the nodes in ``self`` in post-order sequence.
         """
-        return self.seed_node.postorder_iter(filter_fn=filter_fn)
+        return self._traversal_iter("postorder", filter_fn=filter_fn)
 
     def postorder_internal_node_iter(self, filter_fn=None, exclude_seed_node=False):
         """
@@ -4181,8 +4559,15 @@ class Tree(
             An iterator yielding the internal nodes of ``self`` in post-order
             sequence.
         """
-        return self.seed_node.postorder_internal_node_iter(filter_fn=filter_fn,
-                exclude_seed_node=exclude_seed_node)
+        if exclude_seed_node:
+            froot = lambda x: x._parent_node is not None
+        else:
+            froot = lambda x: True
+        if filter_fn:
+            f = lambda x: (froot(x) and x._child_nodes and filter_fn(x)) or None
+        else:
+            f = lambda x: (x and froot(x) and x._child_nodes) or None
+        return self._traversal_iter("postorder", filter_fn=f)
 
     def levelorder_node_iter(self, filter_fn=None):
         """
@@ -4206,7 +4591,7 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding nodes of ``self`` in level-order sequence.
         """
-        return self.seed_node.levelorder_iter(filter_fn=filter_fn)
+        return self._traversal_iter("levelorder", filter_fn=filter_fn)
 
     def level_order_node_iter(self, filter_fn=None):
         """
@@ -4215,7 +4600,7 @@ class Tree(
         deprecate.dendropy_deprecation_warning(
                 message="Deprecated since DendroPy 4: 'level_order_node_iter()' will no longer be supported in future releases; use 'levelorder_node_iter()' instead",
                 stacklevel=3)
-        return self.seed_node.levelorder_iter(filter_fn=filter_fn)
+        return self.levelorder_node_iter(filter_fn=filter_fn)
 
     def inorder_node_iter(self, filter_fn=None):
         """
@@ -4262,7 +4647,11 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding leaf nodes in ``self``.
         """
-        return self.seed_node.leaf_iter(filter_fn=filter_fn)
+        if filter_fn:
+            ff = lambda x: x.is_leaf() and filter_fn(x) or None
+        else:
+            ff = lambda x: x.is_leaf() and x or None
+        return self._traversal_iter("postorder", filter_fn=ff)
 
     def leaf_iter(self, filter_fn=None):
         """
@@ -4271,7 +4660,7 @@ class Tree(
         deprecate.dendropy_deprecation_warning(
                 message="Deprecated since DendroPy 4: 'leaf_iter()' will no longer be supported in future releases; use 'leaf_node_iter()' instead",
                 stacklevel=3)
-        return self.seed_node.leaf_iter(filter_fn=filter_fn)
+        return self.leaf_node_iter(filter_fn=filter_fn)
 
     def ageorder_node_iter(self, include_leaves=True, filter_fn=None, descending=False):
         """
@@ -4418,14 +4807,12 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding nodes in ``self`` in pre-order sequence.
         """
-        # NOTE: from-scratch implementation here instead of wrapping
-        # `preorder_node_iter()`for efficiency
-        stack = [self.seed_node._edge]
-        while stack:
-            edge = stack.pop()
-            if filter_fn is None or filter_fn(edge):
-                yield edge
-            stack.extend(n._edge for n in reversed(edge._head_node._child_nodes))
+        if filter_fn is not None:
+            f = lambda x : filter_fn(x._edge)
+        else:
+            f = None
+        for nd in self._traversal_iter("preorder", filter_fn=f):
+            yield nd._edge
 
     def preorder_internal_edge_iter(self, filter_fn=None, exclude_seed_edge=False):
         """
@@ -4490,33 +4877,12 @@ class Tree(
             An iterator yielding the edges in ``self`` in post-order sequence.
 
         """
-        # NOTE: custom implementation here instead of wrapping
-        # `postorder_node_iter()`for efficiency
-
-        # stack = [(self.seed_node._edge, False)]
-        # while stack:
-        #     edge, state = stack.pop(0)
-        #     if state:
-        #         if filter_fn is None or filter_fn(edge):
-        #             yield edge
-        #     else:
-        #         stack.insert(0, (edge, True))
-        #         child_edges = [(n._edge, False) for n in edge._head_node._child_nodes]
-        #         child_edges.extend(stack)
-        #         stack = child_edges
-
-        ## Prefer `pop()` to `pop(0)`.
-        ## Thanks to Mark T. Holder
-        ## From peyotl commits: d1ffef2 + 19fdea1
-        stack = [(self.seed_node._edge, False)]
-        while stack:
-            edge, state = stack.pop()
-            if state:
-                if filter_fn is None or filter_fn(edge):
-                    yield edge
-            else:
-                stack.append((edge, True))
-                stack.extend([(n._edge, False) for n in reversed(edge._head_node._child_nodes)])
+        if filter_fn is not None:
+            f = lambda x : filter_fn(x._edge)
+        else:
+            f = None
+        for nd in self._traversal_iter("postorder", filter_fn=f):
+            yield nd._edge
 
     def postorder_internal_edge_iter(self, filter_fn=None, exclude_seed_edge=False):
         """
@@ -4584,7 +4950,7 @@ class Tree(
             f = lambda x : filter_fn(x.edge)
         else:
             f = None
-        for nd in self.seed_node.levelorder_iter(filter_fn=f):
+        for nd in self.levelorder_node_iter(filter_fn=f):
             yield nd.edge
 
     def level_order_edge_iter(self, filter_fn=None):
@@ -4650,7 +5016,7 @@ class Tree(
             f = lambda x : filter_fn(x.edge)
         else:
             f = None
-        for nd in self.seed_node.leaf_iter(filter_fn=f):
+        for nd in self.leaf_node_iter(filter_fn=f):
             yield nd.edge
 
     ###########################################################################
@@ -4890,6 +5256,14 @@ class Tree(
         #     debug_children = ", ".join(debug_children)
         #     print("    Children (Node Parent, Edge Tail Node Parent): {}".format(debug_children))
 
+        # if the bipartitions are up to date, only those along the path
+        # between the old and the new seed node need to be updated
+        is_update_bipartitions_along_paths = (update_bipartitions
+                and suppress_unifurcations
+                and collapse_unrooted_basal_bifurcation
+                and self._is_bipartition_encoding_current())
+        changed_nodes = []
+        removed_edges = []
         if self.seed_node is new_seed_node:
             # do not just return: allow for updating of bipartitions,
             # collapsing of unifurcations, collapsing of unrooted basal
@@ -4911,6 +5285,7 @@ class Tree(
             while current_node:
                 if current_node._parent_node is not None:
                     edges_to_invert.append(current_node.edge)
+                changed_nodes.append(current_node)
                 current_node = current_node._parent_node
             while edges_to_invert:
                 edge = edges_to_invert.pop()
@@ -4925,9 +5300,12 @@ class Tree(
                     new_seed_node.remove_child(nsn_ch)
                     for ch in nsn_ch._child_nodes:
                         new_seed_node.add_child(ch)
+                    removed_edges.append(nsn_ch.edge)
             self.seed_node = new_seed_node
 
-        if update_bipartitions:
+        if is_update_bipartitions_along_paths:
+            self.update_bipartitions_along_paths(changed_nodes, removed_edges)
+        elif update_bipartitions:
             self.encode_bipartitions(
                     suppress_unifurcations=suppress_unifurcations,
                     collapse_unrooted_basal_bifurcation=collapse_unrooted_basal_bifurcation)
@@ -4976,6 +5354,13 @@ class Tree(
         ``suppress_unifurcations`` is False, then it will be
         removed from the tree.
         """
+        if update_bipartitions and self._is_rooted:
+            # rooting state does not change, so bipartitions can be updated
+            # while reseeding
+            self.reseed_at(new_seed_node=new_root_node,
+                    update_bipartitions=True,
+                    suppress_unifurcations=suppress_unifurcations)
+            return self.seed_node
         self.reseed_at(new_seed_node=new_root_node,
                 update_bipartitions=False,
                 suppress_unifurcations=suppress_unifurcations)
@@ -5003,6 +5388,7 @@ class Tree(
         ``suppress_unifurcations`` is False, then it will be
         removed from the tree.
         """
+        is_bipartition_encoding_current = self._is_bipartition_encoding_current()
         old_tail = edge.tail_node
         old_head = edge.head_node
         new_seed_node = old_tail.new_child(edge_length=length1)
@@ -5010,6 +5396,11 @@ class Tree(
         # new_seed_node.add_child(old_head, edge_length=length2)
         new_seed_node.add_child(old_head)
         old_head.edge.length = length2
+        if is_bipartition_encoding_current:
+            # splitting the edge does not change any leafsets, and the new
+            # seed node (and all other nodes of which the leafsets change)
+            # will be updated when reseeding
+            self._bipartition_encoding_stamp = self._get_bipartition_encoding_stamp()
         self.reroot_at_node(new_seed_node,
                 update_bipartitions=update_bipartitions,
                 suppress_unifurcations=suppress_unifurcations)
@@ -5154,10 +5545,19 @@ class Tree(
         Collapse all *internal* edges with edge lengths less than or equal to
         ``threshold`` (or with |None| for edge length).
         """
+        is_update_bipartitions_along_paths = (update_bipartitions
+                and self._is_bipartition_encoding_current())
+        changed_nodes = []
+        removed_edges = []
         for e in self.postorder_edge_iter():
             if e.length is None or (e.length <= threshold) and e.is_internal():
-               e.collapse()
-        if update_bipartitions:
+                if e.tail_node is not None:
+                    changed_nodes.append(e.tail_node)
+                    removed_edges.append(e)
+                e.collapse()
+        if is_update_bipartitions_along_paths:
+            self.update_bipartitions_along_paths(changed_nodes, removed_edges)
+        elif update_bipartitions:
             self.update_bipartitions()
 
     def resolve_polytomies(self,
@@ -5186,6 +5586,9 @@ class Tree(
         for node in self.postorder_node_iter():
             if len(node._child_nodes) > limit:
                 polytomies.append(node)
+        is_update_bipartitions_along_paths = (update_bipartitions
+                and self._is_bipartition_encoding_current())
+        changed_nodes = list(polytomies)
         for node in polytomies:
             if rng:
                 to_attach = rng.sample(node._child_nodes, len(node._child_nodes)-limit)
@@ -5196,6 +5599,7 @@ class Tree(
                     next_child = to_attach.pop()
                     next_sib = rng.choice(attachment_points)
                     next_attachment = Node()
+                    changed_nodes.append(next_attachment)
                     p = next_sib._parent_node
                     p.add_child(next_attachment)
                     next_attachment.edge.length = 0.0
@@ -5207,6 +5611,7 @@ class Tree(
             else:
                 while len(node._child_nodes) > limit:
                     nn1 = Node()
+                    changed_nodes.append(nn1)
                     nn1.edge.length = 0.0
                     c1 = node._child_nodes[0]
                     c2 = node._child_nodes[1]
@@ -5215,7 +5620,9 @@ class Tree(
                     nn1.add_child(c1)
                     nn1.add_child(c2)
                     node.add_child(nn1)
-        if update_bipartitions:
+        if is_update_bipartitions_along_paths:
+            self.update_bipartitions_along_paths(changed_nodes)
+        elif update_bipartitions:
             self.update_bipartitions()
 
     def prune_subtree(self,
@@ -5463,6 +5870,7 @@ class Tree(
                 total += len(nd._child_nodes)
                 node_desc_counts[nd] = total
                 nd._child_nodes.sort(key=lambda n: node_desc_counts[n], reverse=not ascending)
+        _structure_changed()
 
     def truncate_from_root(self, distance_from_root):
         self.calc_node_root_distances()
@@ -5484,6 +5892,539 @@ class Tree(
             for ch in nd.child_nodes():
                 nd.remove_child(ch)
 
+    ###########################################################################
+    ### Rearrangements
+
+    def nni_move_iter(self):
+        """
+        Iterates over the nearest-neighbor interchange (NNI) moves on this
+        tree.
+
+        For each internal edge of the tree, a move is yielded for each pair of
+        a child of the head node of the edge and a child (other than the head
+        node) of the tail node of the edge. On unrooted trees with a basal
+        trifurcation, only one of each pair of moves resulting in the same
+        unrooted topology around the edges subtended by the seed node is
+        yielded.
+
+        Moves may be applied to the tree (see :meth:`Tree.apply_move()`)
+        during iteration, as long as they are undone (see
+        :meth:`Tree.undo_move()`) before the next move is requested.
+
+        Returns
+        -------
+        :py:class:`collections.Iterator` [|TreeMove|]
+            An iterator over NNI moves on this tree.
+        """
+        is_unrooted = self.is_unrooted
+        for nd in list(self.preorder_node_iter()):
+            parent = nd._parent_node
+            if parent is None or not nd._child_nodes:
+                continue
+            siblings = [ch for ch in parent._child_nodes if ch is not nd]
+            if is_unrooted and parent._parent_node is None and len(siblings) == 2:
+                siblings = siblings[:1]
+            for sibling in siblings:
+                for child in list(nd._child_nodes):
+                    yield TreeMove("nni", child, sibling)
+
+    def spr_move_iter(self, max_distance=None):
+        """
+        Iterates over the subtree pruning and regrafting (SPR) moves on this
+        tree.
+
+        For each node of the tree (other than the seed node), a move is
+        yielded for each edge of the remainder of the tree onto which the
+        subtree rooted at the node can be regrafted to give a different tree.
+        Moves for each subtree are yielded in order of increasing distance
+        between the pruning and regrafting points. Different moves may result
+        in the same tree.
+
+        Moves may be applied to the tree (see :meth:`Tree.apply_move()`)
+        during iteration, as long as they are undone (see
+        :meth:`Tree.undo_move()`) before the next move is requested.
+
+        Parameters
+        ----------
+        max_distance : integer
+            If not |None|, then only moves regrafting subtrees onto edges
+            of which the far end is at most this number of edges from the
+            parent of the subtree are yielded. A value of 2 gives the moves
+            that are equivalent to NNI moves.
+
+        Returns
+        -------
+        :py:class:`collections.Iterator` [|TreeMove|]
+            An iterator over SPR moves on this tree.
+        """
+        for nd in list(self.preorder_node_iter()):
+            if nd._parent_node is None:
+                continue
+            for target_node in self._get_regraft_target_nodes(
+                    nd,
+                    max_distance=max_distance,
+                    is_subtree_rerooted=False):
+                yield TreeMove("spr", nd, target_node)
+
+    def tbr_move_iter(self, max_distance=None):
+        """
+        Iterates over the tree bisection and reconnection (TBR) moves on this
+        tree.
+
+        For each node of the tree (other than the seed node), a move is
+        yielded for each pair of an edge of the subtree rooted at the node on
+        which the subtree can be rerooted, and an edge of the remainder of
+        the tree onto which it can then be regrafted, to give a different
+        tree. The SPR moves of the tree (see :meth:`Tree.spr_move_iter()`)
+        are included as the moves in which the subtree is not rerooted.
+        Different moves may result in the same tree.
+
+        Moves may be applied to the tree (see :meth:`Tree.apply_move()`)
+        during iteration, as long as they are undone (see
+        :meth:`Tree.undo_move()`) before the next move is requested.
+
+        Parameters
+        ----------
+        max_distance : integer
+            If not |None|, then only moves rerooting subtrees on edges
+            subtending nodes at most this number of edges from the root of the
+            subtree, and regrafting subtrees onto edges of which the far end
+            is at most this number of edges from the parent of the subtree,
+            are yielded.
+
+        Returns
+        -------
+        :py:class:`collections.Iterator` [|TreeMove|]
+            An iterator over TBR moves on this tree.
+        """
+        for nd in list(self.preorder_node_iter()):
+            if nd._parent_node is None:
+                continue
+            subtree_seed_nodes = []
+            stack = [(nd, 0)]
+            while stack:
+                subtree_nd, distance = stack.pop()
+                # rerooting a bifurcating subtree on the edge subtending
+                # either child of its root leaves it unchanged
+                if subtree_nd._parent_node is not nd or len(nd._child_nodes) > 2:
+                    subtree_seed_nodes.append(subtree_nd)
+                if max_distance is None or distance < max_distance:
+                    for ch in reversed(subtree_nd._child_nodes):
+                        stack.append((ch, distance + 1))
+            for subtree_seed_node in subtree_seed_nodes:
+                for target_node in self._get_regraft_target_nodes(
+                        nd,
+                        max_distance=max_distance,
+                        is_subtree_rerooted=subtree_seed_node is not nd):
+                    yield TreeMove("tbr", nd, target_node, subtree_seed_node)
+
+    def apply_move(self, move, update_bipartitions=False):
+        """
+        Applies a rearrangement to this tree.
+
+        Only the nodes immediately involved in the move are touched, and the
+        state needed to undo the move (see :meth:`Tree.undo_move()`) is
+        recorded on the move. Registered move listeners (see
+        :meth:`Tree.add_move_listener()`) are notified once the move has been
+        applied.
+
+        Parameters
+        ----------
+        move : |TreeMove|
+            The move to apply, typically obtained from
+            :meth:`Tree.nni_move_iter()`, :meth:`Tree.spr_move_iter()` or
+            :meth:`Tree.tbr_move_iter()`.
+        update_bipartitions : bool
+            If |True|, then the bipartitions of the tree are updated after the
+            move. If the bipartitions of the tree were up to date before the
+            move, then only those of the edges affected by the move are
+            recalculated (see :meth:`Tree.update_bipartitions_along_paths()`).
+            Otherwise, those of all edges are recalculated, but without
+            suppressing unifurcations or collapsing a basal bifurcation of an
+            unrooted tree, so that the tree (and the nodes referenced by other
+            moves generated for it) is not restructured.
+
+        Returns
+        -------
+        |TreeMove|
+            The move, which can be passed to :meth:`Tree.undo_move()` to
+            revert it.
+        """
+        if move.is_applied:
+            raise ValueError("Move has already been applied")
+        is_bipartition_encoding_current = update_bipartitions and self._is_bipartition_encoding_current()
+        saved_node_states = collections.OrderedDict()
+        def _save_node_state(nd):
+            if id(nd) not in saved_node_states:
+                saved_node_states[id(nd)] = (nd, nd._parent_node, list(nd._child_nodes), nd._edge.length)
+        seed_node = self._seed_node
+        new_nodes = []
+        if move.kind == "nni":
+            changed_nodes = self._apply_nni_move(move, _save_node_state)
+        else:
+            changed_nodes = self._apply_spr_move(move, _save_node_state, new_nodes)
+        _structure_changed()
+        move._saved_state = (seed_node, list(saved_node_states.values()), new_nodes, update_bipartitions)
+        seen = set()
+        move.changed_nodes = []
+        for nd in changed_nodes:
+            if id(nd) not in seen:
+                seen.add(id(nd))
+                move.changed_nodes.append(nd)
+        move.removed_nodes = []
+        if is_bipartition_encoding_current:
+            self.update_bipartitions_along_paths(move.changed_nodes, removed_edges=[])
+        elif update_bipartitions:
+            self._encode_bipartitions_in_place()
+        self._notify_move_listeners(move, False)
+        return move
+
+    def undo_move(self, move):
+        """
+        Reverts a rearrangement applied to this tree.
+
+        The tree is restored to exactly the state it was in before the move
+        was applied (including the identities and order of nodes and the
+        lengths of edges), as long as it has not been otherwise modified
+        since. If several moves have been applied, they must be undone in the
+        reverse order of their application. Registered move listeners (see
+        :meth:`Tree.add_move_listener()`) are notified once the move has been
+        undone.
+
+        Parameters
+        ----------
+        move : |TreeMove|
+            A move applied by :meth:`Tree.apply_move()`. If the bipartitions
+            of the tree were updated when the move was applied, then they are
+            updated here too.
+        """
+        if not move.is_applied:
+            raise ValueError("Move has not been applied")
+        seed_node, saved_node_states, new_nodes, update_bipartitions = move._saved_state
+        is_bipartition_encoding_current = update_bipartitions and self._is_bipartition_encoding_current()
+        for nd, parent_node, child_nodes, edge_length in saved_node_states:
+            nd._parent_node = parent_node
+            nd._child_nodes = child_nodes
+            nd._edge.length = edge_length
+        self._seed_node = seed_node
+        _structure_changed()
+        move._saved_state = None
+        new_node_ids = set(id(nd) for nd in new_nodes)
+        move.changed_nodes = [nd for nd in move.changed_nodes if id(nd) not in new_node_ids]
+        move.removed_nodes = new_nodes
+        if update_bipartitions:
+            if is_bipartition_encoding_current:
+                self.update_bipartitions_along_paths(
+                        move.changed_nodes,
+                        removed_edges=[nd._edge for nd in new_nodes])
+            else:
+                self._encode_bipartitions_in_place()
+        self._notify_move_listeners(move, True)
+
+    def _encode_bipartitions_in_place(self):
+        # Encodes the bipartitions of the tree without restructuring it.
+        self.encode_bipartitions(
+                suppress_unifurcations=False,
+                collapse_unrooted_basal_bifurcation=False)
+
+    def add_move_listener(self, listener):
+        """
+        Registers a function to be called whenever a move is applied to, or
+        undone on, this tree by :meth:`Tree.apply_move()` or
+        :meth:`Tree.undo_move()`.
+
+        The function is called with three arguments: this tree, the
+        |TreeMove| object, and |True| if the move has been undone or |False|
+        if it has been applied. The ``changed_nodes`` and ``removed_nodes``
+        attributes of the move identify the parts of the tree affected by the
+        move, allowing quantities calculated over the tree (e.g., parsimony
+        scores, see :class:`~dendropy.model.parsimony.FitchParsimonyScorer`)
+        to be updated incrementally. Listeners are not copied with the tree.
+
+        Parameters
+        ----------
+        listener : function object
+            The function to call.
+        """
+        listeners = self.__dict__.get("_move_listeners", None)
+        if listeners is None:
+            listeners = []
+            self._move_listeners = listeners
+        listeners.append(listener)
+
+    def remove_move_listener(self, listener):
+        """
+        Unregisters a function registered by
+        :meth:`Tree.add_move_listener()`.
+
+        Parameters
+        ----------
+        listener : function object
+            The function to unregister.
+        """
+        listeners = self.__dict__.get("_move_listeners", None)
+        if not listeners or listener not in listeners:
+            raise ValueError("Not a move listener of this tree: {}".format(listener))
+        listeners.remove(listener)
+
+    def _notify_move_listeners(self, move, is_undo):
+        listeners = self.__dict__.get("_move_listeners", None)
+        if listeners:
+            for listener in list(listeners):
+                listener(self, move, is_undo)
+
+    def _get_prune_successor_node(self, node):
+        # The node that takes the place of the parent of ``node`` in the tree
+        # if the parent is spliced out of the tree (for reuse in regrafting)
+        # on pruning ``node``, or |None| if the parent remains in the tree.
+        parent = node._parent_node
+        siblings = [ch for ch in parent._child_nodes if ch is not node]
+        if len(siblings) == 1:
+            return siblings[0]
+        if len(siblings) == 2 and parent._parent_node is None and self.is_unrooted:
+            # the seed node of an unrooted tree would be left with a basal
+            # bifurcation: one of the remaining children becomes the seed
+            # node, as in `collapse_basal_bifurcation()`
+            for sibling in siblings:
+                if sibling._child_nodes:
+                    return sibling
+        return None
+
+    def _is_prunable_subtree(self, node):
+        # |False| if pruning the subtree rooted at ``node`` would leave a node
+        # without children, or an unrooted tree consisting of a single edge.
+        parent = node._parent_node
+        if len(parent._child_nodes) < 2:
+            return False
+        if (parent._parent_node is None
+                and len(parent._child_nodes) == 3
+                and self.is_unrooted
+                and self._get_prune_successor_node(node) is None):
+            return False
+        return True
+
+    def _get_regraft_target_nodes(self, node, max_distance=None, is_subtree_rerooted=False):
+        # Nodes subtending the edges onto which the subtree rooted at
+        # ``node`` can be regrafted, in breadth-first order from the parent of
+        # ``node``.
+        parent = node._parent_node
+        if not self._is_prunable_subtree(node):
+            return []
+        successor = self._get_prune_successor_node(node)
+        excluded_node_ids = set()
+        if successor is not None:
+            excluded_node_ids.add(id(parent))
+            if parent._parent_node is None and self.is_unrooted:
+                # would become the seed node
+                excluded_node_ids.add(id(successor))
+            if not is_subtree_rerooted:
+                # regrafting onto the edges adjacent to the parent gives back
+                # the original tree
+                for ch in parent._child_nodes:
+                    excluded_node_ids.add(id(ch))
+        if self.is_unrooted:
+            excluded_node_ids.add(id(self._seed_node))
+        distances = {id(parent): 0}
+        target_nodes = []
+        queue = collections.deque([parent])
+        while queue:
+            nd = queue.popleft()
+            distance = distances[id(nd)]
+            neighbors = [ch for ch in nd._child_nodes if ch is not node]
+            if nd._parent_node is not None:
+                neighbors.append(nd._parent_node)
+            for neighbor in neighbors:
+                if id(neighbor) in distances:
+                    continue
+                distances[id(neighbor)] = distance + 1
+                if max_distance is None or distance + 1 < max_distance:
+                    queue.append(neighbor)
+            if id(nd) in excluded_node_ids:
+                continue
+            if nd._parent_node is None or id(nd._parent_node) in distances:
+                target_nodes.append(nd)
+        return target_nodes
+
+    def _apply_nni_move(self, move, save_node_state):
+        node = move.node
+        target_node = move.target_node
+        head_node = node._parent_node
+        if (head_node is None
+                or head_node._parent_node is None
+                or target_node is head_node
+                or target_node._parent_node is not head_node._parent_node):
+            raise ValueError("Not a nearest-neighbor interchange: {} and {}".format(node, target_node))
+        tail_node = head_node._parent_node
+        for nd in (node, target_node, head_node, tail_node):
+            save_node_state(nd)
+        head_node._child_nodes[head_node._child_nodes.index(node)] = target_node
+        tail_node._child_nodes[tail_node._child_nodes.index(target_node)] = node
+        target_node._parent_node = head_node
+        node._parent_node = tail_node
+        return [head_node, tail_node]
+
+    def _apply_spr_move(self, move, save_node_state, new_nodes):
+        node = move.node
+        target_node = move.target_node
+        parent = node._parent_node
+        if parent is None:
+            raise ValueError("Cannot prune subtree rooted at seed node: {}".format(node))
+        if not self._is_prunable_subtree(node):
+            raise ValueError("Cannot prune subtree without leaving a degenerate tree: {}".format(node))
+        nd = target_node
+        while nd is not None and nd is not node:
+            nd = nd._parent_node
+        if nd is node:
+            raise ValueError("Cannot regraft subtree onto itself: {}".format(target_node))
+        if move.kind == "tbr":
+            nd = move.subtree_seed_node
+            while nd is not None and nd is not node:
+                nd = nd._parent_node
+            if nd is None:
+                raise ValueError("Not in subtree being moved: {}".format(move.subtree_seed_node))
+        successor = self._get_prune_successor_node(node)
+        if successor is not None and target_node is parent:
+            raise ValueError("Cannot regraft subtree onto edge removed on pruning: {}".format(target_node))
+        if self.is_unrooted and (target_node is self._seed_node
+                or (target_node is successor and parent._parent_node is None)):
+            raise ValueError("Cannot regraft subtree above seed node of unrooted tree")
+        changed_nodes = []
+
+        # prune
+        save_node_state(node)
+        save_node_state(parent)
+        node_index = parent._child_nodes.index(node)
+        if successor is None:
+            parent._child_nodes.remove(node)
+            changed_nodes.append(parent)
+            junction_node = self.node_factory()
+            new_nodes.append(junction_node)
+        else:
+            save_node_state(successor)
+            grandparent = parent._parent_node
+            if grandparent is not None:
+                save_node_state(grandparent)
+                grandparent._child_nodes[grandparent._child_nodes.index(parent)] = successor
+                successor._parent_node = grandparent
+                try:
+                    successor._edge.length += parent._edge.length
+                except TypeError:
+                    pass
+                changed_nodes.append(grandparent)
+            else:
+                other_siblings = [ch for ch in parent._child_nodes if ch is not node and ch is not successor]
+                for sibling in other_siblings:
+                    save_node_state(sibling)
+                    successor._child_nodes.append(sibling)
+                    sibling._parent_node = successor
+                    try:
+                        sibling._edge.length += successor._edge.length
+                    except TypeError:
+                        pass
+                    changed_nodes.append(successor)
+                successor._parent_node = None
+                successor._edge.length = parent._edge.length
+                self._seed_node = successor
+            parent._child_nodes = []
+            parent._parent_node = None
+            junction_node = parent
+        node._parent_node = None
+
+        # reroot
+        if move.kind == "tbr" and move.subtree_seed_node is not node:
+            subtree_root = self._reroot_detached_subtree(
+                    node,
+                    move.subtree_seed_node,
+                    save_node_state,
+                    new_nodes,
+                    changed_nodes)
+        else:
+            subtree_root = node
+
+        # regraft
+        save_node_state(target_node)
+        target_parent = target_node._parent_node
+        if target_parent is not None:
+            save_node_state(target_parent)
+            target_parent._child_nodes[target_parent._child_nodes.index(target_node)] = junction_node
+            changed_nodes.append(target_parent)
+        else:
+            self._seed_node = junction_node
+        junction_node._parent_node = target_parent
+        if node_index == 0:
+            junction_node._child_nodes = [subtree_root, target_node]
+        else:
+            junction_node._child_nodes = [target_node, subtree_root]
+        subtree_root._parent_node = junction_node
+        target_node._parent_node = junction_node
+        edge_length = target_node._edge.length
+        if edge_length is None:
+            junction_node._edge.length = None
+        else:
+            junction_node._edge.length = edge_length / 2.0
+            target_node._edge.length = edge_length - junction_node._edge.length
+        changed_nodes.append(junction_node)
+        return changed_nodes
+
+    def _reroot_detached_subtree(self,
+            subtree_root,
+            subtree_seed_node,
+            save_node_state,
+            new_nodes,
+            changed_nodes):
+        # Reroots the subtree rooted at ``subtree_root`` (which has been
+        # detached from the tree) on the edge subtending ``subtree_seed_node``,
+        # returning the new root of the subtree.
+        path = [subtree_seed_node]
+        while path[-1] is not subtree_root:
+            path.append(path[-1]._parent_node)
+        if len(subtree_root._child_nodes) <= 2 and len(path) == 2:
+            # rerooting a bifurcating subtree on the edge subtending either
+            # child of its root leaves it unchanged
+            return subtree_root
+        for nd in path:
+            save_node_state(nd)
+        edge_lengths = [nd._edge.length for nd in path]
+        if len(subtree_root._child_nodes) <= 2:
+            # remove the old root from its position, and reuse it as the new
+            # root
+            new_root = subtree_root
+            path.pop()
+            nd = path[-1]
+            for ch in subtree_root._child_nodes:
+                if ch is not nd:
+                    save_node_state(ch)
+                    nd._child_nodes.append(ch)
+                    ch._parent_node = nd
+                    try:
+                        ch._edge.length += nd._edge.length
+                    except TypeError:
+                        pass
+            subtree_root._child_nodes = []
+        else:
+            new_root = self.node_factory()
+            new_nodes.append(new_root)
+            new_root._edge.length = subtree_root._edge.length
+        # reverse the parent-child relationships along the path
+        for idx in range(1, len(path)):
+            path[idx]._child_nodes.remove(path[idx-1])
+        for idx in range(2, len(path)):
+            path[idx-1]._child_nodes.append(path[idx])
+            path[idx]._parent_node = path[idx-1]
+            path[idx]._edge.length = edge_lengths[idx-1]
+        new_root._parent_node = None
+        new_root._child_nodes = [path[0], path[1]]
+        path[0]._parent_node = new_root
+        path[1]._parent_node = new_root
+        if edge_lengths[0] is None:
+            path[1]._edge.length = None
+        else:
+            path[0]._edge.length = edge_lengths[0] / 2.0
+            path[1]._edge.length = edge_lengths[0] - path[0]._edge.length
+        changed_nodes.extend(path)
+        changed_nodes.append(new_root)
+        return new_root
+
     ###########################################################################
     ### Ages, depths, branch lengths etc. (mutation)
 
@@ -5595,78 +6536,65 @@ class Tree(
             Returns collection of node ages.
 
         """
-        ages = []
         if is_force_max_age and is_force_min_age:
             raise ValueError("Cannot specify both 'is_force_max_age' and 'is_force_min_age'")
-        for node in self.postorder_node_iter():
-            child_nodes = node.child_nodes()
-            if set_node_age_fn is not None:
-                node.age = set_node_age_fn(node)
-                # print("Setting node age: {} = {}".format(node.taxon, node.age))
-                if node.age is not None:
+        nodes, parent_indexes = self._get_traversal_order("postorder")
+        if set_node_age_fn is not None:
+            fixed_ages = [set_node_age_fn(node) for node in nodes]
+        else:
+            fixed_ages = None
+        is_check_ultrametricity = not (is_force_max_age
+                or is_force_min_age
+                or ultrametricity_precision is None
+                or ultrametricity_precision is False
+                or ultrametricity_precision < 0)
+        edge_lengths = [node._edge.length for node in nodes]
+        defaulted_edge_length_indexes = []
+        if not (is_force_max_age or is_force_min_age) and None in edge_lengths:
+            # Missing edge lengths are taken to be 0.0 (and set as such) for
+            # the first child of each node, which determines the age of the
+            # node, and for the others if they are checked for ultrametricity.
+            visited_parent_indexes = set()
+            for index, parent_index in enumerate(parent_indexes):
+                if parent_index < 0 or (fixed_ages is not None and fixed_ages[parent_index] is not None):
                     continue
-            if len(child_nodes) == 0:
-               node.age = 0.0
-               if not is_return_internal_node_ages_only:
-                   ages.append(node.age)
-            else:
-                if is_force_max_age:
-                    age_to_set = max([ (child.age + child.edge.length) for child in child_nodes ])
-                elif is_force_min_age:
-                    age_to_set = min([ (child.age + child.edge.length) for child in child_nodes ])
-                else:
-                    first_child = child_nodes[0]
-                    if first_child.edge.length is not None and first_child.age is not None:
-                        age_to_set = first_child.age + first_child.edge.length
-                    elif first_child.edge.length is None:
-                        first_child.edge.length = 0.0
-                        age_to_set = first_child.age
-                    elif first_child.age is None:
-                        first_child.age = 0.0
-                        age_to_set = first_child.edge.length
-                    else:
-                        age_to_set = 0.0
-                node.age = age_to_set
-                if not (is_force_max_age or is_force_min_age or ultrametricity_precision is None or ultrametricity_precision is False or ultrametricity_precision < 0):
-                    for nnd in child_nodes[1:]:
-                        try:
-                            ocnd = nnd.age + nnd.edge.length
-                        except TypeError:
-                            nnd.edge.length = 0.0
-                            ocnd = nnd.age
-                        d = abs(node.age - ocnd)
-                        if  d > ultrametricity_precision:
-                            # try:
-                            #     self.encode_bipartitions()
-                            #     node_id = nnd.bipartition.split_as_newick_string(taxon_namespace=self.taxon_namespace)
-                            # except OSError:
-                            #     node_id = str(nnd)
-                            node_id = str(node)
-                            subtree = node._as_newick_string()
-                            desc = []
-                            for desc_nd in child_nodes:
-                                desc.append("-   {}: has age of {} and edge length of {}, resulting in parent node age of {}".format(
-                                    desc_nd,
-                                    desc_nd.age,
-                                    desc_nd.edge.length,
-                                    desc_nd.edge.length + desc_nd.age))
-                            desc = "\n".join(desc)
-                            raise error.UltrametricityError(
-                                    ("Tree is not ultrametric within threshold of {threshold}: {deviance}.\n"
-                                     "Encountered in subtree of node {node} (edge length of {length}):\n"
-                                     "\n    {subtree}\n\n"
-                                     "Age of children:\n"
-                                     "{desc}"
-                                     ).format(
-                                threshold=ultrametricity_precision,
-                                deviance=d,
-                                node=node_id,
-                                length=node.edge.length,
-                                desc=desc,
-                                subtree=subtree,
-                                ))
-                ages.append(node.age)
-        return ages
+                is_first_child = parent_index not in visited_parent_indexes
+                visited_parent_indexes.add(parent_index)
+                if edge_lengths[index] is None and (is_first_child or is_check_ultrametricity):
+                    nodes[index]._edge.length = edge_lengths[index] = 0.0
+                    defaulted_edge_length_indexes.append(index)
+        ages = _calc_ages_from_arrays(
+                edge_lengths=edge_lengths,
+                parent_indexes=parent_indexes,
+                fixed_ages=fixed_ages,
+                is_force_max_age=is_force_max_age,
+                is_force_min_age=is_force_min_age)
+        for node, age in zip(nodes, ages):
+            node.age = age
+        if is_check_ultrametricity:
+            violations, deviations = _find_ultrametricity_violations(
+                    ages=ages,
+                    edge_lengths=edge_lengths,
+                    parent_indexes=parent_indexes,
+                    ultrametricity_precision=ultrametricity_precision,
+                    fixed_ages=fixed_ages)
+            if violations:
+                index = violations[0]
+                parent_index = parent_indexes[index]
+                # nodes beyond the point of failure are reported as found
+                for defaulted_index in defaulted_edge_length_indexes:
+                    if defaulted_index >= parent_index:
+                        nodes[defaulted_index]._edge.length = None
+                raise _compose_ultrametricity_error(
+                        node=nodes[parent_index],
+                        deviance=deviations[index],
+                        ultrametricity_precision=ultrametricity_precision)
+        if fixed_ages is None and not is_return_internal_node_ages_only:
+            return ages
+        internal_indexes = set(parent_indexes)
+        return [age for index, age in enumerate(ages)
+                if (fixed_ages is None or fixed_ages[index] is None)
+                and (index in internal_indexes or not is_return_internal_node_ages_only)]
 
     def calc_node_root_distances(self, return_leaf_distances_only=True):
         """
@@ -5675,15 +6603,15 @@ class Tree(
         distances. If ``return_leaf_distances_only`` is True, then only
         leaf distances will be true.
         """
-        dists = []
-        for node in self.preorder_node_iter():
-            if node._parent_node is None:
-                node.root_distance = 0.0
-            else:
-                node.root_distance = node.edge.length + node._parent_node.root_distance
-            if (not return_leaf_distances_only or node.is_leaf()):
-                dists.append(node.root_distance)
-        return dists
+        nodes, parent_indexes = self._get_traversal_order("preorder")
+        dists = _calc_root_distances_from_arrays(
+                edge_lengths=[node._edge.length for node in nodes],
+                parent_indexes=parent_indexes)
+        for node, dist in zip(nodes, dists):
+            node.root_distance = dist
+        if not return_leaf_distances_only:
+            return dists
+        return [dist for node, dist in zip(nodes, dists) if not node._child_nodes]
 
     def internal_node_ages(self,
             ultrametricity_precision=constants.DEFAULT_ULTRAMETRICITY_PRECISION,
@@ -5834,6 +6762,7 @@ class Tree(
         """
         self._split_bitmask_edge_map = None
         self._bipartition_edge_map = None
+        self._bipartition_encoding_stamp = None
         taxon_namespace = self._taxon_namespace
         seed_node = self.seed_node
         if not seed_node:
@@ -5903,6 +6832,13 @@ class Tree(
         else:
             # self.bipartition_encoding = dict(zip(map(self._compile_bipartition_for_edge, tree_edges), tree_edges))
             self.bipartition_encoding = list(map(_compile_bipartition, tree_edges))
+            if (suppress_unifurcations
+                    and collapse_unrooted_basal_bifurcation
+                    and not is_bipartitions_mutable):
+                # encoding can be updated incrementally by structural
+                # operations until there are any other changes to the
+                # structure of the tree
+                self._bipartition_encoding_stamp = self._get_bipartition_encoding_stamp()
         return self.bipartition_encoding
 
     def update_bipartitions(self, *args, **kwargs):
@@ -5911,6 +6847,231 @@ class Tree(
         """
         self.encode_bipartitions(*args, **kwargs)
 
+    def update_bipartitions_along_paths(self, nodes, removed_edges=None):
+        """
+        Updates the bipartitions of this tree after local changes to its
+        structure.
+
+        Instead of recalculating the bipartitions of all edges of the tree
+        (as :meth:`Tree.encode_bipartitions()` does), only the bipartitions of
+        the edges subtending ``nodes`` and their ancestors are recalculated,
+        stopping at nodes of which the leafset is unchanged. For operations
+        such as subtree-pruning-and-regrafting or rerooting, this is
+        proportional to the depth of the tree rather than its size. The
+        :attr:`Tree.bipartition_edge_map` and
+        :attr:`Tree.split_bitmask_edge_map`, if already built, are kept up to
+        date.
+
+        As with :meth:`Tree.encode_bipartitions()` (with default arguments),
+        nodes in ``nodes`` that have been left with a single child are
+        removed, and a basal bifurcation of an unrooted tree is collapsed.
+
+        The bipartitions of the tree must have been up to date before the
+        changes to the structure of the tree, and ``nodes`` must include all
+        nodes that have gained or lost child nodes as well as all nodes that
+        have been added to the tree. If the set of leaves of the tree has
+        changed, then all bipartitions of the tree are recalculated.
+
+        Parameters
+        ----------
+        nodes : iterable[|Node|]
+            Nodes whose child nodes have changed, or that have been added to
+            the tree. Nodes that are no longer part of the tree are ignored.
+        removed_edges : iterable[|Edge|]
+            Edges (i.e., subtending nodes) that have been removed from the
+            tree.
+        """
+        if not self.__dict__.get("_bipartition_encoding", None):
+            self.encode_bipartitions()
+            return
+        # (the seed node may have changed, but all existing bipartitions are
+        # normalized against the leafset of the tree)
+        tree_leafset_bitmask = self._bipartition_encoding[0]._tree_leafset_bitmask
+        nodes = list(nodes)
+        if removed_edges is None:
+            removed_edges = []
+        else:
+            removed_edges = list(removed_edges)
+        seed_node = self._seed_node
+        if not self._is_rooted and len(seed_node._child_nodes) == 2:
+            child_nodes = seed_node.child_nodes()
+            self.collapse_basal_bifurcation()
+            for nd in child_nodes:
+                if nd._parent_node is not seed_node:
+                    removed_edges.append(nd.edge)
+                    nodes.append(seed_node)
+        to_check = list(nodes)
+        while to_check:
+            nd = to_check.pop()
+            if len(nd._child_nodes) != 1 or self._get_node_depth(nd) is None:
+                continue
+            # suppress unifurcation, as in `encode_bipartitions()`
+            child = nd._child_nodes[0]
+            if nd.edge.length is not None:
+                if child.edge.length is None:
+                    child.edge.length = nd.edge.length
+                else:
+                    child.edge.length += nd.edge.length
+            removed_edges.append(nd.edge)
+            if nd._parent_node is not None:
+                parent = nd._parent_node
+                pos = parent._child_nodes.index(nd)
+                parent.remove_child(nd)
+                parent.insert_child(index=pos, node=child)
+                nd._parent_node = None
+                nodes.append(parent)
+            else:
+                self.seed_node = child
+                self.seed_node._parent_node = None
+            nodes.append(child)
+            to_check.append(child)
+        # visit nodes (and, where leafsets change, their ancestors) in
+        # order of descending depth, so that children are visited before
+        # their parents
+        heap = []
+        queued = set()
+        for nd in nodes:
+            if id(nd) in queued:
+                continue
+            depth = self._get_node_depth(nd)
+            if depth is not None:
+                queued.add(id(nd))
+                heap.append((-depth, id(nd), nd))
+        heapq.heapify(heap)
+        taxon_namespace = self._taxon_namespace
+        is_rooted = self._is_rooted
+        visited_edges = []
+        updated_bipartitions = []
+        while heap:
+            neg_depth, nd_id, nd = heapq.heappop(heap)
+            edge = nd._edge
+            if nd._child_nodes:
+                leafset_bitmask = 0
+                for child in nd._child_nodes:
+                    child_bipartition = child._edge._bipartition
+                    if child_bipartition is None:
+                        # new node that has not been reported
+                        self.encode_bipartitions()
+                        return
+                    leafset_bitmask |= child_bipartition._leafset_bitmask
+            else:
+                taxon = nd.taxon
+                if taxon:
+                    leafset_bitmask = taxon_namespace.taxon_bitmask(taxon)
+                else:
+                    leafset_bitmask = 0
+            visited_edges.append(edge)
+            bipartition = edge._bipartition
+            if (bipartition is not None
+                    and not bipartition.is_mutable
+                    and bipartition._leafset_bitmask == leafset_bitmask
+                    and bipartition._tree_leafset_bitmask == tree_leafset_bitmask
+                    and bipartition._is_rooted == is_rooted):
+                continue
+            if bipartition is not None:
+                updated_bipartitions.append((edge, bipartition))
+            edge.bipartition = Bipartition(compile_bipartition=False, is_mutable=True)
+            edge.bipartition._leafset_bitmask = leafset_bitmask
+            edge.bipartition._is_rooted = is_rooted
+            edge.bipartition.compile_split_bitmask(
+                    tree_leafset_bitmask=tree_leafset_bitmask,
+                    is_mutable=False)
+            parent = nd._parent_node
+            if parent is not None and id(parent) not in queued:
+                queued.add(id(parent))
+                heapq.heappush(heap, (neg_depth + 1, id(parent), parent))
+        if self._seed_node.edge.bipartition._leafset_bitmask != tree_leafset_bitmask:
+            # leafset of tree has changed: all bipartitions need to be
+            # normalized against the new leafset
+            self.encode_bipartitions()
+            return
+        if self._bipartition_edge_map:
+            bipartition_edge_map = self._bipartition_edge_map
+            split_bitmask_edge_map = self._split_bitmask_edge_map
+            removed = [(edge, edge._bipartition) for edge in removed_edges]
+            for edge, bipartition in removed + updated_bipartitions:
+                if bipartition is None or bipartition.is_mutable:
+                    continue
+                if bipartition_edge_map.get(bipartition, None) is edge:
+                    del bipartition_edge_map[bipartition]
+                if split_bitmask_edge_map.get(bipartition._split_bitmask, None) is edge:
+                    del split_bitmask_edge_map[bipartition._split_bitmask]
+            for edge in visited_edges:
+                bipartition_edge_map[edge.bipartition] = edge
+                split_bitmask_edge_map[edge.bipartition.split_bitmask] = edge
+        self._is_bipartition_encoding_stale = True
+        self._bipartition_encoding_stamp = self._get_bipartition_encoding_stamp()
+
+    def _get_node_depth(self, node):
+        # Number of edges between ``node`` and the seed node of the tree, or
+        # |None| if ``node`` is not part of the tree.
+        depth = 0
+        while node._parent_node is not None:
+            node = node._parent_node
+            depth += 1
+        if node is not self._seed_node:
+            return None
+        return depth
+
+    def _get_bipartition_encoding_stamp(self):
+        # Tokens identifying the state of this tree that its bipartition
+        # encoding depends on: the structure of the tree, the assignment of
+        # taxa to its nodes, its rooting state, and its taxon namespace.
+        return (_structure_version, _taxon_assignment_version, self._is_rooted, self._taxon_namespace)
+
+    def _is_bipartition_encoding_current(self):
+        # |True| if the bipartition encoding of this tree has been calculated
+        # (or updated) by a default call to `encode_bipartitions()` (or
+        # `update_bipartitions_along_paths()`), with no changes to the
+        # structure, rooting state, taxon namespace, or taxa of the nodes of
+        # this (or, for the structure and taxa, any other) tree since then.
+        stamp = self.__dict__.get("_bipartition_encoding_stamp", None)
+        if stamp is None or self.__dict__.get("_bipartition_encoding", None) is None:
+            return False
+        structure_version, taxon_assignment_version, is_rooted, taxon_namespace = stamp
+        return (structure_version is _structure_version
+                and taxon_assignment_version is _taxon_assignment_version
+                and is_rooted == self._is_rooted
+                and taxon_namespace is self._taxon_namespace)
+
+    def topology_fingerprint(self, is_bipartitions_updated=False):
+        """
+        Returns a canonical fingerprint of the topology of this tree: a
+        sorted tuple of the split bitmasks of the tree.
+
+        Two trees with the same rooting state that reference the same
+        |TaxonNamespace| have equal fingerprints if and only if they have
+        the same topology. Unlike sets of |Bipartition| objects, the
+        fingerprint holds no references to the tree, and is cheap to hash,
+        compare and store, making it suitable as a key for counting distinct
+        topologies across large numbers of trees.
+
+        Parameters
+        ----------
+        is_bipartitions_updated : bool
+            If |False| [default], then the tree will have its bipartitions
+            encoded or updated. Otherwise, if |True|, then the tree is assumed
+            to have its bipartitions already encoded and updated.
+
+        Returns
+        -------
+        f : tuple[int]
+            The topology fingerprint of this tree.
+        """
+        if not is_bipartitions_updated:
+            self.encode_bipartitions()
+        return Tree.split_bitmasks_topology_fingerprint(
+                [bipartition.split_bitmask for bipartition in self.bipartition_encoding])
+
+    def split_bitmasks_topology_fingerprint(split_bitmasks):
+        """
+        Returns the canonical topology fingerprint (see
+        :meth:`Tree.topology_fingerprint()`) of the tree encoded by
+        ``split_bitmasks``: a sorted tuple of the distinct split bitmasks.
+        """
+        return tuple(sorted(set(split_bitmasks)))
+    split_bitmasks_topology_fingerprint = staticmethod(split_bitmasks_topology_fingerprint)
+
     def encode_splits(self, *args, **kwargs):
         """
         Recalculates bipartition hashes for tree.
@@ -6406,6 +7567,96 @@ class Tree(
                 width=width,
                 )
 
+###############################################################################
+### TreeMove
+
+class TreeMove(object):
+    """
+    A topological rearrangement of a tree.
+
+    Moves are typically obtained from :meth:`Tree.nni_move_iter()`,
+    :meth:`Tree.spr_move_iter()` or :meth:`Tree.tbr_move_iter()`, and are
+    applied to (and reverted on) the tree by :meth:`Tree.apply_move()` and
+    :meth:`Tree.undo_move()`.
+
+    Three kinds of moves are supported:
+
+        "nni"
+            Nearest-neighbor interchange: ``node``, a child of the head node
+            of an internal edge, swaps places with ``target_node``, a child
+            of the tail node of that edge. Edge lengths travel with the
+            swapped subtrees.
+        "spr"
+            Subtree pruning and regrafting: the subtree rooted at ``node`` is
+            pruned from the tree and regrafted onto the edge subtending
+            ``target_node``.
+        "tbr"
+            Tree bisection and reconnection: as "spr", but before
+            regrafting, the pruned subtree is rerooted on the edge subtending
+            ``subtree_seed_node``, a node in the pruned subtree.
+
+    When an SPR or TBR move leaves the parent of the pruned subtree with a
+    single (unrooted) neighbor, that node is removed from its position and
+    reused to connect the subtree to the regrafting edge (with the length of
+    the regrafting edge split equally between its two parts). Otherwise, a
+    new node is created for this purpose. In either case, the number of nodes
+    touched is constant for NNI and SPR moves, and proportional to the
+    distance between ``node`` and ``subtree_seed_node`` for TBR moves.
+
+    Once applied, a move records the state needed to undo it, as well as the
+    nodes affected by its application (or undoing), for the use of move
+    listeners (see :meth:`Tree.add_move_listener()`):
+
+        ``changed_nodes``
+            Nodes, now in the tree, of which the child nodes have changed,
+            or which have been added to the tree. The sets of descendant
+            leaves of these nodes and their ancestors may have changed; those
+            of all other nodes are unaffected.
+        ``removed_nodes``
+            Nodes that are no longer part of the tree.
+    """
+
+    def __init__(self, kind, node, target_node, subtree_seed_node=None):
+        """
+        Parameters
+        ----------
+        kind : str
+            One of "nni", "spr" or "tbr".
+        node : |Node|
+            The node to be swapped (NNI), or the root of the subtree to be
+            pruned (SPR and TBR).
+        target_node : |Node|
+            The node to be swapped with ``node`` (NNI), or the node
+            subtending the edge on which the subtree is to be regrafted (SPR
+            and TBR).
+        subtree_seed_node : |Node|
+            For TBR moves, the node subtending the edge of the pruned subtree
+            on which it is to be rerooted. Defaults to ``node``, in which case
+            the move is equivalent to an SPR move.
+        """
+        if kind not in ("nni", "spr", "tbr"):
+            raise ValueError("Unrecognized move kind: '{}'".format(kind))
+        self.kind = kind
+        self.node = node
+        self.target_node = target_node
+        if subtree_seed_node is None:
+            subtree_seed_node = node
+        self.subtree_seed_node = subtree_seed_node
+        self.changed_nodes = []
+        self.removed_nodes = []
+        self._saved_state = None
+
+    def __repr__(self):
+        return "<TreeMove {} {} {} {}>".format(
+                self.kind,
+                self.node,
+                self.target_node,
+                self.subtree_seed_node)
+
+    def _get_is_applied(self):
+        return self._saved_state is not None
+    is_applied = property(_get_is_applied)
+
 ###############################################################################
 ### AsciiTreePlot
 
@@ -6718,3 +7969,209 @@ def _convert_node_to_root_polytomy(nd):
         return tuple(ndl)
     return ()
 
+
+def _calc_ages_from_arrays(edge_lengths,
+        parent_indexes,
+        fixed_ages=None,
+        is_force_max_age=False,
+        is_force_min_age=False):
+    """
+    Calculates the ages of the nodes of a tree given as parallel arrays in
+    postorder (i.e., with every node preceding its parent).
+
+    Parameters
+    ----------
+    edge_lengths : list [numeric]
+        Length of the edge subtending each node.
+    parent_indexes : list [int]
+        Index of the parent of each node, or -1 for the seed node.
+    fixed_ages : list [numeric or None]
+        If not |None|, then any non-|None| value in this list fixes the age
+        of the corresponding node, which is then not calculated from its
+        children.
+    is_force_max_age : bool
+        If |True|, then each node is set to the oldest age given its children
+        and their edge lengths. Otherwise, ages are calculated from the first
+        child of each node.
+    is_force_min_age : bool
+        If |True|, then each node is set to the youngest age given its
+        children and their edge lengths.
+
+    Returns
+    -------
+    ages : list [numeric]
+        The age of each node.
+    """
+    if fixed_ages is None:
+        ages = [None] * len(parent_indexes)
+    else:
+        ages = list(fixed_ages)
+    for index, parent_index in enumerate(parent_indexes):
+        age = ages[index]
+        if age is None:
+            # not fixed and no children: a leaf
+            age = ages[index] = 0.0
+        if parent_index < 0 or (fixed_ages is not None and fixed_ages[parent_index] is not None):
+            continue
+        parent_age = ages[parent_index]
+        if parent_age is None:
+            ages[parent_index] = age + edge_lengths[index]
+        elif is_force_max_age:
+            parent_age = age + edge_lengths[index]
+            if parent_age > ages[parent_index]:
+                ages[parent_index] = parent_age
+        elif is_force_min_age:
+            parent_age = age + edge_lengths[index]
+            if parent_age < ages[parent_index]:
+                ages[parent_index] = parent_age
+    return ages
+
+def _calc_root_distances_from_arrays(edge_lengths, parent_indexes):
+    """
+    Calculates the distance from the seed node of the nodes of a tree given as
+    parallel arrays in which every node follows its parent (e.g., preorder or
+    level-order).
+
+    Parameters
+    ----------
+    edge_lengths : list [numeric]
+        Length of the edge subtending each node.
+    parent_indexes : list [int]
+        Index of the parent of each node, or -1 for the seed node.
+
+    Returns
+    -------
+    root_distances : list [numeric]
+        The sum of edge lengths from the seed node to each node.
+    """
+    root_distances = [0.0] * len(parent_indexes)
+    for index, parent_index in enumerate(parent_indexes):
+        if parent_index >= 0:
+            root_distances[index] = edge_lengths[index] + root_distances[parent_index]
+    return root_distances
+
+def _find_ultrametricity_violations(ages, edge_lengths, parent_indexes, ultrametricity_precision, fixed_ages=None):
+    """
+    Returns the indexes of the nodes for which the age of the parent implied
+    by the age of the node and its edge length differs from the actual age of
+    the parent by more than ``ultrametricity_precision``, in order of the
+    indexes of their parents. Nodes without edge lengths, and the children of
+    nodes with ages fixed by ``fixed_ages`` (if given), are not checked.
+    """
+    deviations = [0.0] * len(parent_indexes)
+    for index, parent_index in enumerate(parent_indexes):
+        edge_length = edge_lengths[index]
+        if (parent_index < 0
+                or edge_length is None
+                or (fixed_ages is not None and fixed_ages[parent_index] is not None)):
+            continue
+        deviations[index] = abs(ages[parent_index] - (ages[index] + edge_length))
+    violations = [index for index, deviation in enumerate(deviations) if deviation > ultrametricity_precision]
+    violations.sort(key=lambda index: (parent_indexes[index], index))
+    return violations, deviations
+
+def _compose_ultrametricity_error(node, deviance, ultrametricity_precision):
+    child_nodes = node._child_nodes
+    desc = []
+    for desc_nd in child_nodes:
+        desc.append("-   {}: has age of {} and edge length of {}, resulting in parent node age of {}".format(
+            desc_nd,
+            desc_nd.age,
+            desc_nd.edge.length,
+            desc_nd.edge.length + desc_nd.age))
+    desc = "\n".join(desc)
+    return error.UltrametricityError(
+            ("Tree is not ultrametric within threshold of {threshold}: {deviance}.\n"
+             "Encountered in subtree of node {node} (edge length of {length}):\n"
+             "\n    {subtree}\n\n"
+             "Age of children:\n"
+             "{desc}"
+             ).format(
+        threshold=ultrametricity_precision,
+        deviance=deviance,
+        node=str(node),
+        length=node.edge.length,
+        desc=desc,
+        subtree=node._as_newick_string(),
+        ))
+
+def _build_clades_from_split_bitmasks(split_bitmasks, leafset_bitmask):
+    """
+    Builds the clades of the tree given by ``split_bitmasks`` bottom-up,
+    processing the splits in order of increasing size and tracking the
+    largest clade built so far that contains each leaf (with path compression,
+    as in a union-find structure).
+
+    Leaves are indexed by the index of their bit in ``leafset_bitmask``, and
+    clades by their position in the returned list offset by the bit length of
+    ``leafset_bitmask``. Returns a list of pairs, (clade bitmask, child
+    indexes), for each clade (but not the leaves), with every clade listed
+    after its children and the clade of all leaves listed last, where the
+    child clades (or leaves) are listed in order of their lowest set bit. If
+    the splits are not compatible with each other, |None| is returned.
+    """
+    num_leaf_indexes = leafset_bitmask.bit_length()
+    # index of a larger clade containing each leaf or clade (or of the leaf or
+    # clade itself if there is none)
+    containing_clade_indexes = list(range(num_leaf_indexes))
+    def _get_largest_clade_index(index):
+        largest_index = index
+        while containing_clade_indexes[largest_index] != largest_index:
+            largest_index = containing_clade_indexes[largest_index]
+        while containing_clade_indexes[index] != largest_index:
+            containing_clade_indexes[index], index = largest_index, containing_clade_indexes[index]
+        return largest_index
+    clades = []
+    split_bitmasks = sorted(set(split_bitmasks), key=bitprocessing.num_set_bits)
+    split_bitmasks.append(leafset_bitmask)
+    for split_bitmask in split_bitmasks:
+        clade_index = num_leaf_indexes + len(clades)
+        containing_clade_indexes.append(clade_index)
+        child_indexes = []
+        remaining_bitmask = split_bitmask
+        while remaining_bitmask:
+            child_index = _get_largest_clade_index((remaining_bitmask & -remaining_bitmask).bit_length() - 1)
+            if child_index < num_leaf_indexes:
+                child_bitmask = 1 << child_index
+            else:
+                child_bitmask = clades[child_index - num_leaf_indexes][0]
+                if child_bitmask & ~split_bitmask:
+                    return None
+            child_indexes.append(child_index)
+            containing_clade_indexes[child_index] = clade_index
+            remaining_bitmask ^= child_bitmask
+        clades.append((split_bitmask, child_indexes))
+    return clades
+
+def _filter_compatible_split_bitmasks(split_bitmasks, leafset_bitmask):
+    """
+    Returns the splits in ``split_bitmasks`` that are compatible with all the
+    splits preceding them that have been accepted, in order.
+    """
+    parent_clade_bitmasks = {}
+    def _get_parent_clade(bitmask):
+        return parent_clade_bitmasks.get(bitmask, leafset_bitmask)
+    compatible_split_bitmasks = []
+    for split_bitmask in split_bitmasks:
+        # smallest clade containing the split
+        parent_bitmask = split_bitmask & -split_bitmask
+        while (parent_bitmask & split_bitmask) != split_bitmask:
+            parent_bitmask = _get_parent_clade(parent_bitmask)
+        if parent_bitmask == split_bitmask:
+            continue
+        child_bitmasks = []
+        remaining_bitmask = split_bitmask
+        while remaining_bitmask:
+            child_bitmask = remaining_bitmask & -remaining_bitmask
+            while _get_parent_clade(child_bitmask) != parent_bitmask:
+                child_bitmask = _get_parent_clade(child_bitmask)
+            if child_bitmask & ~split_bitmask:
+                break
+            child_bitmasks.append(child_bitmask)
+            remaining_bitmask &= ~child_bitmask
+        else:
+            for child_bitmask in child_bitmasks:
+                parent_clade_bitmasks[child_bitmask] = split_bitmask
+            parent_clade_bitmasks[split_bitmask] = parent_bitmask
+            compatible_split_bitmasks.append(split_bitmask)
+    return compatible_split_bitmasks
@@ -72,6 +72,7 @@ class PhylogeneticIndependentConstrasts(object):
         self._is_fully_analyzed = False
         self._polytomy_strategy = None
         self._character_contrasts = {}
+        self._postorder_structure = None
         self._set_polytomy_strategy(polytomy_strategy)
         self.tree = tree
         self.char_matrix = char_matrix
@@ -102,6 +103,7 @@ class PhylogeneticIndependentConstrasts(object):
         self._tree = dendropy.Tree(tree)
         if self._polytomy_strategy == 'resolve':
             self._tree.resolve_polytomies()
+        self._postorder_structure = None
         self.is_dirty = True
     tree = property(_get_tree, _set_tree, None, """\
             This tree will have an attribute added to each node, ``pic``. This
@@ -222,6 +224,185 @@ class PhylogeneticIndependentConstrasts(object):
         self._character_contrasts[character_index] = dict(all_results)
         return self._character_contrasts[character_index]
 
+    def _get_postorder_structure(self):
+        """
+        Returns (and caches) the character-independent elements of the
+        analysis as a tuple of lists, each indexed by the postorder position
+        of the node on ``self._tree``:
+
+            - the nodes themselves
+            - the taxa associated with the leaves (|None| for internal nodes)
+            - the postorder indices of the child nodes
+            - the weights of each child node's state value in the
+              calculation of the node's state value (|None| for leaves and
+              nodes that are not analyzed)
+            - ``pic_edge_length_error``
+            - ``pic_corrected_edge_length``
+            - ``pic_contrast_variance``
+
+        This is only recalculated if the tree changes, so that repeated
+        analyses of different characters or character matrices on the same
+        tree only need to traverse it once.
+        """
+        if self._postorder_structure is not None:
+            return self._postorder_structure
+        nodes = []
+        taxa = []
+        child_indices = []
+        child_weights = []
+        edge_length_errors = []
+        corrected_edge_lengths = []
+        contrast_variances = []
+        node_index_map = {}
+        for nd in self._tree.postorder_node_iter():
+            idx = len(nodes)
+            node_index_map[nd] = idx
+            nodes.append(nd)
+            ch_indices = [node_index_map[cnd] for cnd in nd._child_nodes]
+            child_indices.append(ch_indices)
+            if len(ch_indices) == 0:
+                taxa.append(nd.taxon)
+                child_weights.append(None)
+                edge_length_errors.append(0.0)
+                corrected_edge_lengths.append(nd.edge.length)
+                contrast_variances.append(None)
+            elif len(ch_indices) == 1:
+                # root node?
+                taxa.append(None)
+                child_weights.append(None)
+                edge_length_errors.append(None)
+                corrected_edge_lengths.append(None)
+                contrast_variances.append(None)
+            else:
+                if len(ch_indices) != 2 and self._polytomy_strategy != "ignore":
+                    raise ValueError("Tree is not fully-bifurcating")
+                taxa.append(None)
+                corrected_edge_lens = []
+                for cnd, ch_idx in zip(nd._child_nodes, ch_indices):
+                    if corrected_edge_lengths[ch_idx] is not None:
+                        corrected_edge_lens.append(corrected_edge_lengths[ch_idx])
+                    else:
+                        corrected_edge_lens.append(cnd.edge.length)
+                inverse_edge_lens = [1.0/e for e in corrected_edge_lens]
+                sum_of_inverse_edge_lens = sum(inverse_edge_lens)
+                child_weights.append([w/sum_of_inverse_edge_lens for w in inverse_edge_lens])
+                sum_of_child_edges = sum(corrected_edge_lens)
+                prod_of_child_edges = reduce(operator.mul, corrected_edge_lens)
+                edge_length_errors.append( prod_of_child_edges / (sum_of_child_edges) )
+                if nd.edge.length is not None:
+                    corrected_edge_lengths.append(nd.edge.length + edge_length_errors[-1])
+                else:
+                    corrected_edge_lengths.append(None)
+                contrast_variances.append(sum_of_child_edges)
+        self._postorder_structure = (
+                nodes,
+                taxa,
+                child_indices,
+                child_weights,
+                edge_length_errors,
+                corrected_edge_lengths,
+                contrast_variances)
+        return self._postorder_structure
+
+    def contrasts_matrix(self,
+            character_indices=None,
+            char_matrix=None):
+        """
+        Calculates the contrasts for multiple characters at once.
+
+        All characters are analyzed together in a single postorder pass over
+        the tree, with the state values, contrasts, etc. at each node
+        calculated as vectors across characters. Quantities that do not
+        depend on the character values (e.g., the corrected edge lengths)
+        are calculated only once per tree and cached, so that repeated
+        calls, including calls that analyze a different ``char_matrix``, do
+        not need to re-traverse the tree. Unlike :meth:`contrasts_tree`,
+        the tree is not annotated.
+
+        Parameters
+        ----------
+        character_indices : iterable[int]
+            Indices of the characters (columns) to analyze. If not specified,
+            all characters are analyzed.
+        char_matrix : |ContinuousCharacterMatrix|
+            If specified, the characters in this matrix will be analyzed
+            instead of those of ``self.char_matrix``. The tree structure
+            cached by this object will be reused.
+
+        Returns
+        -------
+        d : dict
+            A dictionary with the following keys:
+
+                - ``nodes``: a list of the nodes of the tree being analyzed,
+                  in postorder.
+                - ``character_indices``: a list of the character indices
+                  analyzed.
+                - ``pic_state_value``
+                - ``pic_contrast_raw``
+                - ``pic_contrast_standardized``
+                - ``pic_state_variance``
+                - ``pic_contrast_variance``
+                - ``pic_edge_length_error``
+                - ``pic_corrected_edge_length``
+
+            Each of the "``pic_``" values is a list with elements
+            corresponding to the nodes in ``nodes``. For the first three,
+            each of these elements is itself a list with values
+            corresponding to the characters in ``character_indices`` (or
+            |None| if the value is not defined for the node), while for the
+            others, which do not depend on the character values, each element
+            is a single value.
+        """
+        if char_matrix is None:
+            char_matrix = self._char_matrix
+        if character_indices is None:
+            character_indices = list(range(char_matrix.vector_size))
+        else:
+            character_indices = list(character_indices)
+        nodes, taxa, child_indices, child_weights, edge_length_errors, corrected_edge_lengths, contrast_variances = self._get_postorder_structure()
+        state_values = []
+        contrasts_raw = []
+        contrasts_standardized = []
+        for idx, nd in enumerate(nodes):
+            ch_indices = child_indices[idx]
+            if len(ch_indices) == 0:
+                vals = char_matrix[taxa[idx]].values()
+                state_values.append([vals[cidx] for cidx in character_indices])
+                contrasts_raw.append(None)
+                contrasts_standardized.append(None)
+            elif len(ch_indices) == 1:
+                state_values.append(None)
+                contrasts_raw.append(None)
+                contrasts_standardized.append(None)
+            elif len(ch_indices) == 2:
+                w0, w1 = child_weights[idx]
+                x0 = state_values[ch_indices[0]]
+                x1 = state_values[ch_indices[1]]
+                state_values.append([w0*a + w1*b for a, b in zip(x0, x1)])
+                raw = [a - b for a, b in zip(x0, x1)]
+                scale = 1.0 / (contrast_variances[idx] ** 0.5)
+                contrasts_raw.append(raw)
+                contrasts_standardized.append([c * scale for c in raw])
+            else:
+                weights = child_weights[idx]
+                child_state_values = [state_values[ch_idx] for ch_idx in ch_indices]
+                state_values.append([sum(w * x for w, x in zip(weights, col)) for col in zip(*child_state_values)])
+                contrasts_raw.append(None)
+                contrasts_standardized.append(None)
+        state_variances = [None if not ch_indices else cel for ch_indices, cel in zip(child_indices, corrected_edge_lengths)]
+        return {
+            "nodes": list(nodes),
+            "character_indices": character_indices,
+            "pic_state_value": state_values,
+            "pic_contrast_raw": contrasts_raw,
+            "pic_contrast_standardized": contrasts_standardized,
+            "pic_state_variance": state_variances,
+            "pic_contrast_variance": list(contrast_variances),
+            "pic_edge_length_error": list(edge_length_errors),
+            "pic_corrected_edge_length": list(corrected_edge_lengths),
+        }
+
     def contrasts_tree(self,
             character_index,
             annotate_pic_statistics=True,
@@ -365,6 +546,179 @@ def evolve_continuous_char(node, rng=None, **kwargs):
         if mean_val_attr:
             setattr(nd, mean_val_attr, mr)
 
+def simulate_continuous_chars(
+        tree_model,
+        num_chars=None,
+        root_states=None,
+        variance_rate=1.0,
+        vcv=None,
+        min_value=None,
+        max_value=None,
+        rate_model=None,
+        root_rate=1.0,
+        roeotroe=1.0,
+        min_rate=0.0,
+        max_rate=None,
+        constrain_rate_mode="crop",
+        char_matrix=None,
+        rng=None):
+    """
+    Simulates multiple (optionally correlated) continuous characters under
+    Brownian motion on ``tree_model``, with optional bounds on the character
+    values and optional evolution of the rate of character evolution.
+
+    All characters are simulated together in a single preorder pass over the
+    tree: for each edge, the increments of all characters are drawn at once
+    (as a single multivariate normal draw, if ``vcv`` is given), so the cost
+    of traversing the tree is paid once rather than once per character.
+
+    Parameters
+    ----------
+    tree_model : |Tree|
+        Tree on which to simulate. Edge lengths are taken to be durations.
+    num_chars : int
+        Number of characters to simulate. Can be omitted if either
+        ``root_states`` or ``vcv`` is given.
+    root_states : list[float]
+        Values of the characters at the root. Defaults to 0.0 for all
+        characters. Must fall within ``min_value`` and ``max_value``, if
+        these are given.
+    variance_rate : float
+        Variance of the increments per unit of time (i.e., the Brownian
+        motion rate, sigma-squared) when characters are independent. Ignored
+        if ``vcv`` is given.
+    vcv : list[list[float]]
+        Variance-covariance matrix (``num_chars`` x ``num_chars``) of the
+        increments per unit of time. Must be symmetric positive-definite.
+    min_value : float
+        If not |None|, character values are kept from falling below this by
+        reflecting off it (see ``_bounce_constrain``).
+    max_value : float
+        If not |None|, character values are kept from rising above this by
+        reflecting off it (see ``_bounce_constrain``).
+    rate_model : str
+        If |None| (default), the rate of evolution is constant. Otherwise,
+        the name of the model under which the rate of evolution itself
+        evolves across the tree, with the mean rate over each edge scaling
+        the variance of the increments on that edge. Currently only "KTB"
+        (Kishino, Thorne, and Bruno 2001) is supported: see
+        :func:`evolve_continuous_char`.
+    root_rate : float
+        Rate at the root, if ``rate_model`` is specified.
+    roeotroe : float
+        The rate of evolution of the rate of evolution, if ``rate_model`` is
+        specified.
+    min_rate : float
+        Minimum rate, if ``rate_model`` is specified.
+    max_rate : float
+        Maximum rate, if ``rate_model`` is specified.
+    constrain_rate_mode : str
+        "crop" or "linear_bounce": how the rate is kept within ``min_rate``
+        and ``max_rate``, if ``rate_model`` is specified.
+    char_matrix : |ContinuousCharacterMatrix|
+        If given, the simulated values for taxa on ``tree_model`` leaf nodes
+        will be appended to existing sequences of corresponding taxa in
+        ``char_matrix``; if not, a new |ContinuousCharacterMatrix| object
+        will be created.
+    rng : random number generator
+        If not given, 'GLOBAL_RNG' will be used.
+
+    Returns
+    -------
+    d : |ContinuousCharacterMatrix|
+        The simulated characters.
+    """
+    if rng is None:
+        rng = GLOBAL_RNG
+    if num_chars is None:
+        if root_states is not None:
+            num_chars = len(root_states)
+        elif vcv is not None:
+            num_chars = len(vcv)
+        else:
+            raise TypeError("Must specify at least one of 'num_chars', 'root_states', or 'vcv'")
+    if root_states is None:
+        root_states = [0.0] * num_chars
+    elif len(root_states) != num_chars:
+        raise ValueError("Expecting {} root states but found {}".format(num_chars, len(root_states)))
+    if vcv is not None:
+        if len(vcv) != num_chars or any(len(row) != num_chars for row in vcv):
+            raise ValueError("Variance-covariance matrix must be {n} x {n}".format(n=num_chars))
+        cholesky_factor = _cholesky_decomposition(vcv)
+    else:
+        cholesky_factor = None
+        sd_rate = math.sqrt(variance_rate)
+    if min_value is not None and max_value is not None and min_value >= max_value:
+        raise ValueError("max_value must be greater than min_value")
+    for root_state in root_states:
+        if (min_value is not None and root_state < min_value) or (max_value is not None and root_state > max_value):
+            raise ValueError("Root state {} is outside the bounds given by min_value and max_value".format(root_state))
+    if rate_model is not None:
+        if rate_model.upper() != "KTB":
+            raise ValueError("Only the Kishino-Thorne-Bruno model is supported at this time")
+        constrain_rate_mode = constrain_rate_mode.lower()
+        if constrain_rate_mode == "crop":
+            rate_fn = _calc_KTB_rates_crop
+        elif constrain_rate_mode == "linear_bounce":
+            rate_fn = _calc_KTB_rates_linear_bounce
+        else:
+            raise ValueError('Only "crop" and "linear_bounce" are supported at this time')
+    if char_matrix is None:
+        char_matrix = dendropy.ContinuousCharacterMatrix(taxon_namespace=tree_model.taxon_namespace)
+    else:
+        assert char_matrix.taxon_namespace is tree_model.taxon_namespace, "conflicting taxon sets"
+
+    node_values = {tree_model.seed_node: list(root_states)}
+    node_rates = {tree_model.seed_node: root_rate}
+    for nd in tree_model.preorder_node_iter():
+        values = node_values.pop(nd)
+        rate = node_rates.pop(nd)
+        if nd.is_leaf():
+            if nd.taxon is not None:
+                char_matrix[nd.taxon].extend(values)
+            continue
+        for ch in nd._child_nodes:
+            duration = ch.edge.length
+            if duration is None:
+                duration = 0.0
+            if rate_model is not None:
+                ch_rate, mean_rate = rate_fn(rate, duration, roeotroe, rng, min_rate, max_rate)
+            else:
+                ch_rate, mean_rate = rate, rate
+            scale = math.sqrt(duration * mean_rate)
+            if cholesky_factor is None:
+                sd = sd_rate * scale
+                ch_values = [v + rng.gauss(0.0, sd) for v in values]
+            else:
+                z = [rng.gauss(0.0, 1.0) for i in range(num_chars)]
+                ch_values = [v + scale * sum(l * zj for l, zj in zip(row, z)) for v, row in zip(values, cholesky_factor)]
+            if min_value is not None or max_value is not None:
+                for idx, x in enumerate(ch_values):
+                    if (min_value is not None and x < min_value) or (max_value is not None and x > max_value):
+                        ch_values[idx] = _bounce_constrain(values[idx], x, min_value, max_value)[0]
+            node_values[ch] = ch_values
+            node_rates[ch] = ch_rate
+    return char_matrix
+
+def _cholesky_decomposition(m):
+    """
+    Returns the lower-triangular Cholesky factor, ``L``, of the symmetric
+    positive-definite matrix ``m`` (a list of lists), such that ``m`` =
+    ``L`` x transpose(``L``).
+    """
+    n = len(m)
+    L = [[0.0] * n for i in range(n)]
+    for i in range(n):
+        for j in range(i+1):
+            s = m[i][j] - sum(L[i][k] * L[j][k] for k in range(j))
+            if i == j:
+                if s <= 0.0:
+                    raise ValueError("Variance-covariance matrix is not positive-definite")
+                L[i][j] = math.sqrt(s)
+            else:
+                L[i][j] = s / L[j][j]
+    return L
+
 def _bounce_constrain(start_x, x, min_x=None, max_x=None):
     """Returns the value of variable and its mean value over a path.
     We assume that some variable started at ``start_x`` and moved toward ``x``, but
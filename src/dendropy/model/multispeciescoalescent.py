@@ -19,6 +19,8 @@
 
 from __future__ import division
 import math
+import functools
+import multiprocessing
 import dendropy
 import heapq
 from dendropy.model import reconcile
@@ -165,6 +167,146 @@ class MultispeciesCoalescent(object):
             logP += subP
         return logP
 
+    def score_coalescent_trees(self,
+            coalescent_trees,
+            coalescent_species_lineage_map_fn,
+            population_theta_fn=None,
+            is_coalescent_species_lineage_map_by_node=False,
+            num_processes=1,
+            ):
+        """
+        Returns the log-probabilities of a collection of coalescent (or gene)
+        trees conditioned on the structure (species or population) tree.
+
+        This yields the same values as calling :meth:`score_coalescent_tree`
+        on each tree in turn, but the species tree structure (edge ages,
+        lineage maps, and population thetas) is compiled only once for the
+        entire batch, and each coalescent tree is reduced to a compact
+        numeric encoding (parent indices and node ages) before being fitted
+        and scored. As the encoded trees are plain lists of numbers, scoring
+        can be distributed over multiple processes.
+
+        Parameters
+        ----------
+        coalescent_trees : iterable[|Tree|]
+            The tree instances to be scored.
+        coalescent_species_lineage_map_fn : function object
+            As for :meth:`score_coalescent_tree`.
+        population_theta_fn : function object
+            As for :meth:`score_coalescent_tree`. Called once per species
+            tree edge for the whole batch.
+        is_coalescent_species_lineage_map_by_node : bool
+            As for :meth:`score_coalescent_tree`.
+        num_processes : int
+            Number of processes over which to distribute the scoring. If 1
+            (default) or less, then all scoring is done in the current
+            process.
+
+        Returns
+        -------
+        p : list[numeric]
+            Log probabilities of each of the trees in ``coalescent_trees``,
+            in the same order, given structuring imposed by
+            ``self._species_tree``.
+        """
+        species_structure, species_lineage_index_map = self._compile_species_tree_structure(
+                population_theta_fn=population_theta_fn,
+                is_coalescent_species_lineage_map_by_node=is_coalescent_species_lineage_map_by_node)
+        encoded_trees = []
+        for coalescent_tree in coalescent_trees:
+            encoded_trees.append(self._encode_coalescent_tree(
+                coalescent_tree=coalescent_tree,
+                coalescent_species_lineage_map_fn=coalescent_species_lineage_map_fn,
+                species_lineage_index_map=species_lineage_index_map,
+                is_coalescent_species_lineage_map_by_node=is_coalescent_species_lineage_map_by_node))
+        score_fn = functools.partial(_score_encoded_coalescent_tree,
+                species_structure,
+                self.is_enforce_structure_integrity)
+        if num_processes is None or num_processes <= 1 or len(encoded_trees) < 2:
+            return [score_fn(encoded_tree) for encoded_tree in encoded_trees]
+        chunksize = max(1, len(encoded_trees) // (num_processes * 4))
+        pool = multiprocessing.Pool(processes=num_processes)
+        try:
+            return pool.map(score_fn, encoded_trees, chunksize)
+        finally:
+            pool.close()
+            pool.join()
+
+    def _compile_species_tree_structure(self,
+            population_theta_fn=None,
+            is_coalescent_species_lineage_map_by_node=False):
+        """
+        Reduces the species tree to parallel lists indexed by the postorder
+        position of each edge: head node ages, tail node ages (|None| for the
+        root edge), theta values, child edge indices, and descriptive labels.
+        Also returns a dictionary mapping the species tree |Taxon| (or |Node|)
+        instances of terminal edges to their edge index.
+        """
+        if population_theta_fn is None:
+            population_theta_fn = lambda e: 1.0
+        edge_index_map = {}
+        head_ages = []
+        tail_ages = []
+        thetas = []
+        child_indices = []
+        descs = []
+        species_lineage_index_map = {}
+        for idx, species_edge in enumerate(self._species_tree.postorder_edge_iter()):
+            edge_index_map[species_edge] = idx
+            head_ages.append(species_edge.head_node.age)
+            if species_edge.tail_node is None:
+                tail_ages.append(None)
+            else:
+                tail_ages.append(species_edge.tail_node.age)
+            thetas.append(population_theta_fn(species_edge))
+            child_indices.append([edge_index_map[nd.edge] for nd in species_edge.head_node.child_node_iter()])
+            descs.append(self._compose_edge_desc(species_edge))
+            if species_edge.is_terminal():
+                if is_coalescent_species_lineage_map_by_node:
+                    species_lineage_index_map[species_edge.head_node] = idx
+                else:
+                    species_lineage_index_map[species_edge.head_node.taxon] = idx
+        return (head_ages, tail_ages, thetas, child_indices, descs), species_lineage_index_map
+
+    def _encode_coalescent_tree(self,
+            coalescent_tree,
+            coalescent_species_lineage_map_fn,
+            species_lineage_index_map,
+            is_coalescent_species_lineage_map_by_node=False):
+        """
+        Reduces a coalescent tree to parallel lists indexed by the postorder
+        position of each node: node ages, parent node indices (-1 for the
+        root), child node indices, species tree edge indices (-1 for internal
+        nodes), and leaf labels (used only for error messages).
+        """
+        coalescent_tree.calc_node_ages(ultrametricity_precision=self.ultrametricity_precision)
+        node_index_map = {}
+        ages = []
+        parent_indices = []
+        child_indices = []
+        species_indices = []
+        labels = []
+        for idx, nd in enumerate(coalescent_tree.postorder_node_iter()):
+            node_index_map[nd] = idx
+            ages.append(nd.age)
+            parent_indices.append(-1)
+            children = []
+            for ch in nd._child_nodes:
+                ch_idx = node_index_map[ch]
+                parent_indices[ch_idx] = idx
+                children.append(ch_idx)
+            child_indices.append(children)
+            if children:
+                species_indices.append(-1)
+                labels.append(None)
+            else:
+                if is_coalescent_species_lineage_map_by_node:
+                    species_indices.append(species_lineage_index_map[coalescent_species_lineage_map_fn(nd)])
+                else:
+                    species_indices.append(species_lineage_index_map[coalescent_species_lineage_map_fn(nd.taxon)])
+                labels.append(nd.taxon.label if nd.taxon is not None else nd.label)
+        return ages, parent_indices, child_indices, species_indices, labels
+
     def _fit_coalescent_tree(self,
             coalescent_tree,
             coalescent_species_lineage_map_fn,
@@ -274,3 +416,116 @@ class MultispeciesCoalescent(object):
 
     def _compose_edge_desc(self, e):
         return "+".join(x.taxon.label for x in e.head_node.leaf_iter())
+
+def _compose_encoded_lineage_desc(encoded_tree, node_idx):
+    ages, parent_indices, child_indices, species_indices, labels = encoded_tree
+    leaf_labels = []
+    stack = [node_idx]
+    while stack:
+        idx = stack.pop()
+        if child_indices[idx]:
+            stack.extend(reversed(child_indices[idx]))
+        else:
+            leaf_labels.append(str(labels[idx]))
+    return "+".join(leaf_labels)
+
+def _score_encoded_coalescent_tree(
+        species_structure,
+        is_enforce_structure_integrity,
+        encoded_tree):
+    """
+    Fits and scores a coalescent tree, as encoded by
+    :meth:`MultispeciesCoalescent._encode_coalescent_tree`, in the species
+    tree structure, as compiled by
+    :meth:`MultispeciesCoalescent._compile_species_tree_structure`. This
+    mirrors :meth:`MultispeciesCoalescent._fit_coalescent_tree` and
+    :meth:`MultispeciesCoalescent.score_coalescent_tree`, but operates on
+    node indices rather than on |Node| and |Edge| objects, and is defined at
+    module level so that it can be dispatched to worker processes.
+    """
+    head_ages, tail_ages, thetas, species_child_indices, species_descs = species_structure
+    ages, parent_indices, child_indices, species_indices, labels = encoded_tree
+    num_species_edges = len(head_ages)
+    edge_tail_lineages = [None] * num_species_edges
+    species_leaf_lineages = {}
+    for idx, species_idx in enumerate(species_indices):
+        if species_idx >= 0:
+            species_leaf_lineages.setdefault(species_idx, set()).add(idx)
+    logP = 0.0
+    for species_idx in range(num_species_edges):
+        if species_child_indices[species_idx]:
+            head_lineages = set()
+            for ch_idx in species_child_indices[species_idx]:
+                head_lineages.update(edge_tail_lineages[ch_idx])
+        else:
+            head_lineages = species_leaf_lineages[species_idx]
+        if len(head_lineages) == 1:
+            edge_tail_lineages[species_idx] = head_lineages
+            continue
+        coalescing_nodes = set()
+        if tail_ages[species_idx] is None:
+            ## root edge: coalesce all
+            for idx in head_lineages:
+                parent_idx = parent_indices[idx]
+                while parent_idx >= 0 and parent_idx not in coalescing_nodes:
+                    coalescing_nodes.add(parent_idx)
+                    parent_idx = parent_indices[parent_idx]
+            edge_tail_lineages[species_idx] = set()
+        else:
+            structure_end_time = tail_ages[species_idx]
+            current_lineages = []
+            for idx in head_lineages:
+                parent_idx = parent_indices[idx]
+                current_lineages.append((ages[parent_idx] if parent_idx >= 0 else float("inf"), idx))
+            heapq.heapify(current_lineages)
+            if is_enforce_structure_integrity:
+                valid_coalescing_lineages = set(head_lineages)
+            while len(current_lineages) > 1:
+                coalescent_age, idx = current_lineages[0]
+                if coalescent_age > structure_end_time:
+                    break
+                heapq.heappop(current_lineages)
+                parent_idx = parent_indices[idx]
+                if parent_idx in coalescing_nodes:
+                    continue
+                if is_enforce_structure_integrity:
+                    for ch_idx in child_indices[parent_idx]:
+                        if ch_idx != idx and ch_idx not in valid_coalescing_lineages:
+                            msg = "Invalid coalescence within structure tree edge {}: coalescent tree lineage {} cannot coalesce with lineage {} because the latter is not in the same population at this time".format(
+                                    species_descs[species_idx],
+                                    _compose_encoded_lineage_desc(encoded_tree, idx),
+                                    _compose_encoded_lineage_desc(encoded_tree, ch_idx), )
+                            raise error.InvalidMultispeciesCoalescentStructureError(msg)
+                    valid_coalescing_lineages.add(parent_idx)
+                coalescing_nodes.add(parent_idx)
+                grandparent_idx = parent_indices[parent_idx]
+                heapq.heappush(current_lineages, (ages[grandparent_idx] if grandparent_idx >= 0 else float("inf"), parent_idx))
+            edge_tail_lineages[species_idx] = set(x[1] for x in current_lineages)
+
+        ## score
+        theta = thetas[species_idx]
+        coalescent_ages = sorted(ages[idx] for idx in coalescing_nodes)
+        j = len(head_lineages)
+        t0 = head_ages[species_idx]
+        oldest_coalescent_event_age = None
+        subP = 0.0
+        for t1 in coalescent_ages:
+            if j == 1:
+                break
+            wt = t1 - t0
+            q = math.log(2.0/theta) + (-j * (j-1) * theta * wt)
+            subP += q
+            j -= 1
+            t0 = t1
+            if oldest_coalescent_event_age is None or t1 > oldest_coalescent_event_age:
+                oldest_coalescent_event_age = t1
+        remaining_lineages = j
+        if remaining_lineages > 1:
+            if oldest_coalescent_event_age is None:
+                remaining_time = tail_ages[species_idx] - head_ages[species_idx]
+            else:
+                remaining_time = tail_ages[species_idx] - oldest_coalescent_event_age
+            q = -1 * (remaining_lineages*(remaining_lineages-1))/theta * remaining_time
+            subP += q
+        logP += subP
+    return logP
@@ -22,6 +22,7 @@ Models, modeling and model-fitting of parsimony.
 """
 
 from functools import reduce
+import heapq
 import operator
 import dendropy
 from dendropy.utility.error import TaxonNamespaceIdentityError
@@ -48,6 +49,34 @@ def _retrieve_state_sets_from_attr(n, state_sets_attr_name, taxon_state_sets_map
         setattr(n, state_sets_attr_name, v)
         return v
 
+def _fitch_combine_state_sets(
+        child_state_sets,
+        weights=None,
+        score_by_character_list=None):
+    # Returns the state sets of a node given those of its children, along
+    # with the score contributed by the node.
+    score = 0
+    left_ssl = child_state_sets[0]
+    result = left_ssl
+    for right_ssl in child_state_sets[1:]:
+        result = []
+        for n, ssp in enumerate(zip(left_ssl, right_ssl)):
+            left_ss, right_ss = ssp
+            inter = left_ss.intersection(right_ss)
+            if inter:
+                result.append(inter)
+            else:
+                if weights is None:
+                    wt = 1
+                else:
+                    wt = weights[n]
+                score += wt
+                result.append(left_ss.union(left_ss, right_ss))
+                if score_by_character_list is not None:
+                    score_by_character_list[n] += wt
+        left_ssl = result
+    return result, score
+
 def fitch_down_pass(
         postorder_nodes,
         state_sets_attr_name="state_sets",
@@ -180,35 +209,11 @@ def fitch_down_pass(
         if not c:
             ss = get_node_state_sets(nd)
             continue
-        left_c, right_c = c[:2]
-        remaining = c[2:]
-        left_ssl = get_node_state_sets(left_c)
-        while True:
-            right_ssl = get_node_state_sets(right_c)
-            result = []
-            for n, ssp in enumerate(zip(left_ssl, right_ssl)):
-                left_ss, right_ss = ssp
-                inter = left_ss.intersection(right_ss)
-                if inter:
-                    result.append(inter)
-                else:
-                    if weights is None:
-                        wt = 1
-                    else:
-                        wt = weights[n]
-                    score += wt
-                    result.append(left_ss.union(left_ss, right_ss))
-                    if score_by_character_list is not None:
-                        # try:
-                        #     score_by_character_list[n] += wt
-                        # except IndexError:
-                        #     score_by_character_list.append(wt)
-                        score_by_character_list[n] += wt
-            if remaining:
-                right_c = remaining.pop(0)
-                left_ssl = result
-            else:
-                break
+        result, nd_score = _fitch_combine_state_sets(
+                [get_node_state_sets(ch) for ch in c],
+                weights=weights,
+                score_by_character_list=score_by_character_list)
+        score += nd_score
         # setattr(nd, state_sets_attr_name, result)
         set_node_state_sets(nd, result)
     return score
@@ -406,3 +411,143 @@ def parsimony_score(
             score_by_character_list=score_by_character_list)
     return pscore
 
+
+class FitchParsimonyScorer(object):
+    """
+    Maintains the parsimony score of a tree, under Fitch's (1971) unordered
+    parsimony algorithm, as the tree is rearranged.
+
+    On construction, the tree is scored in full, and the scorer registers
+    itself as a move listener of the tree (see
+    :meth:`dendropy.datamodel.treemodel.Tree.add_move_listener()`). Every
+    time a move is subsequently applied to (or undone on) the tree by
+    :meth:`~dendropy.datamodel.treemodel.Tree.apply_move()` (or
+    :meth:`~dendropy.datamodel.treemodel.Tree.undo_move()`), only the state
+    sets of the nodes affected by the move and their ancestors are
+    recalculated, stopping at nodes of which the state sets are unchanged.
+
+    Examples
+    --------
+
+    ::
+
+        taxon_namespace = dendropy.TaxonNamespace()
+        chars = dendropy.DnaCharacterMatrix.get(
+                path="pythonidae.chars.nexus",
+                schema="nexus",
+                taxon_namespace=taxon_namespace)
+        tree = dendropy.Tree.get(
+                path="pythonidae.mle.newick",
+                schema="newick",
+                taxon_namespace=taxon_namespace)
+        scorer = FitchParsimonyScorer(
+                tree,
+                chars.taxon_state_sets_map(gaps_as_missing=True))
+        best_score = scorer.score
+        for move in tree.nni_move_iter():
+            tree.apply_move(move)
+            if scorer.score < best_score:
+                best_score = scorer.score
+            tree.undo_move(move)
+
+    """
+
+    def __init__(self,
+            tree,
+            taxon_state_sets_map,
+            weights=None):
+        """
+        Parameters
+        ----------
+        tree : a |Tree| instance
+            The tree to be scored.
+        taxon_state_sets_map : dict[taxon] = state sets
+            A dictionary that takes a taxon object as a key and returns a
+            state set list as a value (see
+            :meth:`CharacterMatrix.taxon_state_sets_map()`).
+        weights : iterable
+            A list of weights for each pattern.
+        """
+        self.tree = tree
+        self.taxon_state_sets_map = taxon_state_sets_map
+        self.weights = weights
+        self._node_state_sets = {}
+        self._node_scores = {}
+        self.score = 0
+        for nd in tree.postorder_node_iter():
+            self._score_node(nd)
+        tree.add_move_listener(self)
+
+    def detach(self):
+        """
+        Stops the tracking of rearrangements of the tree.
+        """
+        self.tree.remove_move_listener(self)
+
+    def __call__(self, tree, move, is_undo):
+        self.update(move.changed_nodes, move.removed_nodes)
+
+    def update(self, nodes, removed_nodes=None):
+        """
+        Updates the score after changes to the structure of the tree.
+
+        Parameters
+        ----------
+        nodes : iterable[|Node|]
+            Nodes of which the child nodes have changed, or that have been
+            added to the tree.
+        removed_nodes : iterable[|Node|]
+            Nodes that have been removed from the tree.
+        """
+        if removed_nodes:
+            for nd in removed_nodes:
+                self.score -= self._node_scores.pop(nd, 0)
+                self._node_state_sets.pop(nd, None)
+        # visit nodes in order of descending depth, so that children are
+        # visited before their parents
+        heap = []
+        queued = set()
+        for nd in nodes:
+            if nd not in queued:
+                queued.add(nd)
+                heap.append((-self._get_node_depth(nd), id(nd), nd))
+        heapq.heapify(heap)
+        while heap:
+            neg_depth, nd_id, nd = heapq.heappop(heap)
+            if not self._score_node(nd):
+                continue
+            parent = nd.parent_node
+            if parent is not None and parent not in queued:
+                queued.add(parent)
+                heapq.heappush(heap, (neg_depth + 1, id(parent), parent))
+
+    def _get_node_depth(self, nd):
+        depth = 0
+        while nd.parent_node is not None:
+            nd = nd.parent_node
+            depth += 1
+        return depth
+
+    def _get_node_state_sets(self, nd):
+        try:
+            return self._node_state_sets[nd]
+        except KeyError:
+            self._score_node(nd)
+            return self._node_state_sets[nd]
+
+    def _score_node(self, nd):
+        # (Re)calculates the state sets of ``nd`` from those of its children,
+        # returning |True| if they have changed.
+        child_nodes = nd.child_nodes()
+        if child_nodes:
+            state_sets, nd_score = _fitch_combine_state_sets(
+                    [self._get_node_state_sets(ch) for ch in child_nodes],
+                    weights=self.weights)
+        else:
+            state_sets = self.taxon_state_sets_map[nd.taxon]
+            nd_score = 0
+        self.score += nd_score - self._node_scores.get(nd, 0)
+        self._node_scores[nd] = nd_score
+        is_changed = self._node_state_sets.get(nd, None) != state_sets
+        self._node_state_sets[nd] = state_sets
+        return is_changed
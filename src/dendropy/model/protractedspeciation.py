@@ -461,6 +461,7 @@ class ProtractedSpeciationProcess(object):
         self.incipient_species_extinction_rate = incipient_species_extinction_rate
         self.is_initial_lineage_orthospecies = kwargs.get("is_initial_lineage_orthospecies", False)
         self.species_lineage_sampling_scheme = kwargs.get("species_lineage_sampling_scheme", "random") # 'random', 'oldest', 'youngest'
+        self.simulation_engine = kwargs.get("simulation_engine", "object") # 'object', 'array'
         if lineage_label_format_template is None:
             self.lineage_label_format_template = "S{species_id}.{lineage_id}"
         else:
@@ -552,6 +553,24 @@ class ProtractedSpeciationProcess(object):
         assert lineage_tree is not None
         return lineage_tree, orthospecies_tree
 
+    def generate_samples(self, num_samples, **kwargs):
+        """
+        Returns a list of ``num_samples`` independent samples from the
+        Protracted Speciation Model process, each a tuple of a lineage tree
+        and an orthospecies tree as returned by :meth:`generate_sample`. All
+        other keyword arguments are passed to :meth:`generate_sample`. If
+        taxon namespaces are specified, they will be shared by all the
+        trees of the corresponding type.
+
+        Large numbers of replicates are best generated using the array-based
+        simulation engine (i.e., by setting ``simulation_engine`` to
+        "array").
+        """
+        samples = []
+        for idx in range(num_samples):
+            samples.append(self.generate_sample(**dict(kwargs)))
+        return samples
+
     def _generate_trees(self, **kwargs):
         max_time = kwargs.get("max_time", None)
         if "max_extant_lineages" in kwargs:
@@ -573,13 +592,19 @@ class ProtractedSpeciationProcess(object):
                 "species_id": 0,
                 "lineage_collection": []
                 })
+        if self.simulation_engine == "object":
+            generate_lineages_fn = self._generate_lineages
+        elif self.simulation_engine == "array":
+            generate_lineages_fn = self._generate_lineages_from_arrays
+        else:
+            raise ValueError("Unrecognized simulation engine: '{}'".format(self.simulation_engine))
         phase_idx = 0
         while phase_idx < 2:
             # Run two passes if 'max_time' specified, with each pass building
             # up one side of the root and only accepted if there are at least
             # one surviving lineage; this way, condition crown age on
             # 'max_time'.
-            self._generate_lineages(
+            generate_lineages_fn(
                     lineage_data=lineage_data,
                     max_time=max_time,
                     num_extant_lineages=num_extant_lineages,
@@ -764,6 +789,215 @@ class ProtractedSpeciationProcess(object):
             else:
                 raise Exception("Unexpected event type index: {}".format(event_type_idx))
 
+    def _generate_lineages_from_arrays(self, **kwargs):
+        """
+        Array-backed equivalent of ``_generate_lineages``.
+
+        Rather than a ``_Lineage`` object per lineage (and, when conditioning
+        on the number of orthospecies, a clone of every lineage for every
+        event), the state of the process is maintained in parallel lists
+        indexed by the order in which lineages arise, with the extant
+        orthospecies and incipient species lineages tracked as lists of
+        indices from which lineages are removed in constant time, and the
+        number of lineages of each extant species updated incrementally.
+        ``_Lineage`` objects are only created once the process terminates (or
+        when a candidate set of trees needs to be compiled). The results
+        follow the same distribution as those of ``_generate_lineages``,
+        but not necessarily the same outcome for a given random number
+        generator state.
+        """
+        current_time = 0.0
+        lineage_data = kwargs.get("lineage_data")
+        max_time = kwargs.get("max_time", None)
+        num_extant_lineages = kwargs.get("num_extant_lineages", None)
+        num_extant_orthospecies = kwargs.get("num_extant_orthospecies", None)
+        phase_idx = kwargs.get("phase_idx")
+        lineage_taxon_namespace = kwargs.get("lineage_taxon_namespace", None)
+        species_taxon_namespace = kwargs.get("species_taxon_namespace", None)
+        rng = self.rng
+
+        lineage_ids = []
+        parent_indices = []
+        is_parent_orthospecies = []
+        origin_times = []
+        speciation_completion_times = []
+        extinction_times = []
+        species_ids = []
+        orthospecies_indices = []
+        incipient_species_indices = []
+        species_lineage_counts = {}
+        if phase_idx == 0:
+            lineage_id = 1
+            species_id = 1
+            initial_parent_lineage = None
+            lineage_ids.append(lineage_id)
+            parent_indices.append(-1)
+            is_parent_orthospecies.append(None)
+            origin_times.append(-1e-10)
+            speciation_completion_times.append(None)
+            extinction_times.append(None)
+            species_ids.append(1)
+            orthospecies_indices.append(0)
+        else:
+            lineage_id = lineage_data[0].get("lineage_id", 0) + 1
+            species_id = lineage_data[0].get("species_id", 0)
+            initial_parent_lineage = lineage_data[0]["lineage_collection"][0]
+            lineage_ids.append(lineage_id)
+            parent_indices.append(-1)
+            is_parent_orthospecies.append(initial_parent_lineage.speciation_completion_time is not None)
+            origin_times.append(current_time)
+            speciation_completion_times.append(None)
+            extinction_times.append(None)
+            species_ids.append(initial_parent_lineage.species_id)
+            incipient_species_indices.append(0)
+        species_lineage_counts[species_ids[0]] = 1
+
+        orthospecies_event_rate = self.speciation_initiation_from_orthospecies_rate + self.orthospecies_extinction_rate
+        incipient_species_event_rate = (self.speciation_initiation_from_incipient_species_rate
+                + self.speciation_completion_rate
+                + self.incipient_species_extinction_rate)
+
+        def _build_lineage_collection():
+            lineages = []
+            for idx, parent_idx in enumerate(parent_indices):
+                if parent_idx < 0:
+                    parent_lineage = initial_parent_lineage
+                    parent_lineage_id = 0 if parent_lineage is None else parent_lineage.lineage_id
+                else:
+                    parent_lineage = lineages[parent_idx]
+                    parent_lineage_id = parent_lineage.lineage_id
+                lineage = ProtractedSpeciationProcess._Lineage(
+                        lineage_id=lineage_ids[idx],
+                        parent_lineage_id=parent_lineage_id,
+                        is_parent_orthospecies=is_parent_orthospecies[idx],
+                        origin_time=origin_times[idx],
+                        speciation_completion_time=speciation_completion_times[idx],
+                        extinction_time=extinction_times[idx],
+                        species_id=species_ids[idx],
+                        )
+                lineage._check_parent_lineage = parent_lineage # for _check_good
+                lineages.append(lineage)
+            return lineages
+
+        def _remove_extant_lineage(lineage_indices, pos):
+            idx = lineage_indices[pos]
+            lineage_indices[pos] = lineage_indices[-1]
+            lineage_indices.pop()
+            return idx
+
+        def _decrement_species_lineage_count(sp_id):
+            if species_lineage_counts[sp_id] == 1:
+                del species_lineage_counts[sp_id]
+            else:
+                species_lineage_counts[sp_id] -= 1
+
+        while True:
+            num_orthospecies = len(orthospecies_indices)
+            num_incipient_species = len(incipient_species_indices)
+            if num_incipient_species + num_orthospecies == 0:
+                raise TreeSimTotalExtinctionException()
+            ## Draw time to next event
+            orthospecies_rate = orthospecies_event_rate * num_orthospecies
+            rate_of_any_event = orthospecies_rate + (incipient_species_event_rate * num_incipient_species)
+            waiting_time = rng.expovariate(rate_of_any_event)
+            if max_time and (current_time + waiting_time) > max_time:
+                current_time = max_time
+                break
+            # we do this here so that the (newest) tip lineages have the
+            # waiting time to the next event branch lengths
+            if num_extant_lineages is not None and (num_incipient_species + num_orthospecies) >= num_extant_lineages:
+                final_time = current_time + rng.uniform(0, waiting_time)
+                lineage_data[phase_idx]["final_time"] = final_time
+                break
+            elif num_extant_orthospecies is not None:
+                final_time = current_time + rng.uniform(0, waiting_time)
+                # the number of leaves on the orthospecies tree is the
+                # number of distinct extant species, so trees only need to be
+                # built once this is large enough
+                if len(species_lineage_counts) >= num_extant_orthospecies:
+                    lineage_collection_snapshot = _build_lineage_collection()
+                    try:
+                        orthospecies_tree = self._compile_species_tree(
+                                lineage_collection=lineage_collection_snapshot,
+                                max_time=final_time,
+                                )
+                        num_leaves = len(orthospecies_tree.leaf_nodes())
+                        if num_leaves >= num_extant_orthospecies:
+                            lineage_tree = self._compile_lineage_tree(
+                                lineage_collection=lineage_collection_snapshot,
+                                max_time=final_time,
+                                is_drop_extinct=True,
+                                )
+                            lineage_tree, orthospecies_tree = self._finalize_trees(
+                                    lineage_tree=lineage_tree,
+                                    lineage_taxon_namespace=lineage_taxon_namespace,
+                                    orthospecies_tree=orthospecies_tree,
+                                    species_taxon_namespace=species_taxon_namespace,
+                                    lineage_collection=lineage_collection_snapshot,
+                                    )
+                            lineage_data[phase_idx]["lineage_tree"] = lineage_tree
+                            lineage_data[phase_idx]["orthospecies_tree"] = orthospecies_tree
+                            lineage_data[phase_idx]["lineage_id"] = lineage_id
+                            lineage_data[phase_idx]["species_id"] = species_id
+                            lineage_data[phase_idx]["lineage_collection"] = lineage_collection_snapshot
+                            return
+                    except ProcessFailedException:
+                        pass
+            # add to current time
+            current_time += waiting_time
+            # Select event: as for ``probability.weighted_index_choice``, but
+            # with the cumulative rates calculated from the lineage counts
+            rnd = rng.random() * rate_of_any_event
+            if rnd < orthospecies_rate:
+                if rnd < self.speciation_initiation_from_orthospecies_rate * num_orthospecies:
+                    # Splitting of new incipient species lineage from orthospecies lineage
+                    parent_idx = orthospecies_indices[rng.randint(0, num_orthospecies-1)]
+                else:
+                    # Extinction of an orthospecies lineage
+                    idx = _remove_extant_lineage(orthospecies_indices, rng.randint(0, num_orthospecies-1))
+                    extinction_times[idx] = current_time
+                    _decrement_species_lineage_count(species_ids[idx])
+                    continue
+            else:
+                rnd -= orthospecies_rate
+                if rnd < self.speciation_initiation_from_incipient_species_rate * num_incipient_species:
+                    # Splitting of new incipient species lineage from incipient lineage
+                    parent_idx = incipient_species_indices[rng.randint(0, num_incipient_species-1)]
+                elif rnd < (self.speciation_initiation_from_incipient_species_rate + self.speciation_completion_rate) * num_incipient_species:
+                    # Completion of speciation
+                    idx = _remove_extant_lineage(incipient_species_indices, rng.randint(0, num_incipient_species-1))
+                    speciation_completion_times[idx] = current_time
+                    _decrement_species_lineage_count(species_ids[idx])
+                    species_id += 1
+                    species_ids[idx] = species_id
+                    species_lineage_counts[species_id] = 1
+                    orthospecies_indices.append(idx)
+                    continue
+                else:
+                    # Extinction of an incipient_species lineage
+                    idx = _remove_extant_lineage(incipient_species_indices, rng.randint(0, num_incipient_species-1))
+                    extinction_times[idx] = current_time
+                    _decrement_species_lineage_count(species_ids[idx])
+                    continue
+            # New incipient species lineage (event types 0 and 2)
+            lineage_id += 1
+            lineage_ids.append(lineage_id)
+            parent_indices.append(parent_idx)
+            is_parent_orthospecies.append(speciation_completion_times[parent_idx] is not None)
+            origin_times.append(current_time)
+            speciation_completion_times.append(None)
+            extinction_times.append(None)
+            species_ids.append(species_ids[parent_idx])
+            species_lineage_counts[species_ids[parent_idx]] += 1
+            incipient_species_indices.append(len(lineage_ids) - 1)
+
+        lineage_collection = _build_lineage_collection()
+        lineage_data[phase_idx]["lineage_id"] = lineage_id
+        lineage_data[phase_idx]["species_id"] = species_id
+        lineage_data[phase_idx]["lineage_collection"] = lineage_collection
+        lineage_data[phase_idx]["orthospecies_lineages"] = [lineage_collection[idx] for idx in orthospecies_indices]
+        lineage_data[phase_idx]["incipient_species_lineages"] = [lineage_collection[idx] for idx in incipient_species_indices]
+
     def _new_lineage(self,
             lineage_id,
             parent_lineage,
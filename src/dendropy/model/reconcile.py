@@ -325,6 +325,21 @@ class ContainingTree(dendropy.Tree):
                     dc[tree] = len(edge.tail_contained_edges[tree]) - 1
         return dc
 
+    def reconciliation_index(self, contained_trees=None):
+        """
+        Returns a ``ReconciliationIndex`` based on this tree and the current
+        contained to containing taxon mapping. The index is populated with
+        ``contained_trees`` if given, or the contained trees of ``self``
+        otherwise.
+        """
+        if contained_trees is None:
+            contained_trees = self.contained_trees
+        return ReconciliationIndex(
+                containing_tree=self,
+                contained_to_containing_taxon_map=self._contained_to_containing_taxon_map,
+                contained_trees=contained_trees,
+                ignore_root_deep_coalescences=self.ignore_root_deep_coalescences)
+
     def embed_contained_kingman(self,
             edge_pop_size_attr='pop_size',
             default_pop_size=1,
@@ -475,6 +490,209 @@ class ContainingTree(dendropy.Tree):
         nw._write_trees_block(out, dendropy.TreeList(self.contained_trees, taxon_namespace=contained_taxon_namespace, label=contained_label))
         out.write('\n')
 
+class ReconciliationIndex(object):
+    """
+    Maintains counts of the deep coalescences of a (potentially large)
+    collection of contained trees (e.g., gene trees) in a containing tree
+    (e.g., a species tree), with contained trees added and removed
+    incrementally.
+
+    The leaf sets of the edges of the containing tree are encoded as
+    bitmasks once, when the index is created. Each node of a contained tree
+    is then mapped to the youngest containing tree node whose leaf set
+    contains all the containing taxa of the node's leaves (i.e., the
+    containing tree is fitted so as to minimize deep coalescences), by
+    bitmask containment, and each contained tree lineage is counted on each
+    containing tree edge that it passes through. Adding or removing a tree
+    only updates the counts for that tree, so the total number of deep
+    coalescences is available at any point without reprocessing the other
+    trees.
+
+    The containing tree should not be modified while the index is in use.
+    """
+
+    def __init__(self,
+            containing_tree,
+            contained_to_containing_taxon_map,
+            contained_trees=None,
+            ignore_root_deep_coalescences=True):
+        """
+        Parameters
+        ----------
+        containing_tree : |Tree|
+            The containing (e.g., species, host, or biogeographical area) tree.
+        contained_to_containing_taxon_map : |TaxonNamespaceMapping| or dict
+            Maps |Taxon| objects of the contained trees to the corresponding
+            |Taxon| objects of the containing tree.
+        contained_trees : iterable[|Tree|]
+            Trees to add to the index.
+        ignore_root_deep_coalescences : bool
+            If |True| [default], then deep coalescences in the root will not
+            be counted.
+        """
+        self.containing_tree = containing_tree
+        self.contained_to_containing_taxon_map = contained_to_containing_taxon_map
+        self.ignore_root_deep_coalescences = ignore_root_deep_coalescences
+        self._containing_edges = []
+        self._parent_indices = []
+        self._leafset_bitmasks = []
+        self._leafset_index_map = {}
+        self._leaf_bitmask_index_map = {}
+        self._containing_taxon_bitmask_map = {}
+        self._contained_taxon_bitmask_map = {}
+        self._root_index = None
+        self._encode_containing_tree()
+        self._bitmask_containing_index_map = dict(self._leafset_index_map)
+        self._edge_lineage_counts = [0] * len(self._containing_edges)
+        self._tree_records = {}
+        self._num_deep_coalescences = 0
+        if contained_trees is not None:
+            for tree in contained_trees:
+                self.add_tree(tree)
+
+    def _encode_containing_tree(self):
+        edge_index_map = {}
+        for idx, edge in enumerate(self.containing_tree.postorder_edge_iter()):
+            edge_index_map[edge] = idx
+            self._containing_edges.append(edge)
+            self._parent_indices.append(None)
+            if edge.is_terminal():
+                bitmask = 1 << len(self._containing_taxon_bitmask_map)
+                self._containing_taxon_bitmask_map[edge.head_node.taxon] = bitmask
+                self._leaf_bitmask_index_map[bitmask] = idx
+            else:
+                bitmask = 0
+                for ch in edge.head_node.child_node_iter():
+                    ch_idx = edge_index_map[ch.edge]
+                    self._parent_indices[ch_idx] = idx
+                    bitmask |= self._leafset_bitmasks[ch_idx]
+            self._leafset_bitmasks.append(bitmask)
+            self._leafset_index_map[bitmask] = idx
+        self._root_index = len(self._containing_edges) - 1
+
+    def _get_contained_taxon_bitmask(self, contained_taxon):
+        try:
+            return self._contained_taxon_bitmask_map[contained_taxon]
+        except KeyError:
+            containing_taxon = self.contained_to_containing_taxon_map[contained_taxon]
+            bitmask = self._containing_taxon_bitmask_map[containing_taxon]
+            self._contained_taxon_bitmask_map[contained_taxon] = bitmask
+            return bitmask
+
+    def _get_containing_index(self, bitmask):
+        """
+        Returns the index of the youngest containing tree edge with a leaf set
+        that contains all the containing taxa given by ``bitmask``.
+        """
+        try:
+            return self._bitmask_containing_index_map[bitmask]
+        except KeyError:
+            pass
+        idx = self._leaf_bitmask_index_map[bitmask & -bitmask]
+        while (self._leafset_bitmasks[idx] & bitmask) != bitmask:
+            idx = self._parent_indices[idx]
+        self._bitmask_containing_index_map[bitmask] = idx
+        return idx
+
+    def _count_tree_lineages(self, tree):
+        """
+        Returns a dictionary with the indices of the containing tree edges as
+        keys and the number of lineages of ``tree`` passing through the
+        (tail end of the) corresponding edge as values.
+        """
+        edge_lineage_counts = {}
+        node_containing_indices = {}
+        node_bitmasks = {}
+        for nd in tree.postorder_node_iter():
+            if nd._child_nodes:
+                bitmask = 0
+                for ch in nd._child_nodes:
+                    bitmask |= node_bitmasks.pop(ch)
+            else:
+                bitmask = self._get_contained_taxon_bitmask(nd.taxon)
+            node_bitmasks[nd] = bitmask
+            containing_idx = self._get_containing_index(bitmask)
+            node_containing_indices[nd] = containing_idx
+            for ch in nd._child_nodes:
+                idx = node_containing_indices.pop(ch)
+                while idx != containing_idx:
+                    edge_lineage_counts[idx] = edge_lineage_counts.get(idx, 0) + 1
+                    idx = self._parent_indices[idx]
+        edge_lineage_counts[self._root_index] = edge_lineage_counts.get(self._root_index, 0) + 1
+        return edge_lineage_counts
+
+    def _calc_num_deep_coalescences(self, edge_lineage_counts):
+        dc = 0
+        for idx, count in edge_lineage_counts.items():
+            if idx == self._root_index and self.ignore_root_deep_coalescences:
+                continue
+            dc += count - 1
+        return dc
+
+    def add_tree(self, tree):
+        """
+        Adds ``tree`` to the index, updating the deep coalescence counts.
+        Raises a ValueError if ``tree`` is already in the index.
+        """
+        if tree in self._tree_records:
+            raise ValueError("Tree is already in the index")
+        edge_lineage_counts = self._count_tree_lineages(tree)
+        dc = self._calc_num_deep_coalescences(edge_lineage_counts)
+        for idx, count in edge_lineage_counts.items():
+            self._edge_lineage_counts[idx] += count
+        self._tree_records[tree] = (dc, edge_lineage_counts)
+        self._num_deep_coalescences += dc
+        return dc
+
+    def remove_tree(self, tree):
+        """
+        Removes ``tree`` from the index, updating the deep coalescence counts.
+        Raises a KeyError if ``tree`` is not in the index.
+        """
+        dc, edge_lineage_counts = self._tree_records.pop(tree)
+        for idx, count in edge_lineage_counts.items():
+            self._edge_lineage_counts[idx] -= count
+        self._num_deep_coalescences -= dc
+        return dc
+
+    def update_tree(self, tree):
+        """
+        Recalculates the deep coalescence counts of ``tree`` (e.g., after it
+        has been modified), which must already be in the index.
+        """
+        self.remove_tree(tree)
+        return self.add_tree(tree)
+
+    def __len__(self):
+        return len(self._tree_records)
+
+    def __contains__(self, tree):
+        return tree in self._tree_records
+
+    def __iter__(self):
+        return iter(self._tree_records)
+
+    def num_deep_coalescences(self):
+        """
+        Returns total number of deep coalescences of the trees in the index.
+        """
+        return self._num_deep_coalescences
+
+    def deep_coalescences(self):
+        """
+        Returns dictionary where the trees in the index are keys, and the
+        number of deep coalescences corresponding to the tree are values.
+        """
+        return dict((tree, record[0]) for tree, record in self._tree_records.items())
+
+    def edge_lineage_counts(self):
+        """
+        Returns dictionary where the edges of the containing tree are keys,
+        and the total number of lineages of the trees in the index passing
+        through the (tail end of the) edge are values.
+        """
+        return dict(zip(self._containing_edges, self._edge_lineage_counts))
+
 def reconciliation_discordance(gene_tree, species_tree):
     """
     Given two trees (with splits encoded), this returns the number of gene
@@ -24,6 +24,7 @@ models.
 """
 
 from dendropy.model.continuous import evolve_continuous_char
+from dendropy.model.continuous import simulate_continuous_chars
 from dendropy.model.discrete import DiscreteCharacterEvolutionModel
 from dendropy.model.discrete import DiscreteCharacterEvolver
 from dendropy.model.discrete import simulate_discrete_char_dataset
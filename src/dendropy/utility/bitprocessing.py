@@ -60,8 +60,12 @@ def int_as_bitstring(n, length=None, symbol0=None, symbol1=None, reverse=False):
     else:
         return s
 
-def num_set_bits(n):
-    return bin(n).count("1")
+if sys.hexversion >= 0x030A0000:
+    def num_set_bits(n):
+        return n.bit_count()
+else:
+    def num_set_bits(n):
+        return bin(n).count("1")
 
 def least_significant_set_bit(n):
     """
@@ -26,6 +26,11 @@ import time
 import os
 import sys
 import re
+import io
+try:
+    import queue
+except ImportError:
+    import Queue as queue
 from threading import Event, Thread, Lock
 
 from dendropy.utility import messaging
@@ -60,6 +65,171 @@ def pre_py34_open(file,
             mode=mode,
             buffering=buffering)
 
+###############################################################################
+## Compressed Files
+
+COMPRESSION_FORMAT_MAGIC_BYTES = (
+    ("gzip", b"\x1f\x8b"),
+    ("bz2", b"BZh"),
+    ("xz", b"\xfd7zXZ\x00"),
+    ("zstd", b"\x28\xb5\x2f\xfd"),
+)
+COMPRESSION_FORMAT_FILENAME_EXTENSIONS = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd",
+}
+DEFAULT_DECOMPRESSION_CHUNK_SIZE = 1 << 20
+DEFAULT_DECOMPRESSION_MAX_BUFFERED_CHUNKS = 8
+
+def get_compression_format(filepath):
+    """
+    Returns the compression format ("gzip", "bz2", "xz", or "zstd") of the
+    file ``filepath``, as identified by its leading ("magic") bytes, or |None|
+    if the file is not compressed in any of these formats.
+    """
+    with open(filepath, "rb") as src:
+        magic_bytes = src.read(6)
+    for compression_format, format_magic_bytes in COMPRESSION_FORMAT_MAGIC_BYTES:
+        if magic_bytes.startswith(format_magic_bytes):
+            return compression_format
+    return None
+
+def open_compressed_binary_file(filepath, compression_format, mode="rb"):
+    """
+    Returns binary file object that (de)compresses data read from or written
+    to the file ``filepath`` in the format ``compression_format`` ("gzip",
+    "bz2", "xz", or "zstd"). Support for the "zstd" format requires Python
+    3.14 or the 'zstandard' package.
+    """
+    if compression_format == "gzip":
+        import gzip
+        return gzip.GzipFile(filepath, mode)
+    elif compression_format == "bz2":
+        import bz2
+        return bz2.BZ2File(filepath, mode)
+    elif compression_format == "xz":
+        try:
+            import lzma
+        except ImportError:
+            raise ImportError("Reading or writing 'xz'-compressed files requires the 'lzma' module")
+        return lzma.LZMAFile(filepath, mode)
+    elif compression_format == "zstd":
+        try:
+            from compression import zstd
+        except ImportError:
+            try:
+                import zstandard as zstd
+            except ImportError:
+                raise ImportError("Reading or writing 'zstd'-compressed files requires the 'zstandard' package")
+        return zstd.open(filepath, mode)
+    else:
+        raise ValueError("Unsupported compression format: '{}'".format(compression_format))
+
+class BackgroundDecompressionStream(io.RawIOBase):
+    """
+    Raw binary stream of the data read from a (decompressing) binary file
+    object, with the reading and decompression carried out in a background
+    thread. Decompressed chunks are passed to the reading thread through a
+    bounded queue, so that decompression of the next chunks overlaps with the
+    processing of the current one (the standard library decompressors release
+    the GIL) while memory use stays bounded.
+    """
+
+    def __init__(self,
+            fileobj,
+            name=None,
+            chunk_size=DEFAULT_DECOMPRESSION_CHUNK_SIZE,
+            max_buffered_chunks=DEFAULT_DECOMPRESSION_MAX_BUFFERED_CHUNKS):
+        io.RawIOBase.__init__(self)
+        self.name = name
+        self._fileobj = fileobj
+        self._chunk_size = chunk_size
+        self._chunks = queue.Queue(maxsize=max_buffered_chunks)
+        self._stop_event = Event()
+        self._current_chunk = None
+        self._current_chunk_pos = 0
+        self._is_eof = False
+        self._thread = Thread(target=self._decompress)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _put(self, item):
+        while not self._stop_event.is_set():
+            try:
+                self._chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def _decompress(self):
+        try:
+            while not self._stop_event.is_set():
+                chunk = self._fileobj.read(self._chunk_size)
+                if not chunk:
+                    break
+                self._put(chunk)
+        except Exception as e:
+            self._put(e)
+        self._put(None)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self._current_chunk is None or self._current_chunk_pos >= len(self._current_chunk):
+            if self._is_eof:
+                return 0
+            item = self._chunks.get()
+            if item is None:
+                self._is_eof = True
+                return 0
+            if isinstance(item, Exception):
+                self._is_eof = True
+                raise item
+            self._current_chunk = memoryview(item)
+            self._current_chunk_pos = 0
+        n = min(len(b), len(self._current_chunk) - self._current_chunk_pos)
+        b[:n] = self._current_chunk[self._current_chunk_pos:self._current_chunk_pos + n]
+        self._current_chunk_pos += n
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._stop_event.set()
+            self._thread.join()
+            self._fileobj.close()
+        io.RawIOBase.close(self)
+
+def open_text_file(filepath, mode="r"):
+    """
+    Opens the file ``filepath`` for reading or writing text, transparently
+    (de)compressing the data if the file is compressed.
+
+    When reading (``mode`` of "r"), compressed files are recognized by their
+    leading ("magic") bytes (see ``COMPRESSION_FORMAT_MAGIC_BYTES``), and
+    decompression is carried out in a background thread (see
+    |BackgroundDecompressionStream|). When writing (``mode`` of "w" or "a"),
+    the data is compressed if the filename extension is one of those in
+    ``COMPRESSION_FORMAT_FILENAME_EXTENSIONS``. Otherwise, the file is opened
+    as a regular text file, with universal newlines when reading.
+    """
+    if mode.startswith("r"):
+        compression_format = get_compression_format(filepath)
+        if compression_format is None:
+            if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
+                return pre_py34_open(filepath, "r")
+            return open(filepath, "r", newline=None)
+        raw = BackgroundDecompressionStream(
+                open_compressed_binary_file(filepath, compression_format, "rb"),
+                name=filepath)
+        return io.TextIOWrapper(io.BufferedReader(raw), newline=None)
+    compression_format = COMPRESSION_FORMAT_FILENAME_EXTENSIONS.get(os.path.splitext(filepath)[1].lower(), None)
+    if compression_format is None:
+        return open(filepath, mode)
+    return io.TextIOWrapper(open_compressed_binary_file(filepath, compression_format, mode[0] + "b"))
+
 ###############################################################################
 ## LineReadingThread
 
@@ -110,6 +110,129 @@ class KTBEvolveLinearBounce(unittest.TestCase):
             if i.edge_length is not None:
                 i.edge_length *= i.mean_edge_rate
 
+class SimulateContinuousCharsTest(unittest.TestCase):
+
+    def setUp(self):
+        newick = "((t5:1611.75,t6:1611.75):3922.93,((t4:1043.81,(t2:754.11,t1:754.11):2896.9):6584.0,t3:1702.21):3832.47);"
+        self.tree = dendropy.Tree.get_from_string(newick, "newick")
+        self.tree.scale_edges(1.0/1000)
+
+    def get_star_tree(self, num_leaves):
+        taxon_namespace = dendropy.TaxonNamespace()
+        tree = dendropy.Tree(taxon_namespace=taxon_namespace)
+        for idx in range(num_leaves):
+            nd = tree.seed_node.new_child(edge_length=1.0)
+            nd.taxon = taxon_namespace.require_taxon("t{}".format(idx))
+        return tree
+
+    def test_dimensions(self):
+        char_matrix = continuous.simulate_continuous_chars(
+                tree_model=self.tree,
+                num_chars=7,
+                rng=MockRandom())
+        self.assertTrue(isinstance(char_matrix, dendropy.ContinuousCharacterMatrix))
+        self.assertIs(char_matrix.taxon_namespace, self.tree.taxon_namespace)
+        self.assertEqual(len(char_matrix), len(self.tree.leaf_nodes()))
+        for taxon in char_matrix:
+            self.assertEqual(len(char_matrix[taxon]), 7)
+
+    def test_append_to_existing_matrix(self):
+        char_matrix = continuous.simulate_continuous_chars(
+                tree_model=self.tree,
+                root_states=[1.0, 2.0],
+                rng=MockRandom())
+        char_matrix2 = continuous.simulate_continuous_chars(
+                tree_model=self.tree,
+                num_chars=3,
+                char_matrix=char_matrix,
+                rng=MockRandom())
+        self.assertIs(char_matrix2, char_matrix)
+        for taxon in char_matrix:
+            self.assertEqual(len(char_matrix[taxon]), 5)
+
+    def test_zero_variance(self):
+        root_states = [1.0, -2.0, 3.5]
+        char_matrix = continuous.simulate_continuous_chars(
+                tree_model=self.tree,
+                root_states=root_states,
+                variance_rate=0.0,
+                rng=MockRandom())
+        for taxon in char_matrix:
+            self.assertEqual(char_matrix[taxon].values(), root_states)
+
+    def test_bounds(self):
+        char_matrix = continuous.simulate_continuous_chars(
+                tree_model=self.tree,
+                root_states=[0.5] * 20,
+                variance_rate=10.0,
+                min_value=0.0,
+                max_value=1.0,
+                rng=MockRandom())
+        for taxon in char_matrix:
+            for v in char_matrix[taxon].values():
+                self.assertTrue(0.0 <= v <= 1.0)
+        for root_states in ([0.5, 1.5], [-0.5, 0.5]):
+            self.assertRaises(ValueError,
+                    continuous.simulate_continuous_chars,
+                    tree_model=self.tree,
+                    root_states=root_states,
+                    min_value=0.0,
+                    max_value=1.0,
+                    rng=MockRandom())
+
+    def test_correlated_characters(self):
+        tree = self.get_star_tree(2000)
+        vcv = [[1.0, 0.9], [0.9, 4.0]]
+        char_matrix = continuous.simulate_continuous_chars(
+                tree_model=tree,
+                vcv=vcv,
+                rng=MockRandom())
+        x = [char_matrix[taxon][0] for taxon in char_matrix]
+        y = [char_matrix[taxon][1] for taxon in char_matrix]
+        n = float(len(x))
+        mean_x = sum(x) / n
+        mean_y = sum(y) / n
+        var_x = sum((i - mean_x) ** 2 for i in x) / (n - 1)
+        var_y = sum((i - mean_y) ** 2 for i in y) / (n - 1)
+        cov_xy = sum((i - mean_x) * (j - mean_y) for i, j in zip(x, y)) / (n - 1)
+        self.assertAlmostEqual(var_x, 1.0, delta=0.15)
+        self.assertAlmostEqual(var_y, 4.0, delta=0.6)
+        self.assertAlmostEqual(cov_xy, 0.9, delta=0.2)
+
+    def test_invalid_vcv(self):
+        self.assertRaises(ValueError,
+                continuous.simulate_continuous_chars,
+                tree_model=self.tree,
+                vcv=[[1.0, 2.0], [2.0, 1.0]],
+                rng=MockRandom())
+        self.assertRaises(ValueError,
+                continuous.simulate_continuous_chars,
+                tree_model=self.tree,
+                num_chars=3,
+                vcv=[[1.0, 0.0], [0.0, 1.0]],
+                rng=MockRandom())
+
+    def test_rate_evolution(self):
+        for constrain_rate_mode in ("crop", "linear_bounce"):
+            char_matrix = continuous.simulate_continuous_chars(
+                    tree_model=self.tree,
+                    num_chars=4,
+                    rate_model="KTB",
+                    root_rate=1.0,
+                    roeotroe=0.5,
+                    min_rate=0.1,
+                    max_rate=10.0,
+                    constrain_rate_mode=constrain_rate_mode,
+                    rng=MockRandom())
+            for taxon in char_matrix:
+                self.assertEqual(len(char_matrix[taxon]), 4)
+        self.assertRaises(ValueError,
+                continuous.simulate_continuous_chars,
+                tree_model=self.tree,
+                num_chars=4,
+                rate_model="TKP",
+                rng=MockRandom())
+
 class BifurcatingTreePICTest(dendropytest.ExtendedTestCase):
 
     def setUp(self):
@@ -166,6 +289,58 @@ class BifurcatingTreePICTest(dendropytest.ExtendedTestCase):
                 for vidx, val in enumerate(vals):
                     self.assertAlmostEqual(vals[vidx], exp_vals[vidx])
 
+    def testMatrixValues(self):
+        results = self.pic.contrasts_matrix()
+        self.assertEqual(results["character_indices"], [0, 1])
+        for nidx, nd in enumerate(results["nodes"]):
+            if nd.is_leaf():
+                self.assertEqual(results["pic_state_value"][nidx],
+                        self.char_matrix[nd.taxon].values())
+                self.assertIs(results["pic_contrast_raw"][nidx], None)
+                continue
+            for cidx in results["character_indices"]:
+                vals = (results["pic_state_value"][nidx][cidx],
+                        results["pic_corrected_edge_length"][nidx],
+                        results["pic_contrast_raw"][nidx][cidx],
+                        results["pic_contrast_variance"][nidx])
+                exp_vals = self.expected_vals[cidx][nd.label]
+                for vidx, val in enumerate(vals):
+                    self.assertAlmostEqual(vals[vidx], exp_vals[vidx])
+
+    def testMatrixValuesMatchSingleCharacterValues(self):
+        results = self.pic.contrasts_matrix(character_indices=[1])
+        contrasts = self.pic._get_contrasts(1)
+        for nidx, nd in enumerate(results["nodes"]):
+            exp = contrasts[nd._track_id]
+            for key in ("pic_state_value", "pic_contrast_raw", "pic_contrast_standardized"):
+                if exp[key] is None:
+                    self.assertIs(results[key][nidx], None)
+                else:
+                    self.assertAlmostEqual(results[key][nidx][0], exp[key])
+            for key in ("pic_state_variance", "pic_contrast_variance", "pic_edge_length_error", "pic_corrected_edge_length"):
+                if exp[key] is None:
+                    self.assertIs(results[key][nidx], None)
+                else:
+                    self.assertAlmostEqual(results[key][nidx], exp[key])
+
+    def testMatrixWithCachedTree(self):
+        self.pic.contrasts_matrix()
+        structure = self.pic._postorder_structure
+        self.assertIsNot(structure, None)
+        other_char_matrix = dendropy.ContinuousCharacterMatrix(taxon_namespace=self.char_matrix.taxon_namespace)
+        for taxon in self.char_matrix:
+            other_char_matrix[taxon] = [2.0 * v for v in self.char_matrix[taxon].values()]
+        results = self.pic.contrasts_matrix(char_matrix=other_char_matrix)
+        self.assertIs(self.pic._postorder_structure, structure)
+        for nidx, nd in enumerate(results["nodes"]):
+            if nd.is_leaf():
+                continue
+            for cidx in results["character_indices"]:
+                self.assertAlmostEqual(results["pic_contrast_raw"][nidx][cidx],
+                        2.0 * self.expected_vals[cidx][nd.label][2])
+        self.pic.tree = self.tree
+        self.assertIs(self.pic._postorder_structure, None)
+
 class MultifurcatingTreePICTest(dendropytest.ExtendedTestCase):
 
     def setUp(self):
@@ -210,6 +385,25 @@ class MultifurcatingTreePICTest(dendropytest.ExtendedTestCase):
                 polytomy_strategy="Ignore")
         ctree = pic.contrasts_tree(1)
 
+    def testMatrixErrorOnDefault(self):
+        pic = continuous.PhylogeneticIndependentConstrasts(tree=self.tree,
+                char_matrix=self.char_matrix)
+        self.assertRaises(ValueError, pic.contrasts_matrix)
+
+    def testMatrixIgnore(self):
+        pic = continuous.PhylogeneticIndependentConstrasts(tree=self.tree,
+                char_matrix=self.char_matrix,
+                polytomy_strategy="Ignore")
+        results = pic.contrasts_matrix()
+        contrasts = pic._get_contrasts(1)
+        for nidx, nd in enumerate(results["nodes"]):
+            exp = contrasts[nd._track_id]
+            if exp["pic_contrast_raw"] is None:
+                self.assertIs(results["pic_contrast_raw"][nidx], None)
+            else:
+                self.assertAlmostEqual(results["pic_contrast_raw"][nidx][1], exp["pic_contrast_raw"])
+            self.assertAlmostEqual(results["pic_state_value"][nidx][1], exp["pic_state_value"])
+
     def testResolve(self):
         pic = continuous.PhylogeneticIndependentConstrasts(tree=self.tree,
                 char_matrix=self.char_matrix,
@@ -0,0 +1,159 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for reading and writing binary alignment cache ("dendropy-binary")
+files.
+"""
+
+import io
+import os
+import sys
+import json
+import struct
+import tempfile
+import unittest
+import dendropy
+from dendropy.utility.error import DataParseError
+from dendropy.dataio import binaryalignmentreader
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+from support import dendropytest
+
+class BinaryAlignmentRoundTripTestCase(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".dpb")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def assert_matrices_equal(self, m1, m2):
+        self.assertIs(type(m1), type(m2))
+        self.assertEqual([t.label for t in m1], [t.label for t in m2])
+        for t1, t2 in zip(m1, m2):
+            self.assertEqual(m1[t1].symbols_as_string(), m2[t2].symbols_as_string())
+            self.assertEqual(list(m1[t1]), list(m2[t2]))
+
+    def test_roundtrip(self):
+        for matrix_type, filename in (
+                (dendropy.DnaCharacterMatrix, "standard-test-chars-dna.fasta"),
+                (dendropy.ProteinCharacterMatrix, "standard-test-chars-protein.fasta"),
+                ):
+            m1 = matrix_type.get(path=pathmap.char_source_path(filename), schema="fasta")
+            m1.write(path=self.path, schema="dendropy-binary")
+            m2 = matrix_type.get(path=self.path, schema="dendropy-binary")
+            self.assert_matrices_equal(m1, m2)
+
+    def test_roundtrip_character_subsets(self):
+        m1 = dendropy.DnaCharacterMatrix.get(
+                path=pathmap.char_source_path("interleaved-charsets-all.nex"),
+                schema="nexus")
+        m1.write(path=self.path, schema="dendropy-binary")
+        m2 = dendropy.DnaCharacterMatrix.get(path=self.path, schema="dendropy-binary")
+        self.assert_matrices_equal(m1, m2)
+        self.assertEqual(list(m1.character_subsets.keys()), list(m2.character_subsets.keys()))
+        for label in m1.character_subsets:
+            self.assertEqual(
+                    sorted(m1.character_subsets[label].character_indices),
+                    sorted(m2.character_subsets[label].character_indices))
+            self.assert_matrices_equal(
+                    m1.export_character_subset(label),
+                    m2.export_character_subset(label))
+
+    def test_roundtrip_stream(self):
+        m1 = dendropy.DnaCharacterMatrix.from_dict({
+            "a": "ACGTRN-?", "b": "TTTTAAAA"})
+        dest = io.BytesIO()
+        m1.write(file=dest, schema="dendropy-binary")
+        m2 = dendropy.DnaCharacterMatrix.get(
+                file=io.BytesIO(dest.getvalue()),
+                schema="dendropy-binary")
+        self.assert_matrices_equal(m1, m2)
+
+    def test_lazy_loading(self):
+        m1 = dendropy.DnaCharacterMatrix.from_dict({
+            "a": "ACGTACGTAC", "b": "TTTTAAAACC", "c": "GGGGCCCCAA"})
+        m1.write(path=self.path, schema="dendropy-binary")
+        m2 = dendropy.DnaCharacterMatrix.get(path=self.path, schema="dendropy-binary")
+        self.assertEqual(len(m2["b"]), 10)
+        self.assertEqual(m2.sequence_size, 10)
+        self.assertNotIn("_character_codes", m2["b"].__dict__)
+        m3 = m2.export_character_indices([1, 2, 3, 8])
+        self.assertNotIn("_character_codes", m2["b"].__dict__)
+        self.assertEqual(m3["a"].symbols_as_string(), "CGTA")
+        self.assertEqual(m3["b"].symbols_as_string(), "TTTC")
+        self.assertEqual(m2["c"].symbols_as_string(), "GGGGCCCCAA")
+        self.assertIn("_character_codes", m2["c"].__dict__)
+
+    def test_write_back_to_same_path(self):
+        m1 = dendropy.DnaCharacterMatrix.from_dict({
+            "a": "ACGTACGTAC", "b": "TTTTAAAACC", "c": "GGGGCCCCAA"})
+        m1.write(path=self.path, schema="dendropy-binary")
+        m2 = dendropy.DnaCharacterMatrix.get(path=self.path, schema="dendropy-binary")
+        self.assertNotIn("_character_codes", m2["b"].__dict__)
+        m2.write(path=self.path, schema="dendropy-binary")
+        m3 = dendropy.DnaCharacterMatrix.get(path=self.path, schema="dendropy-binary")
+        self.assert_matrices_equal(m1, m3)
+
+    def test_state_code_translation(self):
+        # write a file in which the state codes differ from the storage codes
+        # of the current state alphabet
+        m1 = dendropy.DnaCharacterMatrix.from_dict({"a": "ACGT-?", "b": "TTNNAA"})
+        dest = io.BytesIO()
+        m1.write(file=dest, schema="dendropy-binary")
+        data = dest.getvalue()
+        magic_size = len(binaryalignmentreader.BINARY_ALIGNMENT_MAGIC)
+        data_start = magic_size + struct.calcsize(binaryalignmentreader.BINARY_ALIGNMENT_HEADER_SIZE_FORMAT)
+        header_size = struct.unpack(binaryalignmentreader.BINARY_ALIGNMENT_HEADER_SIZE_FORMAT, data[magic_size:data_start])[0]
+        header = json.loads(data[data_start:data_start+header_size].decode("utf-8"))
+        rows = bytearray(data[data_start+header_size:])
+        states = header["matrices"][0]["states"]
+        nstates = len(states)
+        header["matrices"][0]["states"] = list(reversed(states))
+        rows = rows.translate(bytes(bytearray([nstates - 1 - i if i < nstates else i for i in range(256)])))
+        header = json.dumps(header).encode("utf-8")
+        src = io.BytesIO()
+        src.write(binaryalignmentreader.BINARY_ALIGNMENT_MAGIC)
+        src.write(struct.pack(binaryalignmentreader.BINARY_ALIGNMENT_HEADER_SIZE_FORMAT, len(header)))
+        src.write(header)
+        src.write(bytes(rows))
+        m2 = dendropy.DnaCharacterMatrix.get(
+                file=io.BytesIO(src.getvalue()),
+                schema="dendropy-binary")
+        self.assert_matrices_equal(m1, m2)
+
+    def test_invalid_file(self):
+        with open(self.path, "w") as dest:
+            dest.write(">a\nACGT\n")
+        self.assertRaises(DataParseError,
+                dendropy.DnaCharacterMatrix.get,
+                path=self.path,
+                schema="dendropy-binary")
+
+    def test_unsupported_matrix_type(self):
+        m = dendropy.ContinuousCharacterMatrix.from_dict({"a": [1.0, 2.0]})
+        self.assertRaises(TypeError,
+                m.write,
+                path=self.path,
+                schema="dendropy-binary")
+
+if __name__ == "__main__":
+    unittest.main()
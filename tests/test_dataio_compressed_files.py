@@ -0,0 +1,131 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+"""
+Tests for transparent reading and writing of compressed files.
+"""
+
+import io
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import dendropy
+from dendropy.utility import filesys
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+from support import dendropytest
+
+def _is_compression_format_supported(compression_format):
+    try:
+        filesys.open_compressed_binary_file(os.devnull, compression_format, "rb").close()
+    except ImportError:
+        return False
+    except Exception:
+        pass
+    return True
+
+class CompressedFileTestCase(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.compression_formats = [compression_format
+                for extension, compression_format in sorted(filesys.COMPRESSION_FORMAT_FILENAME_EXTENSIONS.items())
+                if _is_compression_format_supported(compression_format)]
+        self.extensions = dict((compression_format, extension)
+                for extension, compression_format in filesys.COMPRESSION_FORMAT_FILENAME_EXTENSIONS.items())
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def get_path(self, filename):
+        return os.path.join(self.tempdir, filename)
+
+    def test_tree_list_roundtrip(self):
+        tree_list = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("pythonidae.random.bd0301.tre"),
+                schema="nexus")
+        expected = tree_list.as_string(schema="newick")
+        for compression_format in self.compression_formats:
+            path = self.get_path("trees.nex" + self.extensions[compression_format])
+            tree_list.write(path=path, schema="nexus")
+            self.assertEqual(filesys.get_compression_format(path), compression_format)
+            tree_list2 = dendropy.TreeList.get(path=path, schema="nexus")
+            self.assertEqual(tree_list2.as_string(schema="newick"), expected)
+            tree_list3 = dendropy.TreeList()
+            tree_list3.read(path=path, schema="nexus")
+            self.assertEqual(tree_list3.as_string(schema="newick"), expected)
+            trees = list(dendropy.Tree.yield_from_files(files=[path], schema="nexus"))
+            self.assertEqual(len(trees), len(tree_list))
+
+    def test_detection_by_content(self):
+        char_matrix = dendropy.DnaCharacterMatrix.from_dict({"a": "ACGT-?", "b": "TTNNAA"})
+        for compression_format in self.compression_formats:
+            path = self.get_path("seqs.fasta" + self.extensions[compression_format])
+            char_matrix.write(path=path, schema="fasta")
+            renamed_path = self.get_path("seqs.fasta")
+            os.rename(path, renamed_path)
+            char_matrix2 = dendropy.DnaCharacterMatrix.get(path=renamed_path, schema="fasta")
+            self.assertEqual(char_matrix2["b"].symbols_as_string(), "TTNNAA")
+            os.remove(renamed_path)
+
+    def test_uncompressed_files(self):
+        path = self.get_path("tree.nwk")
+        dendropy.Tree.get(data="((a,b),c);", schema="newick").write(path=path, schema="newick")
+        self.assertIs(filesys.get_compression_format(path), None)
+        with open(path, "r") as src:
+            self.assertEqual(src.read().strip(), "((a,b),c);")
+        self.assertEqual(len(dendropy.Tree.get(path=path, schema="newick").leaf_nodes()), 3)
+
+    def test_decompression_errors_raised(self):
+        if "gzip" not in self.compression_formats:
+            return
+        path = self.get_path("tree.nwk.gz")
+        dendropy.Tree.get(data="((a,b),c);" * 1000, schema="newick").write(path=path, schema="newick")
+        with open(path, "rb") as src:
+            data = src.read()
+        with open(path, "wb") as dest:
+            dest.write(data[:len(data) // 2])
+        with filesys.open_text_file(path) as src:
+            self.assertRaises(Exception, src.read)
+
+class BackgroundDecompressionStreamTestCase(dendropytest.ExtendedTestCase):
+
+    def test_read(self):
+        data = b"".join(("line {}\n".format(i).encode("ascii") for i in range(10000)))
+        stream = filesys.BackgroundDecompressionStream(
+                io.BytesIO(data),
+                chunk_size=1000,
+                max_buffered_chunks=2)
+        self.assertEqual(stream.read(), data)
+        stream.close()
+
+    def test_close_before_end(self):
+        data = b"x" * 100000
+        stream = filesys.BackgroundDecompressionStream(
+                io.BytesIO(data),
+                chunk_size=10,
+                max_buffered_chunks=1)
+        self.assertEqual(stream.read(5), b"xxxxx")
+        stream.close()
+        self.assertTrue(stream.closed)
+        self.assertFalse(stream._thread.is_alive())
+
+if __name__ == "__main__":
+    unittest.main()
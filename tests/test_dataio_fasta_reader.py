@@ -50,6 +50,21 @@ class FastaDnaReaderTestCase(
                 check_column_annotations=False,
                 check_cell_annotations=False)
 
+class FastaInvalidSymbolTestCase(dendropytest.ExtendedTestCase):
+
+    def test_mixed_case_and_whitespace(self):
+        s = ">t1\nACGT nacg\n  t-?R \n>t2\nNNNN\nACGTACGT\n"
+        char_matrix = dendropy.DnaCharacterMatrix.get(data=s, schema="fasta")
+        self.assertEqual(char_matrix[0].symbols_as_string(), "ACGTNACGT-?R")
+        self.assertEqual(char_matrix[1].symbols_as_string(), "NNNNACGTACGT")
+
+    def test_invalid_symbol_location(self):
+        s = ">t1\nACGTACGT\nACGT\n>t2\nACGTACGT\nAC!TACGT\n"
+        with self.assertRaises(dendropy.utility.error.DataParseError) as cm:
+            dendropy.DnaCharacterMatrix.get(data=s, schema="fasta")
+        self.assertEqual(cm.exception.line_num, 6)
+        self.assertEqual(cm.exception.col_num, 3)
+
 class FastaRnaReaderTestCase(
         standard_file_test_chars.RnaTestChecker,
         dendropytest.ExtendedTestCase):
@@ -30,6 +30,7 @@ import random
 import dendropy
 from dendropy.utility import error
 from dendropy.dataio import newickreader
+from dendropy.utility.textprocessing import StringIO
 import os
 import sys
 sys.path.insert(0, os.path.dirname(__file__))
@@ -785,6 +786,19 @@ class NewickTreeReaderOffsetTreeTest(
             leaves = [nd.label for nd in tree.leaf_node_iter()]
             self.assertCountEqual(leaves, expected_leaves[idx])
 
+    def test_offset_get_stops_reading_after_tree(self):
+        s = "(a,('b;c',d)[e;f]);\n((a,b),(c,d));\n((a,c),(b,d));\n(this is not (a valid tree"
+        for tree_offset, expected_leaves in ((0, ["a", "b;c", "d"]), (2, ["a", "c", "b", "d"])):
+            src = StringIO(s)
+            tree = dendropy.Tree.get(
+                    file=src,
+                    schema="newick",
+                    tree_offset=tree_offset)
+            leaves = [nd.taxon.label for nd in tree.leaf_node_iter()]
+            self.assertEqual(leaves, expected_leaves)
+            self.assertEqual(len(tree.taxon_namespace), len(expected_leaves))
+            self.assertFalse(src.closed)
+
     # def test_tree_offset_newick_read(self):
     #     tree_file_title = "dendropy-test-trees-n33-unrooted-x100a"
     #     tree_reference = standard_file_test_trees._TREE_REFERENCES[tree_file_title]
@@ -444,5 +444,52 @@ class NewickTreeWriterGeneralOptionsTests(
         for nd in tree2:
             self.assertEqual(nd.edge.length, 1000)
 
+    def test_single_node_tree(self):
+        tree1 = dendropy.Tree()
+        tree1.seed_node.taxon = tree1.taxon_namespace.require_taxon("hula hoop")
+        tree1.seed_node.edge.length = 2.5
+        s = tree1.as_string("newick", suppress_rooting=True)
+        self.assertEqual(s.strip(), "hula_hoop:2.5;")
+
+    def test_annotations_on_subset_of_nodes(self):
+        tree1 = newick_tree_writer_test_tree()
+        annotated_node = tree1.leaf_nodes()[0]
+        annotated_node.annotations.add_new("color", "blue")
+        annotated_node.edge.annotations.add_new("rate", 0.5)
+        s = tree1.as_string("newick", suppress_annotations=False)
+        self.assertEqual(s.count("[&color=blue]"), 1)
+        self.assertEqual(s.count("[&rate=0.5]"), 1)
+        self.assertEqual(s.count("[&"), 2)
+        tree2 = dendropy.Tree.get_from_string(s, "newick",
+                extract_comment_metadata=True)
+        nodes2 = [nd for nd in tree2 if nd.annotations]
+        self.assertEqual(len(nodes2), 1)
+
+class NewickTreeListWriterBatchTests(dendropytest.ExtendedTestCase):
+
+    def test_batched_writes_match_unbatched(self):
+        tree_list = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("pythonidae.reference-trees.newick"),
+                schema="newick")
+        expected = tree_list.as_string("newick")
+        self.assertEqual(expected.count(";"), len(tree_list))
+        for batch_size in (1, 2, 3, len(tree_list), len(tree_list) + 1):
+            s = tree_list.as_string("newick", tree_write_batch_size=batch_size)
+            self.assertEqual(s, expected)
+
+    def test_batched_writes_are_buffered(self):
+        tree_list = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("pythonidae.reference-trees.newick"),
+                schema="newick")
+        writes = []
+        class _Stream(object):
+            def write(self, s):
+                writes.append(s)
+        writer = dendropy.dataio.newickwriter.NewickWriter(tree_write_batch_size=3)
+        writer._write_tree_list(_Stream(), tree_list)
+        self.assertEqual("".join(writes), tree_list.as_string("newick"))
+        # one write per batch, plus one for the (empty) trailing comments
+        self.assertEqual(len(writes), (len(tree_list) + 2) // 3 + 1)
+
 if __name__ == "__main__":
     unittest.main()
@@ -22,6 +22,7 @@ Tests for NEXML tree list writing.
 """
 
 import unittest
+from xml.etree import ElementTree
 import dendropy
 import os
 import sys
@@ -83,5 +84,28 @@ class NexmlWriterCharactersTestCase(
                 d2 = matrix_type.get_from_string(s, "nexml")
                 self.verify_char_matrix(d2, src_matrix_checker_type)
 
+class NexmlWriterSequenceMarkupTestCase(dendropytest.ExtendedTestCase):
+
+    def get_seqs(self, char_matrix):
+        s = char_matrix.as_string(schema="nexml", markup_as_sequences=True)
+        root = ElementTree.fromstring(s.encode("iso-8859-1"))
+        return [e.text for e in root.iter("{http://www.nexml.org/2009}seq")]
+
+    def test_sequence_lines(self):
+        seq = "ACGTRYN-?" * 15
+        m = dendropy.DnaCharacterMatrix.from_dict({"a": seq, "b": ""})
+        seqs = self.get_seqs(m)
+        self.assertEqual(len(seqs), 2)
+        lines = [line.strip() for line in seqs[0].strip().split("\n")]
+        self.assertEqual([len(line) for line in lines], [58, 58, 19])
+        self.assertEqual("".join(lines), seq)
+        self.assertEqual(seqs[1].strip(), "")
+
+    def test_separated_sequence_lines(self):
+        m = dendropy.StandardCharacterMatrix.from_dict({"a": "01" * 30})
+        seqs = self.get_seqs(m)
+        lines = [line.strip() for line in seqs[0].strip().split("\n")]
+        self.assertEqual(lines, [" ".join("01" * 29), "0 1"])
+
 if __name__ == "__main__":
     unittest.main()
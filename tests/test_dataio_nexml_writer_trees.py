@@ -33,6 +33,7 @@ from support import compare_and_validate
 from support import dendropytest
 from support import curated_test_tree
 from support import standard_file_test_trees
+from dendropy.utility.textprocessing import StringIO
 
 class NexmlTreeWriterTests(
         curated_test_tree.CuratedTestTree,
@@ -100,5 +101,40 @@ class NexmlStandardTreeListWriterTestCase(
                 tree_file_title=tree_file_title,
                 tree_offset=0)
 
+class NexmlTreeWriterNodeEdgeMarkupTest(dendropytest.ExtendedTestCase):
+
+    def test_yielded_trees_match_written_trees(self):
+        tns = dendropy.TaxonNamespace()
+        trees = dendropy.TreeList.get(
+                data="[&R] ((a:1,b:2)x:3,(c:4,d:5)y:6)z:7;(a,(b,(c,d)));",
+                schema="newick",
+                taxon_namespace=tns)
+        trees[0].seed_node.annotations.add_new("color", "red")
+        trees[0].seed_node.child_nodes()[0].edge.annotations.add_new("support", 0.5)
+        s = trees.as_string(schema="nexml")
+        self.assertEqual(s.count("<rootedge"), 2)
+        trees2 = list(dendropy.Tree.yield_from_files(
+            files=[StringIO(s)],
+            schema="nexml",
+            taxon_namespace=tns))
+        self.assertEqual(len(trees2), len(trees))
+        for t1, t2 in zip(trees, trees2):
+            self.assertEqual(bool(t1.is_rooted), bool(t2.is_rooted))
+            self.assertEqual(
+                    t1.as_string(schema="newick", suppress_edge_lengths=True, suppress_rooting=True),
+                    t2.as_string(schema="newick", suppress_edge_lengths=True, suppress_rooting=True))
+        self.assertEqual(
+                [nd.edge.length for nd in trees[0].preorder_node_iter()],
+                [nd.edge.length for nd in trees2[0].preorder_node_iter()])
+        self.assertEqual(trees2[0].seed_node.annotations.get_value("color"), "red")
+        self.assertEqual(trees2[0].seed_node.child_nodes()[0].edge.annotations.get_value("support"), "0.5")
+
+    def test_ids_unique(self):
+        trees = dendropy.TreeList.get(data="((a,b),(c,d));((a,c),(b,d));", schema="newick")
+        trees[1].seed_node.annotations.add_new("color", "red")
+        s = trees.as_string(schema="nexml")
+        ids = re.findall(r' id="([^"]+)"', s)
+        self.assertEqual(len(ids), len(set(ids)))
+
 if __name__ == "__main__":
     unittest.main()
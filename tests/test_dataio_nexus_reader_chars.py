@@ -206,6 +206,58 @@ class NexusTooManyTaxaTest(
                 data_str,
                 'nexus')
 
+class NexusInvalidCharacterStatesTest(
+        dendropytest.ExtendedTestCase):
+
+    def test_invalid_symbol(self):
+        data_str = """\
+#NEXUS
+BEGIN CHARACTERS;
+    DIMENSIONS NTAX=2 NCHAR=8;
+    FORMAT DATATYPE=DNA GAP=- MISSING=? MATCHCHAR=.;
+    MATRIX
+        AAA ACGTACGT
+        BBB ACG!ACGT
+    ;
+END;
+"""
+        with self.assertRaises(nexusreader.NexusReader.InvalidCharacterStateSymbolError) as cm:
+            dendropy.DnaCharacterMatrix.get(data=data_str, schema="nexus")
+        self.assertEqual(cm.exception.line_num, 7)
+
+    def test_too_many_characters(self):
+        data_str = """\
+#NEXUS
+BEGIN CHARACTERS;
+    DIMENSIONS NTAX=2 NCHAR=8;
+    FORMAT DATATYPE=DNA GAP=- MISSING=? MATCHCHAR=.;
+    MATRIX
+        AAA ACGTACGT
+        BBB ACGTACGTA
+    ;
+END;
+"""
+        self.assertRaises(nexusreader.NexusReader.TooManyCharactersError,
+                dendropy.DnaCharacterMatrix.get,
+                data=data_str,
+                schema="nexus")
+
+    def test_mixed_tokens(self):
+        data_str = """\
+#NEXUS
+BEGIN CHARACTERS;
+    DIMENSIONS NTAX=2 NCHAR=12;
+    FORMAT DATATYPE=DNA GAP=- MISSING=? MATCHCHAR=.;
+    MATRIX
+        AAA ACGT acgt {AG}-?N
+        BBB ....AC{CT}T N..G
+    ;
+END;
+"""
+        char_matrix = dendropy.DnaCharacterMatrix.get(data=data_str, schema="nexus")
+        self.assertEqual(char_matrix[0].symbols_as_string(), "ACGTACGTR-?N")
+        self.assertEqual(char_matrix[1].symbols_as_string(), "ACGTACYTN-?G")
+
 class NexusCharsSubsetsTest(
         compare_and_validate.Comparator,
         dendropytest.ExtendedTestCase):
@@ -29,6 +29,8 @@ sys.path.insert(0, os.path.dirname(__file__))
 from support import dendropytest
 from support import standard_file_test_trees
 from support import pathmap
+from dendropy.utility.textprocessing import StringIO
+from dendropy.dataio import nexusreader
 
 if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
     from dendropy.utility.filesys import pre_py34_open as open
@@ -83,8 +85,61 @@ class NexusTreeYielderDefaultTestCase(
             self.assertIs(tree.taxon_namespace, tns)
             self.compare_to_reference_tree(tree, ref_tree)
 
+class NexusTreeYielderSelectionTestCase(dendropytest.ExtendedTestCase):
+
+    def test_tree_selection(self):
+        s = """\
+#NEXUS
+BEGIN TREES;
+    TRANSLATE 1 a, 2 'b;c', 3 d;
+    TREE t0 = [&R] (1,(2,3));
+    TREE 't;1' = [&R] ((1,2),3)[;];
+    TREE t2 = [&R] ((1,3),2);
+END;
+BEGIN TREES;
+    TREE u0 = (a,(x,y));
+    TREE u1 = ((a,x),y);
+END;
+"""
+        for collection_offset, tree_offset, tree_stride, expected_labels in (
+                (None, 1, 2, ["t;1", "u0"]),
+                (None, 0, 1, ["t0", "t;1", "t2", "u0", "u1"]),
+                (0, 2, 1, ["t2"]),
+                (1, 1, 1, ["u1"]),
+                (2, 0, 1, []),
+                ):
+            tree_yielder = dendropy.Tree.yield_from_files(
+                    files=[StringIO(s)],
+                    schema="nexus")
+            tree_yielder.select_trees(
+                    tree_offset=tree_offset,
+                    tree_stride=tree_stride,
+                    collection_offset=collection_offset)
+            self.assertEqual([t.label for t in tree_yielder], expected_labels)
+        tree = dendropy.Tree.get(data=s, schema="nexus", tree_offset=1)
+        self.assertEqual([nd.taxon.label for nd in tree.leaf_node_iter()], ["a", "b;c", "d"])
+        tree = dendropy.Tree.get(data=s, schema="nexus", collection_offset=1, tree_offset=1)
+        self.assertEqual([nd.taxon.label for nd in tree.leaf_node_iter()], ["a", "x", "y"])
+        with self.assertRaises(IndexError):
+            dendropy.Tree.get(data=s, schema="nexus", collection_offset=1, tree_offset=2)
+        with self.assertRaises(IndexError):
+            dendropy.Tree.get(data=s, schema="nexus", collection_offset=2)
+
+    def test_get_with_multiple_taxa_blocks(self):
+        s = """\
+#NEXUS
+BEGIN TAXA; DIMENSIONS NTAX=3; TAXLABELS a b c; END;
+BEGIN TAXA; DIMENSIONS NTAX=3; TAXLABELS d e f; END;
+BEGIN TREES; TREE t0 = ((a,b),c); TREE t1 = ((a,c),b); END;
+"""
+        # as with the full parse (negative tree offset)
+        for tree_offset in (0, -1):
+            with self.assertRaises(nexusreader.NexusReader.TooManyTaxaError):
+                dendropy.Tree.get(data=s, schema="nexus", tree_offset=tree_offset)
+            with self.assertRaises(nexusreader.NexusReader.TooManyTaxaError):
+                dendropy.Tree.get(data=s, schema="nexus", tree_offset=tree_offset, taxon_namespace=dendropy.TaxonNamespace())
+
 ## TODO:
-# - test multiple trees blocks
 # - mix of newick/nexus
 
 if __name__ == "__main__":
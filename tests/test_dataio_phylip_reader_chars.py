@@ -254,6 +254,17 @@ AAACCATTGC CGGTACGCTT AA
             self.assertEqual(taxon.label, expected_taxon)
             self.assertEqual(char_matrix[taxon].symbols_as_string(), self.expected_seqs[expected_taxon])
 
+    def test_relaxed_sequential_invalid_symbol_location(self):
+        s = """\
+2 8
+t1 AAGCTNGG
+taxon2  AAGCT!GG
+"""
+        with self.assertRaises(dendropy.utility.error.DataParseError) as cm:
+            dendropy.DnaCharacterMatrix.get_from_string(s, "phylip")
+        self.assertEqual(cm.exception.line_num, 3)
+        self.assertEqual(cm.exception.col_num, 14)
+
 class PhylipContinuousVariantsTestCases(dendropytest.ExtendedTestCase):
 
     @classmethod
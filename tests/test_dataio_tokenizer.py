@@ -23,6 +23,7 @@ Tests for tokenizers classes.
 
 import unittest
 from dendropy.dataio import nexusprocessing
+from dendropy.dataio import tokenizer
 from dendropy.utility.textprocessing import StringIO
 
 class NexusTokenizerTestCase(unittest.TestCase):
@@ -157,5 +158,24 @@ class NexusTokenizerTestCase(unittest.TestCase):
         self.assertEqual(expected_comments, {})
         self.assertEqual(observed_tokens, expected_tokens)
 
+    def test_skip_to_terminator(self):
+        input_str = "TREE 'a;''b' = [x;[y;]z] (a,'b;''c');\nTREE next = (c,d);"
+        for chunk_size in (1, 2, 3, 7, 65536):
+            tk = nexusprocessing.NexusTokenizer(src=StringIO(input_str))
+            self.assertEqual(tk.next_token(), "TREE")
+            tk.src = tokenizer.ScanningStreamBuffer(tk.src, chunk_size=chunk_size)
+            self.assertTrue(tk.skip_to_terminator(";"))
+            self.assertEqual(tk.current_token, ";")
+            self.assertEqual(list(tk), ["TREE", "next", "=", "(", "c", ",", "d", ")", ";"])
+            self.assertEqual(tk.current_line_num, 2)
+
+    def test_skip_to_terminator_at_end(self):
+        tk = nexusprocessing.NexusTokenizer(src=StringIO("(a,b) [;]"))
+        self.assertFalse(tk.skip_to_terminator(";"))
+        self.assertTrue(tk.is_eof())
+        tk = nexusprocessing.NexusTokenizer(src=StringIO("(a,'b;)"))
+        with self.assertRaises(tokenizer.Tokenizer.UnterminatedQuoteError):
+            tk.skip_to_terminator(";")
+
 if __name__ == "__main__":
     unittest.main()
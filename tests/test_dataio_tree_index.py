@@ -0,0 +1,193 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+"""
+Tests for indexed random access to trees in tree files.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import dendropy
+from dendropy.dataio import treeindex
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+from support import dendropytest
+
+NEXUS_SOURCE = """\
+#NEXUS
+[a comment; with a semi-colon [and a nested; comment]]
+BEGIN TAXA;
+    DIMENSIONS NTAX=4;
+    TAXLABELS A 'B;b' C D;
+END;
+BEGIN TREES;
+    TITLE first;
+    TRANSLATE 1 A, 2 'B;b', 3 C, 4 D;
+    TREE t0 = [&R] ((1,2),(3,4));
+    TREE 't;1' = [&R] ((1,3),(2,4));
+    TREE t2 = [&U] ((1,4),(2,3));
+END;
+BEGIN TREES;
+    TITLE second;
+    TREE u0 = ((A,'B;b'),(C,D)) [;];
+    TREE u1 = ((A,C),('B;b',D));
+END;
+"""
+
+NEWICK_SOURCE = """\
+((A,B),(C,D));
+[comment;] ((A,C),(B,'D;'));
+((A,D),(B,C))
+;((A,B),(C,'D;'));
+"""
+
+class TreeFileIndexTestCase(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def write_source(self, filename, src):
+        path = os.path.join(self.tempdir, filename)
+        with open(path, "w") as dest:
+            dest.write(src)
+        return path
+
+    def get_labels(self, trees):
+        return [t.label for t in trees]
+
+    def get_newick(self, trees):
+        return [t.as_string("newick", suppress_rooting=False) for t in trees]
+
+    def test_scan_nexus(self):
+        path = self.write_source("trees.nex", NEXUS_SOURCE)
+        index = treeindex.TreeFileIndex.build(path)
+        self.assertEqual(index.kind, "nexus")
+        self.assertEqual(len(index), 5)
+        self.assertEqual(index.num_collections, 2)
+        self.assertEqual(list(index.collection_tree_indexes(1)), [3, 4])
+        statements = [NEXUS_SOURCE[start:end].strip() for start, end, collection_index in index.tree_spans]
+        self.assertTrue(statements[1].startswith("TREE 't;1'"))
+        self.assertTrue(statements[3].endswith("[;];"))
+
+    def test_scan_newick(self):
+        path = self.write_source("trees.tre", NEWICK_SOURCE)
+        index = treeindex.TreeFileIndex.build(path)
+        self.assertEqual(index.kind, "newick")
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index.num_collections, 1)
+
+    def test_sidecar(self):
+        path = self.write_source("trees.nex", NEXUS_SOURCE)
+        self.assertIs(treeindex.get_tree_file_index(path, "nexus"), None)
+        index = treeindex.get_tree_file_index(path, "nexus", build=True)
+        self.assertTrue(os.path.exists(treeindex.TreeFileIndex.index_path_for(path)))
+        loaded = treeindex.TreeFileIndex.load(path)
+        self.assertEqual(loaded.tree_spans, index.tree_spans)
+        self.assertEqual(loaded.context_spans, index.context_spans)
+        self.assertIs(treeindex.get_tree_file_index(path, "newick"), None)
+        self.write_source("trees.nex", NEXUS_SOURCE + "\n")
+        self.assertIs(treeindex.TreeFileIndex.load(path), None)
+
+    def test_tree_get(self):
+        for filename, src, schema in (
+                ("trees.nex", NEXUS_SOURCE, "nexus"),
+                ("trees.tre", NEWICK_SOURCE, "newick"),
+                ):
+            path = self.write_source(filename, src)
+            expected = dendropy.TreeList.get(path=path, schema=schema, collection_offset=0)
+            for tree_index in (True, None):
+                for tree_offset in range(len(expected)):
+                    tree = dendropy.Tree.get(
+                            path=path,
+                            schema=schema,
+                            tree_offset=tree_offset,
+                            tree_index=tree_index)
+                    self.assertEqual(self.get_newick([tree]), self.get_newick([expected[tree_offset]]))
+            with self.assertRaises(IndexError):
+                dendropy.Tree.get(path=path, schema=schema, tree_offset=len(expected))
+
+    def test_tree_list_get_and_read(self):
+        path = self.write_source("trees.nex", NEXUS_SOURCE)
+        treeindex.get_tree_file_index(path, "nexus", build=True)
+        for collection_offset, tree_offset in (
+                (0, 1),
+                (0, -1),
+                (1, 1),
+                (-1, None),
+                (None, 2),
+                ):
+            unindexed = dendropy.TreeList.get(
+                    path=path,
+                    schema="nexus",
+                    collection_offset=collection_offset,
+                    tree_offset=tree_offset,
+                    tree_index=False)
+            indexed = dendropy.TreeList.get(
+                    path=path,
+                    schema="nexus",
+                    collection_offset=collection_offset,
+                    tree_offset=tree_offset)
+            self.assertEqual(indexed.label, unindexed.label)
+            self.assertEqual(self.get_labels(indexed), self.get_labels(unindexed))
+            self.assertEqual(self.get_newick(indexed), self.get_newick(unindexed))
+            self.assertEqual(indexed.taxon_namespace.labels(), unindexed.taxon_namespace.labels())
+            tree_list = dendropy.TreeList()
+            tree_list.read(
+                    path=path,
+                    schema="nexus",
+                    collection_offset=collection_offset,
+                    tree_offset=tree_offset)
+            self.assertEqual(self.get_labels(tree_list), self.get_labels(unindexed))
+
+    def test_yield_from_files(self):
+        nexus_path = self.write_source("trees.nex", NEXUS_SOURCE)
+        newick_path = self.write_source("trees.tre", NEWICK_SOURCE)
+        expected_newick = self.get_newick(dendropy.TreeList.get(path=newick_path, schema="newick"))
+        for tree_index in (True, False):
+            trees = list(dendropy.Tree.yield_from_files(
+                    [nexus_path],
+                    schema="nexus",
+                    tree_offset=1,
+                    tree_stride=2,
+                    tree_index=tree_index))
+            self.assertEqual(self.get_labels(trees), ["t;1", "u0"])
+            trees = list(dendropy.Tree.yield_from_files(
+                    [newick_path, newick_path],
+                    schema="newick",
+                    tree_offset=2,
+                    tree_index=tree_index))
+            self.assertEqual(self.get_newick(trees), expected_newick[2:] * 2)
+
+    def test_tree_array_burnin(self):
+        path = pathmap.tree_source_path("pythonidae.reference-trees.nexus")
+        expected = dendropy.TreeList.get(path=path, schema="nexus", tree_offset=5)
+        indexed_path = os.path.join(self.tempdir, "trees.nex")
+        shutil.copy(path, indexed_path)
+        treeindex.get_tree_file_index(indexed_path, "nexus", build=True)
+        tree_array = dendropy.TreeArray(taxon_namespace=dendropy.TaxonNamespace())
+        tree_array.read(path=indexed_path, schema="nexus", tree_offset=5)
+        self.assertEqual(len(tree_array), len(expected))
+
+if __name__ == "__main__":
+    unittest.main()
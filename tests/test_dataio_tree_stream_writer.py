@@ -0,0 +1,171 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for incremental (streaming) tree writing.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+import dendropy
+from dendropy.utility.textprocessing import StringIO
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+from support import dendropytest
+
+class TreeStreamWriterTestCase(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.taxon_namespace = dendropy.TaxonNamespace()
+        self.tree_list = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("pythonidae.reference-trees.nexus"),
+                schema="nexus",
+                taxon_namespace=self.taxon_namespace)
+
+    def test_output_matches_tree_list_write(self):
+        for schema, kwargs in (
+                ("newick", {}),
+                ("nexus", {}),
+                ("nexus", {"translate_tree_taxa": True}),
+                ("nexus", {"suppress_taxa_blocks": True}),
+                ):
+            dest = StringIO()
+            with dendropy.dataio.open_tree_writer(
+                    dest,
+                    schema=schema,
+                    taxon_namespace=self.taxon_namespace,
+                    **kwargs) as writer:
+                writer.write_trees(iter(self.tree_list))
+            self.assertEqual(writer.num_trees_written, len(self.tree_list))
+            self.assertEqual(dest.getvalue(),
+                    self.tree_list.as_string(schema, **kwargs))
+
+    def test_header_written_before_trees(self):
+        dest = StringIO()
+        writer = dendropy.dataio.open_tree_writer(
+                dest,
+                schema="nexus",
+                taxon_namespace=self.taxon_namespace,
+                translate_tree_taxa=True)
+        s = dest.getvalue()
+        self.assertIn("BEGIN TAXA;", s)
+        self.assertIn("Translate", s)
+        self.assertNotIn("TREE ", s)
+        writer.write_tree(self.tree_list[0])
+        self.assertEqual(dest.getvalue().count("TREE "), 1)
+        self.assertNotIn("END;\n\n", dest.getvalue()[len(s):])
+        writer.close()
+        s = dest.getvalue()
+        self.assertTrue(s.endswith("END;\n\n"))
+        writer.close()
+        self.assertEqual(dest.getvalue(), s)
+
+    def test_write_to_path_and_reread(self):
+        fd, path = tempfile.mkstemp(suffix=".nex")
+        os.close(fd)
+        try:
+            with dendropy.dataio.open_tree_writer(
+                    path,
+                    schema="nexus",
+                    taxon_namespace=self.taxon_namespace,
+                    label="filtered") as writer:
+                for tree in dendropy.Tree.yield_from_files(
+                        files=[pathmap.tree_source_path("pythonidae.reference-trees.nexus")],
+                        schema="nexus",
+                        taxon_namespace=self.taxon_namespace):
+                    if tree.label != self.tree_list[1].label:
+                        writer.write_tree(tree)
+            self.assertTrue(writer.stream.closed)
+            tree_list2 = dendropy.TreeList.get(path=path, schema="nexus")
+            self.assertEqual(len(tree_list2), len(self.tree_list) - 1)
+            self.assertEqual(
+                    [t.label for t in tree_list2],
+                    [t.label for t in self.tree_list if t.label != self.tree_list[1].label])
+            self.assertEqual(len(tree_list2.taxon_namespace), len(self.taxon_namespace))
+        finally:
+            os.remove(path)
+
+    def test_foreign_taxon_namespace_error(self):
+        dest = StringIO()
+        with dendropy.dataio.open_tree_writer(
+                dest,
+                schema="newick",
+                taxon_namespace=dendropy.TaxonNamespace()) as writer:
+            self.assertRaises(ValueError, writer.write_tree, self.tree_list[0])
+        self.assertEqual(writer.num_trees_written, 0)
+
+    def test_taxon_namespace_changed_error(self):
+        for kwargs in ({}, {"translate_tree_taxa": True}, {"suppress_taxa_blocks": True, "translate_tree_taxa": True}):
+            taxon_namespace = dendropy.TaxonNamespace()
+            dest = StringIO()
+            with dendropy.dataio.open_tree_writer(
+                    dest,
+                    schema="nexus",
+                    taxon_namespace=taxon_namespace,
+                    **kwargs) as writer:
+                tree = dendropy.Tree.get(data="((a,b),c);", schema="newick", taxon_namespace=taxon_namespace)
+                self.assertRaises(ValueError, writer.write_tree, tree)
+            self.assertEqual(writer.num_trees_written, 0)
+            self.assertNotIn("TREE ", dest.getvalue())
+        # taxa added after some trees were written
+        taxon_namespace = dendropy.TaxonNamespace()
+        tree = dendropy.Tree.get(data="((a,b),c);", schema="newick", taxon_namespace=taxon_namespace)
+        with dendropy.dataio.open_tree_writer(
+                StringIO(),
+                schema="nexus",
+                taxon_namespace=taxon_namespace) as writer:
+            writer.write_tree(tree)
+            tree = dendropy.Tree.get(data="((a,b),d);", schema="newick", taxon_namespace=taxon_namespace)
+            self.assertRaises(ValueError, writer.write_tree, tree)
+        self.assertEqual(writer.num_trees_written, 1)
+        # Newick output does not depend on the taxa
+        taxon_namespace = dendropy.TaxonNamespace()
+        with dendropy.dataio.open_tree_writer(
+                StringIO(),
+                schema="newick",
+                taxon_namespace=taxon_namespace) as writer:
+            writer.write_tree(dendropy.Tree.get(data="((a,b),c);", schema="newick", taxon_namespace=taxon_namespace))
+        self.assertEqual(writer.num_trees_written, 1)
+
+    def test_write_after_close_error(self):
+        dest = StringIO()
+        writer = dendropy.dataio.open_tree_writer(
+                dest,
+                schema="newick",
+                taxon_namespace=self.taxon_namespace)
+        writer.close()
+        self.assertRaises(ValueError, writer.write_tree, self.tree_list[0])
+
+    def test_nexus_requires_taxon_namespace(self):
+        self.assertRaises(TypeError,
+                dendropy.dataio.open_tree_writer,
+                StringIO(),
+                schema="nexus")
+
+    def test_unsupported_schema(self):
+        self.assertRaises(NotImplementedError,
+                dendropy.dataio.open_tree_writer,
+                StringIO(),
+                schema="fasta",
+                taxon_namespace=self.taxon_namespace)
+
+if __name__ == "__main__":
+    unittest.main()
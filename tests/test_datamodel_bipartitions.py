@@ -99,6 +99,108 @@ class BipartitionEncodingTestCase(ExtendedTestCase):
                                 expected_split_bitmask = int(tree_bipartitions_ref[label]["split_bitmask"])
                                 self.assertEqual(bipartition.split_bitmask, expected_split_bitmask)
 
+class IncrementalBipartitionUpdateTestCase(ExtendedTestCase):
+
+    tree_str = "[&R] ((((a:1,b:1)i1:1,(c:1,d:0)i2:1)i3:0,(e:1,(f:1,g:1)i4:1)i5:1)i6:1,((h:1,i:1)i7:0,(j:1,(k:1,l:1)i8:1)i9:1)i10:1)i11;"
+
+    def get_tree(self, rooting="force-rooted"):
+        tree = dendropy.Tree.get(data=self.tree_str, schema="newick", rooting=rooting)
+        tree.encode_bipartitions()
+        tree.bipartition_edge_map
+        return tree
+
+    def get_node(self, tree, label):
+        node = tree.find_node_with_label(label)
+        if node is None:
+            node = tree.find_node_with_taxon_label(label)
+        return node
+
+    def assertBipartitionsEncoded(self, tree):
+        bipartition_encoding = list(tree.bipartition_encoding)
+        bipartition_edge_map = dict(tree.bipartition_edge_map)
+        split_bitmask_edge_map = dict(tree.split_bitmask_edge_map)
+        for edge in tree.postorder_edge_iter():
+            self.assertIs(bipartition_edge_map[edge.bipartition], edge)
+            self.assertIs(split_bitmask_edge_map[edge.bipartition.split_bitmask], edge)
+        expected_tree = dendropy.Tree(tree)
+        expected_tree.encode_bipartitions()
+        self.assertEqual(
+                sorted(b.split_bitmask for b in bipartition_encoding),
+                sorted(b.split_bitmask for b in expected_tree.bipartition_encoding))
+        self.assertEqual(tree.as_string("newick"), expected_tree.as_string("newick"))
+        self.assertEqual(len(bipartition_edge_map), len(expected_tree.bipartition_edge_map))
+        self.assertEqual(
+                set(split_bitmask_edge_map),
+                set(expected_tree.split_bitmask_edge_map))
+
+    def test_spr(self):
+        tree = self.get_tree()
+        node = self.get_node(tree, "i4")
+        target = self.get_node(tree, "c")
+        parent = node.parent_node
+        grandparent = parent.parent_node
+        parent.remove_child(node)
+        target_parent = target.parent_node
+        target_parent.remove_child(target)
+        new_node = target_parent.new_child()
+        new_node.add_child(target)
+        new_node.add_child(node)
+        tree.update_bipartitions_along_paths(
+                [parent, target_parent, new_node],
+                removed_edges=[])
+        self.assertIs(self.get_node(tree, "e").parent_node, grandparent)
+        self.assertBipartitionsEncoded(tree)
+
+    def test_leafset_change(self):
+        tree = self.get_tree()
+        node = tree.find_node_with_label("i4")
+        parent = node.parent_node
+        parent.remove_child(node)
+        tree.update_bipartitions_along_paths([parent], removed_edges=[node.edge])
+        self.assertEqual(len(tree.leaf_nodes()), 10)
+        self.assertBipartitionsEncoded(tree)
+
+    def test_reroot(self):
+        for label in ("i1", "i2", "i8", "a", "k"):
+            tree = self.get_tree()
+            tree.reroot_at_node(self.get_node(tree, label), update_bipartitions=True)
+            self.assertBipartitionsEncoded(tree)
+            tree = self.get_tree()
+            tree.reroot_at_edge(self.get_node(tree, label).edge, length1=0.5, length2=0.5, update_bipartitions=True)
+            self.assertBipartitionsEncoded(tree)
+            tree = self.get_tree(rooting="force-unrooted")
+            tree.reseed_at(self.get_node(tree, label), update_bipartitions=True)
+            self.assertBipartitionsEncoded(tree)
+
+    def test_collapse_and_resolve(self):
+        for rooting in ("force-rooted", "force-unrooted"):
+            tree = self.get_tree(rooting=rooting)
+            tree.collapse_unweighted_edges(update_bipartitions=True)
+            self.assertBipartitionsEncoded(tree)
+            self.assertEqual(len(tree.find_node_with_label("i6").child_nodes()), 3)
+            tree.resolve_polytomies(update_bipartitions=True)
+            self.assertBipartitionsEncoded(tree)
+            tree.resolve_polytomies(update_bipartitions=True, rng=dendropy.utility.GLOBAL_RNG)
+            self.assertBipartitionsEncoded(tree)
+
+    def test_reroot_after_rooting_state_change(self):
+        tree = dendropy.Tree.get(data="[&U] ((A,B),C,(D,(E,F)));", schema="newick")
+        tree.encode_bipartitions()
+        tree.is_rooted = True
+        tree.reroot_at_node(self.get_node(tree, "E").parent_node, update_bipartitions=True)
+        self.assertBipartitionsEncoded(tree)
+        for bipartition in tree.bipartition_encoding:
+            self.assertTrue(bipartition.is_rooted)
+
+    def test_reroot_after_taxa_change(self):
+        for rooting in ("force-rooted", "force-unrooted"):
+            tree = self.get_tree(rooting=rooting)
+            node1 = self.get_node(tree, "a")
+            node2 = self.get_node(tree, "k")
+            node1.taxon, node2.taxon = node2.taxon, node1.taxon
+            tree.reseed_at(self.get_node(tree, "i8"), update_bipartitions=True)
+            self.assertBipartitionsEncoded(tree)
+
 if __name__ == "__main__":
     unittest.main()
 
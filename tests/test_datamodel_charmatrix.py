@@ -29,6 +29,7 @@ import dendropy
 import itertools
 from dendropy.utility import error
 from dendropy.datamodel import charmatrixmodel
+from dendropy.datamodel import charstatemodel
 import os
 import sys
 sys.path.insert(0, os.path.dirname(__file__))
@@ -1082,6 +1083,150 @@ class InfiniteSitesCharacterMatrixCreatingAndCloningTestCase(
         cls.nseqs = 100
         cls.build()
 
+class FixedAlphabetCharacterDataSequenceStorageTest(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.sa = dendropy.DNA_STATE_ALPHABET
+        self.symbols = "ACGT-NR?ACGT"
+        self.states = [self.sa[s] for s in self.symbols]
+
+    def test_compact_storage(self):
+        seq = dendropy.DnaCharacterDataSequence(self.states)
+        self.assertTrue(seq.is_compact)
+        self.assertEqual(len(seq), len(self.states))
+        self.assertEqual(seq.values_view(), self.states)
+        self.assertEqual(list(seq), self.states)
+        self.assertEqual(seq[2:5], self.states[2:5])
+        for idx, state in enumerate(self.states):
+            self.assertIs(seq[idx], state)
+        self.assertIs(seq[-1], self.states[-1])
+        self.assertEqual(seq.symbols_as_string(), self.symbols)
+        self.assertEqual(seq.symbols_as_string(sep=","), ",".join(self.symbols))
+        self.assertEqual(seq.symbols_as_list(), list(self.symbols))
+        self.assertTrue(seq.is_compact)
+
+    def test_values_list(self):
+        seq = dendropy.DnaCharacterDataSequence(self.states)
+        values = seq.values()
+        self.assertIsInstance(values, list)
+        self.assertEqual(values, self.states)
+        values[0] = self.sa["T"]
+        self.assertIs(seq[0], self.sa["T"])
+        self.assertIs(seq.values(), values)
+        self.assertFalse(seq.is_compact)
+
+    def test_mutation(self):
+        seq = dendropy.DnaCharacterDataSequence(self.states)
+        expected = list(self.states)
+        seq[0] = self.sa["T"]
+        expected[0] = self.sa["T"]
+        seq.insert(3, self.sa["G"])
+        expected.insert(3, self.sa["G"])
+        seq.append(self.sa["C"])
+        expected.append(self.sa["C"])
+        del seq[5]
+        del expected[5]
+        del seq[1:3]
+        del expected[1:3]
+        seq.set_at(len(seq), self.sa["A"])
+        expected.append(self.sa["A"])
+        self.assertTrue(seq.is_compact)
+        self.assertEqual(list(seq), expected)
+
+    def test_sparse_character_types_and_annotations(self):
+        seq = dendropy.DnaCharacterDataSequence(self.states)
+        ct = charmatrixmodel.CharacterType()
+        seq.set_character_type_at(4, ct)
+        seq.annotations_at(6).add_new("a", 1)
+        seq.insert(0, self.sa["A"])
+        self.assertIs(seq.character_type_at(5), ct)
+        self.assertIsNone(seq.character_type_at(4))
+        self.assertTrue(seq.has_annotations_at(7))
+        self.assertFalse(seq.has_annotations_at(6))
+        del seq[1]
+        self.assertIs(seq.character_type_at(4), ct)
+        self.assertTrue(seq.has_annotations_at(6))
+        cells = list(seq.cell_iter())
+        self.assertEqual(len(cells), len(seq))
+        self.assertIs(cells[4][1], ct)
+        self.assertIsNotNone(cells[6][2])
+        self.assertIsNone(cells[0][1])
+        self.assertRaises(IndexError, seq.character_type_at, len(seq))
+        self.assertTrue(seq.is_compact)
+
+    def test_fallback_to_list_storage(self):
+        seq = dendropy.DnaCharacterDataSequence(self.states)
+        ct = charmatrixmodel.CharacterType()
+        seq.set_character_type_at(2, ct)
+        foreign_state = dendropy.PROTEIN_STATE_ALPHABET["W"]
+        seq.append(foreign_state)
+        self.assertFalse(seq.is_compact)
+        self.assertEqual(list(seq), self.states + [foreign_state])
+        self.assertIs(seq.character_type_at(2), ct)
+        seq.set_at(len(seq) + 1, self.sa["A"])
+        self.assertIsNone(seq[-2])
+
+    def test_copy_and_extend_from_compact_sequence(self):
+        seq1 = dendropy.DnaCharacterDataSequence(self.states)
+        seq2 = dendropy.DnaCharacterDataSequence(seq1)
+        seq2.extend(seq1)
+        self.assertTrue(seq2.is_compact)
+        self.assertEqual(list(seq2), self.states + self.states)
+        seq3 = copy.deepcopy(seq1)
+        self.assertTrue(seq3.is_compact)
+        self.assertEqual(list(seq3), self.states)
+        seq3[0] = self.sa["G"]
+        self.assertIs(seq1[0], self.states[0])
+
+    def test_new_alphabet_states(self):
+        sa = charstatemodel.DnaStateAlphabet()
+        seq = dendropy.DnaCharacterDataSequence()
+        seq.datatype_alphabet = sa
+        seq.extend([sa["A"], sa["R"]])
+        new_state = sa.new_polymorphic_state(symbol=None, member_state_symbols="CT")
+        seq.append(new_state)
+        self.assertTrue(seq.is_compact)
+        self.assertEqual([seq[0], seq[1], seq[2]], [sa["A"], sa["R"], new_state])
+        self.assertEqual(seq.symbols_as_string(), "AR(C,T)")
+
+    def test_storage_codes_independent_of_request_order(self):
+        sa1 = charstatemodel.DnaStateAlphabet()
+        sa2 = charstatemodel.DnaStateAlphabet()
+        # codes requested (for different states) before and after adding a
+        # new state
+        sa1._get_state_storage_code(sa1["-"])
+        new_state1 = sa1.new_ambiguous_state(symbol=None, member_state_symbols="AC-")
+        new_state2 = sa2.new_ambiguous_state(symbol=None, member_state_symbols="AC-")
+        sa2._get_state_storage_code(sa2["A"])
+        self.assertEqual(
+                [str(state) for state in sa1._storage_code_states],
+                [str(state) for state in sa2._storage_code_states])
+        self.assertEqual(
+                [str(state) for state in sa1._storage_code_states],
+                [str(state) for state in sa1.state_iter()][:-1] + [str(new_state1)])
+        self.assertEqual(sa1._get_state_storage_code(new_state1), sa2._get_state_storage_code(new_state2))
+        self.assertEqual(sa1._get_state_storage_code(sa1["N"]), sa2._get_state_storage_code(sa2["N"]))
+
+    def test_matrix_operations(self):
+        tns = dendropy.TaxonNamespace(["a", "b"])
+        m1 = dendropy.DnaCharacterMatrix.from_dict({
+                "a": "ACGTACGT",
+                "b": "TTTTGGGG"}, taxon_namespace=tns)
+        m2 = dendropy.DnaCharacterMatrix.from_dict({
+                "a": "CCCC",
+                "b": "RN-?"}, taxon_namespace=tns)
+        m3 = dendropy.DnaCharacterMatrix.concatenate([m1, m2])
+        self.assertTrue(m3[0].is_compact)
+        self.assertEqual(m3["a"].symbols_as_string(), "ACGTACGTCCCC")
+        self.assertEqual(m3["b"].symbols_as_string(), "TTTTGGGGRN-?")
+        m4 = m3.export_character_indices([0, 3, 8, 11])
+        self.assertTrue(m4[0].is_compact)
+        self.assertEqual(m4["a"].symbols_as_string(), "ATCC")
+        self.assertEqual(m4["b"].symbols_as_string(), "TTR?")
+        self.assertEqual(m3["a"].symbols_as_string(), "ACGTACGTCCCC")
+        s = m4.as_string("fasta")
+        self.assertEqual(s, ">a\nATCC\n\n>b\nTTR?\n\n")
+
 class TestCharacterMatrixTaxa(dendropytest.ExtendedTestCase):
 
     def setUp(self):
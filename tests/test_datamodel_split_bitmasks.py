@@ -26,6 +26,7 @@ import unittest
 import re
 import sys
 import os
+import pickle
 sys.path.insert(0, os.path.dirname(__file__))
 from support import pathmap
 from support import paupsplitsreference
@@ -346,6 +347,65 @@ class IncompleteLeafSetSplitTest(unittest.TestCase):
         # the trees are now (b,c,(d,e)) and (b,d,(c,e)) so the symmetric diff is 2
         self.assertEqual(2, treecompare.symmetric_difference(first, second))
 
+class SplitDistributionShardTest(unittest.TestCase):
+
+    def setUp(self):
+        self.path = pathmap.tree_source_path("pythonidae.mb.run1.t")
+
+    def get_split_distribution(self, **kwargs):
+        return dendropy.SplitDistribution.from_files(
+                [self.path],
+                schema="nexus",
+                tree_offset=2,
+                **kwargs)
+
+    def check_equal_distributions(self, sd1, sd2):
+        self.assertEqual(sd1.total_trees_counted, sd2.total_trees_counted)
+        self.assertEqual(sd1.tree_rooting_types_counted, sd2.tree_rooting_types_counted)
+        # splits of unrooted trees are normalized relative to the first
+        # taxon, which depends on the order in which trees were read
+        all_labels = frozenset(t.label for t in sd1.taxon_namespace)
+        reference_label = min(all_labels)
+        def _split_labels(sd, split):
+            labels = frozenset(t.label for t in sd.taxon_namespace.bitmask_taxa_list(split))
+            if reference_label in labels:
+                labels = all_labels - labels
+            return labels
+        def _as_label_map(sd, d):
+            return dict((_split_labels(sd, split), sorted(v, key=lambda x: (x is not None, x)) if isinstance(v, list) else v) for split, v in d.items() if v)
+        for attr in ("split_counts", "split_edge_lengths"):
+            self.assertEqual(
+                    _as_label_map(sd1, getattr(sd1, attr)),
+                    _as_label_map(sd2, getattr(sd2, attr)))
+
+    def test_from_files(self):
+        trees = dendropy.TreeList.get(path=self.path, schema="nexus", tree_offset=2)
+        expected = dendropy.SplitDistribution(taxon_namespace=trees.taxon_namespace)
+        for tree in trees:
+            expected.count_splits_on_tree(tree)
+        serial = self.get_split_distribution()
+        self.assertEqual(serial.total_trees_counted, len(trees))
+        self.check_equal_distributions(serial, expected)
+        parallel = self.get_split_distribution(processes=2)
+        self.check_equal_distributions(parallel, expected)
+
+    def test_update_from_shard(self):
+        sd1 = self.get_split_distribution()
+        labels = [t.label for t in sd1.taxon_namespace]
+        taxon_namespace = dendropy.TaxonNamespace()
+        taxon_namespace.new_taxa(labels[:1] + labels[:0:-1])
+        sd2 = dendropy.SplitDistribution(taxon_namespace=taxon_namespace)
+        shard = pickle.loads(pickle.dumps(sd1.as_shard()))
+        sd2.update_from_shard(shard)
+        self.check_equal_distributions(sd1, sd2)
+        sd3 = dendropy.SplitDistribution(taxon_namespace=sd1.taxon_namespace)
+        sd3.update(sd1)
+        sd3.update_from_shard(shard)
+        self.assertEqual(sd3.total_trees_counted, 2 * sd1.total_trees_counted)
+        self.assertEqual(len(sd3.split_counts), len(sd1.split_counts))
+        for split in sd1.split_counts:
+            self.assertEqual(sd3.split_counts[split], 2 * sd1.split_counts[split])
+
 class TestTreeSplitSupportCredibilityScoring(unittest.TestCase):
 
     def setUp(self):
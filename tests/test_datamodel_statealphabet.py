@@ -28,6 +28,7 @@ import unittest
 import collections
 import dendropy
 from dendropy.utility import container
+from dendropy.datamodel import charstatemodel
 import os
 sys.path.insert(0, os.path.dirname(__file__))
 from support import dendropytest
@@ -304,6 +305,43 @@ class StateAlphabetTester(object):
             obs_states = self.sa.get_states_for_symbols(selected_symbols)
             self.assertEqual(obs_states, selected_states, "random seed: {}".format(self.random_seed))
 
+    def test_get_states_for_symbol_string(self):
+        all_symbols = [s for s in self.sa.full_symbol_state_map.keys() if s is not None]
+        if self.sa.symbol_byte_code_table is None:
+            self.assertIsNone(self.sa._get_states_for_symbol_string("".join(all_symbols)))
+            return
+        for rep in range(3):
+            n = random.randint(5, 100)
+            selected_symbols = [self.rng.choice(all_symbols) for _ in range(n)]
+            selected_states = [self.sa[s] for s in selected_symbols]
+            obs_states = self.sa._get_states_for_symbol_string("".join(selected_symbols))
+            self.assertEqual(obs_states, selected_states, "random seed: {}".format(self.random_seed))
+            obs_states = self.sa._get_states_for_symbol_string(" ".join(selected_symbols), ignore_bytes=b" ")
+            self.assertEqual(obs_states, selected_states, "random seed: {}".format(self.random_seed))
+        invalid_symbol = None
+        for c in "!@$%^&*~|<>/\\":
+            if c not in self.sa.full_symbol_state_map:
+                invalid_symbol = c
+                break
+        self.assertIsNotNone(invalid_symbol)
+        self.assertIsNone(self.sa._get_states_for_symbol_string(all_symbols[0] + invalid_symbol))
+        self.assertIsNone(self.sa._get_states_for_symbol_string(all_symbols[0] + u"\u00e9"))
+
+    def test_symbol_byte_code_table_updated_with_new_states(self):
+        if self.sa.symbol_byte_code_table is None:
+            return
+        symbol_pool = list(self.sa.fundamental_symbol_iter())
+        symbol = "&"
+        self.assertNotIn(symbol, self.sa.full_symbol_state_map)
+        self.assertIsNone(self.sa._get_states_for_symbol_string(symbol))
+        new_state = self.sa.new_ambiguous_state(symbol=symbol, member_state_symbols=symbol_pool[:2])
+        try:
+            self.assertEqual(self.sa._get_states_for_symbol_string(symbol), [new_state])
+        finally:
+            self.sa._ambiguous_states.remove(new_state)
+            self.sa.compile_lookup_mappings()
+        self.assertIsNone(self.sa._get_states_for_symbol_string(symbol))
+
     def test_states_property(self):
         check = list(self.sa.state_iter())
         self.assertEqual(len(check), len(self.sa.states))
@@ -386,6 +424,36 @@ class StateAlphabetTester(object):
                     matched_state = match_fn(selected_symbols)
                     self.assertIs(matched_state, multistate, "random seed: {}".format(self.random_seed))
 
+    def test_fundamental_index_bitmasks(self):
+        for state in self.sa.state_iter():
+            self.assertEqual(self.sa._get_fundamental_index_set(state), set(state.fundamental_indexes))
+            try:
+                expected = set(state.fundamental_indexes_with_gaps_as_missing)
+            except ValueError:
+                self.assertRaises(ValueError, self.sa._get_fundamental_index_set, state, gaps_as_missing=True)
+            else:
+                self.assertEqual(self.sa._get_fundamental_index_set(state, gaps_as_missing=True), expected)
+
+    def test_match_state_memoization(self):
+        for state_denomination, multistates in (
+                (self.sa.AMBIGUOUS_STATE, list(self.sa.ambiguous_state_iter())),
+                (self.sa.POLYMORPHIC_STATE, list(self.sa.polymorphic_state_iter()))):
+            for multistate in multistates:
+                if multistate is not self.sa.match_state(multistate.fundamental_symbols, state_denomination):
+                    # multiple definitions of the same member states
+                    continue
+                symbols = "".join(multistate.fundamental_symbols)
+                self.assertIs(self.sa.match_state(symbols, state_denomination), multistate)
+                self.assertIs(self.sa._matched_multistate_cache[state_denomination, symbols], multistate)
+                self.assertIs(self.sa.match_state(symbols, state_denomination), multistate)
+
+    def test_coerce_symbol_string_to_state_identities(self):
+        all_symbols = [s for s in self.sa.full_symbol_state_map.keys() if s is not None]
+        selected_symbols = [self.rng.choice(all_symbols) for _ in range(50)]
+        expected = [self.sa[s] for s in selected_symbols]
+        self.assertEqual(charstatemodel.coerce_to_state_identities(self.sa, "".join(selected_symbols)), expected)
+        self.assertEqual(charstatemodel.coerce_to_state_identities(self.sa, selected_symbols), expected)
+
     def test_on_the_fly_creation_of_multistate(self):
         multistate_states = [list(self.sa.ambiguous_state_iter()), list(self.sa.polymorphic_state_iter())]
         match_fns = [self.sa.match_ambiguous_state, self.sa.match_polymorphic_state]
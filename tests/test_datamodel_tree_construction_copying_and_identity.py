@@ -108,10 +108,10 @@ class TestTreeCopying(
                 suppress_leaf_node_taxa=False)
         self.add_annotations(tree1)
         for tree2 in (
-                # tree1.clone(0),
-                # copy.copy(tree1),
-                # tree1.clone(1),
-                # tree1.taxon_namespace_scoped_copy(),
+                tree1.clone(0),
+                copy.copy(tree1),
+                tree1.clone(1),
+                tree1.taxon_namespace_scoped_copy(),
                 dendropy.Tree(tree1),
                 ):
             self.compare_distinct_trees(tree1, tree2,
@@ -151,6 +151,64 @@ class TestTreeCopying(
                 self.assertIsNot(nd1.taxon, nd2.taxon)
                 self.assertEqual(nd1.taxon.label, nd2.taxon.label)
 
+    def test_copy_of_deep_tree(self):
+        tree1 = dendropy.Tree()
+        nd = tree1.seed_node
+        num_levels = sys.getrecursionlimit() * 2
+        for idx in range(num_levels):
+            nd.new_child(label="t{}".format(idx), edge_length=idx)
+            nd = nd.new_child(edge_length=1.0)
+        for tree2 in (tree1.clone(1), tree1.clone(2)):
+            nodes1 = [nd for nd in tree1]
+            nodes2 = [nd for nd in tree2]
+            self.assertEqual(len(nodes1), len(nodes2))
+            for nd1, nd2 in zip(nodes1, nodes2):
+                self.assertIsNot(nd1, nd2)
+                self.assertEqual(nd1.label, nd2.label)
+                self.assertEqual(nd1.edge.length, nd2.edge.length)
+                self.assertEqual(len(nd1._child_nodes), len(nd2._child_nodes))
+                if nd1.parent_node is None:
+                    self.assertIs(nd2.parent_node, None)
+                else:
+                    self.assertIs(nd2.parent_node.edge.head_node, nd2.parent_node)
+                    self.assertEqual(nd1.parent_node.label, nd2.parent_node.label)
+
+    def test_copy_of_additional_attributes(self):
+        tree1, anodes1, lnodes1, inodes1 = self.get_tree(suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        tree1.encode_bipartitions()
+        for nd in tree1:
+            nd.rates = [nd.edge.length]
+            nd.sisters = nd.sister_nodes()
+        tree2 = tree1.clone(1)
+        for nd1, nd2 in zip(tree1, tree2):
+            self.assertIs(nd1.taxon, nd2.taxon)
+            self.assertIsNot(nd2.rates, nd1.rates)
+            self.assertEqual(nd2.rates, nd1.rates)
+            self.assertEqual(nd2.sisters, nd2.sister_nodes())
+            self.assertIsNot(nd2.edge.bipartition, nd1.edge.bipartition)
+            self.assertEqual(nd2.edge.bipartition, nd1.edge.bipartition)
+            self.assertIsNot(nd2.comments, nd1.comments)
+            self.assertFalse(nd2.has_annotations)
+        self.assertEqual(tree2.seed_node.edge.bipartition.leafset_bitmask,
+                tree1.seed_node.edge.bipartition.leafset_bitmask)
+
+    def test_copy_of_mutable_ages_and_lengths(self):
+        tree1, anodes1, lnodes1, inodes1 = self.get_tree()
+        for nd in tree1:
+            nd.age = [1.0]
+            nd.edge.length = [2.0]
+            nd.label = ["x"]
+        tree2 = tree1.clone(1)
+        for nd1, nd2 in zip(tree1, tree2):
+            for attr1, attr2 in (
+                    (nd1.age, nd2.age),
+                    (nd1.edge.length, nd2.edge.length),
+                    (nd1.label, nd2.label),
+                    ):
+                self.assertIsNot(attr2, attr1)
+                self.assertEqual(attr2, attr1)
+
     def test_deepcopy_excluding_namespace(self):
         tree1, anodes1, lnodes1, inodes1 = self.get_tree(suppress_internal_node_taxa=False,
                 suppress_leaf_node_taxa=False)
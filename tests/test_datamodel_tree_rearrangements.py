@@ -0,0 +1,231 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests of NNI, SPR and TBR rearrangements of trees.
+"""
+
+import unittest
+import dendropy
+import os
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+from support import dendropytest
+
+class TreeRearrangementTestCase(dendropytest.ExtendedTestCase):
+
+    rooted_tree_str = "[&R] (((a:1,b:2):1,(c:3,d:4):2):1,((e:5,f:6):3,(g:7,(h:8,i:9):4):5):6);"
+    unrooted_tree_str = "[&U] ((a:1,b:2):1,(c:3,d:4):2,((e:5,f:6):3,(g:7,(h:8,i:9):4):5):6);"
+    polytomous_tree_str = "[&R] ((a:1,b:2,(c:3,d:4):2):1,(e:5,f:6,(g:7,h:8,i:9):5):6);"
+
+    def get_tree(self, tree_str):
+        tree = dendropy.Tree.get(data=tree_str, schema="newick")
+        tree.encode_bipartitions()
+        tree.bipartition_edge_map
+        return tree
+
+    def get_newick(self, tree):
+        return tree.as_string("newick", suppress_rooting=False)
+
+    def get_topology(self, tree):
+        tree = dendropy.Tree(tree)
+        tree.encode_bipartitions()
+        if tree.is_rooted:
+            return frozenset(b.split_bitmask for b in tree.bipartition_encoding)
+        return frozenset(b.split_bitmask for b in tree.bipartition_encoding if b.split_bitmask != tree.seed_node.edge.bipartition.split_bitmask)
+
+    def assertValidTree(self, tree, num_leaves):
+        self.assertIs(tree.seed_node.parent_node, None)
+        leaves = 0
+        for nd in tree.preorder_node_iter():
+            for ch in nd.child_nodes():
+                self.assertIs(ch.parent_node, nd)
+            self.assertNotEqual(len(nd.child_nodes()), 1)
+            if nd.is_leaf():
+                self.assertIsNot(nd.taxon, None)
+                leaves += 1
+        self.assertEqual(leaves, num_leaves)
+
+    def assertBipartitionsEncoded(self, tree):
+        expected_tree = dendropy.Tree(tree)
+        expected_tree.encode_bipartitions()
+        self.assertEqual(
+                sorted(b.split_bitmask for b in tree.bipartition_encoding),
+                sorted(b.split_bitmask for b in expected_tree.bipartition_encoding))
+        self.assertEqual(len(tree.bipartition_edge_map), len(expected_tree.bipartition_edge_map))
+        for edge in tree.postorder_edge_iter():
+            self.assertIs(tree.bipartition_edge_map[edge.bipartition], edge)
+            self.assertIs(tree.split_bitmask_edge_map[edge.bipartition.split_bitmask], edge)
+
+    def verify_moves(self, tree, moves):
+        original_newick = self.get_newick(tree)
+        original_topology = self.get_topology(tree)
+        num_leaves = len(tree.leaf_nodes())
+        topologies = set()
+        for move in moves:
+            tree.apply_move(move, update_bipartitions=True)
+            self.assertValidTree(tree, num_leaves)
+            self.assertBipartitionsEncoded(tree)
+            topology = self.get_topology(tree)
+            self.assertNotEqual(topology, original_topology)
+            topologies.add(topology)
+            tree.undo_move(move)
+            self.assertEqual(self.get_newick(tree), original_newick)
+            self.assertBipartitionsEncoded(tree)
+        return topologies
+
+    def test_nni(self):
+        for tree_str, num_moves in (
+                (self.rooted_tree_str, 14),
+                (self.unrooted_tree_str, 12),
+                ):
+            tree = self.get_tree(tree_str)
+            moves = list(tree.nni_move_iter())
+            self.assertEqual(len(moves), num_moves)
+            topologies = self.verify_moves(tree, moves)
+            self.assertEqual(len(topologies), num_moves)
+
+    def test_spr(self):
+        for tree_str in (self.rooted_tree_str, self.unrooted_tree_str, self.polytomous_tree_str):
+            tree = self.get_tree(tree_str)
+            moves = list(tree.spr_move_iter())
+            self.verify_moves(tree, moves)
+            local_moves = list(tree.spr_move_iter(max_distance=3))
+            self.assertTrue(0 < len(local_moves) < len(moves))
+        tree = self.get_tree(self.rooted_tree_str)
+        self.assertEqual(
+                self.verify_moves(tree, tree.nni_move_iter()),
+                self.verify_moves(tree, tree.spr_move_iter(max_distance=2)))
+
+    def test_tbr(self):
+        for tree_str in (self.rooted_tree_str, self.unrooted_tree_str, self.polytomous_tree_str):
+            tree = self.get_tree(tree_str)
+            moves = list(tree.tbr_move_iter())
+            self.verify_moves(tree, moves)
+            spr_topologies = self.verify_moves(tree, tree.spr_move_iter())
+            tbr_topologies = self.verify_moves(tree, moves)
+            self.assertTrue(spr_topologies < tbr_topologies)
+
+    def test_move_sequence(self):
+        tree = self.get_tree(self.unrooted_tree_str)
+        original_newick = self.get_newick(tree)
+        applied_moves = []
+        for idx in range(6):
+            moves = list(tree.tbr_move_iter())
+            move = moves[(idx * 37) % len(moves)]
+            tree.apply_move(move, update_bipartitions=True)
+            self.assertBipartitionsEncoded(tree)
+            applied_moves.append(move)
+        for move in reversed(applied_moves):
+            tree.undo_move(move)
+            self.assertBipartitionsEncoded(tree)
+        self.assertEqual(self.get_newick(tree), original_newick)
+
+    def test_moves_on_tree_with_basal_bifurcation(self):
+        # bipartitions not encoded before the moves are generated: the tree
+        # must not be restructured (i.e., the basal bifurcation collapsed)
+        # when they are encoded on applying the moves
+        tree_str = "[&U] ((a:1,b:2):1,((c:3,d:4):2,(e:5,f:6):3):6);"
+        for move_iter_name in ("nni_move_iter", "spr_move_iter", "tbr_move_iter"):
+            tree = dendropy.Tree.get(data=tree_str, schema="newick")
+            original_newick = self.get_newick(tree)
+            moves = list(getattr(tree, move_iter_name)())
+            if move_iter_name == "nni_move_iter":
+                self.assertEqual(len(moves), 8)
+            for move in moves:
+                tree.apply_move(move, update_bipartitions=True)
+                self.assertValidTree(tree, 6)
+                expected_tree = dendropy.Tree(tree)
+                expected_tree.encode_bipartitions(
+                        suppress_unifurcations=False,
+                        collapse_unrooted_basal_bifurcation=False)
+                self.assertEqual(
+                        sorted(b.split_bitmask for b in tree.bipartition_encoding),
+                        sorted(b.split_bitmask for b in expected_tree.bipartition_encoding))
+                tree.undo_move(move)
+                self.assertEqual(self.get_newick(tree), original_newick)
+                self.assertEqual(len(tree.seed_node.child_nodes()), 2)
+
+    def test_node_factory(self):
+        class CustomNode(dendropy.Node):
+            pass
+        class CustomTree(dendropy.Tree):
+            def node_factory(cls, **kwargs):
+                return CustomNode(**kwargs)
+            node_factory = classmethod(node_factory)
+        tree = CustomTree.get(data=self.polytomous_tree_str, schema="newick")
+        a = tree.find_node_with_taxon_label("a")
+        e = tree.find_node_with_taxon_label("e")
+        g = tree.find_node_with_taxon_label("g")
+        original_parent = a.parent_node
+        move = tree.apply_move(dendropy.TreeMove("spr", a, e))
+        self.assertIsNot(a.parent_node, original_parent)
+        self.assertIsInstance(a.parent_node, CustomNode)
+        tree.undo_move(move)
+        tree.apply_move(dendropy.TreeMove("tbr", e.parent_node, a, subtree_seed_node=g))
+        for nd in tree.preorder_node_iter():
+            self.assertIsInstance(nd, CustomNode)
+        self.assertEqual(len(tree.nodes()), 15)
+
+    def test_invalid_moves(self):
+        tree = self.get_tree(self.rooted_tree_str)
+        a = tree.find_node_with_taxon_label("a")
+        e = tree.find_node_with_taxon_label("e")
+        with self.assertRaises(ValueError):
+            tree.apply_move(dendropy.TreeMove("nni", a, e))
+        with self.assertRaises(ValueError):
+            tree.apply_move(dendropy.TreeMove("spr", a.parent_node, a))
+        with self.assertRaises(ValueError):
+            tree.apply_move(dendropy.TreeMove("tbr", a, e, subtree_seed_node=e))
+        with self.assertRaises(ValueError):
+            tree.apply_move(dendropy.TreeMove("spr", tree.seed_node, a))
+        move = dendropy.TreeMove("spr", a, e)
+        with self.assertRaises(ValueError):
+            tree.undo_move(move)
+        tree.apply_move(move)
+        with self.assertRaises(ValueError):
+            tree.apply_move(move)
+
+    def test_move_listeners(self):
+        tree = self.get_tree(self.rooted_tree_str)
+        events = []
+        listener = lambda t, move, is_undo: events.append((t, move, is_undo, list(move.changed_nodes), list(move.removed_nodes)))
+        tree.add_move_listener(listener)
+        a = tree.find_node_with_taxon_label("a")
+        c = tree.find_node_with_taxon_label("c")
+        move = tree.apply_move(dendropy.TreeMove("spr", a, c))
+        self.assertEqual(len(events), 1)
+        self.assertIs(events[0][0], tree)
+        self.assertIs(events[0][1], move)
+        self.assertFalse(events[0][2])
+        junction_node = a.parent_node
+        self.assertIn(junction_node, events[0][3])
+        self.assertIn(c.parent_node.parent_node, events[0][3])
+        tree.undo_move(move)
+        self.assertTrue(events[1][2])
+        self.assertEqual(events[1][4], [])
+        tree_copy = dendropy.Tree(tree)
+        tree_copy.apply_move(next(tree_copy.nni_move_iter()))
+        self.assertEqual(len(events), 2)
+        tree.remove_move_listener(listener)
+        tree.apply_move(move)
+        self.assertEqual(len(events), 2)
+
+if __name__ == "__main__":
+    unittest.main()
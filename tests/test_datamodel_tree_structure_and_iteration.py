@@ -551,6 +551,52 @@ class TestTreeIterators(curated_test_tree.CuratedTestTree, unittest.TestCase):
             ancestors = [ch.label for ch in nd.ancestor_iter(inclusive=True, filter_fn=filter_fn)]
             self.assertEqual(ancestors, expected_ancestors)
 
+    ### Cached Traversals ###
+
+    def test_traversal_after_restructuring(self):
+        tree, anodes, lnodes, inodes = self.get_tree()
+        self.assertSequenceEqual([nd.label for nd in tree], self.preorder_sequence)
+        self.assertSequenceEqual([nd.label for nd in tree.postorder_node_iter()], self.postorder_sequence)
+        nd = tree.find_node_with_label("b")
+        new_nd = nd.new_child(label="x")
+        for iter_fn, node_iter_fn in (
+                (tree.preorder_node_iter, tree.seed_node.preorder_iter),
+                (tree.postorder_node_iter, tree.seed_node.postorder_iter),
+                (tree.levelorder_node_iter, tree.seed_node.levelorder_iter),
+                ):
+            self.assertEqual(list(iter_fn()), list(node_iter_fn()))
+            self.assertIn(new_nd, list(iter_fn()))
+        nd.remove_child(new_nd)
+        self.assertSequenceEqual([nd.label for nd in tree], self.preorder_sequence)
+        tree.ladderize()
+        self.assertEqual(list(tree.postorder_node_iter()), list(tree.seed_node.postorder_iter()))
+
+    def test_restructuring_during_traversal(self):
+        for order in ("preorder", "postorder", "levelorder"):
+            for visit_idx in range(len(self.preorder_sequence)):
+                visited = []
+                for tree_idx in range(2):
+                    tree, anodes, lnodes, inodes = self.get_tree()
+                    if tree_idx == 0:
+                        # populate cache
+                        list(getattr(tree, "{}_node_iter".format(order))())
+                        nodes = getattr(tree, "{}_node_iter".format(order))()
+                    else:
+                        nodes = getattr(tree.seed_node, "{}_iter".format(order))()
+                    labels = []
+                    for idx, nd in enumerate(nodes):
+                        labels.append(nd.label)
+                        if idx == visit_idx:
+                            # move the first leaf to the current node, and
+                            # add a new child to the last leaf
+                            leaves = [x for x in tree.leaf_node_iter() if x is not nd]
+                            if leaves[0].parent_node is not nd.parent_node:
+                                leaves[0].parent_node.remove_child(leaves[0])
+                                nd.add_child(leaves[0])
+                            leaves[-1].new_child(label="x")
+                    visited.append(labels)
+                self.assertEqual(visited[0], visited[1])
+
 class TreeRootingState(dendropytest.ExtendedTestCase):
 
     def test_is_rooted(self):
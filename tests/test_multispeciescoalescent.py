@@ -124,6 +124,73 @@ class MultispeciesCoalescentFixedSingleTreesCalculationTestCase(unittest.TestCas
                 exp_ln_likelihood = sub_regime["log_likelihood"]
                 self.assertAlmostEqual(obs_ln_likelihood, exp_ln_likelihood, 2)
 
+class MultispeciesCoalescentBatchScoringTestCase(unittest.TestCase):
+
+    def setUp(self):
+        with open(pathmap.other_source_path("multispecies_coalescent_test_data.json")) as src:
+            self.test_regimes = json.load(src)
+
+    def check_batch_scoring(self, population_theta_fn=None, num_processes=1):
+        for test_regime in self.test_regimes:
+            species_tree = dendropy.Tree.get(
+                    data=test_regime["species_tree"],
+                    schema="newick",
+                    rooting="force-rooted",
+                    )
+            species_tree.taxon_namespace.is_mutable = False
+            msc = multispeciescoalescent.MultispeciesCoalescent(species_tree=species_tree)
+            coalescent_species_lineage_label_map = test_regime["coalescent_species_lineage_label_map"]
+            coalescent_species_lineage_map_fn = lambda x: species_tree.taxon_namespace.require_taxon(coalescent_species_lineage_label_map[x.label])
+            coalescent_taxa = dendropy.TaxonNamespace(sorted(coalescent_species_lineage_label_map.keys()))
+            coalescent_taxa.is_mutable = False
+            coalescent_trees = []
+            for sub_regime in test_regime["coalescent_trees"]:
+                coalescent_trees.append(dendropy.Tree.get(
+                        data=sub_regime["coalescent_tree"],
+                        schema="newick",
+                        rooting="force-rooted",
+                        taxon_namespace=coalescent_taxa,
+                        ))
+            obs_ln_likelihoods = msc.score_coalescent_trees(
+                    coalescent_trees=coalescent_trees,
+                    coalescent_species_lineage_map_fn=coalescent_species_lineage_map_fn,
+                    population_theta_fn=population_theta_fn,
+                    num_processes=num_processes,
+                    )
+            self.assertEqual(len(obs_ln_likelihoods), len(coalescent_trees))
+            for coalescent_tree, obs_ln_likelihood in zip(coalescent_trees, obs_ln_likelihoods):
+                exp_ln_likelihood = msc.score_coalescent_tree(
+                        coalescent_tree=coalescent_tree,
+                        coalescent_species_lineage_map_fn=coalescent_species_lineage_map_fn,
+                        population_theta_fn=population_theta_fn,
+                        )
+                self.assertAlmostEqual(obs_ln_likelihood, exp_ln_likelihood, 8)
+
+    def test_batch_scoring(self):
+        self.check_batch_scoring()
+
+    def test_batch_scoring_with_thetas(self):
+        self.check_batch_scoring(population_theta_fn=lambda e: 0.5 + e.length if e.length else 0.5)
+
+    def test_batch_scoring_multiprocessing(self):
+        self.check_batch_scoring(num_processes=2)
+
+    def test_batch_scoring_invalid_structure(self):
+        species_tree, coalescent_tree, coalescent_to_species_taxon_map = generate_multispecies_coalescent_system(
+                speciation_ages=[10, 20, 30],
+                coalescent_ages=[5, 6, 15, 16, 35, 36]
+                )
+        ## H2 now maps to species C, so it cannot coalesce with H3 before
+        ## the H and C populations merge
+        for t in coalescent_to_species_taxon_map:
+            if t.label == "H2":
+                coalescent_to_species_taxon_map[t] = species_tree.taxon_namespace.get_taxon("C")
+        msc = multispeciescoalescent.MultispeciesCoalescent(species_tree)
+        with self.assertRaises(dendropy.utility.error.InvalidMultispeciesCoalescentStructureError):
+            msc.score_coalescent_trees(
+                    coalescent_trees=[coalescent_tree],
+                    coalescent_species_lineage_map_fn=lambda x: coalescent_to_species_taxon_map[x])
+
 class MultispeciesCoalescentBasicTestCase(unittest.TestCase):
 
     def calc_log_likelihood(self,
@@ -492,6 +492,34 @@ class ParsimonyScoringTest(unittest.TestCase):
                     gaps_as_missing=gaps_as_missing)
             self.assertEqual(pscore, expected_scores[tree_idx])
 
+class FitchParsimonyScorerTest(unittest.TestCase):
+
+    def test_score_under_rearrangement(self):
+        taxon_namespace = dendropy.TaxonNamespace()
+        chars = dendropy.StandardCharacterMatrix.get(
+                path=pathmap.char_source_path("apternodus.chars.nexus"),
+                schema="nexus",
+                taxon_namespace=taxon_namespace)
+        tree = dendropy.Tree.get(
+                path=pathmap.tree_source_path("apternodus.tre"),
+                schema="nexus",
+                tree_offset=16,
+                taxon_namespace=taxon_namespace)
+        taxon_state_sets_map = chars.taxon_state_sets_map(gaps_as_missing=True)
+        scorer = treescore.FitchParsimonyScorer(tree, taxon_state_sets_map)
+        self.assertEqual(scorer.score, 671)
+        moves = list(tree.spr_move_iter(max_distance=4))
+        self.assertTrue(moves)
+        for move in moves[::7]:
+            tree.apply_move(move)
+            expected = treescore.parsimony_score(tree, chars, gaps_as_missing=True)
+            self.assertEqual(scorer.score, expected)
+            tree.undo_move(move)
+            self.assertEqual(scorer.score, 671)
+        scorer.detach()
+        tree.apply_move(moves[0])
+        self.assertEqual(scorer.score, 671)
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -697,5 +697,60 @@ class ProtractedSpeciationProcessGeneration(unittest.TestCase):
             for test_idx, (lineage_tree, orthospecies_tree) in enumerate(self.iter_samples(psm)):
                 pass
 
+class ProtractedSpeciationProcessArrayEngineGeneration(ProtractedSpeciationProcessGeneration):
+
+    def iter_psm_models(self, **kwargs):
+        kwargs["simulation_engine"] = "array"
+        for psm in super(ProtractedSpeciationProcessArrayEngineGeneration, self).iter_psm_models(**kwargs):
+            yield psm
+
+    def test_batch_generation(self):
+        for psm in self.iter_psm_models(rng=random.Random(559)):
+            lineage_taxon_namespace = dendropy.TaxonNamespace()
+            samples = psm.generate_samples(5,
+                    num_extant_lineages=10,
+                    lineage_taxon_namespace=lineage_taxon_namespace)
+            self.assertEqual(len(samples), 5)
+            for lineage_tree, orthospecies_tree in samples:
+                self.assertIs(lineage_tree.taxon_namespace, lineage_taxon_namespace)
+                self.assertEqual(len(lineage_tree.leaf_nodes()), 10)
+                self.check(orthospecies_tree)
+            self.assertEqual(len(set(id(s[1].taxon_namespace) for s in samples)), len(samples))
+
+    def test_engine_distributions(self):
+        num_samples = 400
+        mean_num_leaves = {}
+        for simulation_engine in ("object", "array"):
+            psm = protractedspeciation.ProtractedSpeciationProcess(
+                    speciation_initiation_from_orthospecies_rate=0.1,
+                    speciation_initiation_from_incipient_species_rate=0.1,
+                    speciation_completion_rate=0.05,
+                    orthospecies_extinction_rate=0.05,
+                    incipient_species_extinction_rate=0.05,
+                    simulation_engine=simulation_engine,
+                    rng=random.Random(631),
+                    )
+            num_lineage_leaves = 0
+            num_orthospecies_leaves = 0
+            for lineage_tree, orthospecies_tree in psm.generate_samples(num_samples, max_time=20):
+                num_lineage_leaves += len(lineage_tree.leaf_nodes())
+                num_orthospecies_leaves += len(orthospecies_tree.leaf_nodes())
+            mean_num_leaves[simulation_engine] = (
+                    float(num_lineage_leaves) / num_samples,
+                    float(num_orthospecies_leaves) / num_samples)
+        self.assertAlmostEqual(mean_num_leaves["object"][0], mean_num_leaves["array"][0], delta=1.5)
+        self.assertAlmostEqual(mean_num_leaves["object"][1], mean_num_leaves["array"][1], delta=0.75)
+
+    def test_invalid_engine(self):
+        psm = protractedspeciation.ProtractedSpeciationProcess(
+                speciation_initiation_from_orthospecies_rate=0.1,
+                speciation_initiation_from_incipient_species_rate=0.1,
+                speciation_completion_rate=0.05,
+                orthospecies_extinction_rate=0.0,
+                incipient_species_extinction_rate=0.0,
+                simulation_engine="bogus",
+                )
+        self.assertRaises(ValueError, psm.generate_sample, max_time=10)
+
 if __name__ == "__main__":
     unittest.main()
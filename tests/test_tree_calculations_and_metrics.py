@@ -955,6 +955,141 @@ class TreeUnaryMetricsTest(unittest.TestCase):
         g = treemeasure.pybus_harvey_gamma(tree)
         self.assertAlmostEqual(g, 0.546276, 4)
 
+class TreeShapeStatisticsTest(unittest.TestCase):
+
+    def get_expected_values(self, tree):
+        return {
+            "B1": treemeasure.B1(tree),
+            "colless_tree_imbalance": treemeasure.colless_tree_imbalance(tree, normalize="yule"),
+            "N_bar": treemeasure.N_bar(tree),
+            "sackin_index": treemeasure.sackin_index(tree, normalize="pda"),
+            "treeness": treemeasure.treeness(tree),
+            "pybus_harvey_gamma": treemeasure.pybus_harvey_gamma(dendropy.Tree(tree)),
+            }
+
+    def test_tree_shape_statistics(self):
+        trees = _get_reference_tree_list()
+        for tree in trees:
+            expected = self.get_expected_values(tree)
+            observed = treemeasure.tree_shape_statistics(
+                    tree,
+                    colless_normalize="yule",
+                    sackin_normalize="pda")
+            self.assertEqual(set(observed), set(treemeasure.TREE_SHAPE_STATISTICS))
+            for stat in expected:
+                self.assertAlmostEqual(observed[stat], expected[stat])
+            self.assertIs(tree.seed_node.age, None)
+            observed = treemeasure.tree_shape_statistics(tree, statistics=["N_bar"])
+            self.assertEqual(list(observed), ["N_bar"])
+        tree = dendropy.Tree.get(data="((a:1,b:1):1,(c:1,(d:2,e:1):1):1);", schema="newick")
+        with self.assertRaises(dendropy.utility.error.UltrametricityError):
+            treemeasure.tree_shape_statistics(tree)
+        self.assertIs(tree.seed_node.age, None)
+        with self.assertRaises(ValueError):
+            treemeasure.tree_shape_statistics(tree, statistics=["treenessss"])
+
+    def test_tree_shape_statistics_with_stored_node_ages(self):
+        tree = dendropy.Tree.get(data="((a:1,b:1):1,c:2);", schema="newick")
+        tree.calc_node_ages()
+        for edge in tree.postorder_edge_iter():
+            if edge.length is not None:
+                edge.length *= 2
+        stored_ages = [nd.age for nd in tree]
+        observed = treemeasure.tree_shape_statistics(tree, statistics=["pybus_harvey_gamma"])
+        self.assertEqual([nd.age for nd in tree], stored_ages)
+        self.assertAlmostEqual(observed["pybus_harvey_gamma"], treemeasure.pybus_harvey_gamma(tree))
+
+    def test_tree_shape_statistics_table(self):
+        trees = _get_reference_tree_list()
+        table = treemeasure.tree_shape_statistics_table(trees, statistics=["B1", "treeness"])
+        self.assertEqual(list(table), ["B1", "treeness"])
+        for idx, tree in enumerate(trees):
+            self.assertAlmostEqual(table["B1"][idx], treemeasure.B1(tree))
+            self.assertAlmostEqual(table["treeness"][idx], treemeasure.treeness(tree))
+        tree_path = pathmap.tree_source_path("pythonidae.reference-trees.nexus")
+        table = treemeasure.tree_shape_statistics_from_files(
+                [tree_path, tree_path],
+                "nexus",
+                statistics=["sackin_index"],
+                tree_offset=9)
+        expected = [treemeasure.sackin_index(tree) for tree in dendropy.TreeList.get(
+            path=tree_path,
+            schema="nexus",
+            tree_offset=9)]
+        self.assertEqual(len(expected), 2)
+        self.assertEqual(list(table["sackin_index"]), expected * 2)
+
+class TreeNodeAgesTest(unittest.TestCase):
+
+    def get_tree(self, newick):
+        return dendropy.Tree.get(data=newick, schema="newick", rooting="force-rooted")
+
+    def test_node_ages_and_root_distances(self):
+        trees = _get_reference_tree_list()
+        for tree in trees:
+            ages = tree.calc_node_ages()
+            self.assertEqual(ages, [nd.age for nd in tree.postorder_node_iter()])
+            for nd in tree.postorder_node_iter():
+                if nd.is_leaf():
+                    self.assertEqual(nd.age, 0.0)
+                else:
+                    first_child = nd.child_nodes()[0]
+                    self.assertEqual(nd.age, first_child.age + first_child.edge.length)
+            internal_ages = tree.calc_node_ages(is_return_internal_node_ages_only=True)
+            self.assertEqual(internal_ages, [nd.age for nd in tree.postorder_internal_node_iter()])
+            dists = tree.calc_node_root_distances(return_leaf_distances_only=False)
+            self.assertEqual(dists, [nd.root_distance for nd in tree.preorder_node_iter()])
+            for nd in tree.preorder_node_iter():
+                self.assertAlmostEqual(nd.root_distance, nd.distance_from_root())
+            self.assertEqual(
+                    tree.calc_node_root_distances(),
+                    [nd.root_distance for nd in tree.leaf_node_iter()])
+
+    def test_forced_and_fixed_ages(self):
+        tree = self.get_tree("((a:1,b:3)i1:1,(c:2,d:2)i2:1)root;")
+        self.assertEqual(tree.calc_node_ages(is_force_max_age=True), [0.0, 0.0, 3.0, 0.0, 0.0, 2.0, 4.0])
+        self.assertEqual(tree.calc_node_ages(is_force_min_age=True), [0.0, 0.0, 1.0, 0.0, 0.0, 2.0, 2.0])
+        with self.assertRaises(ValueError):
+            tree.calc_node_ages(is_force_max_age=True, is_force_min_age=True)
+        tip_ages = {"a": 2.0, "b": 0.0}
+        ages = tree.calc_node_ages(
+                ultrametricity_precision=False,
+                set_node_age_fn=lambda nd: tip_ages.get(nd.taxon.label) if nd.taxon else None)
+        self.assertEqual(ages, [3.0, 0.0, 0.0, 2.0, 4.0])
+        self.assertEqual(tree.find_node_with_taxon_label("a").age, 2.0)
+        self.assertEqual(tree.seed_node.age, 4.0)
+        # children of nodes with fixed ages are not checked, even without
+        # edge lengths
+        tree = self.get_tree("(a:1,b)root;")
+        ages = tree.calc_node_ages(set_node_age_fn=lambda nd: 7.5 if nd is tree.seed_node else None)
+        self.assertEqual(ages, [0.0, 0.0])
+        self.assertEqual(tree.seed_node.age, 7.5)
+        self.assertIs(tree.find_node_with_taxon_label("b").edge.length, None)
+
+    def test_missing_edge_lengths(self):
+        tree = self.get_tree("((a,b)i1:1,(c:1,d:1)i2)root;")
+        self.assertEqual(tree.calc_node_ages(), [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0])
+        for nd in tree.postorder_node_iter():
+            if nd is not tree.seed_node:
+                self.assertIsNot(nd.edge.length, None)
+        tree = self.get_tree("((a,b:1)i1:1,(c:1,d)i2:1)root;")
+        tree.calc_node_ages(ultrametricity_precision=False)
+        self.assertEqual(tree.find_node_with_taxon_label("a").edge.length, 0.0)
+        self.assertIs(tree.find_node_with_taxon_label("d").edge.length, None)
+
+    def test_ultrametricity_violation(self):
+        tree = self.get_tree("((a:1,b:1)i1:1,(c:1,(d:2,e:1)i3:1)i2:1)root;")
+        with self.assertRaises(dendropy.utility.error.UltrametricityError) as cm:
+            tree.calc_node_ages()
+        message = str(cm.exception)
+        self.assertIn("(d:2.0,e:1.0)i3:1.0", message)
+        self.assertIn("Tree is not ultrametric within threshold of 1e-05: 1.0", message)
+        self.assertEqual(tree.find_node_with_label("i3").age, 2.0)
+        tree.calc_node_ages(ultrametricity_precision=2.5)
+        self.assertEqual(tree.seed_node.age, 2.0)
+        tree.calc_node_ages(ultrametricity_precision=-1)
+        self.assertEqual(tree.find_node_with_label("i2").age, 1.0)
+
 class TreeEuclideanDistTest(unittest.TestCase):
 
     def runTest(self):
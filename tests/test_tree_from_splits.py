@@ -55,5 +55,27 @@ class TreeFromBipartitionsTest(unittest.TestCase):
             _LOG.debug("Reconstructed: {}".format(t_tree.as_string("newick")))
             self.assertEqual(treecompare.symmetric_difference(ref_tree, t_tree), 0)
 
+    def testIncompatibleSplits(self):
+        taxon_namespace = dendropy.TaxonNamespace(["A", "B", "C", "D", "E"])
+        # A = 0b00001, ..., E = 0b10000
+        split_edge_lengths = {0b00011: 1.0, 0b00110: 2.0, 0b11100: 3.0, 0b11000: 4.0}
+        for split_bitmasks, expected in (
+                ([0b00011, 0b00110, 0b11100, 0b11000], "((A,B):1.0,(C,(D,E):4.0):3.0)"),
+                ([0b00110, 0b00011, 0b11000, 0b11100], "(A,(B,C):2.0,(D,E):4.0)"),
+                ([0b11000, 0b11100, 0b00011, 0b11000], "((C,(D,E):4.0):3.0,(A,B):1.0)"),
+                # children: leaves first, then clades in the order given
+                ([0b11000, 0b00110], "(A,(D,E):4.0,(B,C):2.0)"),
+                ):
+            tree = dendropy.Tree.from_split_bitmasks(
+                    split_bitmasks,
+                    taxon_namespace=taxon_namespace,
+                    is_rooted=True,
+                    split_edge_lengths=split_edge_lengths)
+            self.assertTrue(tree._debug_tree_is_valid())
+            self.assertEqual(tree.as_string("newick", suppress_rooting=True).strip(), expected + ";")
+            self.assertEqual(
+                    sorted(b.split_bitmask for b in tree.bipartition_encoding),
+                    sorted(nd.edge.bipartition.split_bitmask for nd in tree))
+
 if __name__ == "__main__":
     unittest.main()
@@ -80,6 +80,91 @@ class ContainingTreeDeepCoalescenceSmall(unittest.TestCase):
             # with mesqf:
             #     ct.write_as_mesquite(mesqf)
 
+class ReconciliationIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.taxa = dendropy.TaxonNamespace()
+        self.gene_trees = dendropy.TreeList.get_from_string("""
+            [&R] (A,(B,(C,D))); [&R] ((A,C),(B,D)); [&R] (C,(A,(B,D)));
+            """, "newick", taxon_namespace=self.taxa)
+        self.species_trees = dendropy.TreeList.get_from_string("""
+            [&R] (A,(B,(C,D)));
+            [&R] (A,(C,(B,D)));
+            [&R] ((A,B),(C,D));
+            [&R] ((A,C),(B,D));
+            """, "newick", taxon_namespace=self.taxa)
+        self.identity_map = dict((t, t) for t in self.taxa)
+
+    def testDeepCoalCountsMatchDiscordance(self):
+        for t in self.gene_trees:
+            t.update_bipartitions()
+        for st in self.species_trees:
+            st.update_bipartitions()
+            idx = reconcile.ReconciliationIndex(
+                    containing_tree=st,
+                    contained_to_containing_taxon_map=self.identity_map,
+                    contained_trees=self.gene_trees)
+            dcs = idx.deep_coalescences()
+            expected_total = 0
+            for gt in self.gene_trees:
+                expected = reconcile.reconciliation_discordance(gt, st)
+                self.assertEqual(dcs[gt], expected)
+                expected_total += expected
+            self.assertEqual(idx.num_deep_coalescences(), expected_total)
+
+    def testIncrementalUpdates(self):
+        st = self.species_trees[0]
+        idx = reconcile.ReconciliationIndex(
+                containing_tree=st,
+                contained_to_containing_taxon_map=self.identity_map)
+        self.assertEqual(len(idx), 0)
+        self.assertEqual(idx.num_deep_coalescences(), 0)
+        dcs = []
+        for gt in self.gene_trees:
+            dcs.append(idx.add_tree(gt))
+            self.assertIn(gt, idx)
+            self.assertEqual(idx.num_deep_coalescences(), sum(dcs))
+        self.assertEqual(dcs, [0, 2, 2])
+        self.assertRaises(ValueError, idx.add_tree, self.gene_trees[0])
+        self.assertEqual(idx.remove_tree(self.gene_trees[1]), 2)
+        self.assertNotIn(self.gene_trees[1], idx)
+        self.assertEqual(len(idx), 2)
+        self.assertEqual(idx.num_deep_coalescences(), 2)
+        for edge, count in idx.edge_lineage_counts().items():
+            self.assertTrue(count >= 2)
+        idx.remove_tree(self.gene_trees[0])
+        idx.remove_tree(self.gene_trees[2])
+        self.assertEqual(idx.num_deep_coalescences(), 0)
+        self.assertEqual(set(idx.edge_lineage_counts().values()), set([0]))
+        self.assertRaises(KeyError, idx.remove_tree, self.gene_trees[2])
+
+    def testMultipleLineagesPerContainingTaxon(self):
+        dataset = dendropy.DataSet.get_from_path(pathmap.tree_source_path(filename="deepcoal1.nex"), "nexus")
+        species_tree = dataset.get_tree_list(label="ContainingTree")[0]
+        gene_trees = dataset.get_tree_list(label="EmbeddedTrees")
+        species_tree.taxon_namespace.is_mutable = False
+        taxon_map = dendropy.TaxonNamespaceMapping(
+                domain_taxon_namespace=gene_trees.taxon_namespace,
+                range_taxon_namespace=species_tree.taxon_namespace,
+                mapping_fn=lambda t: species_tree.taxon_namespace.require_taxon(label=t.label[0].upper()))
+        ct = reconcile.ContainingTree(containing_tree=species_tree,
+                contained_taxon_namespace=gene_trees.taxon_namespace,
+                contained_to_containing_taxon_map=taxon_map,
+                contained_trees=gene_trees,
+                fit_containing_edge_lengths=False,
+                )
+        idx = ct.reconciliation_index()
+        self.assertEqual(len(idx), len(ct.contained_trees))
+        # deep coalescences under the minimal embedding can be no more than
+        # those under the original containing tree edge lengths
+        fixed_edges_dcs = ct.deep_coalescences()
+        results = []
+        for gt in ct.contained_trees:
+            self.assertTrue(idx.deep_coalescences()[gt] <= fixed_edges_dcs[gt])
+            results.append(idx.deep_coalescences()[gt])
+        self.assertEqual(results, [1, 5, 3, 1, 3, 2, 2, 3, 4, 2])
+        self.assertEqual(idx.num_deep_coalescences(), sum(results))
+
 class DeepCoalTest(unittest.TestCase):
 
     def testFittedDeepCoalCounting(self):
@@ -28,6 +28,7 @@ import random
 import itertools
 from dendropy.calculate import treecompare
 from dendropy.calculate import statistics
+from dendropy.calculate import treesum
 import os
 import sys
 sys.path.insert(0, os.path.dirname(__file__))
@@ -384,5 +385,27 @@ class TestTopologyCounter(dendropytest.ExtendedTestCase):
             b = frozenset(tree.encode_bipartitions())
             self.assertAlmostEqual(tree.frequency, expected_freqs[b])
 
+    def testTopologyFingerprints(self):
+        taxon_namespace = dendropy.TaxonNamespace()
+        trees = dendropy.TreeList.get(
+                data="[&U] (A,(B,(C,(D,E))));\n[&U] ((((E,D),C),B),A);\n[&U] (A,(E,(B,(C,D))));\n",
+                schema="newick",
+                taxon_namespace=taxon_namespace)
+        fingerprints = [tree.topology_fingerprint() for tree in trees]
+        self.assertEqual(fingerprints[0], fingerprints[1])
+        self.assertNotEqual(fingerprints[0], fingerprints[2])
+        self.assertEqual(list(fingerprints[0]), sorted(set(b.split_bitmask for b in trees[0].bipartition_encoding)))
+        topology_counter = treesum.TopologyCounter()
+        for tree in trees:
+            topology_counter.count(tree)
+        hash_freqs = topology_counter.calc_hash_freqs()
+        self.assertEqual(list(hash_freqs), [fingerprints[0], fingerprints[2]])
+        self.assertEqual(list(hash_freqs.values()), [(2, 2.0/3), (1, 1.0/3)])
+        tree_freqs = topology_counter.calc_tree_freqs(taxon_namespace=taxon_namespace)
+        self.assertEqual([t.topology_fingerprint() for t in tree_freqs], list(hash_freqs))
+        split_bitmask_set_freqs = trees.as_tree_array().split_bitmask_set_frequencies()
+        self.assertEqual(len(split_bitmask_set_freqs), 2)
+        self.assertAlmostEqual(split_bitmask_set_freqs[fingerprints[0]], 2.0/3)
+
 if __name__ == "__main__":
     unittest.main()